@@ -0,0 +1,52 @@
+"""
+Compare how quickly YAML Paths are parsed by the scanner and by characters.
+
+Reports, for each YAML Path, the time to parse both its escaped and
+unescaped forms with the character-by-character parser and with the
+precompiled scanners which YAMLPath now uses for simple paths.  This is a
+measurement only; the differential tests in tests/test_yamlpath.py check that
+both parsers agree.  Run from the top directory of the project:
+
+    python benchmarks/parse_throughput.py [YAML_PATH ...]
+
+Copyright 2022 William W. Kimball, Jr. MBA MSIS
+"""
+import sys
+import timeit
+from typing import List
+
+from yamlpath import YAMLPath
+
+# The YAML Paths to time when none are given
+DEFAULT_PATHS = [
+    "/spec/template/spec/containers[0]/image",
+    "a.b.c.d.e.f.g.h",
+    "/a/b[name=web]/ports[1:3]",
+]
+
+# How many times to parse each path per timing, and how many timings to take
+NUMBER = 200
+REPEAT = 5
+
+def time_parser(yaml_path: str, by_char: bool) -> float:
+    """Get the best time, in seconds, to parse both forms of a YAML Path."""
+    def parse():
+        parsed = YAMLPath(yaml_path)
+        if by_char:
+            # pylint: disable=protected-access
+            return (parsed._parse_path_by_char(True),
+                    parsed._parse_path_by_char(False))
+        return (parsed.escaped, parsed.unescaped)
+
+    return min(timeit.repeat(parse, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+def main(yaml_paths: List[str]) -> None:
+    """Report the parse times of each YAML Path."""
+    print("{:<40} {:>10} {:>10}".format("YAML Path", "by char", "scanner"))
+    for yaml_path in yaml_paths:
+        print("{:<40} {:>8.1f}us {:>8.1f}us".format(
+            yaml_path, time_parser(yaml_path, True) * 1e6,
+            time_parser(yaml_path, False) * 1e6))
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or DEFAULT_PATHS)
@@ -33,13 +33,14 @@ setup(
     packages=find_packages(exclude=["tests"]),
     entry_points={
         "console_scripts": [
-            "eyaml-rotate-keys = yamlpath.commands.eyaml_rotate_keys:main",
-            "yaml-get = yamlpath.commands.yaml_get:main",
-            "yaml-paths = yamlpath.commands.yaml_paths:main",
-            "yaml-set = yamlpath.commands.yaml_set:main",
-            "yaml-merge = yamlpath.commands.yaml_merge:main",
-            "yaml-validate = yamlpath.commands.yaml_validate:main",
-            "yaml-diff = yamlpath.commands.yaml_diff:main",
+            "eyaml-rotate-keys = yamlpath.commands.client:eyaml_rotate_keys",
+            "yaml-get = yamlpath.commands.client:yaml_get",
+            "yaml-paths = yamlpath.commands.client:yaml_paths",
+            "yaml-set = yamlpath.commands.client:yaml_set",
+            "yaml-merge = yamlpath.commands.client:yaml_merge",
+            "yaml-validate = yamlpath.commands.client:yaml_validate",
+            "yaml-diff = yamlpath.commands.client:yaml_diff",
+            "yamlpath-server = yamlpath.commands.yamlpath_server:main",
         ]
     },
     python_requires=">3.7.0",
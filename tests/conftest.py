@@ -1,4 +1,5 @@
 """Define reusable pytest fixtures."""
+import sys
 import tempfile
 from subprocess import run
 from types import SimpleNamespace
@@ -118,6 +119,30 @@ def new_eyaml_keys(tmp_path_factory):
 
     return (new_private_key_file, new_public_key_file)
 
+@pytest.fixture(scope="session")
+def stub_eyaml_binary(tmp_path_factory):
+    """
+    Creates an executable which mimics the eyaml command without encryption.
+
+    Values are "encrypted" by Base64-encoding them into ENC[STUB,...].
+    """
+    stub_dir = tmp_path_factory.mktemp("stub-eyaml")
+    stub_file = stub_dir / "eyaml"
+    stub_file.write_text(f"""#!{sys.executable}
+import base64
+import sys
+
+value = sys.stdin.buffer.read()
+if sys.argv[1] == "encrypt":
+    sys.stdout.write("ENC[STUB," + base64.b64encode(value).decode() + "]")
+elif value.startswith(b"ENC[STUB,"):
+    sys.stdout.buffer.write(base64.b64decode(value[9:-1]))
+else:
+    sys.exit(1)
+""")
+    stub_file.chmod(0o755)
+    return str(stub_file)
+
 def create_temp_yaml_file(tmp_path_factory, content):
     """Creates a test YAML input file."""
     fhnd = tempfile.NamedTemporaryFile(mode='w',
@@ -5,6 +5,7 @@ from tests.conftest import (
     requireseyaml,
     old_eyaml_keys,
     new_eyaml_keys,
+    stub_eyaml_binary,
 )
 
 class Test_eyaml_rotate_keys():
@@ -318,3 +319,67 @@ yet_another:
         with open(backup_file, 'r') as fhnd:
             filedat = fhnd.read()
         assert filedat == content
+
+    def test_batch_isolates_bad_values(self, script_runner, tmp_path_factory, stub_eyaml_binary):
+        key_dir = tmp_path_factory.mktemp("stub-keys")
+        keys = []
+        for key_name in ("old-private", "old-public", "new-private", "new-public"):
+            key_file = key_dir / key_name
+            key_file.write_text(key_name)
+            keys.append(str(key_file))
+
+        content = """---
+aliases:
+  - &secret ENC[STUB, b25l]
+good: ENC[STUB, dHdv]
+alias: *secret
+bad: ENC[bogus]
+"""
+        yaml_file = create_temp_yaml_file(tmp_path_factory, content)
+        result = script_runner.run([
+            self.command,
+            "--eyaml={}".format(stub_eyaml_binary),
+            "--oldprivatekey={}".format(keys[0]),
+            "--oldpublickey={}".format(keys[1]),
+            "--newprivatekey={}".format(keys[2]),
+            "--newpublickey={}".format(keys[3]),
+            yaml_file
+        ])
+        assert not result.success, result.stderr
+        assert "cannot be run due to exit code:  1" in result.stderr
+
+        with open(yaml_file, 'r') as fhnd:
+            filedat = fhnd.read()
+        assert filedat == """---
+aliases:
+  - &secret ENC[STUB,b25l]
+good: ENC[STUB,dHdv]
+alias: *secret
+bad: ENC[bogus]
+"""
+
+    def test_jobs(self, script_runner, tmp_path_factory, imparsible_yaml_file, badsyntax_yaml_file, badcmp_yaml_file):
+        # No file gets far enough to need real EYAML keys
+        keys = [
+            create_temp_yaml_file(tmp_path_factory, "key {}".format(idx))
+            for idx in range(4)]
+        yaml_files = [
+            imparsible_yaml_file, badsyntax_yaml_file, badcmp_yaml_file,
+            "no-such-file.yaml"]
+        result = script_runner.run([
+            self.command,
+            "--jobs=2",
+            "--newprivatekey={}".format(keys[0]),
+            "--newpublickey={}".format(keys[1]),
+            "--oldprivatekey={}".format(keys[2]),
+            "--oldpublickey={}".format(keys[3]),
+        ] + yaml_files)
+
+        # The exit state of the last file which failed is reported
+        assert 2 == result.returncode, result.stderr
+        errors = result.stderr.splitlines()
+        assert 4 == len(errors)
+        assert "YAML parsing error" in errors[0]
+        assert "YAML syntax error" in errors[1]
+        assert "YAML composition error" in errors[2]
+        assert "Not a file:  no-such-file.yaml" in errors[3]
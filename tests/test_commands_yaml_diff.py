@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 from tests.conftest import create_temp_yaml_file, requireseyaml, old_eyaml_keys
@@ -2211,3 +2213,18 @@ d four
         )
         assert 1 == result.returncode, result.stderr
         assert stdout_content == result.stdout
+
+    def test_document_cache(self, script_runner, tmp_path_factory):
+        lhs_file = create_temp_yaml_file(tmp_path_factory, self.lhs_set_content)
+        rhs_file = create_temp_yaml_file(tmp_path_factory, "key: value\n")
+        cache_dir = str(tmp_path_factory.mktemp("cache"))
+        outputs = []
+        for _ in range(2):
+            result = script_runner.run([
+                self.command,
+                "--cachedir={}".format(cache_dir),
+                lhs_file, rhs_file])
+            assert not result.success, result.stderr
+            outputs.append(result.stdout)
+        assert outputs[0] == outputs[1]
+        assert 2 == len(os.listdir(cache_dir))
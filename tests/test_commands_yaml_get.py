@@ -440,3 +440,131 @@ bad_prices_array:
         for line in result.stdout.splitlines():
             assert line == output[match_index]
             match_index += 1
+
+    def test_multiple_queries(self, script_runner, tmp_path_factory):
+        content = """---
+spec:
+  containers:
+    - name: web
+      image: nginx
+    - name: cache
+      image: redis
+"""
+        yaml_file = create_temp_yaml_file(tmp_path_factory, content)
+        result = script_runner.run([
+            self.command,
+            "--query=/spec/containers/*/image",
+            "--query=spec.containers[name=web].name",
+            "--query=/spec/containers/*/image",
+            yaml_file])
+        assert result.success, result.stderr
+        assert "nginx\nredis\nweb\nnginx\nredis\n" == result.stdout
+
+    def test_multiple_queries_one_missing(self, script_runner, tmp_path_factory):
+        content = """---
+key: value
+"""
+        yaml_file = create_temp_yaml_file(tmp_path_factory, content)
+        result = script_runner.run([
+            self.command,
+            "--query=key",
+            "--query=no_such_key",
+            yaml_file])
+        assert not result.success, result.stderr
+        assert "Required YAML Path does not match any nodes" in result.stderr
+
+    @pytest.mark.parametrize("limit,output", [
+        ("1", 'web\n{"name": "cache"}\ncache\n'),
+        ("2", 'web\ncache\n{"name": "cache"}\ncache\nredis\n'),
+    ])
+    def test_limit(self, script_runner, tmp_path_factory, limit, output):
+        content = """---
+containers:
+  - name: web
+  - name: cache
+  - name: redis
+"""
+        yaml_file = create_temp_yaml_file(tmp_path_factory, content)
+        result = script_runner.run([
+            self.command,
+            "--limit={}".format(limit),
+            "--query=/containers/*/name",
+            "--query=containers[name^c]",
+            "--query=containers[name!=web].name",
+            yaml_file])
+        assert result.success, result.stderr
+        assert output == result.stdout
+
+    def test_bad_limit(self, script_runner, tmp_path_factory):
+        content = """---
+key: value
+"""
+        yaml_file = create_temp_yaml_file(tmp_path_factory, content)
+        result = script_runner.run([
+            self.command, "--limit=0", "--query=key", yaml_file])
+        assert not result.success, result.stderr
+        assert "The --limit|-l value must be a positive integer." in result.stderr
+
+    def test_explain(self, script_runner, tmp_path_factory):
+        content = """---
+containers:
+  - name: web
+  - name: cache
+"""
+        yaml_file = create_temp_yaml_file(tmp_path_factory, content)
+        result = script_runner.run([
+            self.command,
+            "--explain",
+            "--query=/containers[name^c]/name",
+            "--query=containers.*",
+            yaml_file])
+        assert result.success, result.stderr
+        lines = result.stdout.splitlines()
+        assert "Query:  /containers[name^c]/name" == lines[0]
+        assert lines[1].startswith("Matches:  1 in ")
+        assert lines[2].startswith("  [0] KEY containers:  evaluations=1,")
+        assert lines[3].startswith("  [1] SEARCH [name^c]:  evaluations=1,")
+        assert lines[4].startswith("  [2] KEY name:  evaluations=1,")
+        assert "Query:  containers.*" == lines[5]
+        assert lines[6].startswith("Matches:  2 in ")
+        assert "cache" not in result.stdout.replace("Query:", "")
+
+    def test_document_cache(self, script_runner, tmp_path_factory):
+        content = """---
+aliases:
+  - &name web
+containers:
+  - name: *name
+    ports: [80, 443]
+"""
+        yaml_file = create_temp_yaml_file(tmp_path_factory, content)
+        cache_dir = str(tmp_path_factory.mktemp("cache"))
+        outputs = []
+        for _ in range(2):
+            result = script_runner.run([
+                self.command,
+                "--verbose",
+                "--cachedir={}".format(cache_dir),
+                "--query=containers[name=web]",
+                yaml_file])
+            assert result.success, result.stderr
+            outputs.append(result.stdout.splitlines())
+        assert [
+            "Parsing {} into the document cache.".format(yaml_file),
+            '{"name": "web", "ports": [80, 443]}',
+        ] == outputs[0]
+        assert [
+            "Loaded {} from the document cache.".format(yaml_file),
+            '{"name": "web", "ports": [80, 443]}',
+        ] == outputs[1]
+
+    def test_bad_cache_size(self, script_runner, tmp_path_factory):
+        yaml_file = create_temp_yaml_file(tmp_path_factory, "key: value\n")
+        result = script_runner.run([
+            self.command,
+            "--cachedir=unused",
+            "--cachesize=0",
+            "--query=key",
+            yaml_file])
+        assert not result.success, result.stderr
+        assert "The --cachesize value must be a positive integer." in result.stderr
@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 from tests.conftest import create_temp_yaml_file
@@ -1091,3 +1093,87 @@ array2[]: bar
         ])
         assert result.success, result.stderr
         assert "\n".join(output) + "\n" == result.stdout
+
+    def test_search_only_deep_keynames(self, script_runner, tmp_path_factory):
+        content = """---
+base: &base
+  image: nginx
+  port: 80
+apps:
+  - name: web
+    spec: *base
+  - name: db
+    spec:
+      <<: *base
+      image: postgres
+  - name: cache
+    env: [[{image: sidecar}], [{port: 1}]]
+tags: !!set
+  ? image
+  ? other
+"""
+        yaml_file = create_temp_yaml_file(tmp_path_factory, content)
+        result = script_runner.run([
+            self.command,
+            "--nostdin", "--nofile",
+            "--pathsep=/", "--onlykeynames", "--allowkeyaliases",
+            "--search", "=~/^(image|port)$/",
+            "--except", "=port",
+            yaml_file
+        ])
+        assert result.success, result.stderr
+        assert "\n".join([
+            "/base/image",
+            "/apps[0]/spec/image",
+            "/apps[1]/spec/image",
+            "/apps[2]/env[0][0]/image",
+            "/tags/image",
+        ]) + "\n" == result.stdout
+
+    def test_document_cache(self, script_runner, tmp_path_factory):
+        content = """---
+base: &base
+  image: nginx
+apps:
+  - spec: *base
+"""
+        yaml_file = create_temp_yaml_file(tmp_path_factory, content)
+        cache_dir = str(tmp_path_factory.mktemp("cache"))
+        outputs = []
+        for _ in range(2):
+            result = script_runner.run([
+                self.command,
+                "--nostdin", "--nofile",
+                "--cachedir={}".format(cache_dir),
+                "--pathsep=/",
+                "--search", "=nginx",
+                yaml_file])
+            assert result.success, result.stderr
+            outputs.append(result.stdout)
+        assert "/base/image\n/apps[0]/spec/image\n" == outputs[0]
+        assert outputs[0] == outputs[1]
+        assert 1 == len(os.listdir(cache_dir))
+
+    def test_jobs(self, script_runner, tmp_path_factory):
+        yaml_files = [
+            create_temp_yaml_file(
+                tmp_path_factory,
+                "key{}: value\nlist: [{}]\n".format(idx, "value, " * idx))
+            for idx in range(12)]
+        yaml_files.insert(5, create_temp_yaml_file(tmp_path_factory, "key: ["))
+        outputs = []
+        for jobs in ("1", "4"):
+            result = script_runner.run(
+                [self.command, "--nostdin", "--jobs", jobs, "--search", "=value"]
+                + yaml_files)
+            assert 3 == result.returncode, result.stderr
+            assert "YAML parsing error" in result.stderr
+            outputs.append(result.stdout)
+
+        # Results are reported in input order however many files run at once
+        assert outputs[0] == outputs[1]
+        assert [
+            yaml_file for yaml_file in yaml_files if yaml_file != yaml_files[5]
+        ] == list(dict.fromkeys(
+            line.split("/0: ")[0] for line in outputs[0].splitlines()
+            if "/0: " in line))
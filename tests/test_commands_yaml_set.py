@@ -10,7 +10,7 @@ class Test_yaml_set():
     def test_no_options(self, script_runner):
         result = script_runner.run([self.command])
         assert not result.success, result.stderr
-        assert "the following arguments are required: -g/--change" in result.stderr
+        assert "one of the arguments -g/--change -B/--batch is required" in result.stderr
 
     def test_no_input_file(self, script_runner):
         result = script_runner.run([self.command, "--nostdin", "--change='/test'"])
@@ -1654,3 +1654,137 @@ TestService:
         with open(yaml_file, 'r') as fhnd:
             filedat = fhnd.read()
         assert filedat == yamlout
+
+    def test_batch_changes(self, script_runner, tmp_path_factory):
+        yaml_file = create_temp_yaml_file(tmp_path_factory, """---
+anchored: &anchor old
+spec:
+  containers:
+    - name: web
+      image: nginx:1.0
+    - name: db
+      image: postgres:1.0
+ref: *anchor
+""")
+        changes_file = create_temp_yaml_file(tmp_path_factory, """# Deployment changes
+/spec/containers[name==web]/image=nginx:2.0
+
+/spec/containers[name=db]/image=postgres:2.0
+/anchored=new value
+/added/key=a=b
+""")
+        result_content = """---
+anchored: &anchor new value
+spec:
+  containers:
+    - name: web
+      image: nginx:2.0
+    - name: db
+      image: postgres:2.0
+ref: *anchor
+added:
+  key: a=b
+"""
+        result = script_runner.run([
+            self.command, "--batch={}".format(changes_file), yaml_file])
+        assert result.success, result.stderr
+
+        with open(yaml_file, 'r') as fhnd:
+            filedat = fhnd.read()
+        assert filedat == result_content
+
+    def test_batch_changes_from_stdin(self, script_runner, tmp_path_factory):
+        import subprocess
+
+        yaml_file = create_temp_yaml_file(tmp_path_factory, """---
+key: value
+other: value
+""")
+        result = subprocess.run(
+            [self.command
+            , "--batch=-"
+            , yaml_file]
+            , stdout=subprocess.PIPE
+            , stderr=subprocess.PIPE
+            , input="key=changed\nother=changed too\n"
+            , universal_newlines=True
+        )
+        assert 0 == result.returncode, result.stderr
+
+        with open(yaml_file, 'r') as fhnd:
+            filedat = fhnd.read()
+        assert filedat == "---\nkey: changed\nother: changed too\n"
+
+    def test_batch_changes_mustexist(self, script_runner, tmp_path_factory):
+        content = """---
+key: value
+"""
+        yaml_file = create_temp_yaml_file(tmp_path_factory, content)
+        changes_file = create_temp_yaml_file(
+            tmp_path_factory, "key=changed\nno_such_key=added\n")
+        result = script_runner.run([
+            self.command, "--batch={}".format(changes_file), "--mustexist",
+            yaml_file])
+        assert not result.success, result.stderr
+        assert "No nodes matched required YAML Path" in result.stderr
+
+        with open(yaml_file, 'r') as fhnd:
+            filedat = fhnd.read()
+        assert filedat == content
+
+    def test_batch_bad_change(self, script_runner, tmp_path_factory):
+        yaml_file = create_temp_yaml_file(tmp_path_factory, "key: value\n")
+        changes_file = create_temp_yaml_file(
+            tmp_path_factory, "key=changed\n/list[name=value]\n")
+        result = script_runner.run([
+            self.command, "--batch={}".format(changes_file), yaml_file])
+        assert not result.success, result.stderr
+        assert "Batch change on line 2 is not a YAML_PATH=VALUE pair" in result.stderr
+
+    def test_batch_excludes_value_options(self, script_runner):
+        result = script_runner.run([
+            self.command, "--batch=changes", "--value=abc", "no-such-file"])
+        assert not result.success, result.stderr
+        assert "The --batch|-B option may be combined only with" in result.stderr
+
+    def test_explain(self, script_runner, tmp_path_factory):
+        content = """---
+containers:
+  - name: web
+  - name: cache
+"""
+        yaml_file = create_temp_yaml_file(tmp_path_factory, content)
+        result = script_runner.run([
+            self.command, "--explain", "--change=/containers[name=web]/name",
+            yaml_file])
+        assert result.success, result.stderr
+        lines = result.stdout.splitlines()
+        assert "Query:  /containers[name=web]/name" == lines[0]
+        assert lines[1].startswith("Matches:  1 in ")
+        assert lines[3].startswith("  [1] SEARCH [name=web]:  evaluations=1,")
+
+        with open(yaml_file, 'r') as fhnd:
+            filedat = fhnd.read()
+        assert filedat == content
+
+    def test_explain_batch(self, script_runner, tmp_path_factory):
+        content = """---
+key: value
+"""
+        yaml_file = create_temp_yaml_file(tmp_path_factory, content)
+        changes_file = create_temp_yaml_file(
+            tmp_path_factory, "key=changed\nno_such_key=added\n")
+        result = script_runner.run([
+            self.command, "--explain", "--batch={}".format(changes_file),
+            yaml_file])
+        assert result.success, result.stderr
+        assert [
+            "Query:  key", "Query:  no_such_key"
+        ] == [
+            line for line in result.stdout.splitlines()
+            if line.startswith("Query:")]
+        assert "Matches:  0 in " in result.stdout
+
+        with open(yaml_file, 'r') as fhnd:
+            filedat = fhnd.read()
+        assert filedat == content
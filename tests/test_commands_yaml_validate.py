@@ -88,3 +88,33 @@ this:
         )
         assert 2 == result.returncode, result.stderr
         assert "  * YAML parsing error in" in result.stdout
+
+    def test_jobs(self, script_runner, tmp_path_factory):
+        yaml_files = [
+            create_temp_yaml_file(tmp_path_factory, content)
+            for content in [
+                "key: value\n", "{[}", "---\ndoc: 1\n---\ndoc: 2\n",
+                "key: [", "- list\n"] * 3]
+        outputs = []
+        for jobs in ("1", "3"):
+            result = script_runner.run(
+                [self.command, "--nostdin", "--verbose", "--jobs", jobs]
+                + yaml_files)
+            assert 2 == result.returncode, result.stderr
+            outputs.append(result.stdout)
+
+        # Every document is reported, in order, however many files run at once
+        assert outputs[0] == outputs[1]
+        assert [
+            "{}/{}".format(yaml_file, idx) for yaml_file in yaml_files
+            for idx in range(2 if "doc: 2" in open(yaml_file).read() else 1)
+        ] == [
+            line.rsplit(" is ", 1)[0] for line in outputs[0].splitlines()
+            if not line.startswith("  * ")]
+
+    def test_bad_jobs(self, script_runner, tmp_path_factory):
+        yaml_file = create_temp_yaml_file(tmp_path_factory, "key: value\n")
+        result = script_runner.run(
+            [self.command, "--nostdin", "--jobs=-1", yaml_file])
+        assert 1 == result.returncode
+        assert "The --jobs value must be zero or a positive" in result.stderr
@@ -0,0 +1,190 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+from io import StringIO
+
+import pytest
+
+from yamlpath.commands import client
+from yamlpath.commands.yamlpath_server import ClientInput, run_command
+
+from tests.conftest import create_temp_yaml_file
+
+
+@pytest.fixture
+def server(tmp_path):
+    """Run a yamlpath-server for the duration of one test."""
+    socket_file = str(tmp_path / "yamlpath.sock")
+    process = subprocess.Popen(
+        [sys.executable, "-m", "yamlpath.commands.yamlpath_server",
+         "--quiet", socket_file],
+        stdin=subprocess.DEVNULL)
+    for _ in range(600):
+        if os.path.exists(socket_file) or process.poll() is not None:
+            break
+        time.sleep(0.05)
+    yield socket_file
+    process.terminate()
+    assert 0 == process.wait(timeout=30)
+    assert not os.path.exists(socket_file)
+
+
+class Test_commands_yamlpath_server():
+    """Tests for the yamlpath-server command and its thin client."""
+
+    def test_no_server(self, tmp_path):
+        assert client.forward(
+            str(tmp_path / "missing.sock"), "yaml-get", []) is None
+
+    def test_second_server_refused(self, server):
+        result = subprocess.run(
+            [sys.executable, "-m", "yamlpath.commands.yamlpath_server",
+             server],
+            stdin=subprocess.DEVNULL, capture_output=True, text=True)
+        assert 1 == result.returncode
+        assert "Another server is already listening" in result.stderr
+
+    def test_get_reloads_changed_files(self, capsys, tmp_path, server):
+        yaml_file = str(tmp_path / "test.yaml")
+        with open(yaml_file, "w") as fhnd:
+            fhnd.write("key: value\n")
+        argv = ["--nostdin", "--query=/key", yaml_file]
+        for _ in range(2):
+            assert 0 == client.forward(server, "yaml-get", argv)
+            assert "value\n" == capsys.readouterr().out
+
+        # Same-size content with the same modification time is still reloaded
+        stat = os.stat(yaml_file)
+        with open(yaml_file, "w") as fhnd:
+            fhnd.write("key: other\n")
+        os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert 0 == client.forward(server, "yaml-get", argv)
+        assert "other\n" == capsys.readouterr().out
+
+    def test_set_then_get(self, capsys, monkeypatch, tmp_path, server):
+        with open(str(tmp_path / "test.yaml"), "w") as fhnd:
+            fhnd.write("---\nkey: value\n")
+
+        # Relative paths are relative to the working directory of the client
+        monkeypatch.chdir(tmp_path)
+        assert 0 == client.forward(server, "yaml-set", [
+            "--change=/key", "--value=changed", "test.yaml"])
+        assert 0 == client.forward(server, "yaml-get", [
+            "--nostdin", "--query=/key", "test.yaml"])
+        assert "changed\n" == capsys.readouterr().out
+        with open(str(tmp_path / "test.yaml"), "r") as fhnd:
+            assert "---\nkey: changed\n" == fhnd.read()
+
+    def test_reads_client_stdin(self, capsys, monkeypatch, server):
+        monkeypatch.setattr(sys, "stdin", StringIO("key: piped\n"))
+        assert 0 == client.forward(server, "yaml-get", ["--query=/key"])
+        assert "piped\n" == capsys.readouterr().out
+
+    def test_reports_failures(self, capsys, tmp_path, server):
+        assert 1 == client.forward(server, "yaml-get", [
+            "--nostdin", "--query=/key", str(tmp_path / "missing.yaml")])
+        assert "File not found" in capsys.readouterr().err
+
+        # Usage errors name the command the client ran
+        assert 2 == client.forward(server, "yaml-paths", ["--nonesuch"])
+        assert "usage: yaml-paths" in capsys.readouterr().err
+
+    @pytest.mark.parametrize("command,argv,exit_code,output", [
+        ("yaml-paths", ["--nostdin", "--nofile", "--search==b"], 0, "key\n"),
+        ("yaml-diff", [], 1, "c key\n< \"a\"\n---\n> \"b\"\n"),
+        ("yaml-merge", ["--nostdin"], 0, "---\nkey: b\n"),
+        ("yaml-validate", ["--nostdin"], 0, ""),
+    ])
+    def test_commands(
+        self, capsys, tmp_path_factory, server, command, argv, exit_code,
+        output
+    ):
+        files = [
+            create_temp_yaml_file(tmp_path_factory, "key: a\n"),
+            create_temp_yaml_file(tmp_path_factory, "key: b\n")]
+        if command in ("yaml-paths", "yaml-validate"):
+            files = files[1:]
+        assert exit_code == client.forward(server, command, argv + files)
+        assert output == capsys.readouterr().out
+
+    def test_jobs_run_in_server(self, capsys, tmp_path_factory, server):
+        files = [
+            create_temp_yaml_file(tmp_path_factory, "key: {}\n".format(idx))
+            for idx in range(4)]
+
+        # The client runs apart so that a server which never answers fails
+        # this test rather than hanging it
+        result = subprocess.run(
+            [sys.executable, "-c",
+             "import sys\n"
+             "from yamlpath.commands import client\n"
+             "sys.exit(client.forward(sys.argv[1], 'yaml-validate',"
+             " sys.argv[2:]))",
+             server, "--nostdin", "--jobs", "2"] + files,
+            stdin=subprocess.DEVNULL, capture_output=True, text=True,
+            timeout=60)
+        assert 0 == result.returncode
+        assert "" == result.stdout
+
+        # The server goes on serving other commands
+        assert 0 == client.forward(
+            server, "yaml-get", ["--nostdin", "--query=/key", files[0]])
+        assert "0\n" == capsys.readouterr().out
+
+    def test_run(
+        self, capsys, monkeypatch, tmp_path, tmp_path_factory, server
+    ):
+        yaml_file = create_temp_yaml_file(tmp_path_factory, "key: value\n")
+        monkeypatch.setattr(
+            sys, "argv", ["yaml-get", "--nostdin", "--query=/key", yaml_file])
+
+        # Via the server
+        monkeypatch.setenv(client.SERVER_ENV, server)
+        with pytest.raises(SystemExit) as ex:
+            client.yaml_get()
+        assert 0 == ex.value.code
+        assert "value\n" == capsys.readouterr().out
+
+        # Locally, when no server answers
+        monkeypatch.setenv(client.SERVER_ENV, str(tmp_path / "missing.sock"))
+        client.yaml_get()
+        assert "value\n" == capsys.readouterr().out
+
+    def test_run_command(self, tmp_path):
+        with open(str(tmp_path / "test.yaml"), "w") as fhnd:
+            fhnd.write("key: value\n")
+        stdin = sys.stdin
+        assert {"stdout": "value\n", "stderr": "", "exit": 0} == run_command(
+            {"command": "yaml-get", "argv": ["--query=/key", "test.yaml"],
+             "cwd": str(tmp_path), "isatty": True}, None)
+        assert sys.stdin is stdin
+
+        result = run_command(
+            {"command": "yaml-get", "argv": ["--query=/key", "test.yaml"],
+             "cwd": str(tmp_path / "missing"), "isatty": True}, None)
+        assert 1 == result["exit"]
+        assert "FileNotFoundError" in result["stderr"]
+
+    def test_client_input(self):
+        rfile = io.BytesIO(json.dumps({"stdin": "a\nb\n"}).encode() + b"\n")
+        wfile = io.BytesIO()
+        stdin = ClientInput(rfile, wfile, False)
+        assert stdin.readable()
+        assert not stdin.isatty()
+        assert "utf-8" == stdin.encoding
+        with pytest.raises(io.UnsupportedOperation):
+            stdin.fileno()
+
+        # STDIN is requested from the client only once it is first read
+        assert b"" == wfile.getvalue()
+        assert "a\n" == stdin.readline()
+        assert ["b\n"] == list(stdin)
+        assert b'{"read": "stdin"}\n' == wfile.getvalue()
+
+        stdin.close()
+        assert stdin.closed
+        with pytest.raises(ValueError):
+            stdin.read()
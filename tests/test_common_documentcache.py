@@ -0,0 +1,200 @@
+import os
+from io import StringIO
+
+import pytest
+
+from ruamel.yaml.composer import ComposerError
+
+from yamlpath.common import DocumentCache, MemoryDocumentCache, Parsers
+
+from tests.conftest import create_temp_yaml_file
+
+
+class Test_common_documentcache():
+    """Tests for the DocumentCache class."""
+
+    content = """---
+# Leading comment
+base: &base
+  image: nginx  # trailing comment
+  quoted: 'single'
+  when: 2022-02-22T10:11:12+01:00
+child:
+  <<: *base
+  own: !custom tagged
+spec: *base
+list: [&first 1, *first, 0x1F, 1.50]
+tags: !!set
+  ? beta
+  ? alpha
+"""
+
+    @staticmethod
+    def dump(yaml, data):
+        buffer = StringIO()
+        yaml.dump(data, buffer)
+        return buffer.getvalue()
+
+    def test_round_trips_documents(self, tmp_path, quiet_logger):
+        yaml_file = str(tmp_path / "doc.yaml")
+        with open(yaml_file, "w") as fhnd:
+            fhnd.write(self.content)
+        yaml = Parsers.get_yaml_editor()
+        cache = DocumentCache(quiet_logger, str(tmp_path / "cache"))
+
+        parsed = cache.load(yaml, yaml_file)
+        assert (0, 1) == (cache.hits, cache.misses)
+        cached = cache.load(yaml, yaml_file)
+        assert (1, 1) == (cache.hits, cache.misses)
+        assert cached is not parsed
+
+        # Anchors, Aliases, tags, comments, and ordering are all retained
+        assert self.dump(yaml, parsed) == self.dump(yaml, cached)
+        assert cached["spec"] is cached["base"]
+        assert cached["child"].merge[0][1] is cached["base"]
+        assert "base" == cached["base"].anchor.value
+
+        info = cache.cache_info()
+        assert (1, 1, 1) == (info["hits"], info["misses"], info["size"])
+        assert 0 < info["bytes"] < info["maxsize"]
+
+    def test_changes_miss(self, tmp_path, quiet_logger):
+        yaml_file = str(tmp_path / "doc.yaml")
+        with open(yaml_file, "w") as fhnd:
+            fhnd.write("key: value\n")
+        cache = DocumentCache(quiet_logger, str(tmp_path / "cache"))
+        editor = Parsers.get_yaml_editor()
+        assert "value" == cache.load(editor, yaml_file)["key"]
+
+        # Rewrite the file with same-size content and the same mtime
+        stat = os.stat(yaml_file)
+        with open(yaml_file, "w") as fhnd:
+            fhnd.write("key: other\n")
+        os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert "other" == cache.load(editor, yaml_file)["key"]
+        assert (0, 2) == (cache.hits, cache.misses)
+
+        # Differently configured parsers load different documents
+        reader = Parsers.get_yaml_reader(fast=True)
+        assert dict is type(cache.load(reader, yaml_file))
+        assert (0, 3) == (cache.hits, cache.misses)
+        assert dict is type(cache.load(reader, yaml_file))
+        assert "other" == cache.load(editor, yaml_file)["key"]
+        assert (2, 3) == (cache.hits, cache.misses)
+
+    def test_multidoc(self, tmp_path, quiet_logger):
+        yaml_file = str(tmp_path / "docs.yaml")
+        with open(yaml_file, "w") as fhnd:
+            fhnd.write("---\ndoc: 1\n---\ndoc: 2\n")
+        yaml = Parsers.get_yaml_editor()
+        cache = DocumentCache(quiet_logger, str(tmp_path / "cache"))
+        for _ in range(2):
+            assert [1, 2] == [
+                doc["doc"] for (doc, loaded)
+                in Parsers.get_yaml_multidoc_data(
+                    yaml, quiet_logger, yaml_file, cache=cache)
+                if loaded]
+        assert (1, 1) == (cache.hits, cache.misses)
+
+        # A single-document load of the same file is not the same entry
+        with pytest.raises(ComposerError):
+            cache.load(yaml, yaml_file)
+        assert 1 == len(os.listdir(cache.directory))
+
+    def test_errors_are_not_cached(
+        self, capsys, tmp_path, tmp_path_factory, quiet_logger
+    ):
+        yaml_file = create_temp_yaml_file(
+            tmp_path_factory, "---\ndoc: 1\n---\ndoc: [\n")
+        yaml = Parsers.get_yaml_editor()
+        cache = DocumentCache(quiet_logger, str(tmp_path / "cache"))
+        for _ in range(2):
+            assert [True, False] == [
+                loaded for (_, loaded) in Parsers.get_yaml_multidoc_data(
+                    yaml, quiet_logger, yaml_file, cache=cache)]
+            # Errors name the file just as they do without a cache
+            assert yaml_file in capsys.readouterr().err
+        assert (0, 2) == (cache.hits, cache.misses)
+        assert [] == os.listdir(str(tmp_path / "cache"))
+
+    def test_evicts_least_recently_used(self, tmp_path, quiet_logger):
+        yaml = Parsers.get_yaml_editor()
+        yaml_files = []
+        for idx in range(4):
+            yaml_file = str(tmp_path / "doc{}.yaml".format(idx))
+            with open(yaml_file, "w") as fhnd:
+                fhnd.write("key: {}\n".format("x" * 100))
+            yaml_files.append(yaml_file)
+
+        cache = DocumentCache(quiet_logger, str(tmp_path / "cache"))
+        cache.load(yaml, yaml_files[0])
+        entry_size = cache.cache_info()["bytes"]
+        cache.maxsize = entry_size * 2
+        cache.load(yaml, yaml_files[1])
+
+        # Using the first entry leaves the second least recently used
+        for name in os.listdir(cache.directory):
+            os.utime(os.path.join(cache.directory, name), ns=(0, 0))
+        cache.load(yaml, yaml_files[0])
+        cache.load(yaml, yaml_files[2])
+        assert 2 == cache.cache_info()["size"]
+        cache.load(yaml, yaml_files[0])
+        cache.load(yaml, yaml_files[2])
+        assert (3, 3) == (cache.hits, cache.misses)
+        cache.load(yaml, yaml_files[1])
+        assert (3, 4) == (cache.hits, cache.misses)
+
+        # Entries larger than the entire cache are never kept
+        cache.clear()
+        cache.maxsize = entry_size - 1
+        cache.load(yaml, yaml_files[3])
+        cache.load(yaml, yaml_files[3])
+        assert (3, 6) == (cache.hits, cache.misses)
+        assert [] == os.listdir(cache.directory)
+
+    def test_discards_unreadable_entries(self, tmp_path, quiet_logger):
+        yaml_file = str(tmp_path / "doc.yaml")
+        with open(yaml_file, "w") as fhnd:
+            fhnd.write("key: value\n")
+        yaml = Parsers.get_yaml_editor()
+        cache = DocumentCache(quiet_logger, str(tmp_path / "cache"))
+        cache.load(yaml, yaml_file)
+        (entry,) = os.listdir(cache.directory)
+        with open(os.path.join(cache.directory, entry), "r+b") as fhnd:
+            fhnd.truncate(10)
+
+        assert "value" == cache.load(yaml, yaml_file)["key"]
+        assert "value" == cache.load(yaml, yaml_file)["key"]
+        assert (1, 2) == (cache.hits, cache.misses)
+
+    def test_memory_cache(self, tmp_path, quiet_logger):
+        yaml_files = []
+        for idx in range(3):
+            yaml_file = str(tmp_path / "doc{}.yaml".format(idx))
+            with open(yaml_file, "w") as fhnd:
+                fhnd.write(self.content)
+            yaml_files.append(yaml_file)
+        yaml = Parsers.get_yaml_editor()
+        cache = MemoryDocumentCache(quiet_logger)
+
+        parsed = cache.load(yaml, yaml_files[0])
+        cached = cache.load(yaml, yaml_files[0])
+        assert (1, 1) == (cache.hits, cache.misses)
+        assert self.dump(yaml, parsed) == self.dump(yaml, cached)
+
+        # Every load is a copy which can be changed independently
+        cached["base"]["image"] = "changed"
+        assert "nginx" == cache.load(yaml, yaml_files[0])["spec"]["image"]
+
+        # The least recently used entries are evicted
+        cache.maxsize = cache.cache_info()["bytes"] * 2
+        cache.load(yaml, yaml_files[1])
+        cache.load(yaml, yaml_files[0])
+        cache.load(yaml, yaml_files[2])
+        assert 2 == cache.cache_info()["size"]
+        cache.load(yaml, yaml_files[0])
+        cache.load(yaml, yaml_files[1])
+        assert (4, 4) == (cache.hits, cache.misses)
+
+        cache.clear()
+        assert 0 == cache.cache_info()["size"]
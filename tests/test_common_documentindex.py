@@ -0,0 +1,143 @@
+import pytest
+
+from ruamel.yaml import YAML
+
+from yamlpath.common import Anchors, DocumentIndex
+
+
+class Test_common_documentindex():
+    """Tests for the DocumentIndex class."""
+
+    @pytest.mark.parametrize("yamldata", [
+        ("""---
+base: &base
+  key: value
+  child: &child_anchor child value
+list:
+  - &element element value
+  - *element
+  - &hash
+    name: hashed
+derived:
+  <<: *base
+  extra: *child_anchor
+? &key_anchor anchored key
+: keyed value
+"""),
+        ("""---
+- &scalar scalar
+- nested:
+    - &deep deep value
+"""),
+        ("just a scalar"),
+    ])
+    def test_anchors_match_scan(self, yamldata):
+        yaml = YAML()
+        data = yaml.load(yamldata)
+        expected = {}
+        Anchors.scan_for_anchors(data, expected)
+        index = DocumentIndex(data)
+        assert not index.is_built
+        assert index.anchors == expected
+        assert index.is_built
+        assert all(
+            index.anchors[name] is node for name, node in expected.items())
+
+    def test_alias_sites(self):
+        yaml = YAML()
+        data = yaml.load("""---
+list:
+  - &element element value
+  - *element
+hash:
+  first: *element
+  <<: &base
+    merged: value
+""")
+        index = DocumentIndex(data)
+        element = data["list"][0]
+        sites = index.alias_sites(element)
+        assert len(sites) == 3
+        assert (data["list"], 0) in sites
+        assert (data["list"], 1) in sites
+        assert (data["hash"], "first") in sites
+        assert index.alias_sites(data["hash"]["merged"]) == []
+        assert index.alias_sites("not in the document") == []
+
+    def test_invalidate(self):
+        yaml = YAML()
+        data = yaml.load("""---
+key: &old value
+""")
+        index = DocumentIndex(data)
+        assert "old" in index.anchors
+        data["key"].yaml_set_anchor("new", always_dump=True)
+        assert "old" in index.anchors
+        index.invalidate()
+        assert not index.is_built
+        assert "new" in index.anchors
+        assert "old" not in index.anchors
+
+    def test_references(self):
+        yaml = YAML()
+        data = yaml.load("""---
+list:
+  - &element element value
+  - *element
+hash:
+  first: *element
+set: !!set
+  ? member
+""")
+        index = DocumentIndex(data)
+        assert not index.has_references
+        element = data["list"][0]
+        sites = index.references(element)
+        assert index.has_references
+        assert len(sites) == 3
+        assert (data["list"], 0, False) in sites
+        assert (data["list"], 1, False) in sites
+        assert (data["hash"], "first", False) in sites
+
+        hash_key = list(data["hash"].keys())[0]
+        assert index.references(hash_key) == [(data["hash"], "first", True)]
+        member = list(data["set"])[0]
+        assert index.references(member) == [(data["set"], member, False)]
+        assert index.references("not in the document") == []
+
+    def test_replace_node(self):
+        yaml = YAML()
+        data = yaml.load("""---
+anchored: &anchor value
+alias: *anchor
+""")
+        index = DocumentIndex(data)
+        old_node = data["anchored"]
+        assert "anchor" in index.anchors
+        sites = index.references(old_node)
+
+        new_node = yaml.load("new: &anchor new value")["new"]
+        data["anchored"] = new_node
+        index.replace_node(old_node, new_node, sites[:1])
+        assert not index.is_built
+        assert index.references(old_node) == sites[1:]
+        assert index.references(new_node) == sites[:1]
+
+        data["alias"] = new_node
+        index.replace_node(old_node, new_node, sites[1:])
+        assert index.references(old_node) == []
+        assert index.references(new_node) == sites
+        assert index.anchors["anchor"] is new_node
+
+    def test_add_node(self):
+        yaml = YAML()
+        data = yaml.load("key: value")
+        index = DocumentIndex(data)
+        index.references(data["key"])
+
+        new_node = yaml.load("- nested")
+        data["added"] = new_node
+        index.add_node(new_node, data, "added")
+        assert index.references(new_node) == [(data, "added", False)]
+        assert index.references(new_node[0]) == [(new_node, 0, False)]
+        assert len(index.references("added")) == 1
@@ -0,0 +1,170 @@
+import io
+import multiprocessing
+import os
+import sys
+
+import pytest
+
+from yamlpath.common import FilePool
+from yamlpath.common import filepool
+
+# Files processed in the process which ran the FilePool
+local_files = []
+
+
+def report_file(prefix, yaml_file):
+    """Report one file, failing or exiting as its name says."""
+    local_files.append(yaml_file)
+    name = os.path.basename(yaml_file)
+    print("{}{}".format(prefix, name))
+    print("{}{}".format(prefix, name), file=sys.stderr)
+    if name.startswith("exit"):
+        sys.exit(4)
+    if name.startswith("raise"):
+        raise RuntimeError("Cannot process {}".format(name))
+    if name.startswith("fail"):
+        return int(name[4])
+    return 0
+
+def get_file_processor(prefix):
+    """Build the per-file function of each worker."""
+    return lambda yaml_file: report_file(prefix, yaml_file)
+
+def report_streams(yaml_file):
+    """Report one file to STDERR, then STDOUT, then STDERR again."""
+    name = os.path.basename(yaml_file)
+    print("begin {}".format(name), file=sys.stderr)
+    print("out {}".format(name))
+    print("end {}".format(name), file=sys.stderr)
+    return 0
+
+def get_stream_reporter():
+    """Build the per-file function which reports to both streams."""
+    return report_streams
+
+
+class Test_common_filepool():
+    """Tests for the FilePool class."""
+
+    @staticmethod
+    def make_files(tmp_path, names):
+        yaml_files = []
+        for (idx, name) in enumerate(names):
+            yaml_file = str(tmp_path / name)
+            with open(yaml_file, "w") as fhnd:
+                fhnd.write("key: {}\n".format("x" * 1000 * (idx % 5)))
+            yaml_files.append(yaml_file)
+        return yaml_files
+
+    @pytest.mark.parametrize("jobs", [1, 3, 0])
+    def test_reports_in_order(self, capsys, tmp_path, jobs):
+        names = ["ok{}.yaml".format(idx) for idx in range(20)]
+        names[5] = "fail2.yaml"
+        names[12] = "fail3.yaml"
+        yaml_files = self.make_files(tmp_path, names)
+
+        assert 3 == FilePool(jobs, get_file_processor, "> ").run(yaml_files)
+        captured = capsys.readouterr()
+        expected = "".join("> {}\n".format(name) for name in names)
+        assert expected == captured.out
+        assert expected == captured.err
+
+    def test_exit_stops_in_order(self, capsys, tmp_path):
+        names = ["ok{}.yaml".format(idx) for idx in range(10)]
+        names[6] = "exit.yaml"
+        yaml_files = self.make_files(tmp_path, names)
+
+        with pytest.raises(SystemExit) as ex:
+            FilePool(4, get_file_processor, "").run(yaml_files)
+        assert 4 == ex.value.code
+        assert "".join(
+            "{}\n".format(name) for name in names[:7]
+        ) == capsys.readouterr().out
+
+    def test_stdin_is_local(self, capsys, tmp_path):
+        yaml_files = self.make_files(
+            tmp_path, ["ok{}.yaml".format(idx) for idx in range(4)])
+        yaml_files.insert(2, "-")
+        local_files.clear()
+
+        assert 0 == FilePool(2, get_file_processor, "").run(yaml_files)
+        assert ["-"] == local_files
+        assert "".join(
+            "{}\n".format(os.path.basename(yaml_file))
+            for yaml_file in yaml_files) == capsys.readouterr().out
+
+    @pytest.mark.parametrize("jobs", [1, 3])
+    def test_streams_stay_interleaved(self, monkeypatch, tmp_path, jobs):
+        names = ["ok{}.yaml".format(idx) for idx in range(6)]
+        yaml_files = self.make_files(tmp_path, names)
+        output = io.StringIO()
+        monkeypatch.setattr(sys, "stdout", output)
+        monkeypatch.setattr(sys, "stderr", output)
+
+        assert 0 == FilePool(jobs, get_stream_reporter).run(yaml_files)
+        assert "".join(
+            "begin {0}\nout {0}\nend {0}\n".format(name)
+            for name in names) == output.getvalue()
+
+    @pytest.mark.parametrize("jobs", [1, 3])
+    def test_exceptions_are_reported(self, capsys, tmp_path, jobs):
+        names = ["ok{}.yaml".format(idx) for idx in range(6)]
+        names[2] = "raise.yaml"
+        names[4] = "fail2.yaml"
+        yaml_files = self.make_files(tmp_path, names)
+
+        assert 2 == FilePool(jobs, get_file_processor, "").run(yaml_files)
+        captured = capsys.readouterr()
+        assert "".join(
+            "{}\n".format(name) for name in names) == captured.out
+        errors = captured.err.split("raise.yaml\n", 1)
+        assert "ok0.yaml\nok1.yaml\n" == errors[0]
+        assert "RuntimeError: Cannot process raise.yaml" in errors[1]
+        assert errors[1].endswith("ok3.yaml\nfail2.yaml\nok5.yaml\n")
+
+    def test_nothing_starts_after_exit(self, monkeypatch):
+        stop_at = multiprocessing.Value("l", 10)
+        monkeypatch.setattr(filepool, "_STOP_AT", stop_at)
+        monkeypatch.setattr(
+            filepool, "_PROCESS_FILE", get_file_processor(""))
+        local_files.clear()
+
+        results = filepool._process_chunk(
+            [(2, "ok2.yaml"), (6, "exit.yaml"), (8, "ok8.yaml"),
+             (4, "ok4.yaml")])
+        assert [(2, 0, False), (6, 4, True), (4, 0, False)] == [
+            result[:3] for result in results]
+        assert [(False, "exit.yaml\n"), (True, "exit.yaml\n")] == results[1][3]
+        assert 6 == stop_at.value
+        assert [] == filepool._process_chunk([(7, "ok7.yaml")])
+        assert ["ok2.yaml", "exit.yaml", "ok4.yaml"] == local_files
+
+    def test_in_process(self, capsys, monkeypatch, tmp_path):
+        names = ["ok{}.yaml".format(idx) for idx in range(4)]
+        yaml_files = self.make_files(tmp_path, names)
+        monkeypatch.setattr(FilePool, "in_process", True)
+        local_files.clear()
+
+        assert 0 == FilePool(2, get_file_processor, "").run(yaml_files)
+        assert yaml_files == local_files
+        assert "".join(
+            "{}\n".format(name) for name in names) == capsys.readouterr().out
+
+    def test_chunks(self, tmp_path):
+        pool = FilePool(2, get_file_processor, "")
+        large_file = str(tmp_path / "large.yaml")
+        with open(large_file, "w") as fhnd:
+            fhnd.write("x" * 1000000)
+        small_files = [
+            (idx, str(tmp_path / "missing{}.yaml".format(idx)))
+            for idx in range(1, 300)]
+
+        chunks = pool._chunk([(0, large_file)] + small_files)
+        # The largest file is scheduled first and alone
+        assert [(0, large_file)] == chunks[0]
+        # Small files are grouped, but never too many of them
+        assert all(
+            1 < len(chunk) <= FilePool.MAX_CHUNK_FILES
+            for chunk in chunks[1:])
+        assert list(range(300)) == sorted(
+            index for chunk in chunks for (index, _) in chunk)
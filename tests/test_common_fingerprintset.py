@@ -0,0 +1,70 @@
+import pytest
+
+from ruamel.yaml import YAML
+
+from yamlpath.common import FingerprintSet
+
+
+class Test_common_fingerprintset():
+    """Tests for the FingerprintSet class."""
+
+    @pytest.fixture
+    def data(self):
+        yaml = YAML()
+        return yaml.load("""---
+scalars: [1, 1.0, true, "1", abc, null]
+hashes:
+  - {a: 1, b: [x, y]}
+  - {b: [x, y], a: 1}
+  - {a: 1, b: [y, x]}
+set: !!set {? p, ? q}
+tagged: !custom value
+""")
+
+    @pytest.mark.parametrize("lhs,rhs", [
+        (1, 1.0),
+        (1, True),
+        ("abc", "abc"),
+        (None, None),
+        ({"a": 1, "b": ["x", "y"]}, {"b": ["x", "y"], "a": 1}),
+        ([1, {"a": [2]}], [1.0, {"a": [2]}]),
+        ({"p", "q"}, frozenset(["q", "p"])),
+    ])
+    def test_equal_fingerprints(self, lhs, rhs):
+        assert lhs == rhs
+        assert (FingerprintSet.fingerprint(lhs)
+                == FingerprintSet.fingerprint(rhs))
+
+    def test_yaml_fingerprints(self, data):
+        hashes = data["hashes"]
+        assert (FingerprintSet.fingerprint(hashes[0])
+                == FingerprintSet.fingerprint(hashes[1]))
+        assert (FingerprintSet.fingerprint(hashes[0])
+                != FingerprintSet.fingerprint(hashes[2]))
+        assert (FingerprintSet.fingerprint(data["set"])
+                == FingerprintSet.fingerprint({"p", "q"}))
+
+    def test_contains_like_list(self, data):
+        values = (list(data["scalars"]) + list(data["hashes"])
+                  + [data["set"], data["tagged"], ["x", "y"]])
+        probes = values + [
+            2, "abc", "ABC", {"a": 1, "b": ["x", "y"]}, ["y", "x"], {"p"},
+            {"a": 1}, [], {}]
+        for size in range(len(values) + 1):
+            members = values[:size]
+            nodes = FingerprintSet(members)
+            assert size == len(nodes)
+            for probe in probes:
+                assert (probe in members) == (probe in nodes)
+
+    def test_unhashable(self):
+        class Unhashable:
+            __hash__ = None
+            def __init__(self, value):
+                self.value = value
+            def __eq__(self, other):
+                return self.value == getattr(other, "value", None)
+
+        nodes = FingerprintSet([Unhashable(1)])
+        assert Unhashable(1) in nodes
+        assert Unhashable(2) not in nodes
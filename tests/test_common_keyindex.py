@@ -0,0 +1,57 @@
+import pytest
+
+from ruamel.yaml import YAML
+
+from yamlpath.common import KeyIndex
+
+
+class Test_common_keyindex():
+    """Tests for the KeyIndex class."""
+
+    @pytest.fixture
+    def data(self):
+        yaml = YAML()
+        return yaml.load("""---
+base: &base
+  image: nginx
+apps:
+  - name: web
+    spec: *base
+  - name: db
+    spec:
+      image: postgres
+  - name: cache
+tags: !!set
+  ? image
+  ? other
+""")
+
+    def test_lazy_build(self, data):
+        index = KeyIndex(data)
+        assert not index.is_built
+        assert {"base", "apps", "tags", "image", "name", "spec", "other"} == set(
+            index.keys())
+        assert index.is_built
+        assert 7 == len(index)
+
+        index.invalidate()
+        assert not index.is_built
+
+    def test_holders_of(self, data):
+        index = KeyIndex(data)
+        holders = index.holders_of("image")
+        apps = data["apps"]
+        assert {
+            id(data), id(data["base"]), id(apps), id(apps[0]), id(apps[1]),
+            id(apps[1]["spec"]), id(data["tags"]),
+        } == set(holders)
+        assert id(apps[2]) not in holders
+        assert holders is index.holders_of("image")
+        assert frozenset() == index.holders_of("no-such-key")
+        assert {id(data)} == set(index.holders_of("base", "apps"))
+
+    def test_is_indexed(self, data):
+        index = KeyIndex(data)
+        assert index.is_indexed(data["apps"][2])
+        assert not index.is_indexed({"name": "cache"})
+        assert not index.is_indexed(data["apps"][2]["name"])
@@ -6,7 +6,7 @@ from yamlpath.enums import PathSearchKeywords
 from yamlpath.path import SearchKeywordTerms
 from yamlpath.common import KeywordSearches
 from yamlpath.exceptions import YAMLPathException
-from yamlpath import YAMLPath
+from yamlpath import TranslatedPath, YAMLPath
 
 class Test_common_keywordsearches():
     """Tests for the KeywordSearches helper class."""
@@ -46,6 +46,17 @@ class Test_common_keywordsearches():
             ))
         assert -1 < str(ex.value).find("has no child nodes")
 
+    def test_has_child_aoh_paths(self):
+        data = [{"abc": 1}, {"def": 2}, {"abc": 3}]
+        nodes = list(KeywordSearches.has_child(
+            data,
+            False,
+            ["abc"],
+            YAMLPath("/list[has_child(abc)]"),
+            translated_path=TranslatedPath("/list")
+        ))
+        assert ["/list[0]", "/list[2]"] == [str(n.path) for n in nodes]
+
 
     ###
     # name
@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 from datetime import date, datetime
 from types import SimpleNamespace
@@ -109,3 +111,71 @@ class Test_common_nodes():
     ])
     def test_wrap_type(self, value, checktype):
         assert isinstance(Nodes.wrap_type(value), checktype)
+
+    ###
+    # typed_value
+    ###
+    @pytest.mark.parametrize("value,typed", [
+        ("true", True),
+        ("FALSE", False),
+        ("8080", 8080),
+        ("-2.5", -2.5),
+        ("'quoted'", "quoted"),
+        ("None", None),
+        ("default", "default"),
+        ("1.2.3", "1.2.3"),
+        ("", ""),
+    ])
+    def test_typed_value(self, value, typed):
+        Nodes.clear_typed_value_cache()
+        for _ in range(2):
+            result = Nodes.typed_value(value)
+            assert result == typed
+            assert type(result) is type(typed)
+        info = Nodes.typed_value_cache_info()
+        assert info["hits"] == 1
+        assert info["misses"] == 1
+
+    def test_typed_value_keeps_nonliterals(self):
+        Nodes.clear_typed_value_cache()
+        first = PlainScalarString("default")
+        second = PlainScalarString("default")
+        assert Nodes.typed_value(first) is first
+        assert Nodes.typed_value(second) is second
+
+    def test_typed_value_does_not_share_containers(self):
+        Nodes.clear_typed_value_cache()
+        first = Nodes.typed_value("[1, 2]")
+        first.append(3)
+        assert Nodes.typed_value("[1, 2]") == [1, 2]
+
+    def test_typed_value_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(Nodes, "TYPED_VALUE_CACHE_SIZE", 2)
+        Nodes.clear_typed_value_cache()
+        for value in ("1", "2", "3"):
+            Nodes.typed_value(value)
+        assert Nodes.typed_value_cache_info()["size"] == 2
+        Nodes.clear_typed_value_cache()
+
+    def test_typed_value_cache_threads(self, monkeypatch):
+        monkeypatch.setattr(Nodes, "TYPED_VALUE_CACHE_SIZE", 4)
+        Nodes.clear_typed_value_cache()
+        values = [str(value) for value in range(8)]
+        failures = []
+
+        def convert_values():
+            try:
+                for _ in range(200):
+                    for value in values:
+                        assert int(value) == Nodes.typed_value(value)
+            except Exception as ex:
+                failures.append(ex)
+
+        threads = [threading.Thread(target=convert_values) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert failures == []
+        assert Nodes.typed_value_cache_info()["size"] == 4
+        Nodes.clear_typed_value_cache()
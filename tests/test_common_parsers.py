@@ -17,7 +17,8 @@ else:                                         # pragma: no cover
     # From whence shall come AnchoredDate?
 
 from yamlpath.enums import YAMLValueFormats
-from yamlpath.common import Parsers
+from yamlpath.common import Parsers, PlainYAMLReader
+from tests.conftest import create_temp_yaml_file
 
 class Test_common_parsers():
     """Tests for the Parsers helper class."""
@@ -74,6 +75,99 @@ has: different data
             assert data["document"] == document
             assert data["has"] == has
 
+    ###
+    # get_yaml_reader
+    ###
+    def test_get_yaml_reader_loads_plain_data(self, quiet_logger):
+        serialized_yaml = """---
+hash:
+  key: value
+  when: 2022-02-22
+list: [ichi, 2, 3.5, true, ~]
+"""
+        yaml = Parsers.get_yaml_reader(fast=True)
+        assert isinstance(yaml, PlainYAMLReader)
+        (data, loaded) = Parsers.get_yaml_data(
+            yaml, quiet_logger, serialized_yaml, literal=True)
+        assert loaded == True
+        assert type(data) is dict
+        assert isinstance(data["hash"]["when"], AnchoredDate)
+        assert ["ichi", 2, 3.5, True, None] == data["list"]
+
+        # The result matches what the round-trip editor loads
+        (rt_data, _) = Parsers.get_yaml_data(
+            Parsers.get_yaml_reader(), quiet_logger, serialized_yaml,
+            literal=True)
+        assert isinstance(rt_data, ry.comments.CommentedMap)
+        assert (json.dumps(Parsers.jsonify_yaml_data(rt_data))
+                == json.dumps(Parsers.jsonify_yaml_data(data)))
+
+    @pytest.mark.parametrize("serialized_yaml", [
+        "anchored: &anchor value\naliased: *anchor\n",
+        "base: &base {key: value}\nchild:\n  <<: *base\n",
+        "tagged: !tag value\n",
+        "list: [&anchor value]\n",
+        "set: !!set {a, b}\n",
+    ])
+    def test_get_yaml_reader_round_trips_references(
+        self, quiet_logger, serialized_yaml
+    ):
+        assert not PlainYAMLReader.is_plain(serialized_yaml)
+        (data, loaded) = Parsers.get_yaml_data(
+            Parsers.get_yaml_reader(fast=True), quiet_logger,
+            serialized_yaml, literal=True)
+        assert loaded == True
+        assert isinstance(data, ry.comments.CommentedMap)
+
+    @pytest.mark.parametrize("serialized_yaml", [
+        "key: val&ue\nother: a*b!\n",
+        "key: 'single quoted'\n",
+        "url: http://example.com/*\n",
+    ])
+    def test_get_yaml_reader_plain_indicators(self, serialized_yaml):
+        assert PlainYAMLReader.is_plain(serialized_yaml)
+
+    @pytest.mark.parametrize("serialized_yaml", [
+        "key: value\nkey: other\n",
+        "key: [unclosed\n",
+        "key: value\n  bad: indent\n",
+    ])
+    def test_get_yaml_reader_reports_errors_like_editor(
+        self, capsys, tmp_path_factory, quiet_logger, serialized_yaml
+    ):
+        yaml_file = create_temp_yaml_file(tmp_path_factory, serialized_yaml)
+        outputs = []
+        for yaml in [
+            Parsers.get_yaml_editor(), Parsers.get_yaml_reader(fast=True)
+        ]:
+            (data, loaded) = Parsers.get_yaml_data(
+                yaml, quiet_logger, yaml_file)
+            assert (None, False) == (data, loaded)
+            outputs.append(capsys.readouterr().err)
+        assert yaml_file in outputs[0]
+        assert outputs[0] == outputs[1]
+
+    def test_get_yaml_reader_multidoc(self, capsys, quiet_logger):
+        yaml = Parsers.get_yaml_reader(fast=True)
+        documents = list(Parsers.get_yaml_multidoc_data(
+            yaml, quiet_logger, "---\na: 1\n---\nb: 2\n", literal=True))
+        assert [({"a": 1}, True), ({"b": 2}, True)] == documents
+        assert all(type(data) is dict for (data, _) in documents)
+
+        # Every document is round-tripped when any one needs it
+        documents = list(Parsers.get_yaml_multidoc_data(
+            yaml, quiet_logger, "---\na: 1\n---\nb: &b 2\n",
+            literal=True))
+        assert all(
+            isinstance(data, ry.comments.CommentedMap)
+            for (data, _) in documents)
+
+        # Documents preceding an error are still yielded
+        documents = list(Parsers.get_yaml_multidoc_data(
+            yaml, quiet_logger, "---\na: 1\n---\nb: [\n", literal=True))
+        assert [True, False] == [loaded for (_, loaded) in documents]
+        assert "YAML parsing error" in capsys.readouterr().err
+
     ###
     # stringify_dates
     ###
@@ -0,0 +1,90 @@
+import pytest
+
+from ruamel.yaml import YAML
+
+from yamlpath.common import QueryCache
+from yamlpath.wrappers import NodeCoords
+from yamlpath import CompiledYAMLPath
+
+
+class Test_common_querycache():
+    """Tests for the QueryCache class."""
+
+    @pytest.fixture
+    def data(self):
+        yaml = YAML()
+        return yaml.load("""---
+anchored: &anchor
+  key: value
+hosts:
+  - name: web
+  - name: db
+other:
+  key: value
+""")
+
+    @staticmethod
+    def coords_of(data, *keys):
+        parent = data
+        ancestry = []
+        for key in keys[:-1]:
+            ancestry.append((parent, key))
+            parent = parent[key]
+        ancestry.append((parent, keys[-1]))
+        return [NodeCoords(
+            parent[keys[-1]], parent, keys[-1], ancestry=ancestry)]
+
+    def test_hits_and_misses(self, data):
+        cache = QueryCache()
+        yaml_path = CompiledYAMLPath.compile("/other/key")
+        assert cache.get(yaml_path) is None
+        node_coords = self.coords_of(data, "other", "key")
+        cache.put(yaml_path, node_coords)
+        assert node_coords is cache.get(yaml_path)
+        assert 1 == len(cache)
+        assert {"hits": 1, "misses": 1, "size": 1, "maxsize": 256,
+                "version": 0} == cache.cache_info()
+
+    def test_any_change_stales_all(self, data):
+        cache = QueryCache()
+        yaml_path = CompiledYAMLPath.compile("/other/key")
+        cache.put(yaml_path, self.coords_of(data, "other", "key"))
+        cache.discard([], data["hosts"])
+        assert 1 == cache.version
+        assert cache.get(yaml_path) is None
+        assert 0 == len(cache)
+
+    @pytest.mark.parametrize("yaml_path,keys,changed,kept", [
+        ("/other/key", ("other", "key"), ("hosts",), True),
+        ("/other/key", ("other", "key"), ("other",), False),
+        ("/other/*", ("other", "key"), ("hosts",), False),
+        ("/hosts[1]/name", ("hosts", 1, "name"), ("other",), True),
+        ("/other/key", ("other", "key"), ("anchored",), False),
+        ("/other[key=value]", ("other",), ("hosts",), False),
+    ])
+    def test_selective(self, data, yaml_path, keys, changed, kept):
+        cache = QueryCache(selective=True)
+        yaml_path = CompiledYAMLPath.compile(yaml_path)
+        node_coords = self.coords_of(data, *keys)
+        cache.put(yaml_path, node_coords)
+        changed_node = data[changed[0]]
+        cache.discard([(data, changed[0])], changed_node, data)
+        assert (node_coords if kept else None) == cache.get(yaml_path)
+
+    def test_selective_empty_results(self, data):
+        cache = QueryCache(selective=True)
+        yaml_path = CompiledYAMLPath.compile("/other/missing")
+        cache.put(yaml_path, [])
+        cache.discard([(data, "hosts")], data["hosts"], data)
+        assert cache.get(yaml_path) is None
+
+    def test_maxsize(self, data):
+        cache = QueryCache(maxsize=2)
+        node_coords = self.coords_of(data, "other", "key")
+        for yaml_path in ("/a", "/b", "/c"):
+            cache.put(CompiledYAMLPath.compile(yaml_path), node_coords)
+        assert 2 == len(cache)
+        assert cache.get(CompiledYAMLPath.compile("/a")) is None
+
+        cache.invalidate()
+        assert 0 == len(cache)
@@ -0,0 +1,98 @@
+import pytest
+
+from yamlpath.common import QueryExplanation
+from yamlpath.enums import PathSegmentTypes
+from yamlpath.wrappers import NodeCoords
+from yamlpath import CompiledYAMLPath
+
+
+class Test_common_queryexplanation():
+    """Tests for the QueryExplanation class."""
+
+    def test_segments_mirror_yaml_path(self):
+        explanation = QueryExplanation(
+            CompiledYAMLPath.compile("/a/**/[1]/*"))
+        assert [
+            (PathSegmentTypes.KEY, "a"),
+            (PathSegmentTypes.TRAVERSE, "**"),
+            (PathSegmentTypes.INDEX, "[1]"),
+            (PathSegmentTypes.MATCH_ALL, "*"),
+        ] == [
+            (stats.segment_type, stats.segment)
+            for stats in explanation.segments]
+        assert all(
+            not stats.children for stats in explanation.segments)
+
+    def test_profile_counts_results(self):
+        yaml_path = CompiledYAMLPath.compile("/a")
+        explanation = QueryExplanation(yaml_path)
+        results = iter([1, 2, 3])
+        assert [1, 2] == [
+            result for (_, result)
+            in zip(range(2), explanation.profile(yaml_path, 0, results))]
+        stats = explanation.segments[0]
+        assert (1, 1, 2) == (stats.evaluations, stats.visited, stats.yielded)
+
+        # Abandoned results leave no segment under evaluation
+        explanation.visit(5)
+        assert 1 == stats.visited
+
+    def test_nested_segments_are_exclusive(self):
+        yaml_path = CompiledYAMLPath.compile("/a")
+        sub_path = CompiledYAMLPath.compile("/b/c")
+        explanation = QueryExplanation(yaml_path)
+
+        def inner():
+            yield NodeCoords(None, None, None)
+            yield NodeCoords(None, None, None)
+
+        def outer():
+            explanation.visit(2)
+            for node_coord in explanation.profile(sub_path, 1, inner()):
+                yield node_coord
+            yield NodeCoords(None, None, None)
+
+        assert 3 == len(list(explanation.profile(yaml_path, 0, outer())))
+        stats = explanation.segments[0]
+        assert (3, 3, 1) == (stats.visited, stats.yielded, stats.node_coords)
+        assert ["/b/c", "/b/c"] == [
+            child.yaml_path.original for child in stats.children]
+        nested = stats.children[1]
+        assert (1, 1, 2, 2) == (
+            nested.evaluations, nested.visited, nested.yielded,
+            nested.node_coords)
+        assert 0 == stats.children[0].evaluations
+
+    def test_counts_only_while_explaining(self):
+        yaml_path = CompiledYAMLPath.compile("/a")
+        explanation = QueryExplanation(yaml_path)
+
+        def handler():
+            yield NodeCoords(None, None, None)
+            NodeCoords(None, None, None)
+            yield NodeCoords(None, None, None)
+
+        created = NodeCoords.created
+        NodeCoords(None, None, None)
+        assert created == NodeCoords.created
+
+        results = explanation.profile(yaml_path, 0, handler())
+        next(results)
+        # Objects created between results belong to no segment
+        assert not NodeCoords.counting
+        NodeCoords(None, None, None)
+        assert created + 1 == NodeCoords.created
+        assert 1 == len(list(results))
+        assert not NodeCoords.counting
+        assert created + 3 == NodeCoords.created
+        assert 3 == explanation.segments[0].node_coords
+
+    def test_render(self):
+        yaml_path = CompiledYAMLPath.compile("/a[b=c]")
+        explanation = QueryExplanation(yaml_path)
+        explanation.matches = 4
+        lines = str(explanation).splitlines()
+        assert "Query:  /a[b=c]" == lines[0]
+        assert lines[1].startswith("Matches:  4 in ")
+        assert lines[2].startswith("  [0] KEY a:  evaluations=0, visited=0,")
+        assert lines[3].startswith("  [1] SEARCH [b=c]:")
@@ -96,6 +96,29 @@ class Test_common_searches():
     def test_search_matches(self, match, method, needle, haystack):
         assert match == Searches.search_matches(method, needle, haystack)
 
+    ###
+    # search_predicate
+    ###
+    @pytest.mark.parametrize("method, needle, haystacks, matches", [
+        (PathSearchMethods.EQUALS, "42", [42, "42", 42.0, "x"], [True, True, False, False]),
+        (PathSearchMethods.EQUALS, "true", [True, "True", 1, "x"], [True, True, False, False]),
+        (PathSearchMethods.EQUALS, "1", [True, 1, "1", 1.0], [True, True, True, False]),
+        (PathSearchMethods.EQUALS, "2.5", [2.5, "2.5", 2, "x"], [True, True, False, False]),
+        (PathSearchMethods.EQUALS, "abc", ["abc", "abcd", 1], [True, False, False]),
+        (PathSearchMethods.GREATER_THAN, "2", [3, 1.5, "3", "b"], [True, False, True, True]),
+        (PathSearchMethods.LESS_THAN, "b", [1, "a", "c"], [False, True, False]),
+        (PathSearchMethods.REGEX, "^a.c$", ["abc", "abcd", 1], [True, False, False]),
+    ])
+    def test_search_predicate(self, method, needle, haystacks, matches):
+        is_match = Searches.search_predicate(method, needle)
+        for haystack, match in zip(haystacks, matches):
+            assert match == is_match(haystack)
+            assert match == Searches.search_matches(method, needle, haystack)
+
+    def test_search_predicate_unknown_method(self):
+        with pytest.raises(NotImplementedError):
+            _ = Searches.search_predicate(None, "needle")
+
     ###
     # search_anchor
     ###
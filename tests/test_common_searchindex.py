@@ -0,0 +1,78 @@
+import pytest
+
+from ruamel.yaml import YAML
+
+from yamlpath.enums import PathSearchMethods
+from yamlpath.common import SearchIndex
+
+
+class Test_common_searchindex():
+    """Tests for the SearchIndex class."""
+
+    @pytest.fixture
+    def users(self):
+        yaml = YAML()
+        return yaml.load("""---
+- name: alice
+  id: 1
+- name: bob
+  id: 1.0
+- name: albert
+  id: "01"
+- nickname: al
+- name: 1
+  id: true
+""")
+
+    @pytest.mark.parametrize("attribute,method,term,candidates", [
+        ("name", PathSearchMethods.EQUALS, "alice", [0, 3]),
+        ("name", PathSearchMethods.EQUALS, "nobody", [3]),
+        ("name", PathSearchMethods.EQUALS, "1", [3, 4]),
+        ("name", PathSearchMethods.STARTS_WITH, "al", [0, 2, 3]),
+        ("name", PathSearchMethods.STARTS_WITH, "", [0, 1, 2, 3, 4]),
+        ("id", PathSearchMethods.EQUALS, "1", [0, 1, 3, 4]),
+        ("id", PathSearchMethods.EQUALS, "01", [2, 3]),
+        ("name", PathSearchMethods.CONTAINS, "b", None),
+    ])
+    def test_candidates(self, users, attribute, method, term, candidates):
+        index = SearchIndex()
+        assert candidates == index.candidates(users, attribute, method, term)
+
+    def test_reuse_and_discard(self, users):
+        yaml = YAML()
+        others = yaml.load("- name: carol\n")
+        index = SearchIndex()
+        index.candidates(users, "name", PathSearchMethods.EQUALS, "bob")
+        index.candidates(users, "id", PathSearchMethods.EQUALS, "1")
+        index.candidates(others, "name", PathSearchMethods.EQUALS, "carol")
+        assert 3 == len(index)
+
+        users[1]["name"] = "robert"
+        assert [1, 3] == index.candidates(
+            users, "name", PathSearchMethods.EQUALS, "bob")
+
+        index.discard([(users, 1)], users[1]["name"], users[1])
+        assert 1 == len(index)
+        assert [1, 3] == index.candidates(
+            users, "name", PathSearchMethods.EQUALS, "robert")
+
+        index.invalidate()
+        assert 0 == len(index)
+
+    def test_shared_elements(self):
+        yaml = YAML()
+        data = yaml.load("""---
+base: &base
+  name: alice
+users:
+  - *base
+others:
+  - name: carol
+""")
+        index = SearchIndex()
+        index.candidates(
+            data["users"], "name", PathSearchMethods.EQUALS, "alice")
+        index.candidates(
+            data["others"], "name", PathSearchMethods.EQUALS, "carol")
+        index.discard([(data, "base")], data["base"]["name"], data["base"])
+        assert 1 == len(index)
@@ -0,0 +1,133 @@
+import threading
+
+import pytest
+
+from yamlpath.exceptions import YAMLPathException
+from yamlpath.enums import PathSegmentTypes, PathSeparators
+from yamlpath import CompiledYAMLPath, YAMLPath
+
+class Test_CompiledYAMLPath():
+    """Tests for the CompiledYAMLPath class."""
+
+    def setup_method(self):
+        CompiledYAMLPath.clear_cache()
+
+    def teardown_method(self):
+        CompiledYAMLPath.CACHE_SIZE = 1024
+        CompiledYAMLPath.clear_cache()
+
+    @pytest.mark.parametrize("yamlpath,pathsep,output", [
+        ("", PathSeparators.AUTO, ""),
+        ("abc", PathSeparators.AUTO, "abc"),
+        ("/abc[1]", PathSeparators.AUTO, "/abc[1]"),
+        ("abc[!def^ghi]", PathSeparators.AUTO, "abc[def!^ghi]"),
+        (YAMLPath("abc.def"), PathSeparators.FSLASH, "/abc/def"),
+        (YAMLPath("abc.def"), PathSeparators.AUTO, "abc.def"),
+    ])
+    def test_str(self, yamlpath, pathsep, output):
+        assert output == str(CompiledYAMLPath.compile(yamlpath, pathsep))
+
+    def test_steps(self):
+        plan = CompiledYAMLPath.compile("/abc[1]/&def")
+        assert 3 == len(plan)
+        assert not plan.is_root
+        assert [
+            PathSegmentTypes.KEY, PathSegmentTypes.INDEX,
+            PathSegmentTypes.ANCHOR
+        ] == [step.segment_type for step in plan.steps]
+        assert ["abc", 1, "def"] == [step.stripped_attrs for step in plan.steps]
+        assert "def" == str(plan.steps[2])
+        assert plan.steps[1].unescaped == (PathSegmentTypes.INDEX, 1)
+        assert plan.steps[1].unstripped_attrs == 1
+
+    def test_root(self):
+        plan = CompiledYAMLPath.compile(None)
+        assert plan.is_root
+        assert 0 == len(plan.steps)
+
+    def test_matches_yamlpath(self):
+        yaml_path = YAMLPath(r"abc.'def.g\"h\"i'[ghi=~/^j/]")
+        plan = CompiledYAMLPath.compile(yaml_path)
+        assert tuple(yaml_path.escaped) == plan.escaped
+        assert tuple(yaml_path.unescaped) == plan.unescaped
+        assert yaml_path.separator == plan.separator
+        assert yaml_path.original == plan.original
+
+    def test_compile_passthrough(self):
+        plan = CompiledYAMLPath.compile("abc.def")
+        assert plan is CompiledYAMLPath.compile(plan)
+
+    def test_cache_hits(self):
+        first = CompiledYAMLPath.compile("abc.def")
+        second = CompiledYAMLPath.compile("abc.def")
+        third = CompiledYAMLPath.compile(YAMLPath("abc.def"))
+        assert first is second
+        assert first is third
+        info = CompiledYAMLPath.cache_info()
+        assert 1 == info["misses"]
+        assert 2 == info["hits"]
+        assert 1 == info["size"]
+
+    def test_cache_by_separator(self):
+        dotted = CompiledYAMLPath.compile(YAMLPath("abc"), PathSeparators.DOT)
+        slashed = CompiledYAMLPath.compile(
+            YAMLPath("abc"), PathSeparators.FSLASH)
+        assert dotted is not slashed
+        assert "/abc" == str(slashed)
+
+    def test_cache_eviction(self):
+        CompiledYAMLPath.CACHE_SIZE = 2
+        first = CompiledYAMLPath.compile("abc")
+        CompiledYAMLPath.compile("def")
+        CompiledYAMLPath.compile("abc")
+        CompiledYAMLPath.compile("ghi")
+        assert 2 == CompiledYAMLPath.cache_info()["size"]
+        assert first is CompiledYAMLPath.compile("abc")
+        assert 3 == CompiledYAMLPath.cache_info()["misses"]
+        CompiledYAMLPath.compile("def")
+        assert 4 == CompiledYAMLPath.cache_info()["misses"]
+
+    def test_cache_threads(self):
+        CompiledYAMLPath.CACHE_SIZE = 4
+        paths = ["/key{}".format(idx) for idx in range(8)]
+        failures = []
+
+        def compile_paths():
+            try:
+                for _ in range(200):
+                    for path in paths:
+                        assert path == str(CompiledYAMLPath.compile(path))
+            except Exception as ex:  # pylint: disable=broad-except
+                failures.append(ex)
+
+        threads = [threading.Thread(target=compile_paths) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert [] == failures
+        info = CompiledYAMLPath.cache_info()
+        assert 4 == info["size"]
+        assert 8 * 200 * 8 == info["hits"] + info["misses"]
+
+    def test_plan_is_independent_of_source(self):
+        yaml_path = YAMLPath("abc")
+        plan = CompiledYAMLPath.compile(yaml_path)
+        yaml_path.append("def")
+        assert "abc" == str(plan)
+        assert 1 == len(plan)
+
+    def test_yaml_path(self):
+        plan = CompiledYAMLPath.compile(
+            YAMLPath("abc.def"), PathSeparators.FSLASH)
+        yaml_path = plan.yaml_path
+        assert isinstance(yaml_path, YAMLPath)
+        assert "/abc/def" == str(yaml_path)
+
+    def test_repr(self):
+        assert "CompiledYAMLPath('abc', '.')" == repr(
+            CompiledYAMLPath.compile("abc"))
+
+    def test_bad_path(self):
+        with pytest.raises(YAMLPathException):
+            CompiledYAMLPath.compile("abc[")
@@ -11,7 +11,8 @@ from yamlpath.eyaml import EYAMLProcessor
 from yamlpath.wrappers import ConsolePrinter
 from yamlpath.eyaml.exceptions import EYAMLCommandException
 
-from tests.conftest import requireseyaml, quiet_logger, old_eyaml_keys
+from yamlpath.eyaml import EYAMLBackend
+from tests.conftest import requireseyaml, quiet_logger, old_eyaml_keys, stub_eyaml_binary
 
 
 @pytest.fixture
@@ -96,7 +97,7 @@ aliased::secrets:
 
 @pytest.fixture
 def force_subprocess_run_cpe(monkeypatch):
-    import yamlpath.eyaml.eyamlprocessor as break_module
+    import yamlpath.eyaml.eyamlbackend as break_module
 
     def fake_run(*args, **kwargs):
         raise CalledProcessError(42, "bad eyaml")
@@ -112,6 +113,18 @@ def force_no_access(monkeypatch):
 
     monkeypatch.setattr(break_module, "access", fake_access)
 
+class CountingBackend(EYAMLBackend):
+    """Reverse each value rather than running any eyaml command."""
+    def __init__(self):
+        self.batches = []
+
+    def run(self, cmd, value):
+        return value.decode("ascii")[::-1]
+
+    def run_many(self, cmd, values):
+        self.batches.append(values)
+        return super().run_many(cmd, values)
+
 class Test_eyaml_EYAMLProcessor():
     def test_find_eyaml_paths(self, quiet_logger, eyamldata_f):
         processor = EYAMLProcessor(quiet_logger, eyamldata_f)
@@ -249,3 +262,29 @@ class Test_eyaml_EYAMLProcessor():
     @requireseyaml
     def test_non_executable(self, old_eyaml_keys, force_no_access):
         assert EYAMLProcessor.get_eyaml_executable(str(old_eyaml_keys[0])) is None
+
+    def test_batch_with_stub_binary(self, quiet_logger, stub_eyaml_binary):
+        processor = EYAMLProcessor(quiet_logger, None, binary=stub_eyaml_binary)
+        encvals = processor.encrypt_eyaml_values(["one", "two", "ENC[...]"])
+        assert encvals == ["ENC[STUB,b25l]", "ENC[STUB,dHdv]", "ENC[...]"]
+
+        assert ["ENC[STUB,b25l]\n"] == processor.encrypt_eyaml_values(
+            ["one"], EYAMLOutputFormats.BLOCK)
+        assert processor.decrypt_eyaml_values([
+            "ENC[STUB,\n  b25l]", "plain", ["ENC[STUB,dHdv]", 5]
+        ]) == ["one", "plain", ["two", 5]]
+
+    def test_batch_backend(self, quiet_logger, stub_eyaml_binary):
+        backend = CountingBackend()
+        processor = EYAMLProcessor(
+            quiet_logger, None, binary=stub_eyaml_binary, backend=backend)
+        assert processor.decrypt_eyaml_values(
+            ["ENC[a]", "ENC[b]", "ENC[a]", "c"]
+        ) == ["]a[CNE", "]b[CNE", "]a[CNE", "c"]
+        assert backend.batches == [[b"ENC[a]", b"ENC[b]"]]
+
+    def test_batch_calledprocesserror(self, quiet_logger, stub_eyaml_binary):
+        processor = EYAMLProcessor(quiet_logger, None, binary=stub_eyaml_binary)
+        with pytest.raises(EYAMLCommandException) as ex:
+            processor.decrypt_eyaml_values(["ENC[STUB,b25l]", "ENC[bad]"])
+        assert -1 < str(ex.value).find("cannot be run due to exit code:  1")
@@ -13,6 +13,12 @@ class Test_path_SearchTerms():
 	def test_str(self, invert, method, attr, term, output):
 		assert output == str(SearchTerms(invert, method, attr, term))
 
+	def test_predicate(self):
+		terms = SearchTerms(True, PathSearchMethods.STARTS_WITH, "abc", "b")
+		assert terms.predicate is terms.predicate
+		assert terms.predicate("bcd")
+		assert not terms.predicate("abc")
+
 	# Disabled until Python matures enough to permit classes and types to play
 	# nicely together...
 	# def test_from_path_segment_attrs(self):
@@ -0,0 +1,83 @@
+import pytest
+
+from ruamel.yaml import YAML
+
+from yamlpath.func import unwrap_node_coords
+from yamlpath import CompiledYAMLPath, PathTrie, Processor
+
+
+class Test_PathTrie():
+    """Tests for the PathTrie class."""
+
+    def test_shared_prefixes(self):
+        trie = PathTrie()
+        plan = trie.insert("/spec/containers/name", "name")
+        trie.insert("/spec/containers/image", "image")
+        trie.insert("/spec", "spec")
+        trie.insert("/spec", "spec again")
+        assert isinstance(plan, CompiledYAMLPath)
+        assert 4 == len(trie)
+        assert 1 == len(trie.root.children)
+
+        spec = list(trie.root.children.values())[0]
+        assert ["spec", "spec again"] == spec.payloads
+        assert 1 == len(spec.children)
+        containers = list(spec.children.values())[0]
+        assert 2 == containers.segment_index
+        assert 2 == len(containers.children)
+
+    def test_lookahead_edges(self):
+        trie = PathTrie()
+        trie.insert("/**/name", 1)
+        trie.insert("/**/image", 2)
+        trie.insert("(/a)+(/b)", 3)
+        trie.insert("(/a)-(/b)", 4)
+        trie.insert("(/a)", 5)
+        # Traversals differ by their next segment; Collectors by their math
+        assert 5 == len(trie.root.children)
+        assert [1, 1, 2, 2, 1] == [
+            child.segment_index for child in trie.root.children.values()]
+
+    @pytest.mark.parametrize("yamlpath", [
+        "/", "/top/key", "/top/sub/*/name", "/top/sub[name==bob]/age",
+        "/**/key", "/**/name", "/**", "/top/*", "/top/sub[age>3]",
+        "/list[0]", "/list[&a1]", "/other/&topanc",
+        "(/top/sub/name)+(/other/deep/name)",
+        "(/top/sub/name)-(/top/sub[0]/name)", "(/top/sub/age)[0]",
+        "/top/sub[has_child(name)]", "/top/sub/items[0:1]",
+        "/top/sub/*/items[.>1]", "/other/**/name", "/top/sub/items[max()]",
+    ])
+    def test_matches_get_nodes(self, quiet_logger, yamlpath):
+        yaml = YAML()
+        data = yaml.load("""---
+aliases:
+  - &a1 val1
+top: &topanc
+  key: v
+  sub:
+    - name: alice
+      age: 3
+      items: [1, 2, 3]
+    - name: bob
+      age: 5
+      items: [4, 5]
+other:
+  <<: *topanc
+  key: w
+  deep:
+    name: carol
+list: [*a1, x]
+""")
+        processor = Processor(quiet_logger, data)
+        trie = PathTrie()
+        for yaml_path in ["/top/key", "/top/sub/name", "/**/name"]:
+            trie.insert(yaml_path, None)
+        trie.insert(yamlpath, yamlpath)
+
+        expected = [
+            (str(nc.path), unwrap_node_coords(nc))
+            for nc in processor.get_nodes(yamlpath, mustexist=True)]
+        assert expected == [
+            (str(nc.path), unwrap_node_coords(nc))
+            for (payload, nc) in processor._get_nodes_by_trie(data, trie.root)
+            if payload == yamlpath]
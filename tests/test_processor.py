@@ -1,3 +1,5 @@
+import tracemalloc
+
 import pytest
 from datetime import date, datetime
 from types import SimpleNamespace
@@ -2144,3 +2146,652 @@ minerals:
 
         diff = [x for x, y in zip(config.items(), expected.items()) if x != y]
         assert 0 == len(diff)
+
+    def test_document_index_tracks_changes(self, quiet_logger):
+        yamldata = """---
+base: &base
+  key: value
+target:
+  <<: *base
+  own: value
+list:
+  - plain
+"""
+        yaml = YAML()
+        data = yaml.load(yamldata)
+        processor = Processor(quiet_logger, data)
+        index = processor.document_index
+        assert index.data is data
+        assert list(index.anchors) == ["base"]
+        assert list(processor.get_nodes("target.&base"))[0].node is data["base"]
+
+        processor.alias_nodes("list[0]", "target.own", anchor_name="owned")
+        assert "owned" in index.anchors
+        assert data["list"][0] is data["target"]["own"]
+
+        processor.set_value("base.key", "new value")
+        assert index.anchors["base"] is data["base"]
+        assert data["base"]["key"] == "new value"
+
+        list(processor.delete_nodes("target.&base"))
+        assert 0 == len(data["target"].merge)
+
+        other = yaml.load("other: &other value")
+        processor.data = other
+        assert processor.document_index is not index
+        assert list(processor.document_index.anchors) == ["other"]
+
+    @pytest.mark.parametrize("index_references", [False, True])
+    def test_index_references_updates_aliases(self, quiet_logger, index_references):
+        yamldata = """---
+anchored: &anchor value
+list:
+  - *anchor
+  - plain
+hash:
+  alias: *anchor
+"""
+        yaml = YAML()
+        data = yaml.load(yamldata)
+        processor = Processor(quiet_logger, data)
+        processor.index_references = index_references
+        assert processor.index_references == index_references
+
+        processor.set_value("anchored", "new value")
+        assert data["anchored"] == "new value"
+        assert data["hash"]["alias"] is data["anchored"]
+        assert data["list"][0] == "value"
+
+        processor.set_value("list[1]", "changed")
+        processor.set_value("list[2]", "added")
+        processor.set_value("list[2]", "changed again")
+        assert data["list"] == ["value", "changed", "changed again"]
+        assert processor.document_index.has_references == index_references
+
+    @pytest.mark.parametrize("index_references", [False, True])
+    def test_set_value_beside_sets(self, quiet_logger, index_references):
+        yamldata = """---
+aset: !!set
+  ? one
+  ? two
+key: value
+"""
+        yaml = YAML()
+        data = yaml.load(yamldata)
+        processor = Processor(quiet_logger, data)
+        processor.index_references = index_references
+        processor.set_value("key", "changed")
+        processor.set_value("aset.one", "one")
+        assert data["key"] == "changed"
+        assert list(data["aset"]) == ["two", "one"]
+
+    @pytest.mark.parametrize("index_references", [False, True])
+    def test_apply_changes(self, quiet_logger, index_references):
+        yamldata = """---
+anchored: &anchor value
+list:
+  - *anchor
+  - plain
+hash:
+  alias: *anchor
+  key: value
+"""
+        yaml = YAML()
+        data = yaml.load(yamldata)
+        processor = Processor(quiet_logger, data)
+        processor.index_references = index_references
+        results = processor.apply_changes([
+            ("anchored", "new value"),
+            ("list[1]", "changed"),
+            ("/hash/key", "5", YAMLValueFormats.INT),
+            ("hash.new", "added", YAMLValueFormats.DEFAULT, "!tagged"),
+            ("list[1]", "changed again"),
+        ])
+        assert [1, 1, 1, 1, 1] == [len(result) for result in results]
+        assert "value" == results[0][0].node
+        assert data["anchored"] == "new value"
+        assert data["hash"]["alias"] is data["anchored"]
+        assert data["list"] == ["value", "changed again"]
+        assert data["hash"]["key"] == 5
+        assert data["hash"]["new"].tag.value == "!tagged"
+
+    def test_apply_changes_mustexist(self, quiet_logger):
+        yaml = YAML()
+        data = yaml.load("key: value\n")
+        processor = Processor(quiet_logger, data)
+        with pytest.raises(YAMLPathException) as ex:
+            processor.apply_changes(
+                [("key", "changed"), ("no_such_key", "added")],
+                mustexist=True)
+        assert -1 < str(ex.value).find("No nodes matched required YAML Path")
+        assert data == {"key": "value"}
+
+    def test_apply_changes_null_doc(self, quiet_logger):
+        processor = Processor(quiet_logger, None)
+        assert [[]] == processor.apply_changes([("key", "value")])
+
+    def test_get_nodes_many(self, quiet_logger):
+        yamldata = """---
+spec:
+  containers:
+    - name: web
+      image: nginx
+      ports: [80, 443]
+    - name: cache
+      image: redis
+      ports: [6379]
+"""
+        yaml = YAML()
+        data = yaml.load(yamldata)
+        processor = Processor(quiet_logger, data)
+        yaml_paths = [
+            "/spec/containers/*/name",
+            "spec.containers[name=cache].image",
+            "/spec/containers/*/ports/*",
+            "spec.containers.name",
+        ]
+        matches = {yaml_path: [] for yaml_path in yaml_paths}
+        for (yaml_path, node_coords) in processor.get_nodes_many(
+            yaml_paths, mustexist=True
+        ):
+            matches[yaml_path].append(node_coords.node)
+
+        for yaml_path in yaml_paths:
+            assert matches[yaml_path] == [
+                unwrap_node_coords(node_coords) for node_coords
+                in processor.get_nodes(yaml_path, mustexist=True)]
+        assert ["web", "cache"] == matches["/spec/containers/*/name"]
+        assert [80, 443, 6379] == matches["/spec/containers/*/ports/*"]
+
+    def test_get_nodes_many_missing(self, quiet_logger):
+        yaml = YAML()
+        data = yaml.load("key: value\n")
+        processor = Processor(quiet_logger, data)
+        with pytest.raises(YAMLPathException) as ex:
+            list(processor.get_nodes_many(
+                ["key", "no_such_key"], mustexist=True))
+        assert -1 < str(ex.value).find(
+            "Required YAML Path does not match any nodes")
+
+        results = list(processor.get_nodes_many(
+            ["key", "new_key"], default_value="added"))
+        assert ["key", "new_key"] == [path for (path, _) in results]
+        assert data["new_key"] == "added"
+
+    def test_get_nodes_many_null_doc(self, quiet_logger):
+        processor = Processor(quiet_logger, None)
+        assert [] == list(processor.get_nodes_many(["key"]))
+
+    @pytest.mark.parametrize("yaml_path,names", [
+        ("/users[name=alice]", ["alice"]),
+        ("/users[name==1]", ["1"]),
+        ("/users[name^al]", ["alice", "albert"]),
+        ("/users[name!=alice]", ["bob", "albert", "None", "1"]),
+        ("/users[name$ce]", ["alice"]),
+    ])
+    def test_index_searches(self, quiet_logger, yaml_path, names):
+        yamldata = """---
+users:
+  - name: alice
+  - name: bob
+  - name: albert
+  - nickname: al
+  - name: 1
+"""
+        yaml = YAML()
+        data = yaml.load(yamldata)
+        processor = Processor(quiet_logger, data)
+        processor.index_searches = True
+        for _ in range(2):
+            assert names == [
+                str(node_coords.node.get("name")) for node_coords
+                in processor.get_nodes(yaml_path, mustexist=True)]
+
+    def test_index_searches_track_changes(self, quiet_logger):
+        yamldata = """---
+base: &alice
+  name: alice
+users:
+  - *alice
+  - name: bob
+others:
+  - name: carol
+"""
+        yaml = YAML()
+        data = yaml.load(yamldata)
+        processor = Processor(quiet_logger, data)
+        processor.index_searches = True
+        assert processor.exists("/users[name=bob]")
+        assert processor.exists("/others[name=carol]")
+        assert 2 == len(processor.search_index)
+
+        processor.set_value("/base/name", "zed")
+        assert 1 == len(processor.search_index)
+        assert processor.exists("/users[name=zed]")
+
+        processor.set_value("/users[1]/name", "robert")
+        assert not processor.exists("/users[name=bob]")
+        assert processor.exists("/users[name=robert]")
+
+        list(processor.get_nodes("/users[2]/name", default_value="dave"))
+        assert processor.exists("/users[name=dave]")
+
+        list(processor.delete_nodes("/users[name=dave]"))
+        assert not processor.exists("/users[name=dave]")
+
+        processor.index_searches = False
+        assert 0 == len(processor.search_index)
+
+    @pytest.fixture
+    def counted_segments(self, quiet_logger, monkeypatch):
+        """Count how many segments a Processor evaluates."""
+        yaml = YAML()
+        data = yaml.load("""---
+hosts:
+  - name: web
+    healthy: true
+  - name: cache
+    healthy: true
+  - name: db
+    healthy: false
+""")
+        processor = Processor(quiet_logger, data)
+        counts = SimpleNamespace(segments=0)
+        evaluate = processor._get_nodes_by_path_segment
+
+        def count_segment(*args, **kwargs):
+            counts.segments += 1
+            return evaluate(*args, **kwargs)
+
+        monkeypatch.setattr(
+            processor, "_get_nodes_by_path_segment", count_segment)
+        return (processor, counts)
+
+    def test_exists_stops_at_first_match(self, counted_segments):
+        (processor, counts) = counted_segments
+        assert processor.exists("/hosts/**/healthy")
+        first_match = counts.segments
+
+        counts.segments = 0
+        assert 3 == processor.count("/hosts/**/healthy")
+        assert first_match < counts.segments
+
+    @pytest.mark.parametrize("yaml_path,first", [
+        ("/hosts/*/name", "web"),
+        ("hosts[healthy=false].name", "db"),
+        ("/hosts/*/no_such_key", None),
+    ])
+    def test_first(self, quiet_logger, counted_segments, yaml_path, first):
+        (processor, _) = counted_segments
+        node_coords = processor.first(yaml_path)
+        if first is None:
+            assert node_coords is None
+        else:
+            assert first == node_coords.node
+        assert Processor(quiet_logger, None).first(yaml_path) is None
+
+    @pytest.mark.parametrize("yaml_path,count", [
+        ("/hosts/*/name", 3),
+        ("hosts[healthy=true]", 2),
+        ("(/hosts/*/name)", 1),
+        ("/hosts/*/no_such_key", 0),
+    ])
+    def test_count(self, quiet_logger, counted_segments, yaml_path, count):
+        (processor, _) = counted_segments
+        assert count == processor.count(yaml_path)
+        assert 0 == Processor(quiet_logger, None).count(yaml_path)
+
+    @pytest.mark.parametrize("limit,offset,names", [
+        (None, 0, ["web", "cache", "db"]),
+        (2, 0, ["web", "cache"]),
+        (1, 1, ["cache"]),
+        (None, 2, ["db"]),
+        (5, 3, []),
+        (0, 0, []),
+    ])
+    @pytest.mark.parametrize("mustexist", [True, False])
+    def test_get_nodes_limit_offset(self, counted_segments, limit, offset, names, mustexist):
+        (processor, _) = counted_segments
+        assert names == [
+            node_coords.node for node_coords in processor.get_nodes(
+                "/hosts/*/name", mustexist=mustexist, limit=limit,
+                offset=offset)]
+
+    def test_get_nodes_limit_stops_early(self, counted_segments):
+        (processor, counts) = counted_segments
+        list(processor.get_nodes("/hosts/**/name", limit=1))
+        limited = counts.segments
+
+        counts.segments = 0
+        list(processor.get_nodes("/hosts/**/name"))
+        assert limited < counts.segments
+
+    def test_get_nodes_many_limit(self, counted_segments):
+        (processor, _) = counted_segments
+        results = list(processor.get_nodes_many(
+            ["/hosts/*/name", "/hosts/*/healthy"], limit=2))
+        assert ["web", "cache"] == [
+            node_coords.node for (path, node_coords) in results
+            if path == "/hosts/*/name"]
+        assert [True, True] == [
+            node_coords.node for (path, node_coords) in results
+            if path == "/hosts/*/healthy"]
+        assert [] == list(processor.get_nodes_many(
+            ["/hosts/*/name"], limit=0))
+
+    def test_search_skips_unmatched_descendants(self, quiet_logger):
+        yaml = YAML()
+        data = yaml.load("""---
+- name: alice
+- other: value
+""")
+        processor = Processor(quiet_logger, data)
+        assert [{"name": "alice"}] == [
+            node_coords.node for node_coords
+            in processor.get_nodes("/[name=alice]")]
+
+    @pytest.mark.parametrize("yaml_path", [
+        ("**"),
+        ("**.name"),
+        ("/hosts/**/port"),
+        ("hosts[name^web].**"),
+        ("**[.=~/^w/]"),
+        ("**.port[.>100]"),
+        ("**[&alias1]"),
+        ("/set/**"),
+        ("/empty/**"),
+        ("/merged/**"),
+        ("/*/**/name"),
+        ("(**.name)-(/hosts[port>100]/name)"),
+        ("(**.tags.**)[1]"),
+        ("/hosts[name=web1]/**[. = b]"),
+    ])
+    def test_iterative_engine(self, quiet_logger, yaml_path):
+        yamldata = """---
+aliases:
+  - &alias1 one
+hosts:
+  - name: web1
+    port: 80
+    tags: [a, b]
+  - name: web2
+    port: 8080
+    tags: [b, c]
+  - name: db1
+    nested: {deep: {name: x, port: 1}}
+merged:
+  <<: {name: base, port: 9}
+  extra: *alias1
+set: !!set {? p, ? q}
+empty:
+"""
+        yaml = YAML()
+        data = yaml.load(yamldata)
+        results = []
+        for iterative in (False, True):
+            processor = Processor(quiet_logger, data)
+            processor.iterative_engine = iterative
+            results.append([
+                (str(node_coords.translated_path),
+                 unwrap_node_coords(node_coords),
+                 node_coords.parentref,
+                 [ref for (_, ref) in node_coords.ancestry])
+                for node_coords
+                in processor.get_nodes(yaml_path, mustexist=True)])
+        assert results[0]
+        assert results[0] == results[1]
+
+    def test_iterative_engine_deep_document(self, quiet_logger):
+        import sys
+        depth = sys.getrecursionlimit() + 100
+        data = leaf = {}
+        for _ in range(depth):
+            leaf["child"] = {}
+            leaf = leaf["child"]
+        leaf["name"] = "bottom"
+
+        processor = Processor(quiet_logger, data)
+        with pytest.raises(RecursionError):
+            processor.count("**.name")
+
+        processor.iterative_engine = True
+        node_coords = processor.first("**.name")
+        assert "bottom" == node_coords.node
+        assert depth + 1 == len(node_coords.ancestry)
+        assert ["bottom"] == [
+            node_coords.node for node_coords in processor.get_nodes("**")]
+
+    @pytest.mark.parametrize("yaml_path,results", [
+        ("(/hashes)-(/remove)", [[{"id": 1, "v": "a"}, {"id": 3, "v": "c"}]]),
+        ("(/hashes)&(/remove)", [[{"id": 2, "v": "b"}]]),
+        ("(/scalars)-(/scalars[. =~ /^[bd]/])", [["a", 1.0]]),
+        ("(/scalars)&(/remove/*/v)", [["b", "b", "d"]]),
+        ("(/pair)-(/same/*/k)", [[{"v": 2}]]),
+    ])
+    def test_collector_set_math(self, quiet_logger, yaml_path, results):
+        yamldata = """---
+hashes:
+  - {id: 1, v: a}
+  - {id: 2, v: b}
+  - {id: 3, v: c}
+remove:
+  - {v: b, id: 2}
+  - {id: 4, v: d}
+scalars: [a, b, 1.0, b, d]
+pair: {k: 1, v: 2}
+same:
+  - {k: 1}
+  - {k: 1}
+"""
+        yaml = YAML()
+        processor = Processor(quiet_logger, yaml.load(yamldata))
+        assert results == [
+            unwrap_node_coords(node_coords) for node_coords
+            in processor.get_nodes(yaml_path, mustexist=True)]
+
+    @pytest.mark.parametrize("selective", [False, True])
+    def test_cache_queries(self, counted_segments, selective):
+        (processor, counts) = counted_segments
+        processor.cache_queries = True
+        processor.query_cache.selective = selective
+        names = ["web", "cache", "db"]
+        assert names == [
+            node_coords.node for node_coords
+            in processor.get_nodes("/hosts/*/name", mustexist=True)]
+        evaluated = counts.segments
+        assert 3 == processor.count("/hosts/*/name")
+        assert processor.exists("/hosts/*/name")
+        assert "web" == processor.first("/hosts/*/name").node
+        assert evaluated == counts.segments
+        assert 3 == processor.query_cache.hits
+        assert 1 == processor.query_cache.misses
+
+        processor.set_value("/hosts[1]/name", "memo")
+        assert ["web", "memo", "db"] == [
+            node_coords.node for node_coords
+            in processor.get_nodes("/hosts/*/name", mustexist=True)]
+        assert 2 == processor.query_cache.misses
+
+    def test_cache_queries_selective(self, quiet_logger):
+        yamldata = """---
+hosts:
+  - name: web1
+  - name: web2
+settings:
+  mode: fast
+"""
+        yaml = YAML()
+        processor = Processor(quiet_logger, yaml.load(yamldata))
+        processor.cache_queries = True
+        processor.query_cache.selective = True
+        for yaml_path in ("/settings/mode", "/hosts[1]/name",
+                          "/hosts[name^web]"):
+            assert processor.count(yaml_path)
+
+        processor.set_value("/hosts[0]/name", "web0")
+        assert "fast" == processor.first("/settings/mode").node
+        assert "web2" == processor.first("/hosts[1]/name").node
+        assert 2 == processor.query_cache.hits
+        assert 2 == processor.count("/hosts[name^web]")
+        assert 2 == processor.query_cache.hits
+
+        list(processor.delete_nodes("/hosts[0]"))
+        assert "fast" == processor.first("/settings/mode").node
+        assert processor.first("/hosts[1]/name") is None
+        assert 3 == processor.query_cache.hits
+
+    def test_cache_queries_only_complete_results(self, counted_segments):
+        (processor, _) = counted_segments
+        processor.cache_queries = True
+        assert processor.exists("/hosts/*/name")
+        assert 0 == len(processor.query_cache)
+        assert 3 == processor.count("/hosts/*/name")
+        assert 1 == len(processor.query_cache)
+
+        processor.cache_queries = False
+        assert 0 == len(processor.query_cache)
+
+    @pytest.mark.parametrize("iterative", [False, True])
+    def test_explain(self, counted_segments, iterative):
+        (processor, _) = counted_segments
+        processor.iterative_engine = iterative
+        explanation = processor.explain("/hosts[healthy=true]/name")
+        assert 2 == explanation.matches
+        assert ["hosts", "[healthy=true]", "name"] == [
+            stats.segment for stats in explanation.segments]
+        (hosts, search, name) = explanation.segments
+        assert PathSegmentTypes.SEARCH is search.segment_type
+        assert (1, 1, 1) == (hosts.evaluations, hosts.visited, hosts.yielded)
+        assert (1, 4, 2) == (
+            search.evaluations, search.visited, search.yielded)
+        assert (2, 2) == (name.evaluations, name.yielded)
+        assert 2 == search.node_coords
+        assert all(stats.elapsed >= 0.0 for stats in explanation.segments)
+        assert "[1] SEARCH [healthy=true]:" in str(explanation)
+
+        explanation = processor.explain("/hosts/**/name")
+        traversal = explanation.segments[1]
+        assert 1 + 3 + 6 == traversal.visited
+        assert 3 == explanation.matches
+
+    def test_explain_subpaths(self, counted_segments):
+        (processor, _) = counted_segments
+        explanation = processor.explain(
+            "(/hosts[healthy=true]/name)-(/hosts[0]/name)")
+        assert 1 == explanation.matches
+        collector = explanation.segments[0]
+        assert ["/hosts[healthy=true]/name", "/hosts[0]/name"] == list(
+            dict.fromkeys(
+                stats.yaml_path.original for stats in collector.children))
+        assert 6 == len(collector.children)
+        assert "Path:  /hosts[0]/name" in str(explanation)
+
+    def test_explain_leaves_document_unchanged(self, counted_segments):
+        (processor, _) = counted_segments
+        processor.cache_queries = True
+        explanation = processor.explain("/hosts/*/no_such_key")
+        assert 0 == explanation.matches
+        assert 0 == len(processor.query_cache)
+        assert processor._explanation is None
+        assert not processor.exists("/hosts/*/no_such_key")
+
+        processor.data = None
+        assert 0 == processor.explain("/hosts").matches
+
+    @pytest.mark.parametrize("iterative", [False, True])
+    @pytest.mark.parametrize("yaml_path", [
+        "/**/image",
+        "/apps/**/image",
+        "**.name",
+        "**.other",
+        "**.0",
+        "**.no_such_key",
+        "(/**/image)+(/**/tag)",
+    ])
+    def test_index_keys(self, quiet_logger, iterative, yaml_path):
+        yamldata = """---
+base: &base
+  image: nginx
+  tag: "1.0"
+apps:
+  - name: web
+    spec: *base
+  - name: db
+    spec:
+      <<: *base
+      image: postgres
+  - name: cache
+    env: [[a, b], [c]]
+tags: !!set
+  ? image
+  ? other
+"""
+        yaml = YAML()
+        plain = Processor(quiet_logger, yaml.load(yamldata))
+        indexed = Processor(quiet_logger, yaml.load(yamldata))
+        for processor in (plain, indexed):
+            processor.iterative_engine = iterative
+        indexed.index_keys = True
+
+        def matches(processor):
+            return [
+                (str(node_coords.path), unwrap_node_coords(node_coords))
+                for node_coords in processor.get_nodes(yaml_path)]
+        assert matches(plain) == matches(indexed)
+
+        visited = lambda processor: sum(
+            stats.visited for stats in processor.explain(yaml_path).segments)
+        assert visited(indexed) <= visited(plain)
+
+    def test_index_keys_prunes_and_invalidates(self, quiet_logger):
+        yamldata = """---
+apps:
+  - name: web
+    image: nginx
+  - name: db
+    env: {a: 1, b: 2}
+  - name: cache
+    env: {c: 3}
+"""
+        yaml = YAML()
+        processor = Processor(quiet_logger, yaml.load(yamldata))
+        processor.index_keys = True
+        explanation = processor.explain("/**/image")
+        assert 1 == explanation.matches
+        assert processor.key_index.is_built
+        traversal = explanation.segments[0]
+        assert 1 + 1 + 3 + 2 == traversal.visited
+
+        processor.set_value("/apps[2]/env/image", "redis")
+        assert not processor.key_index.is_built
+        assert ["nginx", "redis"] == [
+            node_coords.node for node_coords
+            in processor.get_nodes("/**/image", mustexist=True)]
+
+        processor.index_keys = False
+        assert not processor.key_index.is_built
+
+    @pytest.mark.parametrize("yaml_path", [
+        "/**",
+        "/charts/*/tags/*",
+        "/charts/*/meta/y/z",
+    ])
+    def test_result_memory(self, quiet_logger, yaml_path):
+        yamldata = "charts:\n" + "".join(
+            "  c{0}:\n    image: img{0}\n    tags: [a, b, c]\n"
+            "    meta: {{x: 1, y: {{z: 2}}}}\n".format(idx)
+            for idx in range(200))
+        yaml = YAML()
+        processor = Processor(quiet_logger, yaml.load(yamldata))
+        list(processor.get_nodes(yaml_path, mustexist=True))
+
+        # Bytes retained per result, including its rendered YAML Path
+        tracemalloc.start()
+        try:
+            results = list(processor.get_nodes(yaml_path, mustexist=True))
+            for node_coords in results:
+                assert node_coords.path is not None
+            retained = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        assert retained / len(results) < 1536
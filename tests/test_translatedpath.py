@@ -0,0 +1,63 @@
+import pytest
+
+from yamlpath.exceptions import YAMLPathException
+from yamlpath.enums import PathSeparators
+from yamlpath import TranslatedPath, YAMLPath
+
+class Test_TranslatedPath():
+    """Tests for the TranslatedPath class."""
+
+    @pytest.mark.parametrize("root,segments", [
+        ("", []),
+        ("", ["abc"]),
+        ("", ["[0]", "abc"]),
+        ("", ["/abc", "def"]),
+        ("", [" ", "abc"]),
+        ("abc", ["def", "[1]", "ghi"]),
+        ("/abc", ["def", "[1]", "ghi"]),
+        (YAMLPath("abc.def"), ["[&ghi]", "jkl"]),
+        (None, ["abc", r"d\.ef"]),
+    ])
+    def test_matches_yamlpath_add(self, root, segments):
+        expected = YAMLPath(root)
+        actual = TranslatedPath(root)
+        for segment in segments:
+            expected = expected + segment
+            actual = actual + segment
+            assert expected.separator == actual.separator
+        assert expected.original == actual.original
+        assert str(expected) == str(actual)
+        assert expected == actual.yaml_path
+
+    def test_shares_parents(self):
+        root = TranslatedPath("abc")
+        left = root + "[0]"
+        right = root + "[1]"
+        assert left.parent is root
+        assert right.parent is root
+        assert "abc[0]" == str(left)
+        assert "abc[1]" == str(right)
+        assert "abc" == str(root)
+
+    def test_renders_lazily_once(self):
+        path = TranslatedPath() + "abc" + "def"
+        assert path.yaml_path is path.yaml_path
+        assert "abc.def" == path.original
+
+    def test_parent_of_root(self):
+        path = TranslatedPath("/abc/def")
+        assert "/abc" == str(path.parent)
+        assert "/abc/def" == str(path)
+
+    def test_parent_beyond_root(self):
+        with pytest.raises(YAMLPathException):
+            _ = TranslatedPath("").parent
+
+    def test_separator(self):
+        assert PathSeparators.AUTO == TranslatedPath().separator
+        assert PathSeparators.DOT == (TranslatedPath() + "abc").separator
+        assert PathSeparators.FSLASH == (TranslatedPath("/abc") + "d").separator
+
+    def test_repr(self):
+        assert "TranslatedPath('abc.def')" == repr(
+            TranslatedPath("abc") + "def")
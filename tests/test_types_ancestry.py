@@ -0,0 +1,59 @@
+import pytest
+
+from yamlpath.types import Ancestry
+
+class Test_types_Ancestry():
+    """Tests for the Ancestry class."""
+
+    def test_empty(self):
+        ancestry = Ancestry()
+        assert 0 == len(ancestry)
+        assert [] == ancestry.to_list()
+        assert [] == list(ancestry)
+        assert ancestry == []
+
+    def test_add_does_not_mutate(self):
+        base = Ancestry() + [("root", None)]
+        left = base + [("left", 0)]
+        right = base + [("right", 1)]
+        assert 1 == len(base)
+        assert [("root", None), ("left", 0)] == left.to_list()
+        assert [("root", None), ("right", 1)] == right.to_list()
+        assert left.tail is base
+        assert right.tail is base
+
+    def test_indexing(self):
+        ancestry = Ancestry() + [("a", 1), ("b", 2), ("c", 3), ("d", 4)]
+        assert ("a", 1) == ancestry[0]
+        assert ("b", 2) == ancestry[1]
+        assert ("c", 3) == ancestry[-2]
+        assert ("d", 4) == ancestry[-1]
+        assert ("d", 4) == ancestry.head
+        assert [("b", 2), ("c", 3)] == ancestry[1:3]
+
+    @pytest.mark.parametrize("index", [4, -5])
+    def test_bad_index(self, index):
+        ancestry = Ancestry() + [("a", 1), ("b", 2), ("c", 3), ("d", 4)]
+        with pytest.raises(IndexError):
+            _ = ancestry[index]
+
+    def test_empty_head_and_tail(self):
+        with pytest.raises(IndexError):
+            _ = Ancestry().head
+        with pytest.raises(IndexError):
+            _ = Ancestry().tail
+
+    def test_equality(self):
+        entries = [("a", 1), ("b", 2)]
+        assert Ancestry() + entries == Ancestry.from_entries(entries)
+        assert Ancestry() + entries == entries
+        assert Ancestry() + entries != entries[:1]
+        assert Ancestry() + entries != "ab"
+
+    def test_from_entries(self):
+        ancestry = Ancestry() + [("a", 1)]
+        assert ancestry is Ancestry.from_entries(ancestry)
+        assert 0 == len(Ancestry.from_entries(None))
+
+    def test_repr(self):
+        assert "Ancestry() + [('a', 1)]" == repr(Ancestry() + [("a", 1)])
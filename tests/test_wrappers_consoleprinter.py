@@ -223,6 +223,47 @@ class Test_wrappers_ConsolePrinter():
         console = capsys.readouterr()
         assert not console.out
 
+    @pytest.mark.parametrize("quiet,debug,enabled", [
+        (False, False, False),
+        (False, True, True),
+        (True, True, False),
+        (True, False, False),
+    ])
+    def test_is_debug_enabled(self, quiet, debug, enabled):
+        args = SimpleNamespace(verbose=False, quiet=quiet, debug=debug)
+        logger = ConsolePrinter(args)
+        assert enabled == logger.is_debug_enabled
+
+    def test_debug_deferred_format(self, capsys):
+        args = SimpleNamespace(verbose=False, quiet=False, debug=True)
+        logger = ConsolePrinter(args)
+        logger.debug("Test {} of {}", 1, "many", prefix="test:  ")
+        console = capsys.readouterr()
+        assert console.out == "DEBUG:  test:  Test 1 of many\n"
+
+    def test_debug_callable(self, capsys):
+        args = SimpleNamespace(verbose=False, quiet=False, debug=True)
+        logger = ConsolePrinter(args)
+        logger.debug(lambda: "Test")
+        console = capsys.readouterr()
+        assert console.out == "DEBUG:  Test\n"
+
+    def test_debug_off_is_lazy(self, capsys):
+        args = SimpleNamespace(verbose=False, quiet=False, debug=False)
+        logger = ConsolePrinter(args)
+
+        class Unprintable:
+            def __str__(self):
+                raise AssertionError("must not be formatted")
+
+        def unrenderable():
+            raise AssertionError("must not be called")
+
+        logger.debug("Test {}", Unprintable())
+        logger.debug(unrenderable)
+        console = capsys.readouterr()
+        assert not console.out
+
     def test_warning_noisy(self, capsys):
         args = SimpleNamespace(verbose=False, quiet=False, debug=False)
         logger = ConsolePrinter(args)
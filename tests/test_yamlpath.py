@@ -1,9 +1,58 @@
+import ast
+import random
+from pathlib import Path
+
 import pytest
 
 from yamlpath.exceptions import YAMLPathException
 from yamlpath.enums import PathSegmentTypes, PathSeparators
 from yamlpath import YAMLPath
 
+
+# Fragments from which to fuzz YAML Paths, favoring those the scanner accepts
+FUZZ_FRAGMENTS = [
+    "/", "/", ".", ".", "a", "b", "bc", "1", "-", ":", "*", "**", "=", "==",
+    "!", "^", "$", "%", ">", "<", ">=", "<=", "~", "[", "]", "[0]", "[-1]",
+    "[1:3]", "[a=b]", "[a!=b]", "[.^x]", "[a>=1]", "[&a]", "&", "(", ")",
+    "(a)", "+", "'", '"', " ", "\\", "[has_child(a)]", "=~/x/", "\t", "#",
+    "{", ",",
+]
+
+
+def parse_outcome(parse, *args):
+    """Get comparable segments -- or the error -- of a YAML Path parse."""
+    try:
+        segments = parse(*args)
+    except (YAMLPathException, IndexError) as ex:
+        return (type(ex), str(ex))
+    if segments is None:
+        return None
+    return [
+        (segment_type, attrs if isinstance(attrs, (str, int, type(None)))
+         else (type(attrs), str(attrs), getattr(attrs, "attribute", None),
+               getattr(attrs, "term", None)))
+        for (segment_type, attrs) in segments]
+
+
+def fuzzed_paths(count, seed):
+    """Generate random YAML Paths."""
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice(FUZZ_FRAGMENTS) for _ in range(rng.randint(1, 8)))
+        for _ in range(count)]
+
+
+def corpus_paths():
+    """Get every short, single-line string in the test suite."""
+    strings = set()
+    for test_file in Path(__file__).parent.glob("*.py"):
+        for node in ast.walk(ast.parse(test_file.read_text())):
+            if (isinstance(node, ast.Constant) and isinstance(node.value, str)
+                    and node.value.strip() and "\n" not in node.value
+                    and len(node.value) < 200):
+                strings.add(node.value)
+    return sorted(strings)
+
 class Test_YAMLPath():
     """Tests for the Path class."""
 
@@ -76,6 +125,36 @@ class Test_YAMLPath():
         else:
             assert not lhs == rhs
 
+    @pytest.mark.parametrize("lhs,rhs,iseq", [
+        ("", "/", True),
+        ("abc.def", "/abc/def", True),
+        ("abc[def==1]", "/abc[def=1]", True),
+        ("abc.'d e f'", r"/abc/d\ e\ f", True),
+        ("abc.def", "/abc/def/ghi", False),
+        ("abc.def/ghi", "/abc/def/ghi", False),
+    ])
+    def test_hash(self, lhs, rhs, iseq):
+        lhs_path = YAMLPath(lhs)
+        rhs_path = YAMLPath(rhs)
+        assert iseq == (hash(lhs_path) == hash(rhs_path))
+        assert iseq == (rhs_path in {lhs_path: None})
+        assert iseq == (len({lhs_path, rhs_path}) == 1)
+
+    def test_hash_follows_changes(self):
+        yp = YAMLPath("abc")
+        assert hash(yp) == hash(YAMLPath("/abc"))
+        yp.append("def")
+        assert yp == "/abc/def"
+        assert hash(yp) == hash(YAMLPath("/abc/def"))
+        yp.pop()
+        assert hash(yp) == hash(YAMLPath("/abc"))
+
+        # Only the original YAML Path determines equivalence
+        yp = YAMLPath("abc.def")
+        yp.separator = PathSeparators.FSLASH
+        assert yp == YAMLPath("/abc/def")
+        assert hash(yp) == hash(YAMLPath("/abc/def"))
+
     @pytest.mark.parametrize("lhs,rhs,isne", [
         (YAMLPath(""), YAMLPath(""), False),
         (YAMLPath(""), "", False),
@@ -231,3 +310,48 @@ class Test_YAMLPath():
             for _ in range(5):
                 yp.pop()
         assert -1 < str(ex.value).find("Cannot pop when")
+
+    def test_scanner_matches_parser_on_corpus(self):
+        scanned = 0
+        for path in corpus_paths():
+            yp = YAMLPath(path)
+            fast = parse_outcome(
+                YAMLPath._scan_simple_path, path, path, str(yp.separator))
+            if fast is None:
+                continue
+            scanned += 1
+            assert fast == parse_outcome(yp._parse_path_by_char, True), path
+        assert scanned > 500
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_parse_matches_parser_on_fuzzed_paths(self, seed):
+        for path in fuzzed_paths(2500, seed):
+            for pathsep in (PathSeparators.AUTO, PathSeparators.FSLASH):
+                expect = YAMLPath(path, pathsep)
+                actual = YAMLPath(path, pathsep)
+                assert (
+                    parse_outcome(expect._parse_path_by_char, True)
+                    == parse_outcome(lambda: actual.escaped)), path
+                assert (
+                    parse_outcome(expect._parse_path_by_char, False)
+                    == parse_outcome(lambda: actual.unescaped)), path
+
+    @pytest.mark.parametrize("seed", range(2))
+    def test_append_matches_parser_on_fuzzed_paths(self, seed):
+        paths = fuzzed_paths(2000, seed)
+        for (path, segment) in zip(paths, reversed(paths)):
+            appended = YAMLPath(path)
+            try:
+                appended.escaped
+                appended.unescaped
+            except (YAMLPathException, IndexError):
+                continue
+            appended.append(segment)
+            expect = YAMLPath(appended.original)
+            assert (
+                parse_outcome(expect._parse_path_by_char, True)
+                == parse_outcome(lambda: appended.escaped)), appended.original
+            assert (
+                parse_outcome(expect._parse_path_by_char, False)
+                == parse_outcome(lambda: appended.unescaped)
+            ), appended.original
@@ -1,6 +1,34 @@
 """Core YAML Path classes."""
+from importlib import import_module
+from typing import Any, TYPE_CHECKING
+
 # Establish the version number common to all components
-__version__ = "3.8.2"
+__version__ = "3.9.0"
+
+# The core classes are imported upon first use so light-weight entry points,
+# like the yamlpath-server client, needn't import ruamel.yaml
+_CORE_CLASSES = {
+    "YAMLPath": "yamlpath.yamlpath",
+    "CompiledYAMLPath": "yamlpath.compiledyamlpath",
+    "TranslatedPath": "yamlpath.translatedpath",
+    "PathTrie": "yamlpath.pathtrie",
+    "Processor": "yamlpath.processor",
+}
+__all__ = list(_CORE_CLASSES)
+
+if TYPE_CHECKING:
+    from yamlpath.yamlpath import YAMLPath
+    from yamlpath.compiledyamlpath import CompiledYAMLPath
+    from yamlpath.translatedpath import TranslatedPath
+    from yamlpath.pathtrie import PathTrie
+    from yamlpath.processor import Processor
+
 
-from yamlpath.yamlpath import YAMLPath
-from yamlpath.processor import Processor
+def __getattr__(name: str) -> Any:
+    """Import each core class upon first use."""
+    if name not in _CORE_CLASSES:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(import_module(_CORE_CLASSES[name]), name)
+    globals()[name] = value
+    return value
@@ -1,4 +1,20 @@
-"""Make all of the command APIs available."""
-from yamlpath.commands import eyaml_rotate_keys
-from yamlpath.commands import yaml_get
-from yamlpath.commands import yaml_set
+"""
+Make all of the command APIs available.
+
+Each command module is imported only upon first use so that the thin client
+of yamlpath-server can start without importing any of them.
+"""
+from importlib import import_module
+from typing import Any
+
+__all__ = ["eyaml_rotate_keys", "yaml_get", "yaml_set"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a command module upon first use."""
+    if name not in __all__:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name))
+    module = import_module("yamlpath.commands." + name)
+    globals()[name] = module
+    return module
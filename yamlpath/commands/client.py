@@ -0,0 +1,172 @@
+"""
+Run the yamlpath console scripts, via yamlpath-server when one is running.
+
+When the YAMLPATH_SERVER environment variable names the socket of a running
+yamlpath-server, each console script hands its command-line, working
+directory, and -- only when the command reads it -- STDIN to that server and
+then reproduces the output and exit code of the command as the server ran
+it.  The server keeps parsed documents and compiled YAML Paths in memory, so
+the many short-lived invocations of a script or build pipeline each skip the
+cost of starting Python, importing ruamel.yaml, and parsing unchanged files.
+Otherwise -- or when no server answers -- the command runs locally just as it
+always has.  This module imports nothing beyond the Python standard library
+so that it starts as quickly as possible.
+
+Copyright 2022 William W. Kimball, Jr. MBA MSIS
+"""
+import json
+import os
+import socket
+import sys
+from importlib import import_module
+from typing import Any, Dict, List, Optional
+
+# The environment variable naming the socket of a running yamlpath-server
+SERVER_ENV = "YAMLPATH_SERVER"
+
+# The module of each console script which yamlpath-server can run
+COMMANDS = {
+    "eyaml-rotate-keys": "eyaml_rotate_keys",
+    "yaml-diff": "yaml_diff",
+    "yaml-get": "yaml_get",
+    "yaml-merge": "yaml_merge",
+    "yaml-paths": "yaml_paths",
+    "yaml-set": "yaml_set",
+    "yaml-validate": "yaml_validate",
+}
+
+def send_message(stream: Any, message: Dict[str, Any]) -> None:
+    """
+    Send one message, as a line of JSON, to the other end of a connection.
+
+    Parameters:
+    1. stream (Any) The binary file-like view of the connection
+    2. message (Dict[str, Any]) The message to send
+
+    Returns:  N/A
+
+    Raises:
+        - `OSError` when the connection is lost
+    """
+    stream.write(json.dumps(message).encode("utf-8") + b"\n")
+    stream.flush()
+
+def receive_message(stream: Any) -> Optional[Dict[str, Any]]:
+    """
+    Receive one message, as a line of JSON, from the other end of a connection.
+
+    Parameters:
+    1. stream (Any) The binary file-like view of the connection
+
+    Returns:  (Optional[Dict[str, Any]]) The message or None when the other
+        end has closed the connection
+
+    Raises:
+        - `OSError` when the connection is lost
+        - `ValueError` when the message is not valid JSON
+    """
+    line = stream.readline()
+    if not line:
+        return None
+    message: Dict[str, Any] = json.loads(line.decode("utf-8"))
+    return message
+
+def forward(server: str, command: str, argv: List[str]) -> Optional[int]:
+    """
+    Run a command on a yamlpath-server.
+
+    The output of the command is written to STDOUT and STDERR.
+
+    Parameters:
+    1. server (str) The socket of the server
+    2. command (str) The name of the console script to run
+    3. argv (List[str]) The command-line arguments of the command
+
+    Returns:  (Optional[int]) The exit code of the command or None when no
+        server answers at the socket, in which case the command has not run
+
+    Raises:  N/A
+    """
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(server)
+    except OSError:
+        connection.close()
+        return None
+
+    with connection, connection.makefile("rwb") as stream:
+        try:
+            send_message(stream, {
+                "command": command,
+                "argv": argv,
+                "cwd": os.getcwd(),
+                "isatty": sys.stdin is None or sys.stdin.isatty(),
+            })
+            message = receive_message(stream)
+            while message is not None and "exit" not in message:
+                # The command is reading STDIN
+                send_message(stream, {
+                    "stdin": "" if sys.stdin is None else sys.stdin.read()})
+                message = receive_message(stream)
+        except (OSError, ValueError):
+            message = None
+
+    # The command may have partially run, so it must not be run again
+    if message is None:
+        print("yamlpath-server at {} ended the connection before {} finished."
+              .format(server, command), file=sys.stderr)
+        return 1
+
+    sys.stdout.write(message["stdout"])
+    sys.stdout.flush()
+    sys.stderr.write(message["stderr"])
+    sys.stderr.flush()
+    exit_code: int = message["exit"]
+    return exit_code
+
+def run(command: str) -> None:
+    """
+    Run a console script, via yamlpath-server when one is running.
+
+    Parameters:
+    1. command (str) The name of the console script to run
+
+    Returns:  N/A
+
+    Raises:
+        - `SystemExit` with the exit code of the command
+    """
+    server = os.environ.get(SERVER_ENV)
+    if server:
+        exit_code = forward(server, command, sys.argv[1:])
+        if exit_code is not None:
+            sys.exit(exit_code)
+    import_module("yamlpath.commands." + COMMANDS[command]).main()
+
+def eyaml_rotate_keys() -> None:
+    """Run eyaml-rotate-keys."""
+    run("eyaml-rotate-keys")
+
+def yaml_diff() -> None:
+    """Run yaml-diff."""
+    run("yaml-diff")
+
+def yaml_get() -> None:
+    """Run yaml-get."""
+    run("yaml-get")
+
+def yaml_merge() -> None:
+    """Run yaml-merge."""
+    run("yaml-merge")
+
+def yaml_paths() -> None:
+    """Run yaml-paths."""
+    run("yaml-paths")
+
+def yaml_set() -> None:
+    """Run yaml-set."""
+    run("yaml-set")
+
+def yaml_validate() -> None:
+    """Run yaml-validate."""
+    run("yaml-validate")
@@ -8,6 +8,7 @@ Copyright 2018, 2019 William W. Kimball, Jr. MBA MSIS
 """
 import sys
 import argparse
+from functools import partial
 from shutil import copy2
 from os import remove, access, R_OK
 from os.path import isfile, exists
@@ -15,8 +16,9 @@ from os.path import isfile, exists
 from ruamel.yaml.scalarstring import FoldedScalarString
 
 from yamlpath import __version__ as YAMLPATH_VERSION
-from yamlpath.common import Anchors, Parsers
+from yamlpath.common import Anchors, FilePool, Parsers
 from yamlpath.eyaml.exceptions import EYAMLCommandException
+from yamlpath.enums import YAMLValueFormats
 from yamlpath.eyaml.enums import EYAMLOutputFormats
 from yamlpath.eyaml import EYAMLProcessor
 from yamlpath.wrappers import ConsolePrinter
@@ -53,6 +55,9 @@ def processcli():
     parser.add_argument("-x", "--eyaml", default="eyaml",
                         help="the eyaml binary to use when it isn't on the"
                         + " PATH")
+    parser.add_argument("-j", "--jobs", metavar="N", type=int, default=1,
+                        help="rotate the keys of up to N files at once, each"
+                        + " in its own process; 0 = one per CPU; default=1")
 
     key_group = parser.add_argument_group(
         "EYAML_KEYS", "All key arguments are required"
@@ -92,110 +97,167 @@ def validateargs(args, log):
                 "EYAML key is not a readable file:  " + check_file
             )
 
+    # * --jobs must not be negative
+    if args.jobs < 0:
+        has_errors = True
+        log.error("The --jobs value must be zero or a positive integer.")
+
     if has_errors:
         sys.exit(1)
 
-# pylint: disable=locally-disabled,too-many-locals,too-many-branches,too-many-statements
-def main():
-    """Perform the work specified via CLI arguments and exit.
-
-    Main code.
+def _run_batch(log, batch_call, single_call, values):
     """
-    # Process any command-line arguments
-    args = processcli()
-    log = ConsolePrinter(args)
-    validateargs(args, log)
-    processor = EYAMLProcessor(log, None, binary=args.eyaml)
+    Run an EYAML batch operation, isolating the failures when it fails.
 
-    # Prep the YAML parser
-    yaml = Parsers.get_yaml_editor()
+    Returns a tuple of the results -- None for each value which could not be
+    processed -- and whether all values were processed.
+    """
+    try:
+        return (batch_call(values), True)
+    except EYAMLCommandException:
+        # Retry the values one at a time to report only those which fail
+        results = []
+        all_ok = True
+        for value in values:
+            try:
+                results.append(single_call(value))
+            except EYAMLCommandException as ex:
+                log.error(ex)
+                results.append(None)
+                all_ok = False
+        return (results, all_ok)
 
-    # Process the input file(s)
-    in_file_count = len(args.yaml_files)
+# pylint: disable=locally-disabled,too-many-locals,too-many-branches,too-many-statements
+def process_file(args, log, processor, yaml, yaml_file):
+    """Rotate the EYAML keys of every value within one YAML file."""
     exit_state = 0
-    for yaml_file in args.yaml_files:
-        file_changed = False
-        backup_file = yaml_file + ".bak"
-        seen_anchors = []
-
-        # Each YAML_FILE must actually be a file
-        if not isfile(yaml_file):
-            log.error("Not a file:  {}".format(yaml_file))
-            exit_state = 2
-            continue
-
-        # Don't bother with the file change update when there's only one input
-        # file.
-        if in_file_count > 1:
-            log.info("Processing {}...".format(yaml_file))
+    file_changed = False
+    backup_file = yaml_file + ".bak"
+    seen_anchors = []
+
+    # Each YAML_FILE must actually be a file
+    if not isfile(yaml_file):
+        log.error("Not a file:  {}".format(yaml_file))
+        return 2
+
+    # Don't bother with the file change update when there's only one input
+    # file.
+    if len(args.yaml_files) > 1:
+        log.info("Processing {}...".format(yaml_file))
+
+    # Try to open the file
+    (yaml_data, doc_loaded) = Parsers.get_yaml_data(yaml, log, yaml_file)
+    if not doc_loaded:
+        # An error message has already been logged
+        return 3
+
+    # Gather all EYAML values
+    processor.data = yaml_data
+    rotations = []
+    for yaml_path in processor.find_eyaml_paths():
+        # Use ::get_nodes() instead of ::get_eyaml_values() here in order
+        # to ignore values that have already been rotated via their
+        # Anchors.
+        for node_coordinate in processor.get_nodes(
+            yaml_path, mustexist=True
+        ):
+            # Ignore values which are Aliases for those already decrypted
+            node = node_coordinate.node
+            anchor_name = Anchors.get_node_anchor(node)
+            if anchor_name is not None:
+                if anchor_name in seen_anchors:
+                    continue
 
-        # Try to open the file
-        (yaml_data, doc_loaded) = Parsers.get_yaml_data(yaml, log, yaml_file)
-        if not doc_loaded:
-            # An error message has already been logged
-            exit_state = 3
+                seen_anchors.append(anchor_name)
+
+            # Prefer block (folded) values unless the original YAML value
+            # was already a massivly long (string) line.
+            output = EYAMLOutputFormats.BLOCK
+            if not isinstance(node, FoldedScalarString):
+                output = EYAMLOutputFormats.STRING
+
+            rotations.append((yaml_path, node, output))
+
+    if not rotations:
+        return exit_state
+
+    # Decrypt every value with the old EYAML keys in one batch
+    log.verbose("Decrypting {} value(s).".format(len(rotations)))
+    processor.publickey = args.oldpublickey
+    processor.privatekey = args.oldprivatekey
+    (txtvals, batch_ok) = _run_batch(
+        log, processor.decrypt_eyaml_values, processor.decrypt_eyaml,
+        [node for (_, node, _) in rotations])
+    if not batch_ok:
+        exit_state = 3
+
+    # Re-encrypt the values with new EYAML keys in one batch per output
+    # format
+    processor.publickey = args.newpublickey
+    processor.privatekey = args.newprivatekey
+    for output in (EYAMLOutputFormats.BLOCK, EYAMLOutputFormats.STRING):
+        batch = [
+            (yaml_path, txtval)
+            for ((yaml_path, _, rotate_output), txtval)
+            in zip(rotations, txtvals)
+            if txtval is not None and rotate_output is output]
+        if not batch:
             continue
 
-        # Process all EYAML values
-        processor.data = yaml_data
-        for yaml_path in processor.find_eyaml_paths():
-            # Use ::get_nodes() instead of ::get_eyaml_values() here in order
-            # to ignore values that have already been rotated via their
-            # Anchors.
-            for node_coordinate in processor.get_nodes(
-                yaml_path, mustexist=True
-            ):
-                # Ignore values which are Aliases for those already decrypted
-                node = node_coordinate.node
-                anchor_name = Anchors.get_node_anchor(node)
-                if anchor_name is not None:
-                    if anchor_name in seen_anchors:
-                        continue
-
-                    seen_anchors.append(anchor_name)
-
-                log.verbose("Decrypting value(s) at {}.".format(yaml_path))
-                processor.publickey = args.oldpublickey
-                processor.privatekey = args.oldprivatekey
-
-                try:
-                    txtval = processor.decrypt_eyaml(node)
-                except EYAMLCommandException as ex:
-                    log.error(ex)
-                    exit_state = 3
-                    continue
+        (encvals, batch_ok) = _run_batch(
+            log,
+            partial(processor.encrypt_eyaml_values, output=output),
+            partial(processor.encrypt_eyaml, output=output),
+            [txtval for (_, txtval) in batch])
+        if not batch_ok:
+            exit_state = 3
 
-                # Prefer block (folded) values unless the original YAML value
-                # was already a massivly long (string) line.
-                output = EYAMLOutputFormats.BLOCK
-                if not isinstance(node, FoldedScalarString):
-                    output = EYAMLOutputFormats.STRING
-
-                # Re-encrypt the value with new EYAML keys
-                processor.publickey = args.newpublickey
-                processor.privatekey = args.newprivatekey
-
-                try:
-                    processor.set_eyaml_value(yaml_path, txtval, output=output)
-                except EYAMLCommandException as ex:
-                    log.error(ex)
-                    exit_state = 3
-                    continue
+        emit_format = YAMLValueFormats.FOLDED
+        if output is EYAMLOutputFormats.STRING:
+            emit_format = YAMLValueFormats.DEFAULT
+        for ((yaml_path, _), encval) in zip(batch, encvals):
+            if encval is None:
+                continue
+            log.verbose("Re-encrypted value(s) at {}.".format(yaml_path))
+            processor.set_value(
+                yaml_path, encval, value_format=emit_format)
+            file_changed = True
+
+    # Save the changes
+    if file_changed:
+        if args.backup:
+            log.verbose("Saving a backup of {} to {}."
+                        .format(yaml_file, backup_file))
+            if exists(backup_file):
+                remove(backup_file)
+            copy2(yaml_file, backup_file)
+
+        log.verbose("Writing changed data to {}.".format(yaml_file))
+        with open(yaml_file, 'w', encoding='utf-8') as yaml_dump:
+            yaml.dump(yaml_data, yaml_dump)
+
+    return exit_state
+
+def get_file_processor(args):
+    """Build the function which processes each file, with its own parser."""
+    log = ConsolePrinter(args)
+    processor = EYAMLProcessor(log, None, binary=args.eyaml)
+    yaml = Parsers.get_yaml_editor()
+    return partial(process_file, args, log, processor, yaml)
 
-                file_changed = True
+def main():
+    """Perform the work specified via CLI arguments and exit.
 
-        # Save the changes
-        if file_changed:
-            if args.backup:
-                log.verbose("Saving a backup of {} to {}."
-                            .format(yaml_file, backup_file))
-                if exists(backup_file):
-                    remove(backup_file)
-                copy2(yaml_file, backup_file)
+    Main code.
+    """
+    # Process any command-line arguments
+    args = processcli()
+    log = ConsolePrinter(args)
+    validateargs(args, log)
 
-            log.verbose("Writing changed data to {}.".format(yaml_file))
-            with open(yaml_file, 'w', encoding='utf-8') as yaml_dump:
-                yaml.dump(yaml_data, yaml_dump)
+    # Results are reported in input order however many files run at once
+    exit_state = FilePool(args.jobs, get_file_processor, args).run(
+        args.yaml_files)
 
     sys.exit(exit_state)
 
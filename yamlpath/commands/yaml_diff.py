@@ -9,7 +9,7 @@ from os import access, R_OK
 from os.path import isfile
 
 from yamlpath import __version__ as YAMLPATH_VERSION
-from yamlpath.common import Parsers
+from yamlpath.common import DocumentCache, Parsers
 from yamlpath.enums import PathSeparators
 from yamlpath.differ.enums import AoHDiffOpts, ArrayDiffOpts
 from yamlpath.wrappers import ConsolePrinter
@@ -128,6 +128,24 @@ https://github.com/wwkimball/yamlpath/issues.
         help="Do not use EYAML to compare encrypted data; rather,\ntreat"
              " ENC[...] values as regular strings")
 
+    cache_group = parser.add_argument_group(
+        "document cache options", "Parsed documents can be kept in an"
+        " on-disk cache so that unchanged\nfiles need not be parsed again."
+        "  Because the cache holds Python pickles,\nit must be no less"
+        " trusted than this command.")
+    cache_group.add_argument(
+        "--cachedir",
+        metavar="DIR",
+        help="the directory in which to cache parsed documents; files\nwhich"
+             " have not changed are loaded from it rather than parsed")
+    cache_group.add_argument(
+        "--cachesize",
+        metavar="MB",
+        type=int,
+        default=1024,
+        help="remove the least recently used documents whenever the\ncache"
+             " grows larger than this many megabytes; default=1024")
+
     noise_group = parser.add_mutually_exclusive_group()
     noise_group.add_argument(
         "-d", "--debug",
@@ -198,6 +216,11 @@ def validateargs(args, log):
         log.error(
             "EYAML public key is not a readable file:  " + args.publickey)
 
+    # When set, --cachesize must be positive
+    if args.cachesize < 1:
+        has_errors = True
+        log.error("The --cachesize value must be a positive integer.")
+
     if has_errors:
         sys.exit(1)
 
@@ -228,7 +251,7 @@ def print_report(log, args, diff):
 
     return changes_found
 
-def get_docs(log, yaml_editor, yaml_file):
+def get_docs(log, yaml_editor, yaml_file, cache=None):
     """Get all documents from a YAML/JSON/Compatible file."""
     docs_loaded = True
     docs = []
@@ -237,7 +260,7 @@ def get_docs(log, yaml_editor, yaml_file):
         return ([], False)
 
     for (yaml_data, doc_loaded) in Parsers.get_yaml_multidoc_data(
-        yaml_editor, log, yaml_file
+        yaml_editor, log, yaml_file, cache=cache
     ):
         if not doc_loaded:
             # An error message has already been logged
@@ -279,8 +302,10 @@ def main():
     rhs_file = args.yaml_files[1]
     lhs_yaml = Parsers.get_yaml_editor()
     rhs_yaml = Parsers.get_yaml_editor()
-    (lhs_docs, lhs_loaded) = get_docs(log, lhs_yaml, lhs_file)
-    (rhs_docs, rhs_loaded) = get_docs(log, rhs_yaml, rhs_file)
+    cache = (DocumentCache(log, args.cachedir, args.cachesize * 1024 * 1024)
+             if args.cachedir else None)
+    (lhs_docs, lhs_loaded) = get_docs(log, lhs_yaml, lhs_file, cache)
+    (rhs_docs, rhs_loaded) = get_docs(log, rhs_yaml, rhs_file, cache)
     lhs_doc_count = len(lhs_docs) if lhs_loaded else 0
     rhs_doc_count = len(rhs_docs) if rhs_loaded else 0
     lhs_idx_set = (hasattr(args, "left_document_index")
@@ -21,7 +21,7 @@ from yamlpath.patches.timestamp import (
 )
 
 from yamlpath import __version__ as YAMLPATH_VERSION
-from yamlpath.common import Parsers, Nodes
+from yamlpath.common import DocumentCache, Parsers, Nodes
 from yamlpath import YAMLPath
 from yamlpath.exceptions import YAMLPathException
 from yamlpath.eyaml.exceptions import EYAMLCommandException
@@ -54,10 +54,27 @@ def processcli():
     required_group.add_argument(
         "-p", "--query",
         required=True,
+        action="append",
         metavar="YAML_PATH",
-        help="YAML Path to query"
+        help="YAML Path to query; repeat to query many YAML Paths in a"
+             " single pass over the document, reporting the results of each"
+             " in the order given"
     )
 
+    parser.add_argument(
+        "-l", "--limit",
+        type=int,
+        metavar="N",
+        help="report at most N results for each YAML_PATH; the document is\
+              evaluated only until each has that many")
+
+    parser.add_argument(
+        "-E", "--explain",
+        action="store_true",
+        help="rather than its results, report how each YAML_PATH is\
+              evaluated:  the work done -- and time spent -- for each of its\
+              segments")
+
     parser.add_argument(
         "-t", "--pathsep",
         default="dot",
@@ -84,6 +101,24 @@ def processcli():
     eyaml_group.add_argument("-r", "--privatekey", help="EYAML private key")
     eyaml_group.add_argument("-u", "--publickey", help="EYAML public key")
 
+    cache_group = parser.add_argument_group(
+        "document cache options",
+        "Parsed documents can be kept in an on-disk cache so that unchanged\
+         files need not be parsed again.  Because the cache holds Python\
+         pickles, it must be no less trusted than this command.")
+    cache_group.add_argument(
+        "--cachedir",
+        metavar="DIR",
+        help="the directory in which to cache parsed documents; files which\
+              have not changed are loaded from it rather than parsed")
+    cache_group.add_argument(
+        "--cachesize",
+        metavar="MB",
+        type=int,
+        default=1024,
+        help="remove the least recently used documents whenever the cache\
+              grows larger than this many megabytes; default=1024")
+
     noise_group = parser.add_mutually_exclusive_group()
     noise_group.add_argument(
         "-d", "--debug",
@@ -118,6 +153,11 @@ def validateargs(args, log):
         has_errors = True
         log.error("YAML_FILE must be set or be read from STDIN.")
 
+    # When set, --limit must be positive
+    if args.limit is not None and args.limit < 1:
+        has_errors = True
+        log.error("The --limit|-l value must be a positive integer.")
+
     # When set, --privatekey must be a readable file
     if args.privatekey and not (
             isfile(args.privatekey) and access(args.privatekey, R_OK)
@@ -146,6 +186,11 @@ def validateargs(args, log):
         has_errors = True
         log.error("Both private and public EYAML keys must be set.")
 
+    # When set, --cachesize must be positive
+    if args.cachesize < 1:
+        has_errors = True
+        log.error("The --cachesize value must be a positive integer.")
+
     # When dumping the document to STDOUT, mute all non-errors
     force_verbose = args.verbose
     force_debug = args.debug
@@ -157,6 +202,7 @@ def validateargs(args, log):
     if has_errors:
         sys.exit(1)
 
+# pylint: disable=locally-disabled,too-many-branches
 def main():
     """Perform the work specified via CLI arguments and exit.
 
@@ -165,29 +211,51 @@ def main():
     args = processcli()
     log = ConsolePrinter(args)
     validateargs(args, log)
-    yaml_path = YAMLPath(args.query, pathsep=args.pathsep)
+    yaml_paths = [
+        YAMLPath(query, pathsep=args.pathsep) for query in args.query]
 
     # Prep the YAML parser
-    yaml = Parsers.get_yaml_editor()
+    yaml = Parsers.get_yaml_reader(fast=True)
+    cache = (DocumentCache(log, args.cachedir, args.cachesize * 1024 * 1024)
+             if args.cachedir else None)
 
     # Attempt to open the YAML file; check for parsing errors
     (yaml_data, doc_loaded) = Parsers.get_yaml_data(
         yaml, log,
-        args.yaml_file if args.yaml_file else "-")
+        args.yaml_file if args.yaml_file else "-", cache=cache)
     if not doc_loaded:
         # An error message has already been logged
         sys.exit(1)
 
-    # Seek the queried value(s)
+    # Seek the queried value(s), keeping the matches of each query apart even
+    # when the same YAML Path is queried more than once
     discovered_nodes = []
+    matches = {id(yaml_path): [] for yaml_path in yaml_paths}
     processor = EYAMLProcessor(
         log, yaml_data, binary=args.eyaml,
         publickey=args.publickey, privatekey=args.privatekey)
+    if args.explain:
+        try:
+            for yaml_path in yaml_paths:
+                print(processor.explain(yaml_path))
+        except YAMLPathException as ex:
+            log.critical(ex, 1)
+        return
+
     try:
-        for node in processor.get_eyaml_values(yaml_path, mustexist=True):
+        for (yaml_path, node) in processor.get_nodes_many(
+            yaml_paths, mustexist=True, limit=args.limit
+        ):
             log.debug(
                 "Got node from {}:".format(yaml_path), data=node,
                 prefix="yaml_get::main:  ")
+            matches[id(yaml_path)].append(node)
+
+        # Decrypt any EYAML values in one batch
+        for node in processor.decrypt_eyaml_values([
+            node for yaml_path in yaml_paths
+            for node in matches[id(yaml_path)]
+        ]):
             discovered_nodes.append(NodeCoords.unwrap_node_coords(node))
     except YAMLPathException as ex:
         log.critical(ex, 1)
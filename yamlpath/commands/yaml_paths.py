@@ -1,3 +1,4 @@
+#pylint: disable=too-many-lines
 """
 Enable users to discover the YAML Path of every expression-matching term.
 
@@ -10,14 +11,15 @@ Copyright 2019, 2020, 2021 William W. Kimball, Jr. MBA MSIS
 import sys
 import argparse
 import json
+from functools import partial
 from os import access, R_OK
 from os.path import isfile
-from typing import Any, Dict, Generator, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, Generator, List, Optional, Tuple
 
-from ruamel.yaml.comments import CommentedSeq, CommentedMap, CommentedSet
+from ruamel.yaml.comments import CommentedMap, CommentedSet
 
 from yamlpath import __version__ as YAMLPATH_VERSION
-from yamlpath.common import Anchors, Parsers, Searches
+from yamlpath.common import DocumentCache, FilePool, Parsers, Searches
 from yamlpath.exceptions import YAMLPathException
 from yamlpath.enums import (
     AnchorMatches,
@@ -188,6 +190,32 @@ def processcli():
             "Do not implicitly read from STDIN, even when there are\n"
             "no - pseudo-files in YAML_FILEs with a non-TTY session"))
 
+    parser.add_argument(
+        "-j", "--jobs",
+        metavar="N",
+        type=int,
+        default=1,
+        help="search up to N files at once, each in its own process; 0 = one\
+              per CPU; default=1")
+
+    cache_group = parser.add_argument_group(
+        "document cache options",
+        "Parsed documents can be kept in an on-disk cache so that unchanged\
+         files need not be parsed again.  Because the cache holds Python\
+         pickles, it must be no less trusted than this command.")
+    cache_group.add_argument(
+        "--cachedir",
+        metavar="DIR",
+        help="the directory in which to cache parsed documents; files which\
+              have not changed are loaded from it rather than parsed")
+    cache_group.add_argument(
+        "--cachesize",
+        metavar="MB",
+        type=int,
+        default=1024,
+        help="remove the least recently used documents whenever the cache\
+              grows larger than this many megabytes; default=1024")
+
     noise_group = parser.add_mutually_exclusive_group()
     noise_group.add_argument(
         "-d", "--debug",
@@ -261,6 +289,16 @@ def validateargs(args, log):
         has_errors = True
         log.error("Both private and public EYAML keys must be set.")
 
+    # * When set, --cachesize must be positive
+    if args.cachesize < 1:
+        has_errors = True
+        log.error("The --cachesize value must be a positive integer.")
+
+    # * --jobs must not be negative
+    if args.jobs < 0:
+        has_errors = True
+        log.error("The --jobs value must be zero or a positive integer.")
+
     if has_errors:
         sys.exit(1)
 
@@ -285,7 +323,7 @@ def yield_children(logger: ConsolePrinter, data: Any,
     exclude_alias_matchers = [AnchorMatches.UNSEARCHABLE_ALIAS,
                               AnchorMatches.ALIAS_EXCLUDED]
 
-    if isinstance(data, CommentedSeq):
+    if isinstance(data, list):
         if not build_path and pathsep is PathSeparators.FSLASH:
             build_path = str(pathsep)
         build_path += "["
@@ -313,7 +351,7 @@ def yield_children(logger: ConsolePrinter, data: Any,
                     and anchor_matched in exclude_alias_matchers):
                 continue
 
-            if isinstance(ele, (CommentedMap, CommentedSeq)):
+            if isinstance(ele, (dict, list)):
                 for path in yield_children(
                         logger, ele, terms, pathsep, tmp_path, seen_anchors,
                         search_anchors=search_anchors,
@@ -323,13 +361,15 @@ def yield_children(logger: ConsolePrinter, data: Any,
             else:
                 yield YAMLPath(tmp_path)
 
-    elif isinstance(data, CommentedMap):
+    elif isinstance(data, dict):
         if build_path:
             build_path += str(pathsep)
         elif pathsep is PathSeparators.FSLASH:
             build_path = str(pathsep)
 
-        pool = data.non_merged_items()
+        pool = (data.non_merged_items()
+                if isinstance(data, CommentedMap)
+                else data.items())
         if include_key_aliases or include_value_aliases:
             pool = data.items()
 
@@ -355,7 +395,7 @@ def yield_children(logger: ConsolePrinter, data: Any,
             ):
                 continue
 
-            if isinstance(val, (CommentedSeq, CommentedMap)):
+            if isinstance(val, (list, dict)):
                 for path in yield_children(
                         logger, val, terms, pathsep, tmp_path, seen_anchors,
                         search_anchors=search_anchors,
@@ -392,15 +432,21 @@ def search_for_paths(logger: ConsolePrinter, processor: EYAMLProcessor,
     decrypt_eyaml: bool = kwargs.pop("decrypt_eyaml", False)
     expand_children: bool = kwargs.pop("expand_children", False)
     all_anchors: Dict[str, Any] = kwargs.pop("all_anchors", {})
+    key_holders: Optional[FrozenSet[int]] = kwargs.pop("key_holders", None)
     strsep = str(pathsep)
     invert = terms.inverted
-    method = terms.method
-    term = terms.term
+    is_match = terms.predicate
 
     if seen_anchors is None:
         seen_anchors = []
 
-    if isinstance(data, CommentedSeq):
+    # Skip every subtree which cannot hold a matching key name
+    if (key_holders is not None
+            and id(data) not in key_holders
+            and processor.key_index.is_indexed(data)):
+        return
+
+    if isinstance(data, list):
         # Build the path
         if not build_path and pathsep is PathSeparators.FSLASH:
             build_path = strsep
@@ -448,7 +494,7 @@ def search_for_paths(logger: ConsolePrinter, processor: EYAMLProcessor,
                     yield YAMLPath(tmp_path)
                 continue
 
-            if isinstance(ele, (CommentedSeq, CommentedMap)):
+            if isinstance(ele, (list, dict)):
                 logger.debug(
                     "Recursing into complex data:", data=ele,
                     prefix="yaml_paths::search_for_paths<list>:  ",
@@ -461,7 +507,7 @@ def search_for_paths(logger: ConsolePrinter, processor: EYAMLProcessor,
                         include_value_aliases=include_value_aliases,
                         decrypt_eyaml=decrypt_eyaml,
                         expand_children=expand_children,
-                        all_anchors=all_anchors):
+                        all_anchors=all_anchors, key_holders=key_holders):
                     logger.debug(
                         "Yielding RECURSED match, {}.".format(subpath),
                         prefix="yaml_paths::search_for_paths<list>:  ",
@@ -477,7 +523,7 @@ def search_for_paths(logger: ConsolePrinter, processor: EYAMLProcessor,
                 if decrypt_eyaml and processor.is_eyaml_value(ele):
                     check_value = processor.decrypt_eyaml(ele)
 
-                matches = Searches.search_matches(method, term, check_value)
+                matches = is_match(check_value)
                 if (matches and not invert) or (invert and not matches):
                     logger.debug(
                         ("yaml_paths::search_for_paths<list>:"
@@ -487,13 +533,15 @@ def search_for_paths(logger: ConsolePrinter, processor: EYAMLProcessor,
                     yield YAMLPath(tmp_path)
 
     # pylint: disable=too-many-nested-blocks
-    elif isinstance(data, CommentedMap):
+    elif isinstance(data, dict):
         if build_path:
             build_path += strsep
         elif pathsep is PathSeparators.FSLASH:
             build_path = strsep
 
-        pool = data.non_merged_items()
+        pool = (data.non_merged_items()
+                if isinstance(data, CommentedMap)
+                else data.items())
         if include_key_aliases or include_value_aliases:
             pool = data.items()
 
@@ -544,7 +592,7 @@ def search_for_paths(logger: ConsolePrinter, processor: EYAMLProcessor,
                     continue
 
                 # Search the name of the key, itself
-                matches = Searches.search_matches(method, term, key)
+                matches = is_match(key)
                 if (matches and not invert) or (invert and not matches):
                     logger.debug(
                         ("yaml_paths::search_for_paths<dict>:"
@@ -588,7 +636,7 @@ def search_for_paths(logger: ConsolePrinter, processor: EYAMLProcessor,
                     yield YAMLPath(tmp_path)
                 continue
 
-            if isinstance(val, (CommentedSeq, CommentedMap, CommentedSet)):
+            if isinstance(val, (list, dict, CommentedSet)):
                 logger.debug(
                     "Recursing into complex data:", data=val,
                     prefix="yaml_paths::search_for_paths<dict>:  ",
@@ -602,7 +650,7 @@ def search_for_paths(logger: ConsolePrinter, processor: EYAMLProcessor,
                         include_value_aliases=include_value_aliases,
                         decrypt_eyaml=decrypt_eyaml,
                         expand_children=expand_children,
-                        all_anchors=all_anchors):
+                        all_anchors=all_anchors, key_holders=key_holders):
                     logger.debug(
                         "Yielding RECURSED match, {}.".format(subpath),
                         prefix="yaml_paths::search_for_paths<dict>:  ",
@@ -618,7 +666,7 @@ def search_for_paths(logger: ConsolePrinter, processor: EYAMLProcessor,
                 if decrypt_eyaml and processor.is_eyaml_value(val):
                     check_value = processor.decrypt_eyaml(val)
 
-                matches = Searches.search_matches(method, term, check_value)
+                matches = is_match(check_value)
                 if (matches and not invert) or (invert and not matches):
                     logger.debug(
                         ("yaml_paths::search_for_paths<dict>:"
@@ -636,8 +684,7 @@ def search_for_paths(logger: ConsolePrinter, processor: EYAMLProcessor,
                         tmp_path = (build_path + "[&{}]".format(
                             YAMLPath.escape_path_section(
                                 anchor_name, pathsep)))
-                        matches = Searches.search_matches(
-                            method, term, anchor_name)
+                        matches = is_match(anchor_name)
                         if ((matches and not invert)
                             or (invert and not matches)
                         ):
@@ -679,7 +726,7 @@ def search_for_paths(logger: ConsolePrinter, processor: EYAMLProcessor,
                 continue
 
             # Search the name of the key, itself
-            matches = Searches.search_matches(method, term, key)
+            matches = is_match(key)
             if (matches and not invert) or (invert and not matches):
                 logger.debug(
                     ("yaml_paths::search_for_paths<set>:"
@@ -688,6 +735,32 @@ def search_for_paths(logger: ConsolePrinter, processor: EYAMLProcessor,
                 )
                 yield YAMLPath(tmp_path)
 
+def get_key_holders(processor: EYAMLProcessor, terms: SearchTerms,
+                    **kwargs: bool) -> Optional[FrozenSet[int]]:
+    """
+    Identify the nodes whose subtrees hold a key name matching a search.
+
+    Only searches of key names alone -- not of values, Anchors, or the
+    Anchors of YAML Merge Keys -- can be answered via the key name index of
+    the Processor, and only when that index is enabled.  Each distinct key
+    name in the document is compared against the search only once.
+    """
+    search_values: bool = kwargs.pop("search_values", True)
+    search_keys: bool = kwargs.pop("search_keys", False)
+    search_anchors: bool = kwargs.pop("search_anchors", False)
+    include_value_aliases: bool = kwargs.pop("include_value_aliases", False)
+    if (not processor.index_keys
+            or search_values
+            or not search_keys
+            or search_anchors
+            or include_value_aliases):
+        return None
+
+    key_index = processor.key_index
+    return key_index.holders_of(*[
+        key for key in key_index.keys()
+        if terms.predicate(key) != terms.inverted])
+
 def get_search_term(logger: ConsolePrinter,
                     expression: str) -> Optional[SearchTerms]:
     """
@@ -786,16 +859,21 @@ def print_results(
 def process_yaml_file(
     args: Any, yaml: Any, log: ConsolePrinter, yaml_file: str,
     processor: EYAMLProcessor, search_values: bool, search_keys: bool,
-    include_key_aliases: bool, include_value_aliases: bool, file_tally: int = 0
+    include_key_aliases: bool, include_value_aliases: bool,
+    file_tally: int = 0, cache: Optional[DocumentCache] = None
 ):
     """Process a (potentially multi-doc) YAML file."""
+    log.debug(
+        "yaml_merge::main:  Processing file, {}".format(
+            "STDIN" if yaml_file.strip() == "-" else yaml_file))
+
     # Try to open the file
     exit_state = 0
     subdoc_index = -1
 
     # pylint: disable=too-many-nested-blocks
     for (yaml_data, doc_loaded) in Parsers.get_yaml_multidoc_data(
-        yaml, log, yaml_file
+        yaml, log, yaml_file, cache=cache
     ):
         file_tally += 1
         subdoc_index += 1
@@ -806,9 +884,9 @@ def process_yaml_file(
 
         # Process all searches
         processor.data = yaml_data
-        all_anchors: Dict[str, Any] = {}
-        Anchors.scan_for_anchors(yaml_data, all_anchors)
-        yaml_paths: List[Tuple[str, YAMLPath]] = []
+        all_anchors: Dict[str, Any] = processor.document_index.anchors
+        # Unique results, in the order found
+        yaml_paths: Dict[YAMLPath, Tuple[str, YAMLPath]] = {}
         for expression in args.search:
             exterm = get_search_term(log, expression)
             log.debug(("yaml_paths::process_yaml_file:"
@@ -818,6 +896,10 @@ def process_yaml_file(
                 exit_state = 1
                 continue
 
+            key_holders = get_key_holders(
+                processor, exterm, search_values=search_values,
+                search_keys=search_keys, search_anchors=args.refnames,
+                include_value_aliases=include_value_aliases)
             for result in search_for_paths(
                     log, processor, yaml_data, exterm, args.pathsep,
                     search_values=search_values, search_keys=search_keys,
@@ -826,15 +908,9 @@ def process_yaml_file(
                     include_value_aliases=include_value_aliases,
                     decrypt_eyaml=args.decrypt,
                     expand_children=args.expand,
-                    all_anchors=all_anchors):
+                    all_anchors=all_anchors, key_holders=key_holders):
                 # Record only unique results
-                add_entry = True
-                for entry in yaml_paths:
-                    if str(result) == str(entry[1]):
-                        add_entry = False
-                        break
-                if add_entry:
-                    yaml_paths.append((expression, result))
+                yaml_paths.setdefault(result, (expression, result))
 
         if not yaml_paths:
             # Nothing further to do when there are no results
@@ -850,6 +926,10 @@ def process_yaml_file(
                     exit_state = 1
                     continue
 
+                key_holders = get_key_holders(
+                    processor, exterm, search_values=search_values,
+                    search_keys=search_keys, search_anchors=args.refnames,
+                    include_value_aliases=include_value_aliases)
                 for result in search_for_paths(
                         log, processor, yaml_data, exterm, args.pathsep,
                         search_values=search_values,
@@ -859,29 +939,18 @@ def process_yaml_file(
                         include_value_aliases=include_value_aliases,
                         decrypt_eyaml=args.decrypt,
                         expand_children=args.expand,
-                        all_anchors=all_anchors):
-                    for entry in yaml_paths:
-                        if str(result) == str(entry[1]):
-                            # Disable modified-iterating-list because the loop
-                            # is exited immediately upon container change.
-                            # pylint: disable=modified-iterating-list
-                            yaml_paths.remove(entry)
-                            break  # Entries are already unique
+                        all_anchors=all_anchors, key_holders=key_holders):
+                    yaml_paths.pop(result, None)
 
         print_results(
-            args, processor, yaml_file, yaml_paths, subdoc_index)
+            args, processor, yaml_file, list(yaml_paths.values()),
+            subdoc_index)
 
     return exit_state
 
-def main():
-    """Perform the work specified via CLI arguments and exit.
-
-    Main code.
-    """
-    # Process any command-line arguments
-    args = processcli()
+def get_file_processor(args):
+    """Build the function which processes each file, with its own parser."""
     log = ConsolePrinter(args)
-    validateargs(args, log)
     search_values = True
     search_keys = False
     include_key_aliases = False
@@ -902,32 +971,38 @@ def main():
         include_value_aliases = True
 
     # Prepare the YAML processor
-    yaml = Parsers.get_yaml_editor()
+    yaml = Parsers.get_yaml_reader(fast=True)
+    cache = (DocumentCache(log, args.cachedir, args.cachesize * 1024 * 1024)
+             if args.cachedir else None)
     processor = EYAMLProcessor(
         log, None, binary=args.eyaml,
         publickey=args.publickey, privatekey=args.privatekey)
 
-    # Process the input file(s)
-    exit_state = 0
-    file_tally = -1
-    consumed_stdin = False
+    # Searches of key names alone need visit only the subtrees which hold a
+    # matching key name
+    processor.index_keys = True
 
-    for yaml_file in args.yaml_files:
-        file_tally += 1
-        if yaml_file.strip() == "-":
-            consumed_stdin = True
+    return partial(
+        process_yaml_file, args, yaml, log, processor=processor,
+        search_values=search_values, search_keys=search_keys,
+        include_key_aliases=include_key_aliases,
+        include_value_aliases=include_value_aliases, cache=cache)
 
-        log.debug(
-            "yaml_merge::main:  Processing file, {}".format(
-                "STDIN" if yaml_file.strip() == "-" else yaml_file))
+def main():
+    """Perform the work specified via CLI arguments and exit.
 
-        proc_state = process_yaml_file(
-            args, yaml, log, yaml_file, processor, search_values, search_keys,
-            include_key_aliases, include_value_aliases, file_tally
-        )
+    Main code.
+    """
+    # Process any command-line arguments
+    args = processcli()
+    log = ConsolePrinter(args)
+    validateargs(args, log)
+    consumed_stdin = any(
+        yaml_file.strip() == "-" for yaml_file in args.yaml_files)
 
-        if proc_state != 0:
-            exit_state = proc_state
+    # Results are reported in input order however many files run at once
+    pool = FilePool(args.jobs, get_file_processor, args)
+    exit_state = pool.run(args.yaml_files)
 
     # Check for a waiting STDIN document
     if (exit_state == 0
@@ -935,11 +1010,7 @@ def main():
         and not args.nostdin
         and not sys.stdin.isatty()
     ):
-        file_tally += 1
-        exit_state = process_yaml_file(
-            args, yaml, log, "-", processor, search_values, search_keys,
-            include_key_aliases, include_value_aliases, file_tally
-        )
+        exit_state = pool.process_file("-")
 
     sys.exit(exit_state)
 
@@ -52,11 +52,17 @@ def processcli():
                         version="%(prog)s " + YAMLPATH_VERSION)
 
     required_group = parser.add_argument_group("required settings")
-    required_group.add_argument(
+    change_group = required_group.add_mutually_exclusive_group(required=True)
+    change_group.add_argument(
         "-g", "--change",
-        required=True,
         metavar="YAML_PATH",
         help="YAML Path where the target value is found")
+    change_group.add_argument(
+        "-B", "--batch",
+        metavar="CHANGES_FILE",
+        help="apply many changes at once, read from CHANGES_FILE (or - for"
+             " STDIN) with one YAML_PATH=VALUE per line; blank lines and"
+             " lines starting with # are ignored")
 
     inputex_group = parser.add_argument_group("input options")
     input_group = inputex_group.add_mutually_exclusive_group()
@@ -116,6 +122,11 @@ def processcli():
     parser.add_argument(
         "-b", "--backup", action="store_true",
         help="save a backup YAML_FILE with an extra .bak file-extension")
+    parser.add_argument(
+        "-E", "--explain", action="store_true",
+        help="rather than changing YAML_FILE, report how each YAML_PATH to\
+              change is evaluated:  the work done -- and time spent -- for\
+              each of its segments; no input option is required")
     parser.add_argument(
         "-t", "--pathsep",
         default="dot",
@@ -190,7 +201,7 @@ def processcli():
         help="the YAML file to update; omit or use - to read from STDIN")
     return parser.parse_args()
 
-# pylint: disable=too-many-branches
+# pylint: disable=too-many-branches,too-many-statements
 def validateargs(args, log):
     """Validate command-line arguments."""
     has_errors = False
@@ -204,8 +215,25 @@ def validateargs(args, log):
         has_errors = True
         log.error("There must be a YAML_FILE or STDIN document.")
 
+    # --batch supplies its own values and supports only plain changes
+    if args.batch:
+        if (args.batch.strip() == "-") and in_stream_mode:
+            has_errors = True
+            log.error(
+                "Impossible to read both document and batch changes from"
+                " STDIN!")
+        if any((
+                args.value is not None, args.aliasof, args.mergekey,
+                args.file, args.stdin, args.random, args.null, args.delete,
+                args.anchor, args.check, args.saveto, args.eyamlcrypt)):
+            has_errors = True
+            log.error(
+                "The --batch|-B option may be combined only with --format,"
+                " --tag, --mustexist, --backup, --explain, and output"
+                " options.")
+
     # One of the input group options must be specified.
-    if not (
+    elif not (
             args.value
             or args.value == ""
             or args.aliasof
@@ -217,6 +245,7 @@ def validateargs(args, log):
             or args.delete
             or args.anchor
             or args.tag
+            or args.explain
     ):
         has_errors = True
         log.error(
@@ -406,6 +435,65 @@ def write_output_document(args, log, yaml, yaml_data):
     else:
         save_to_file(args, log, yaml, yaml_data, backup_file)
 
+def _read_batch_changes(args, log):
+    """Read the YAML_PATH=VALUE changes of --batch."""
+    changes = []
+    if args.batch.strip() == "-":
+        lines = sys.stdin.readlines()
+    else:
+        try:
+            with open(args.batch, 'r', encoding='utf-8') as fhnd:
+                lines = fhnd.readlines()
+        except OSError as ex:
+            log.critical(
+                "Unable to read batch changes from {}:  {}"
+                .format(args.batch, ex), 1)
+
+    for line_no, line in enumerate(lines, 1):
+        line = line.rstrip("\r\n")
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+
+        change = _split_batch_change(line)
+        if change is None:
+            log.critical(
+                "Batch change on line {} is not a YAML_PATH=VALUE pair:  {}"
+                .format(line_no, line), 1)
+        changes.append(change)
+
+    if not changes:
+        log.critical("No changes were found in {}.".format(args.batch), 1)
+    return changes
+
+def _split_batch_change(line):
+    """
+    Split a YAML_PATH=VALUE batch change into its YAML Path and value.
+
+    The YAML Path ends at the first = which is not escaped, quoted, or within
+    a search expression or Collector of the YAML Path.
+    """
+    depth = 0
+    demarc = None
+    escaped = False
+    for idx, char in enumerate(line):
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif demarc is not None:
+            if char == demarc:
+                demarc = None
+        elif char in "'\"":
+            demarc = char
+        elif char in "[(":
+            depth += 1
+        elif char in "])":
+            depth = max(0, depth - 1)
+        elif char == "=" and depth == 0:
+            yaml_path = line[:idx].strip()
+            return (yaml_path, line[idx + 1:]) if yaml_path else None
+    return None
+
 def _try_load_input_file(args, log, yaml, change_path, new_value):
     """Attempt to load the input data file or abend on error."""
     (yaml_data, doc_loaded) = Parsers.get_yaml_data(yaml, log, args.yaml_file)
@@ -477,6 +565,23 @@ def _ymk_nodes(
     except YAMLPathException as ex:
         log.critical(ex, 1)
 
+def _apply_batch_changes(args, log, processor, batch_changes, must_exist):
+    """Apply every --batch change at once."""
+    value_format = YAMLValueFormats.from_str(args.format)
+    try:
+        results = processor.apply_changes(
+            [(YAMLPath(change_path, pathsep=args.pathsep), value,
+              value_format, args.tag)
+             for (change_path, value) in batch_changes],
+            mustexist=must_exist)
+    except YAMLPathException as ex:
+        log.critical(ex, 1)
+
+    for ((change_path, _), changed_nodes) in zip(batch_changes, results):
+        log.verbose(
+            "Changed {} node(s) at {}.".format(
+                len(changed_nodes), change_path))
+
 # pylint: disable=locally-disabled,too-many-locals,too-many-branches,too-many-statements
 def main():
     """Perform the work specified via CLI arguments and exit.
@@ -486,14 +591,18 @@ def main():
     args = processcli()
     log = ConsolePrinter(args)
     validateargs(args, log)
-    change_path = YAMLPath(args.change, pathsep=args.pathsep)
     must_exist=args.mustexist or args.saveto
 
     # Obtain the replacement value
     consumed_stdin = False
     new_value = None
     has_new_value = False
-    if args.value or args.value == "":
+    batch_changes = []
+    if args.batch:
+        batch_changes = _read_batch_changes(args, log)
+        consumed_stdin = args.batch.strip() == "-"
+        (args.change, new_value) = batch_changes[0]
+    elif args.value or args.value == "":
         new_value = args.value
         has_new_value = True
     elif args.stdin:
@@ -513,6 +622,8 @@ def main():
         )
         has_new_value = True
 
+    change_path = YAMLPath(args.change, pathsep=args.pathsep)
+
     # Prep the YAML parser
     yaml = Parsers.get_yaml_editor()
 
@@ -537,6 +648,26 @@ def main():
     processor = EYAMLProcessor(
         log, yaml_data, binary=args.eyaml,
         publickey=args.publickey, privatekey=args.privatekey)
+
+    # Report how each YAML Path is evaluated without changing the document
+    if args.explain:
+        explain_paths = (
+            [change for (change, _) in batch_changes] if batch_changes
+            else [args.change])
+        try:
+            for explain_path in explain_paths:
+                print(processor.explain(
+                    YAMLPath(explain_path, pathsep=args.pathsep)))
+        except YAMLPathException as ex:
+            log.critical(ex, 1)
+        return
+
+    if batch_changes:
+        _apply_batch_changes(
+            args, log, processor, batch_changes, must_exist)
+        write_output_document(args, log, yaml, yaml_data)
+        return
+
     ignore_fail = not must_exist
     change_node_coordinates = _get_nodes(
         log, processor, change_path, must_exist=True, ignore_fail=ignore_fail,
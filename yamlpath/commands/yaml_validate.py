@@ -5,9 +5,10 @@ Copyright 2020 William W. Kimball, Jr. MBA MSIS
 """
 import sys
 import argparse
+from functools import partial
 
 from yamlpath import __version__ as YAMLPATH_VERSION
-from yamlpath.common import Parsers
+from yamlpath.common import FilePool, Parsers
 from yamlpath.wrappers import ConsolePrinter
 
 class LogErrorCap:
@@ -54,6 +55,14 @@ def processcli():
             "Do not implicitly read from STDIN, even when there are\n"
             "no - pseudo-files in YAML_FILEs with a non-TTY session"))
 
+    parser.add_argument(
+        "-j", "--jobs",
+        metavar="N",
+        type=int,
+        default=1,
+        help="validate up to N files at once, each in its own process; 0 = one\
+              per CPU; default=1")
+
     noise_group = parser.add_mutually_exclusive_group()
     noise_group.add_argument(
         "-d", "--debug",
@@ -98,6 +107,11 @@ def validateargs(args, log):
         has_errors = True
         log.error("Only one YAML_FILE may be the - pseudo-file.")
 
+    # --jobs must not be negative
+    if args.jobs < 0:
+        has_errors = True
+        log.error("The --jobs value must be zero or a positive integer.")
+
     if has_errors:
         sys.exit(1)
 
@@ -107,6 +121,8 @@ def process_file(log, yaml, yaml_file):
     subdoc_index = 0
     exit_state = 0
     file_name = "STDIN" if yaml_file.strip() == "-" else yaml_file
+    log.debug(
+        "yaml_merge::main:  Processing file, {}".format(file_name))
     for (_, doc_loaded) in Parsers.get_yaml_multidoc_data(
         yaml, logcap, yaml_file
     ):
@@ -124,6 +140,12 @@ def process_file(log, yaml, yaml_file):
 
     return exit_state
 
+def get_file_processor(args):
+    """Build the function which processes each file, with its own parser."""
+    log = ConsolePrinter(args)
+    yaml = Parsers.get_yaml_reader(fast=True)
+    return partial(process_file, log, yaml)
+
 def main():
     """Perform the work specified via CLI arguments and exit.
 
@@ -133,22 +155,12 @@ def main():
     args = processcli()
     log = ConsolePrinter(args)
     validateargs(args, log)
-    exit_state = 0
-    consumed_stdin = False
-    yaml = Parsers.get_yaml_editor()
-
-    for yaml_file in args.yaml_files:
-        if yaml_file.strip() == '-':
-            consumed_stdin = True
-
-        log.debug(
-            "yaml_merge::main:  Processing file, {}".format(
-                "STDIN" if yaml_file.strip() == "-" else yaml_file))
-
-        proc_state = process_file(log, yaml, yaml_file)
+    consumed_stdin = any(
+        yaml_file.strip() == "-" for yaml_file in args.yaml_files)
 
-        if proc_state != 0:
-            exit_state = proc_state
+    # Results are reported in input order however many files run at once
+    pool = FilePool(args.jobs, get_file_processor, args)
+    exit_state = pool.run(args.yaml_files)
 
     # Check for a waiting STDIN document
     if (exit_state == 0
@@ -156,7 +168,7 @@ def main():
         and not args.nostdin
         and not sys.stdin.isatty()
     ):
-        exit_state = process_file(log, yaml, "-")
+        exit_state = pool.process_file("-")
 
     sys.exit(exit_state)
 
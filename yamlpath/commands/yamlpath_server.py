@@ -0,0 +1,313 @@
+"""
+Serve the yamlpath console scripts from one long-running process.
+
+Listens on a Unix domain socket for the command-lines of yaml-get, yaml-set,
+yaml-paths, yaml-merge, yaml-diff, yaml-validate, and eyaml-rotate-keys as
+they are forwarded by those same console scripts whenever the YAMLPATH_SERVER
+environment variable names the socket.  Each command runs exactly as it
+would have run locally -- in the working directory of the client, reading
+the STDIN of the client, and reporting its output and exit code back to the
+client -- but without the cost of starting Python and importing ruamel.yaml.
+Parsed documents are kept in memory, keyed by the path, size, modification
+time, and content hash of each file, so unchanged files are not parsed again
+while any changed file is reloaded.  Compiled YAML Paths are likewise kept
+for reuse.  Commands are run one at a time, each processing all of its files
+in this process whatever its --jobs.
+
+Copyright 2022 William W. Kimball, Jr. MBA MSIS
+"""
+import sys
+import argparse
+import io
+import os
+import signal
+import socket
+import socketserver
+import traceback
+from importlib import import_module
+from typing import Any, Dict, Optional
+
+from yamlpath import __version__ as YAMLPATH_VERSION
+from yamlpath.commands.client import (
+    COMMANDS, SERVER_ENV, receive_message, send_message)
+from yamlpath.common import FilePool, MemoryDocumentCache, Parsers
+
+from yamlpath.wrappers import ConsolePrinter
+
+def processcli():
+    """Process command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Serves the yamlpath commands from one long-running process which"
+            " keeps parsed documents and compiled YAML Paths in memory.  The"
+            " yamlpath commands run via this server whenever the "
+            + SERVER_ENV + " environment variable is set to its SOCKET."),
+        epilog=(
+            "Only the user who starts the server can connect to it, and each"
+            " command runs with the permissions and environment of the server."
+            "  For more information about YAML Paths, please visit"
+            " https://github.com/wwkimball/yamlpath/wiki.  To report issues"
+            " with this tool or to request enhancements, please visit"
+            " https://github.com/wwkimball/yamlpath/issues.")
+    )
+    parser.add_argument("-V", "--version", action="version",
+                        version="%(prog)s " + YAMLPATH_VERSION)
+
+    parser.add_argument(
+        "--cachesize",
+        metavar="MB",
+        type=int,
+        default=1024,
+        help="forget the least recently used documents whenever those kept in\
+              memory grow larger than this many megabytes; default=1024")
+
+    noise_group = parser.add_mutually_exclusive_group()
+    noise_group.add_argument(
+        "-d", "--debug",
+        action="store_true",
+        help="output debugging details")
+    noise_group.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="increase output verbosity")
+    noise_group.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="suppress all output except errors")
+
+    parser.add_argument(
+        "socket", metavar="SOCKET",
+        help="the Unix domain socket on which to listen")
+
+    return parser.parse_args()
+
+def validateargs(args, log):
+    """Validate command-line arguments."""
+    has_errors = False
+
+    # --cachesize must be positive
+    if args.cachesize < 1:
+        has_errors = True
+        log.error("The --cachesize value must be a positive integer.")
+
+    # SOCKET must not be in use by another server
+    if os.path.exists(args.socket) and is_serving(args.socket):
+        has_errors = True
+        log.error("Another server is already listening on {}."
+                  .format(args.socket))
+
+    if has_errors:
+        sys.exit(1)
+
+def is_serving(server: str) -> bool:
+    """Indicate whether any server is listening on a socket."""
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(server)
+    except OSError:
+        return False
+    finally:
+        connection.close()
+    return True
+
+class ClientInput(io.TextIOBase):
+    """
+    The STDIN of a client, fetched from the client only once it is read.
+
+    Most commands never read STDIN, so it is not sent along with each command.
+    Like the STDIN of any process, it can be closed but has no file descriptor.
+    """
+
+    def __init__(self, rfile: Any, wfile: Any, isatty: bool) -> None:
+        """
+        Instantiate a ClientInput.
+
+        Parameters:
+        1. rfile (Any) The binary file-like view of the connection to read
+        2. wfile (Any) The binary file-like view of the connection to write
+        3. isatty (bool) Whether the STDIN of the client is a terminal
+
+        Returns:  N/A
+        """
+        super().__init__()
+        self._rfile: Any = rfile
+        self._wfile: Any = wfile
+        self._isatty: bool = isatty
+        self._buffer: Optional[io.StringIO] = None
+
+    @property
+    def encoding(self) -> str:  # type: ignore
+        """Name the encoding in which the client sends its STDIN."""
+        return "utf-8"
+
+    def fileno(self) -> int:
+        """Refuse to name a file descriptor, for there is none."""
+        raise io.UnsupportedOperation(
+            "The STDIN of a client has no file descriptor")
+
+    def readable(self) -> bool:
+        """Indicate that the STDIN of the client can be read."""
+        return True
+
+    def isatty(self) -> bool:
+        """Indicate whether the STDIN of the client is a terminal."""
+        return self._isatty
+
+    def read(self, size: Optional[int] = -1) -> str:
+        """Read from the STDIN of the client."""
+        return self._fetch().read(size)
+
+    def readline(self, size: int = -1) -> str:  # type: ignore
+        """Read one line from the STDIN of the client."""
+        return self._fetch().readline(size)
+
+    def _fetch(self) -> io.StringIO:
+        """Get the entire STDIN of the client."""
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        if self._buffer is None:
+            send_message(self._wfile, {"read": "stdin"})
+            message = receive_message(self._rfile)
+            self._buffer = io.StringIO(
+                "" if message is None else message.get("stdin", ""))
+        return self._buffer
+
+def run_command(request: Dict[str, Any], stdin: Any) -> Dict[str, Any]:
+    """
+    Run one command as if it were run by the client which requested it.
+
+    Parameters:
+    1. request (Dict[str, Any]) The command, argv, cwd, and isatty of the
+       client
+    2. stdin (Any) The STDIN of the client
+
+    Returns:  (Dict[str, Any]) The stdout, stderr, and exit code of the
+        command
+
+    Raises:  N/A
+    """
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    exit_code = 0
+    saved_cwd = os.getcwd()
+    saved_streams = (sys.argv, sys.stdin, sys.stdout, sys.stderr)
+    try:
+        module = import_module(
+            "yamlpath.commands." + COMMANDS[request["command"]])
+        os.chdir(request["cwd"])
+        sys.argv = [request["command"]] + list(request["argv"])
+        (sys.stdin, sys.stdout, sys.stderr) = (stdin, stdout, stderr)
+        module.main()
+    except SystemExit as ex:
+        exit_code = get_exit_code(ex, stderr)
+    # Any failure of a command is reported to the client, not the server
+    except Exception:  # pylint: disable=broad-except
+        stderr.write(traceback.format_exc())
+        exit_code = 1
+    finally:
+        (sys.argv, sys.stdin, sys.stdout, sys.stderr) = saved_streams
+        os.chdir(saved_cwd)
+
+    return {
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+        "exit": exit_code,
+    }
+
+def get_exit_code(ex: SystemExit, stderr: Any) -> int:
+    """Convert a SystemExit into the exit code Python would report."""
+    if ex.code is None:
+        return 0
+    if isinstance(ex.code, int):
+        return ex.code
+    print(ex.code, file=stderr)
+    return 1
+
+class CommandHandler(socketserver.StreamRequestHandler):
+    """Run the one command of each connection."""
+
+    def handle(self) -> None:
+        """Run the command of a client and report its results."""
+        request = receive_message(self.rfile)
+        if request is None:
+            return
+        log = self.server.log  # type: ignore
+        log.verbose("Running {} {}".format(
+            request.get("command"), request.get("argv")))
+        response = run_command(
+            request,
+            ClientInput(self.rfile, self.wfile, request.get("isatty", True)))
+        send_message(self.wfile, response)
+        log.verbose("Finished {} with exit code {}; {}".format(
+            request.get("command"), response["exit"],
+            Parsers.default_cache.cache_info()))
+
+class CommandServer(socketserver.UnixStreamServer):
+    """Listen for the commands of clients."""
+
+    def __init__(self, log: ConsolePrinter, server: str) -> None:
+        """
+        Instantiate a CommandServer.
+
+        Parameters:
+        1. log (ConsolePrinter) Instance of ConsolePrinter or subclass
+        2. server (str) The socket on which to listen
+
+        Returns:  N/A
+        """
+        self.log: ConsolePrinter = log
+        super().__init__(server, CommandHandler)
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        """Log any connection which failed rather than stop serving."""
+        self.log.warning("A client connection failed:  {}".format(
+            sys.exc_info()[1]))
+
+def stop(_signum: int, _frame: Any) -> None:
+    """Stop serving upon SIGTERM."""
+    raise KeyboardInterrupt()
+
+def main():
+    """Perform the work specified via CLI arguments and exit.
+
+    Main code.
+    """
+    args = processcli()
+    log = ConsolePrinter(args)
+    validateargs(args, log)
+
+    # Every command loads its files through documents kept in memory, which
+    # reports to this server rather than to any client
+    Parsers.default_cache = MemoryDocumentCache(
+        ConsolePrinter(argparse.Namespace(
+            debug=False, verbose=False, quiet=True)),
+        args.cachesize * 1024 * 1024)
+
+    # Commands run one at a time in this process, so --jobs is moot; workers
+    # forked from here would inherit its socket and client connections
+    FilePool.in_process = True
+    for module in COMMANDS.values():
+        import_module("yamlpath.commands." + module)
+
+    # A stale socket is left behind by any server which was killed; only the
+    # user who started the server may connect to its socket
+    if os.path.exists(args.socket):
+        os.remove(args.socket)
+    saved_umask = os.umask(0o077)
+    try:
+        server = CommandServer(log, args.socket)
+    finally:
+        os.umask(saved_umask)
+
+    signal.signal(signal.SIGTERM, stop)
+    log.info("Listening on {}".format(args.socket))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.remove(args.socket)
+
+if __name__ == "__main__":
+    main()  # pragma: no cover
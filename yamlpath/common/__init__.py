@@ -1,6 +1,15 @@
 """Common library methods."""
 from .anchors import Anchors
+from .documentcache import DocumentCache, MemoryDocumentCache
+from .documentindex import DocumentIndex
+from .filepool import FilePool
+from .fingerprintset import FingerprintSet
+from .keyindex import KeyIndex
 from .nodes import Nodes
 from .parsers import Parsers
+from .plainyamlreader import PlainYAMLReader
+from .querycache import QueryCache
+from .queryexplanation import QueryExplanation, SegmentStatistics
 from .searches import Searches
+from .searchindex import SearchIndex
 from .keywordsearches import KeywordSearches
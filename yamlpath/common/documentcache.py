@@ -0,0 +1,403 @@
+"""
+Implement DocumentCache, an on-disk cache of parsed YAML documents.
+
+MemoryDocumentCache keeps the same entries in memory instead.
+
+Copyright 2022 William W. Kimball, Jr. MBA MSIS
+"""
+import io
+import os
+import pickle
+import sys
+import tempfile
+from collections import OrderedDict
+from hashlib import sha256
+from typing import Any, Dict, Generator, List, Optional, Tuple
+
+import ruamel.yaml # type: ignore
+
+from yamlpath import __version__ as YAMLPATH_VERSION
+from yamlpath.wrappers import ConsolePrinter
+
+
+class DocumentCache:
+    """
+    Keep the parsed documents of YAML files in a directory on disk.
+
+    Each entry holds every document of one file exactly as a parser loaded
+    it -- including its Anchors, Aliases, tags, comments, and ordering -- in
+    a form which loads far faster than the YAML itself can be parsed.  An
+    entry is keyed by the path, size, modification time, and content hash of
+    the file along with the parser which loaded it, so any change to the file
+    or to the parser's configuration makes for a different entry.  Whenever
+    the entries together exceed the size bound of the cache, the least
+    recently used are removed.  The cache is best-effort:  an entry which
+    cannot be read or written is merely treated as a miss.  Because entries
+    are pickled, the cache directory must be no less trusted than the code
+    which reads it.
+    """
+
+    # Maximum total size of the entries, in bytes, by default
+    DEFAULT_SIZE: int = 1024 * 1024 * 1024
+
+    # File-name suffix of every entry
+    SUFFIX: str = ".pickle"
+
+    def __init__(
+        self, logger: ConsolePrinter, directory: str,
+        maxsize: int = DEFAULT_SIZE
+    ) -> None:
+        """
+        Instantiate a DocumentCache.
+
+        Parameters:
+        1. logger (ConsolePrinter) Instance of ConsolePrinter or subclass
+        2. directory (str) The directory holding the entries; it is created
+           as necessary
+        3. maxsize (int) The greatest total size, in bytes, of the entries
+
+        Returns:  N/A
+        """
+        self.logger: ConsolePrinter = logger
+        self.directory: str = directory
+        self.maxsize: int = maxsize
+        self._hits: int = 0
+        self._misses: int = 0
+
+    @property
+    def hits(self) -> int:
+        """Get the number of files loaded from this cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Get the number of files which had to be parsed."""
+        return self._misses
+
+    def cache_info(self) -> Dict[str, Any]:
+        """
+        Report statistics about this cache.
+
+        Parameters:  N/A
+
+        Returns:  (Dict[str, Any]) hits, misses, size (number of entries),
+            bytes (total size of the entries), and maxsize of the cache
+
+        Raises:  N/A
+        """
+        entries = self._entries()
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "size": len(entries),
+            "bytes": sum(size for (_, _, size) in entries),
+            "maxsize": self.maxsize,
+        }
+
+    def load(self, parser: Any, source: str) -> Any:
+        """
+        Load the single document of a YAML file.
+
+        Parameters:
+        1. parser (ruamel.yaml.YAML) The YAML data parser
+        2. source (str) The file to load
+
+        Returns:  (Any) The document
+
+        Raises:
+            - Any error of the parser or of reading the file
+        """
+        return list(self._load(parser, source, False))[0]
+
+    def load_all(
+        self, parser: Any, source: str
+    ) -> Generator[Any, None, None]:
+        """
+        Load every document of a YAML file.
+
+        Parameters:
+        1. parser (ruamel.yaml.YAML) The YAML data parser
+        2. source (str) The file to load
+
+        Returns:  (Generator[Any, None, None]) Each document
+
+        Raises:
+            - Any error of the parser or of reading the file
+        """
+        yield from self._load(parser, source, True)
+
+    def clear(self) -> None:
+        """
+        Remove every entry.
+
+        Parameters:  N/A
+
+        Returns:  N/A
+
+        Raises:  N/A
+        """
+        for (entry, _, _) in self._entries():
+            self._discard(entry)
+
+    def _load(
+        self, parser: Any, source: str, multidoc: bool
+    ) -> Generator[Any, None, None]:
+        """Load the documents of a YAML file, from its entry when able."""
+        with open(source, "rb") as fhnd:
+            content = fhnd.read()
+            stat = os.fstat(fhnd.fileno())
+
+        key = (
+            os.path.realpath(source), stat.st_size, stat.st_mtime_ns,
+            sha256(content).hexdigest(), multidoc,
+            DocumentCache._describe(parser))
+        entry = self._entry(sha256(repr(key).encode("utf-8")).hexdigest())
+
+        documents = self._read(entry, key)
+        if documents is not None:
+            self._hits += 1
+            self.logger.verbose(
+                "Loaded {} from the document cache.".format(source))
+            yield from documents
+            return
+
+        # Parse the content which was hashed rather than reading the file
+        # again, naming the file in any error message
+        self._misses += 1
+        self.logger.verbose(
+            "Parsing {} into the document cache.".format(source))
+        stream = io.StringIO(content.decode("utf-8"))
+        stream.name = source  # type: ignore
+        writer = self._open(key)
+        try:
+            for document in (
+                parser.load_all(stream) if multidoc else [parser.load(stream)]
+            ):
+                # Each document is stored before it can be changed
+                writer = self._write(writer, (True, document))
+                yield document
+            writer = self._write(writer, (False, None))
+            self._close(writer, entry)
+            writer = None
+        finally:
+            # Abandon the entry when any document could not be parsed
+            if writer is not None:
+                self._abandon(writer)
+
+    def _entry(self, digest: str) -> str:
+        """Name the entry of a key digest."""
+        return os.path.join(self.directory, digest + DocumentCache.SUFFIX)
+
+    def _read(self, entry: str, key: Tuple[Any, ...]) -> Optional[List[Any]]:
+        """Read the documents of an entry, if it is present and valid."""
+        try:
+            with open(entry, "rb") as fhnd:
+                documents = DocumentCache._unpickle(fhnd, key)
+            if documents is None:
+                return None
+            # Mark the entry as most recently used
+            os.utime(entry)
+        except FileNotFoundError:
+            return None
+        # Any unreadable entry is discarded
+        except Exception:  # pylint: disable=broad-except
+            self.logger.debug(
+                "Discarding unreadable document cache entry, {}."
+                .format(entry), prefix="DocumentCache::_read:  ")
+            DocumentCache._remove(entry)
+            return None
+        return documents
+
+    @staticmethod
+    def _unpickle(fhnd: Any, key: Tuple[Any, ...]) -> Optional[List[Any]]:
+        """Read the documents of an entry unless it has a different key."""
+        if pickle.load(fhnd) != key:
+            return None
+        documents = []
+        (more, document) = pickle.load(fhnd)
+        while more:
+            documents.append(document)
+            (more, document) = pickle.load(fhnd)
+        return documents
+
+    def _open(self, key: Tuple[Any, ...]) -> Optional[Tuple[Any, str]]:
+        """Begin writing a new entry, yielding its file and file name."""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            (fdesc, temp_path) = tempfile.mkstemp(
+                dir=self.directory, suffix=".tmp")
+            writer = (os.fdopen(fdesc, "wb"), temp_path)
+        except OSError as ex:
+            self.logger.debug(
+                "Unable to write to the document cache:  {}".format(ex),
+                prefix="DocumentCache::_open:  ")
+            return None
+        return self._write(writer, key)
+
+    def _write(
+        self, writer: Optional[Tuple[Any, str]], value: Any
+    ) -> Optional[Tuple[Any, str]]:
+        """Add a value to a new entry, abandoning the entry upon failure."""
+        if writer is None:
+            return None
+        try:
+            pickle.dump(value, writer[0], protocol=pickle.HIGHEST_PROTOCOL)
+        # Any document which cannot be pickled is merely not cached
+        except Exception as ex:  # pylint: disable=broad-except
+            self.logger.debug(
+                "Unable to write to the document cache:  {}".format(ex),
+                prefix="DocumentCache::_write:  ")
+            self._abandon(writer)
+            return None
+        return writer
+
+    def _abandon(self, writer: Tuple[Any, str]) -> None:
+        """Discard a new entry which could not be completed."""
+        (fhnd, temp_path) = writer
+        fhnd.close()
+        DocumentCache._remove(temp_path)
+
+    def _close(self, writer: Optional[Tuple[Any, str]], entry: str) -> None:
+        """Finish writing a new entry and then enforce the size bound."""
+        if writer is None:
+            return
+        (fhnd, temp_path) = writer
+        fhnd.close()
+        try:
+            if os.path.getsize(temp_path) > self.maxsize:
+                DocumentCache._remove(temp_path)
+                return
+
+            # Concurrent readers see either the entire entry or none of it
+            os.replace(temp_path, entry)
+        except OSError as ex:
+            self.logger.debug(
+                "Unable to write to the document cache:  {}".format(ex),
+                prefix="DocumentCache::_close:  ")
+            DocumentCache._remove(temp_path)
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries until within bounds."""
+        entries = self._entries()
+        total = sum(size for (_, _, size) in entries)
+        for (entry, _, size) in sorted(entries, key=lambda ent: ent[1]):
+            if total <= self.maxsize:
+                break
+            self._discard(entry)
+            total -= size
+
+    def _entries(self) -> List[Tuple[str, int, int]]:
+        """List every entry as (name, last use, size)."""
+        entries: List[Tuple[str, int, int]] = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return entries
+        for name in names:
+            if not name.endswith(DocumentCache.SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, stat.st_mtime_ns, stat.st_size))
+        return entries
+
+    def _discard(self, entry: str) -> None:
+        """Remove one entry."""
+        DocumentCache._remove(entry)
+
+    @staticmethod
+    def _describe(parser: Any) -> Tuple[Any, ...]:
+        """Identify everything about a parser which affects what it loads."""
+        editor = getattr(parser, "fallback", parser)
+        return (
+            type(parser).__module__, type(parser).__qualname__,
+            tuple(getattr(parser, "typ", ())),
+            getattr(editor, "preserve_quotes", None),
+            ruamel.yaml.__version__, YAMLPATH_VERSION,
+            sys.version_info[:2])
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        """Remove a file which may already have been removed."""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class MemoryDocumentCache(DocumentCache):
+    """
+    Keep the parsed documents of YAML files in memory.
+
+    Entries are keyed, bounded, and evicted exactly as they are by
+    DocumentCache, but live only as long as the cache itself.  Because every
+    entry is kept pickled, each load yields a fresh copy of the documents
+    which its caller may freely change.  This suits long-running processes,
+    like yamlpath-server, which load the same files over and over.
+    """
+
+    def __init__(
+        self, logger: ConsolePrinter,
+        maxsize: int = DocumentCache.DEFAULT_SIZE
+    ) -> None:
+        """
+        Instantiate a MemoryDocumentCache.
+
+        Parameters:
+        1. logger (ConsolePrinter) Instance of ConsolePrinter or subclass
+        2. maxsize (int) The greatest total size, in bytes, of the entries
+
+        Returns:  N/A
+        """
+        super().__init__(logger, "", maxsize)
+        # Entries ordered from least to most recently used
+        self._store: "OrderedDict[str, bytes]" = OrderedDict()
+
+    def _entry(self, digest: str) -> str:
+        """Name the entry of a key digest."""
+        return digest
+
+    def _read(self, entry: str, key: Tuple[Any, ...]) -> Optional[List[Any]]:
+        """Read the documents of an entry, if it is present and valid."""
+        blob = self._store.get(entry)
+        if blob is None:
+            return None
+        documents = DocumentCache._unpickle(io.BytesIO(blob), key)
+        if documents is not None:
+            self._store.move_to_end(entry)
+        return documents
+
+    def _open(self, key: Tuple[Any, ...]) -> Optional[Tuple[Any, str]]:
+        """Begin writing a new entry into a buffer."""
+        return self._write((io.BytesIO(), ""), key)
+
+    def _abandon(self, writer: Tuple[Any, str]) -> None:
+        """Discard a new entry which could not be completed."""
+        writer[0].close()
+
+    def _close(self, writer: Optional[Tuple[Any, str]], entry: str) -> None:
+        """Finish writing a new entry and then enforce the size bound."""
+        if writer is None:
+            return
+        blob = writer[0].getvalue()
+        writer[0].close()
+        if len(blob) > self.maxsize:
+            return
+        self._store[entry] = blob
+        self._store.move_to_end(entry)
+        self._evict()
+
+    def _entries(self) -> List[Tuple[str, int, int]]:
+        """List every entry as (name, last use, size)."""
+        return [
+            (entry, use, len(blob))
+            for (use, (entry, blob)) in enumerate(self._store.items())]
+
+    def _discard(self, entry: str) -> None:
+        """Remove one entry."""
+        self._store.pop(entry, None)
@@ -0,0 +1,322 @@
+"""
+Implement DocumentIndex, a lazily-built index of a document's YAML Anchors.
+
+Copyright 2022 William W. Kimball, Jr. MBA MSIS
+"""
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ruamel.yaml.comments import CommentedSeq, CommentedSet, CommentedMap
+
+# A place where a node is held:  (parent, parentref, is_key)
+ReferenceSite = Tuple[Any, Any, bool]
+
+
+class DocumentIndex:
+    """
+    Index the YAML Anchors, Aliases, and node references of a document.
+
+    Every lookup of an Anchor by its name would otherwise require a scan of
+    the entire document, which makes evaluating queries against documents
+    with many YAML Merge Keys quadratic.  The index is built in a single pass
+    upon first use and is retained until it is invalidated.  Any code which
+    changes the Anchors or Aliases of the indexed document -- other than
+    through the Processor which owns the index -- must invalidate it.
+
+    Separately and only upon request, the index also maps every node -- by
+    identity -- to every place in the document which holds it.  This lets a
+    change to a node reach all of its references without searching the whole
+    document for them.
+    """
+
+    def __init__(self, data: Any) -> None:
+        """
+        Instantiate a DocumentIndex.
+
+        Parameters:
+        1. data (Any) The document to index
+
+        Returns:  N/A
+
+        Raises:  N/A
+        """
+        self._data: Any = data
+        self._anchors: Optional[Dict[str, Any]] = None
+        self._alias_sites: Dict[int, List[Tuple[Any, Any]]] = {}
+        self._references: Optional[
+            Dict[int, Tuple[Any, List[ReferenceSite]]]] = None
+
+    @property
+    def data(self) -> Any:
+        """Get the indexed document."""
+        return self._data
+
+    @property
+    def is_built(self) -> bool:
+        """Indicate whether the index is presently built."""
+        return self._anchors is not None
+
+    @property
+    def has_references(self) -> bool:
+        """Indicate whether the reference index is presently built."""
+        return self._references is not None
+
+    @property
+    def anchors(self) -> Dict[str, Any]:
+        """
+        Get every Anchor in the document, by name.
+
+        The result is identical to that of `Anchors.scan_for_anchors` against
+        the whole document.  Callers must not modify it.
+
+        Parameters:  N/A
+
+        Returns:  (Dict[str, Any]) The anchored nodes, by Anchor name
+
+        Raises:  N/A
+        """
+        if self._anchors is None:
+            self._build()
+        return self._anchors  # type: ignore
+
+    def alias_sites(self, node: Any) -> List[Tuple[Any, Any]]:
+        """
+        Get every place an Anchored node is referenced within the document.
+
+        This includes the Anchor itself and every Alias to it, whether as a
+        value, an element, or a key.  YAML Merge Key references are excluded.
+
+        Parameters:
+        1. node (Any) The Anchored node
+
+        Returns:  (List[Tuple[Any, Any]]) Each (parent, parentref) which holds
+            `node`; empty when `node` has no Anchor or is not in the document
+        """
+        if self._anchors is None:
+            self._build()
+        return list(self._alias_sites.get(id(node), []))
+
+    def references(self, node: Any) -> List[ReferenceSite]:
+        """
+        Get every place the document holds a node, by identity.
+
+        Each place is reported as a (parent, parentref, is_key) tuple.  When
+        `is_key` is True, `node` is itself the key of a Hash; otherwise, it is
+        the value at `parentref` within a Hash or Array, or an element of a
+        Set.  Merged values are reported only within the Hash which defines
+        them.  The reference index is built in a single pass upon first use.
+
+        Parameters:
+        1. node (Any) The node to look up
+
+        Returns:  (List[ReferenceSite]) Every place which holds `node`
+        """
+        if self._references is None:
+            self._references = {}
+            self._index_references(self._data, set())
+
+        entry = self._references.get(id(node))
+        if entry is None or entry[0] is not node:
+            return []
+        return list(entry[1])
+
+    def add_node(self, node: Any, parent: Any, parentref: Any) -> None:
+        """
+        Record a node which has just been added to the document.
+
+        When `parent` is a Hash, `parentref` is recorded as a new key, too.
+
+        Parameters:
+        1. node (Any) The new node
+        2. parent (Any) The node's parent
+        3. parentref (Any) Index or Key of the node within `parent`
+
+        Returns:  N/A
+        """
+        self._forget_anchors_in(node)
+        if self._references is not None:
+            if isinstance(parent, dict):
+                self._add_reference(parentref, (parent, parentref, True))
+            self._add_reference(node, (parent, parentref, False))
+            self._index_references(node, set())
+
+    def replace_node(
+        self, old_node: Any, new_node: Any, sites: List[ReferenceSite]
+    ) -> None:
+        """
+        Record that some references to a node now hold another node.
+
+        Parameters:
+        1. old_node (Any) The node which was replaced; it must not be a
+           collection
+        2. new_node (Any) The node which replaced `old_node`
+        3. sites (List[ReferenceSite]) The places -- as reported by
+           `references` -- which held `old_node` and now hold `new_node`
+
+        Returns:  N/A
+        """
+        self._forget_anchors_in(old_node)
+        self._forget_anchors_in(new_node)
+        if self._references is None:
+            return
+
+        entry = self._references.get(id(old_node))
+        if entry is not None and entry[0] is old_node:
+            remaining = [site for site in entry[1] if not any(
+                site[0] is moved[0] and site[1] == moved[1]
+                and site[2] == moved[2] for moved in sites)]
+            if remaining:
+                self._references[id(old_node)] = (old_node, remaining)
+            else:
+                del self._references[id(old_node)]
+
+        for (parent, parentref, is_key) in sites:
+            # Keys and Set elements are their own references
+            if is_key or isinstance(parent, (set, CommentedSet)):
+                parentref = new_node
+            self._add_reference(new_node, (parent, parentref, is_key))
+        self._index_references(new_node, set())
+
+    def invalidate(self) -> None:
+        """
+        Discard the index so it will be rebuilt upon its next use.
+
+        Parameters:  N/A
+
+        Returns:  N/A
+
+        Raises:  N/A
+        """
+        self._anchors = None
+        self._alias_sites = {}
+        self._references = None
+
+    def _forget_anchors_in(self, node: Any) -> None:
+        """Discard the Anchor index when a node is or may hold an Anchor."""
+        if (self._anchors is not None
+            and (DocumentIndex._is_anchored(node)
+                 or isinstance(node, (dict, list, set, CommentedSet)))
+        ):
+            self._anchors = None
+            self._alias_sites = {}
+
+    def _add_reference(self, node: Any, site: ReferenceSite) -> None:
+        """Record that a node is held at a site."""
+        references: Dict[int, Tuple[Any, List[ReferenceSite]]] = (
+            self._references)  # type: ignore
+        entry = references.get(id(node))
+        if entry is None or entry[0] is not node:
+            references[id(node)] = (node, [site])
+        else:
+            entry[1].append(site)
+
+    def _index_references(self, dom: Any, visited: Set[int]) -> None:
+        """
+        Record every reference held by a node and its descendants.
+
+        Parameters:
+        1. dom (Any) The node to index
+        2. visited (Set[int]) Identities of the collections already indexed
+
+        Returns:  N/A
+        """
+        if id(dom) in visited:
+            return
+
+        add = self._add_reference
+        if isinstance(dom, dict):
+            visited.add(id(dom))
+            for key in dom.keys():
+                add(key, (dom, key, True))
+            items = (dom.non_merged_items()
+                     if isinstance(dom, CommentedMap)
+                     else dom.items())
+            for key, val in items:
+                add(val, (dom, key, False))
+                self._index_references(val, visited)
+
+        elif isinstance(dom, list):
+            visited.add(id(dom))
+            for idx, ele in enumerate(dom):
+                add(ele, (dom, idx, False))
+                self._index_references(ele, visited)
+
+        elif isinstance(dom, (set, CommentedSet)):
+            visited.add(id(dom))
+            for ele in dom:
+                add(ele, (dom, ele, False))
+
+    def _build(self) -> None:
+        """Index the entire document in one pass."""
+        self._anchors = {}
+        self._alias_sites = {}
+        self._scan(self._data, set())
+
+    def _add_site(self, node: Any, parent: Any, parentref: Any) -> None:
+        """Record that an Anchored node is held by a parent."""
+        self._alias_sites.setdefault(id(node), []).append((parent, parentref))
+
+    def _scan(self, dom: Any, visited: Set[int]) -> None:
+        """
+        Index a node and its descendants.
+
+        Anchors are gathered exactly as `Anchors.scan_for_anchors` gathers
+        them -- including from merged and aliased content -- while the
+        references held by each collection are recorded only once.
+
+        Parameters:
+        1. dom (Any) The node to index
+        2. visited (Set[int]) Identities of the collections already recorded
+
+        Returns:  N/A
+        """
+        first_visit = id(dom) not in visited
+        if isinstance(dom, CommentedMap):
+            visited.add(id(dom))
+            self._scan_map(dom, first_visit, visited)
+
+        elif isinstance(dom, CommentedSeq):
+            visited.add(id(dom))
+            for idx, ele in enumerate(dom):
+                self._scan(ele, visited)
+                if first_visit and DocumentIndex._is_anchored(ele):
+                    self._add_site(ele, dom, idx)
+
+        elif DocumentIndex._is_anchored(dom):
+            self._anchors[dom.anchor.value] = dom  # type: ignore
+
+    def _scan_map(
+        self, dom: CommentedMap, first_visit: bool, visited: Set[int]
+    ) -> None:
+        """
+        Index a Hash and its descendants.
+
+        Parameters:
+        1. dom (CommentedMap) The Hash to index
+        2. first_visit (bool) Whether `dom` has not yet been recorded
+        3. visited (Set[int]) Identities of the collections already recorded
+
+        Returns:  N/A
+        """
+        anchors: Dict[str, Any] = self._anchors  # type: ignore
+        for key, val in dom.items():
+            if DocumentIndex._is_anchored(key):
+                anchors[key.anchor.value] = key
+
+            if DocumentIndex._is_anchored(val):
+                anchors[val.anchor.value] = val
+
+            # Recurse into complex values
+            if isinstance(val, (CommentedMap, CommentedSeq)):
+                self._scan(val, visited)
+
+        if first_visit:
+            for key, val in dom.non_merged_items():
+                if DocumentIndex._is_anchored(key):
+                    self._add_site(key, dom, key)
+                if DocumentIndex._is_anchored(val):
+                    self._add_site(val, dom, key)
+
+    @staticmethod
+    def _is_anchored(node: Any) -> bool:
+        """Indicate whether a node has an Anchor."""
+        return hasattr(node, "anchor") and node.anchor.value is not None
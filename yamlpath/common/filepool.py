@@ -0,0 +1,288 @@
+"""
+Implement FilePool, which processes many files in parallel processes.
+
+Copyright 2022 William W. Kimball, Jr. MBA MSIS
+"""
+import io
+import multiprocessing
+import os
+import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# The function which processes each file in this worker process
+_PROCESS_FILE: Optional[Callable[[str], int]] = None
+
+# The index of the earliest file known to have exited, shared by every worker
+_STOP_AT: Any = None
+
+
+class FilePool:
+    """
+    Process each of many files, in a pool of worker processes when able.
+
+    Each worker builds its own function for processing files -- along with
+    whatever parser and processor that function keeps -- exactly once, so
+    nothing but file names and results pass between processes.  Files are
+    handed to the workers in chunks, largest files first:  every large file
+    is a chunk of its own while small files are grouped until their chunk is
+    about as costly as the others, so neither a few huge files nor thousands
+    of tiny ones leave workers idle.  The output of each file is captured by
+    its worker -- STDOUT and STDERR together, in the order written -- and
+    then written, and its exit state counted, strictly in the order in which
+    the files were given, so the results are identical to those of
+    processing every file one after another.  The - pseudo-file is always
+    processed in this process, which holds STDIN.
+
+    Any unexpected exception while processing a file is reported as that
+    file's traceback on STDERR and an exit state of 1; the remaining files
+    are still processed.  Once any file exits, no worker starts any later
+    file, but a later file which another worker had already started is
+    finished -- though its output is discarded -- before the exit.
+
+    Setting `FilePool.in_process` processes every file in this process no
+    matter how many jobs are requested, as yamlpath-server does so that no
+    worker inherits its socket or the connections of its clients.
+    """
+
+    # Number of chunks to schedule for each worker
+    CHUNKS_PER_JOB: int = 4
+
+    # Greatest number of files in any one chunk
+    MAX_CHUNK_FILES: int = 64
+
+    # Cost of processing any file, in bytes, beyond its size
+    FILE_OVERHEAD: int = 4096
+
+    # Whether to process every file in this process, without any workers
+    in_process: bool = False
+
+    def __init__(
+        self, jobs: int, initializer: Callable[..., Callable[[str], int]],
+        *initargs: Any
+    ) -> None:
+        """
+        Instantiate a FilePool.
+
+        Parameters:
+        1. jobs (int) The greatest number of files to process at once; 0 =
+           one per CPU
+        2. initializer (Callable[..., Callable[[str], int]]) Builds the
+           function which processes one file and returns its exit state; it
+           must be a module-level function
+        3. *initargs (Any) Picklable arguments for `initializer`
+
+        Returns:  N/A
+        """
+        self.jobs: int = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.initializer: Callable[..., Callable[[str], int]] = initializer
+        self.initargs: Tuple[Any, ...] = initargs
+        self._process_file: Optional[Callable[[str], int]] = None
+
+    def process_file(self, yaml_file: str) -> int:
+        """
+        Process one file in this process.
+
+        Parameters:
+        1. yaml_file (str) The file to process; may be - for STDIN
+
+        Returns:  (int) The exit state of processing the file
+        """
+        if self._process_file is None:
+            self._process_file = self.initializer(*self.initargs)
+        return self._process_file(yaml_file)
+
+    def run(self, yaml_files: List[str]) -> int:
+        """
+        Process every file, reporting each in the order given.
+
+        Parameters:
+        1. yaml_files (List[str]) The files to process
+
+        Returns:  (int) The last non-zero exit state of any file -- 1 for
+            any file which raised an unexpected exception -- or 0 when every
+            file was processed successfully
+
+        Raises:
+            - `SystemExit` when processing any file exits, once the output of
+              every earlier file has been written
+        """
+        exit_state = 0
+        pooled = [
+            (index, yaml_file) for (index, yaml_file) in enumerate(yaml_files)
+            if yaml_file.strip() != "-"]
+        if FilePool.in_process or self.jobs < 2 or len(pooled) < 2:
+            for yaml_file in yaml_files:
+                (proc_state, exited) = _run_file(self.process_file, yaml_file)
+                if exited:
+                    sys.exit(proc_state)
+                if proc_state != 0:
+                    exit_state = proc_state
+            return exit_state
+        return self._run_pool(yaml_files, pooled)
+
+    def _run_pool(
+        self, yaml_files: List[str], pooled: List[Tuple[int, str]]
+    ) -> int:
+        """Process files in a pool of workers, reporting each in order."""
+        exit_state = 0
+        stop_at = multiprocessing.Value("l", len(yaml_files))
+        results: Dict[int, Tuple[Any, bool, List[Tuple[bool, str]]]] = {}
+        next_index = 0
+        exited = False
+        with multiprocessing.Pool(
+            min(self.jobs, len(pooled)), initializer=_start_worker,
+            initargs=(self.initializer, self.initargs, stop_at)
+        ) as pool:
+            # Every chunk is awaited, even after a file exits, so that no
+            # worker is terminated while it is changing a file
+            for chunk_results in pool.imap_unordered(
+                _process_chunk, self._chunk(pooled)
+            ):
+                for (index, proc_state, file_exited, output) in (
+                    chunk_results
+                ):
+                    results[index] = (proc_state, file_exited, output)
+
+                # Report every file whose turn has come
+                while not exited and next_index < len(yaml_files):
+                    if yaml_files[next_index].strip() == "-":
+                        (proc_state, exited) = _run_file(
+                            self.process_file, "-")
+                        if exited:
+                            _stop_after(stop_at, next_index)
+                    elif next_index in results:
+                        (proc_state, exited, output) = results.pop(
+                            next_index)
+                        _write_output(output)
+                    else:
+                        break
+
+                    if exited or proc_state != 0:
+                        exit_state = proc_state
+                    next_index += 1
+
+        if exited:
+            sys.exit(exit_state)
+        return exit_state
+
+    def _chunk(
+        self, yaml_files: List[Tuple[int, str]]
+    ) -> List[List[Tuple[int, str]]]:
+        """Group files into chunks of similar cost, costliest first."""
+        costs = sorted(
+            ((FilePool._cost(yaml_file), index, yaml_file)
+             for (index, yaml_file) in yaml_files),
+            key=lambda cost: (-cost[0], cost[1]))
+        budget = (sum(cost for (cost, _, _) in costs)
+                  // (self.jobs * FilePool.CHUNKS_PER_JOB))
+
+        chunks: List[List[Tuple[int, str]]] = []
+        chunk: List[Tuple[int, str]] = []
+        chunk_cost = 0
+        for (cost, index, yaml_file) in costs:
+            chunk.append((index, yaml_file))
+            chunk_cost += cost
+            if (chunk_cost >= budget
+                    or len(chunk) >= FilePool.MAX_CHUNK_FILES):
+                chunks.append(chunk)
+                chunk = []
+                chunk_cost = 0
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    @staticmethod
+    def _cost(yaml_file: str) -> int:
+        """Estimate the cost of processing a file."""
+        try:
+            size = os.path.getsize(yaml_file)
+        except OSError:
+            size = 0
+        return size + FilePool.FILE_OVERHEAD
+
+class _OutputRecorder(io.TextIOBase):
+    """Record what is written to STDOUT or STDERR, in order with the other."""
+
+    def __init__(self, output: List[Tuple[bool, str]], to_stderr: bool):
+        """
+        Instantiate an _OutputRecorder.
+
+        Parameters:
+        1. output (List[Tuple[bool, str]]) The writes to both streams, as
+           (to_stderr, text), shared with the recorder of the other stream
+        2. to_stderr (bool) Whether this records STDERR rather than STDOUT
+
+        Returns:  N/A
+        """
+        super().__init__()
+        self.output: List[Tuple[bool, str]] = output
+        self.to_stderr: bool = to_stderr
+
+    def writable(self) -> bool:
+        """Indicate that this stream can be written."""
+        return True
+
+    def write(self, text: str) -> int:  # type: ignore
+        """Record text written to this stream."""
+        if self.output and self.output[-1][0] == self.to_stderr:
+            self.output[-1] = (self.to_stderr, self.output[-1][1] + text)
+        else:
+            self.output.append((self.to_stderr, text))
+        return len(text)
+
+def _run_file(
+    process_file: Callable[[str], int], yaml_file: str
+) -> Tuple[Any, bool]:
+    """Process one file; get its exit state and whether it exited."""
+    try:
+        return (process_file(yaml_file), False)
+    except SystemExit as ex:
+        return (ex.code, True)
+    # The failure of one file is reported like any other, in its turn
+    except Exception:  # pylint: disable=broad-except
+        sys.stderr.write(traceback.format_exc())
+        return (1, False)
+
+def _stop_after(stop_at: Any, index: int) -> None:
+    """Keep every worker from starting any file after one which exited."""
+    with stop_at.get_lock():
+        stop_at.value = min(stop_at.value, index)
+
+def _write_output(output: List[Tuple[bool, str]]) -> None:
+    """Write the captured output of one file to STDOUT and STDERR."""
+    for (to_stderr, text) in output:
+        stream = sys.stderr if to_stderr else sys.stdout
+        stream.write(text)
+        stream.flush()
+
+def _start_worker(
+    initializer: Callable[..., Callable[[str], int]],
+    initargs: Tuple[Any, ...], stop_at: Any
+) -> None:
+    """Build the function which processes each file in a worker."""
+    # pylint: disable=global-statement
+    global _PROCESS_FILE, _STOP_AT
+    _PROCESS_FILE = initializer(*initargs)
+    _STOP_AT = stop_at
+
+def _process_chunk(
+    chunk: List[Tuple[int, str]]
+) -> List[Tuple[int, Any, bool, List[Tuple[bool, str]]]]:
+    """Process every file of a chunk in a worker, capturing its output."""
+    results = []
+    for (index, yaml_file) in chunk:
+        # No file after one which exited is ever reported
+        if index > _STOP_AT.value:
+            continue
+
+        output: List[Tuple[bool, str]] = []
+        with redirect_stdout(_OutputRecorder(output, False)), \
+                redirect_stderr(_OutputRecorder(output, True)):
+            (proc_state, exited) = _run_file(
+                _PROCESS_FILE, yaml_file)  # type: ignore
+        if exited:
+            _stop_after(_STOP_AT, index)
+        results.append((index, proc_state, exited, output))
+    return results
@@ -0,0 +1,104 @@
+"""
+Implement FingerprintSet, hash-based membership tests for YAML nodes.
+
+Copyright 2022 William W. Kimball, Jr. MBA MSIS
+"""
+from collections.abc import Mapping, Set
+from typing import Any, Dict, Hashable, Iterable, List
+
+
+# Fingerprint of every node which can be neither hashed nor decomposed
+_UNHASHABLE = ("<unhashable>",)
+
+
+class FingerprintSet:
+    """
+    A collection of YAML nodes which answers `node in collection` quickly.
+
+    Testing whether a node is in a List compares it against every element of
+    the List.  A FingerprintSet instead groups its nodes by a canonical,
+    hashable fingerprint of their content so that each test compares only
+    the nodes which share a fingerprint with the sought node, after first
+    checking for the very same node.  Membership is decided exactly as for a
+    List:  a node is in the collection when it is, or is equal (`==`) to, any
+    node added to it.  Nodes must not be changed while they are in a
+    FingerprintSet.
+    """
+
+    def __init__(self, nodes: Iterable[Any] = ()) -> None:
+        """
+        Instantiate a FingerprintSet.
+
+        Parameters:
+        1. nodes (Iterable[Any]) The initial nodes of the collection
+
+        Returns:  N/A
+        """
+        # Nodes are retained so their identities remain unique
+        self._nodes: List[Any] = []
+        self._ids: Dict[int, None] = {}
+        self._buckets: Dict[Hashable, List[Any]] = {}
+        for node in nodes:
+            self.add(node)
+
+    def __len__(self) -> int:
+        """Indicate how many nodes have been added."""
+        return len(self._nodes)
+
+    def __contains__(self, node: Any) -> bool:
+        """Indicate whether a node is, or is equal to, any added node."""
+        if id(node) in self._ids:
+            return True
+        for candidate in self._buckets.get(
+                FingerprintSet.fingerprint(node), ()):
+            if candidate is node or candidate == node:
+                return True
+        return False
+
+    def add(self, node: Any) -> None:
+        """
+        Add a node to this collection.
+
+        Parameters:
+        1. node (Any) The node to add
+
+        Returns:  N/A
+        """
+        self._nodes.append(node)
+        self._ids[id(node)] = None
+        self._buckets.setdefault(
+            FingerprintSet.fingerprint(node), []).append(node)
+
+    @staticmethod
+    def fingerprint(node: Any) -> Hashable:
+        """
+        Get a canonical, hashable fingerprint of the content of a node.
+
+        Nodes which are equal (`==`) have equal fingerprints, whatever their
+        ruamel.yaml or Python type.  Unequal nodes usually, but not always,
+        have different fingerprints.  Maps and Sets are fingerprinted without
+        regard to the order of their entries.
+
+        Parameters:
+        1. node (Any) The node to fingerprint
+
+        Returns:  (Hashable) The fingerprint
+        """
+        if isinstance(node, Mapping):
+            return ("{}", frozenset(
+                (FingerprintSet.fingerprint(key),
+                 FingerprintSet.fingerprint(val))
+                for key, val in node.items()))
+        if isinstance(node, (list, tuple)):
+            return ("[]", tuple(
+                FingerprintSet.fingerprint(ele) for ele in node))
+        if isinstance(node, Set):
+            return ("set", frozenset(
+                FingerprintSet.fingerprint(ele) for ele in node))
+
+        hashable: Hashable = node
+        try:
+            hash(hashable)
+        except TypeError:
+            return _UNHASHABLE
+        return hashable
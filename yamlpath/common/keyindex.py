@@ -0,0 +1,178 @@
+"""
+Implement KeyIndex, a lazily-built inverted index of a document's key names.
+
+Copyright 2022 William W. Kimball, Jr. MBA MSIS
+"""
+from typing import (
+    Any, Dict, FrozenSet, Hashable, Iterable, List, Optional, Tuple)
+
+from ruamel.yaml.comments import CommentedSet, TaggedScalar
+
+
+class KeyIndex:
+    """
+    Index every Hash key and Set element of a document by its name.
+
+    Finding every Hash with a particular key -- as `/**/image` does --
+    otherwise requires visiting every node of the document.  This index maps
+    each key name to the Hashes (and Sets) which hold it and each Hash, Array,
+    and Set to the Hashes and Arrays which hold it so that the Hashes, Arrays,
+    and Sets whose subtrees hold a key can be found without visiting any
+    other node.  Every other subtree can then be skipped.  Nodes are indexed
+    by identity, so each node is indexed once no matter how many Aliases
+    refer to it.  The index is built in a single pass upon first use and is
+    retained until it is invalidated.  Any code which changes the indexed
+    document -- other than through the Processor which owns the index -- must
+    invalidate it.
+    """
+
+    def __init__(self, data: Any) -> None:
+        """
+        Instantiate a KeyIndex.
+
+        Parameters:
+        1. data (Any) The document to index
+
+        Returns:  N/A
+
+        Raises:  N/A
+        """
+        self._data: Any = data
+        self._sites: Optional[Dict[Hashable, List[int]]] = None
+        self._parents: Dict[int, List[int]] = {}
+        # Indexed nodes are retained so their identities remain unique
+        self._nodes: Dict[int, Any] = {}
+        self._holders: Dict[Tuple[Hashable, ...], FrozenSet[int]] = {}
+
+    def __len__(self) -> int:
+        """Indicate how many distinct key names are indexed."""
+        return len(self._get_sites())
+
+    @property
+    def data(self) -> Any:
+        """Get the indexed document."""
+        return self._data
+
+    @property
+    def is_built(self) -> bool:
+        """Indicate whether the index is presently built."""
+        return self._sites is not None
+
+    def keys(self) -> List[Hashable]:
+        """
+        Get every distinct key name in the document.
+
+        Parameters:  N/A
+
+        Returns:  (List[Hashable]) Every Hash key and Set element
+
+        Raises:  N/A
+        """
+        return list(self._get_sites())
+
+    def is_indexed(self, node: Any) -> bool:
+        """
+        Indicate whether a Hash, Array, or Set is part of the document.
+
+        Parameters:
+        1. node (Any) The node to check
+
+        Returns:  (bool) True when the node was indexed; False, otherwise
+
+        Raises:  N/A
+        """
+        self._get_sites()
+        return self._nodes.get(id(node)) is node
+
+    def holders_of(self, *keys: Hashable) -> FrozenSet[int]:
+        """
+        Identify every node whose subtree holds any of several key names.
+
+        Parameters:
+        1. *keys (Hashable) The key names to find
+
+        Returns:  (FrozenSet[int]) The identities (`id`) of every indexed
+            Hash and Set which holds any of the keys and of every indexed
+            Hash and Array which -- at any depth -- holds one of those
+
+        Raises:  N/A
+        """
+        sites = self._get_sites()
+        holders = self._holders.get(keys)
+        if holders is not None:
+            return holders
+
+        found: Dict[int, None] = {}
+        pending: List[int] = []
+        for key in keys:
+            pending.extend(sites.get(key, ()))
+        while pending:
+            node_id = pending.pop()
+            if node_id in found:
+                continue
+            found[node_id] = None
+            pending.extend(self._parents.get(node_id, ()))
+
+        holders = frozenset(found)
+        self._holders[keys] = holders
+        return holders
+
+    def invalidate(self) -> None:
+        """
+        Discard the index so it will be rebuilt upon its next use.
+
+        Parameters:  N/A
+
+        Returns:  N/A
+
+        Raises:  N/A
+        """
+        self._sites = None
+        self._parents = {}
+        self._nodes = {}
+        self._holders = {}
+
+    def _get_sites(self) -> Dict[Hashable, List[int]]:
+        """Get the index of key names to their holders, building it first."""
+        if self._sites is None:
+            self._build()
+        return self._sites  # type: ignore
+
+    def _build(self) -> None:
+        """Index the entire document in a single pass."""
+        sites: Dict[Hashable, List[int]] = {}
+        parents: Dict[int, List[int]] = {}
+        nodes: Dict[int, Any] = {}
+
+        # Each node's subtree is the same wherever it appears, so each node
+        # is descended into only once; its other parents are merely recorded
+        pending: List[Any] = [self._data]
+        while pending:
+            node = pending.pop()
+            node_id = id(node)
+            if node_id in nodes:
+                continue
+            nodes[node_id] = node
+
+            if isinstance(node, dict):
+                children: Iterable[Any] = node.values()
+                for key in node:
+                    sites.setdefault(key, []).append(node_id)
+            elif isinstance(node, list):
+                children = node
+            elif isinstance(node, (CommentedSet, set)):
+                for ele in node:
+                    key = ele.value if isinstance(ele, TaggedScalar) else ele
+                    sites.setdefault(key, []).append(node_id)
+                continue
+            else:
+                continue
+
+            for child in children:
+                if isinstance(child, (dict, list, CommentedSet, set)):
+                    parents.setdefault(id(child), []).append(node_id)
+                    pending.append(child)
+
+        self._sites = sites
+        self._parents = parents
+        self._nodes = nodes
@@ -7,25 +7,26 @@ pre-defined keywords (in the programming language sense).
 
 Copyright 2020, 2022 William W. Kimball, Jr. MBA MSIS
 """
-from typing import Any, Dict, Generator, List, Optional
+from typing import (
+    Any, Callable, Dict, Generator, List, Optional, Tuple, Union)
 
 from ruamel.yaml.comments import CommentedMap
 
-from yamlpath.types import AncestryEntry, PathSegment
+from yamlpath.types import Ancestry, PathSegment
 from yamlpath.enums import PathSearchKeywords, PathSearchMethods
-from yamlpath.common import Anchors, Nodes, Searches
+from yamlpath.common import Anchors, DocumentIndex, Nodes, Searches
 from yamlpath.path import SearchKeywordTerms
 from yamlpath.exceptions import YAMLPathException
 from yamlpath.wrappers import NodeCoords
-from yamlpath import YAMLPath
+from yamlpath import CompiledYAMLPath, TranslatedPath, YAMLPath
 
 class KeywordSearches:
     """Helper methods for common data searching operations."""
 
     @staticmethod
     def search_matches(
-        terms: SearchKeywordTerms, haystack: Any, yaml_path: YAMLPath,
-        **kwargs: Any
+        terms: SearchKeywordTerms, haystack: Any,
+        yaml_path: Union[CompiledYAMLPath, YAMLPath], **kwargs: Any
     ) -> Generator[NodeCoords, None, None]:
         """
         Perform a keyword search.
@@ -77,8 +78,8 @@ class KeywordSearches:
     @staticmethod
     # pylint: disable=locally-disabled,too-many-locals
     def has_child(
-        data: Any, invert: bool, parameters: List[str], yaml_path: YAMLPath,
-        **kwargs: Any
+        data: Any, invert: bool, parameters: List[str],
+        yaml_path: Union[CompiledYAMLPath, YAMLPath], **kwargs: Any
     ) -> Generator[NodeCoords, None, None]:
         """
         Indicate whether data has a named or anchored child.
@@ -95,9 +96,9 @@ class KeywordSearches:
         * parentref (Any) The Index or Key of data within parent
         * relay_segment (PathSegment) YAML Path segment presently under
           evaluation
-        * translated_path (YAMLPath) YAML Path indicating precisely which node
-          is being evaluated
-        * ancestry (List[AncestryEntry]) Stack of ancestors preceding the
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
           present node under evaluation
 
         Returns:  (Generator[NodeCoords, None, None]) each result as it is
@@ -126,8 +127,8 @@ class KeywordSearches:
     @staticmethod
     # pylint: disable=locally-disabled,too-many-locals
     def _has_concrete_child(
-        data: Any, invert: bool, parameters: List[str], yaml_path: YAMLPath,
-        **kwargs: Any
+        data: Any, invert: bool, parameters: List[str],
+        yaml_path: Union[CompiledYAMLPath, YAMLPath], **kwargs: Any
     ) -> Generator[NodeCoords, None, None]:
         """
         Indicate whether data has a named child.
@@ -144,9 +145,9 @@ class KeywordSearches:
         * parentref (Any) The Index or Key of data within parent
         * relay_segment (PathSegment) YAML Path segment presently under
           evaluation
-        * translated_path (YAMLPath) YAML Path indicating precisely which node
-          is being evaluated
-        * ancestry (List[AncestryEntry]) Stack of ancestors preceding the
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
           present node under evaluation
 
         Returns:  (Generator[NodeCoords, None, None]) each result as it is
@@ -154,8 +155,9 @@ class KeywordSearches:
         """
         parent: Any = kwargs.pop("parent", None)
         parentref: Any = kwargs.pop("parentref", None)
-        translated_path: YAMLPath = kwargs.pop("translated_path", YAMLPath(""))
-        ancestry: List[AncestryEntry] = kwargs.pop("ancestry", [])
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
         relay_segment: PathSegment = kwargs.pop("relay_segment", None)
 
         match_key = parameters[0]
@@ -182,7 +184,7 @@ class KeywordSearches:
             # against each map in the list.
             if Nodes.node_is_aoh(data):
                 for idx, ele in enumerate(data):
-                    next_path = translated_path.append("[{}]".format(str(idx)))
+                    next_path = translated_path + "[{}]".format(str(idx))
                     for aoh_match in KeywordSearches._has_concrete_child(
                         ele, invert, parameters, yaml_path,
                         parent=data, parentref=idx, translated_path=next_path
@@ -213,8 +215,8 @@ class KeywordSearches:
     @staticmethod
     # pylint: disable=locally-disabled,too-many-locals,too-many-branches,too-many-statements
     def _has_anchored_child(
-        data: Any, invert: bool, parameters: List[str], yaml_path: YAMLPath,
-        **kwargs: Any
+        data: Any, invert: bool, parameters: List[str],
+        yaml_path: Union[CompiledYAMLPath, YAMLPath], **kwargs: Any
     ) -> Generator[NodeCoords, None, None]:
         """
         Indicate whether data has an anchored child.
@@ -231,19 +233,24 @@ class KeywordSearches:
         * parentref (Any) The Index or Key of data within parent
         * relay_segment (PathSegment) YAML Path segment presently under
           evaluation
-        * translated_path (YAMLPath) YAML Path indicating precisely which node
-          is being evaluated
-        * ancestry (List[AncestryEntry]) Stack of ancestors preceding the
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
           present node under evaluation
+        * document_index (DocumentIndex) Index of the YAML Anchors in the
+          document being evaluated
 
         Returns:  (Generator[NodeCoords, None, None]) each result as it is
             generated
         """
         parent: Any = kwargs.pop("parent", None)
         parentref: Any = kwargs.pop("parentref", None)
-        translated_path: YAMLPath = kwargs.pop("translated_path", YAMLPath(""))
-        ancestry: List[AncestryEntry] = kwargs.pop("ancestry", [])
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
         relay_segment: PathSegment = kwargs.pop("relay_segment", None)
+        document_index: Optional[DocumentIndex] = kwargs.pop(
+            "document_index", None)
 
         match_key = parameters[0]
         anchor_name = match_key[1:] if match_key[0] == "&" else match_key
@@ -251,8 +258,14 @@ class KeywordSearches:
         if isinstance(data, CommentedMap):
             # Look for YAML Merge Keys by the Anchor name
             all_data = ancestry[0][0] if len(ancestry) > 0 else data
-            all_anchors: Dict[str, Any] = {}
-            Anchors.scan_for_anchors(all_data, all_anchors)
+            all_anchors: Dict[str, Any]
+            if (document_index is not None
+                and document_index.data is all_data
+            ):
+                all_anchors = document_index.anchors
+            else:
+                all_anchors = {}
+                Anchors.scan_for_anchors(all_data, all_anchors)
             compare_node = (all_anchors[anchor_name]
                             if anchor_name in all_anchors
                             else None)
@@ -303,7 +316,7 @@ class KeywordSearches:
                 if ele is None:
                     continue
 
-                next_path = translated_path.append("[{}]".format(str(idx)))
+                next_path = translated_path + "[{}]".format(str(idx))
                 next_ancestry = ancestry + [(data, idx)]
                 for aoh_match in KeywordSearches._has_anchored_child(
                     ele, invert, parameters, yaml_path,
@@ -331,8 +344,8 @@ class KeywordSearches:
     @staticmethod
     # pylint: disable=locally-disabled,too-many-locals
     def name(
-        invert: bool, parameters: List[str], yaml_path: YAMLPath,
-        **kwargs: Any
+        invert: bool, parameters: List[str],
+        yaml_path: Union[CompiledYAMLPath, YAMLPath], **kwargs: Any
     ) -> Generator[NodeCoords, None, None]:
         """
         Match only the key-name of the present node.
@@ -348,9 +361,9 @@ class KeywordSearches:
         * parentref (Any) The Index or Key of data within parent
         * relay_segment (PathSegment) YAML Path segment presently under
           evaluation
-        * translated_path (YAMLPath) YAML Path indicating precisely which node
-          is being evaluated
-        * ancestry (List[AncestryEntry]) Stack of ancestors preceding the
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
           present node under evaluation
 
         Returns:  (Generator[NodeCoords, None, None]) each result as it is
@@ -358,8 +371,9 @@ class KeywordSearches:
         """
         parent: Any = kwargs.pop("parent", None)
         parentref: Any = kwargs.pop("parentref", None)
-        translated_path: YAMLPath = kwargs.pop("translated_path", YAMLPath(""))
-        ancestry: List[AncestryEntry] = kwargs.pop("ancestry", [])
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
         relay_segment: PathSegment = kwargs.pop("relay_segment", None)
 
         # There are no parameters
@@ -381,11 +395,31 @@ class KeywordSearches:
             parentref, parent, parentref, translated_path, ancestry,
             relay_segment)
 
+    @staticmethod
+    def _rank_predicates(
+        method: PathSearchMethods, match_value: Any
+    ) -> Tuple[Callable[[Any], bool], Callable[[Any], bool]]:
+        """
+        Compile the comparisons against the present extreme value.
+
+        Parameters:
+        1. method (PathSearchMethods) The comparison which ranks a value ahead
+           of `match_value`
+        2. match_value (Any) The present extreme value
+
+        Returns:  (Tuple[Callable[[Any], bool], Callable[[Any], bool]]) The
+            predicates indicating whether a value ranks ahead of and equal to
+            `match_value`, respectively
+        """
+        return (
+            Searches.search_predicate(method, match_value),
+            Searches.search_predicate(PathSearchMethods.EQUALS, match_value))
+
     @staticmethod
     # pylint: disable=locally-disabled,too-many-locals,too-many-branches,too-many-statements
     def max(
-        data: Any, invert: bool, parameters: List[str], yaml_path: YAMLPath,
-        **kwargs: Any
+        data: Any, invert: bool, parameters: List[str],
+        yaml_path: Union[CompiledYAMLPath, YAMLPath], **kwargs: Any
     ) -> Generator[NodeCoords, None, None]:
         """
         Find whichever nodes/elements have a maximum value.
@@ -402,9 +436,9 @@ class KeywordSearches:
         * parentref (Any) The Index or Key of data within parent
         * relay_segment (PathSegment) YAML Path segment presently under
           evaluation
-        * translated_path (YAMLPath) YAML Path indicating precisely which node
-          is being evaluated
-        * ancestry (List[AncestryEntry]) Stack of ancestors preceding the
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
           present node under evaluation
 
         Returns:  (Generator[NodeCoords, None, None]) each result as it is
@@ -412,8 +446,9 @@ class KeywordSearches:
         """
         parent: Any = kwargs.pop("parent", None)
         parentref: Any = kwargs.pop("parentref", None)
-        translated_path: YAMLPath = kwargs.pop("translated_path", YAMLPath(""))
-        ancestry: List[AncestryEntry] = kwargs.pop("ancestry", [])
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
         relay_segment: PathSegment = kwargs.pop("relay_segment", None)
 
         # There may be 0 or 1 parameters
@@ -427,6 +462,8 @@ class KeywordSearches:
 
         scan_node = parameters[0] if param_count > 0 else None
         match_value: Any = None
+        is_better, is_equal = KeywordSearches._rank_predicates(
+            PathSearchMethods.GREATER_THAN, match_value)
         match_nodes: List[NodeCoords] = []
         discard_nodes: List[NodeCoords] = []
         unwrapped_data: Any = NodeCoords.unwrap_node_coords(data)
@@ -448,11 +485,11 @@ class KeywordSearches:
                 if ele is not None and scan_node in ele:
                     eval_val = ele[scan_node]
                     if (match_value is None
-                        or Searches.search_matches(
-                            PathSearchMethods.GREATER_THAN, match_value,
-                            eval_val)
+                        or is_better(eval_val)
                     ):
                         match_value = eval_val
+                        is_better, is_equal = KeywordSearches._rank_predicates(
+                            PathSearchMethods.GREATER_THAN, match_value)
                         discard_nodes.extend(match_nodes)
                         match_nodes = [
                             NodeCoords(
@@ -462,9 +499,7 @@ class KeywordSearches:
                         continue
 
                     if (match_value is None
-                        or Searches.search_matches(
-                            PathSearchMethods.EQUALS, match_value,
-                            eval_val)
+                        or is_equal(eval_val)
                     ):
                         match_nodes.append(NodeCoords(
                             ele, data, idx, next_path, next_ancestry,
@@ -493,11 +528,13 @@ class KeywordSearches:
                     if val is not None and scan_node in val:
                         eval_val = val[scan_node]
                         if (match_value is None
-                            or Searches.search_matches(
-                                PathSearchMethods.GREATER_THAN, match_value,
-                                eval_val)
+                            or is_better(eval_val)
                         ):
                             match_value = eval_val
+                            is_better, is_equal = (
+                                KeywordSearches._rank_predicates(
+                                    PathSearchMethods.GREATER_THAN,
+                                    match_value))
                             discard_nodes.extend(match_nodes)
                             match_nodes = [
                                 NodeCoords(
@@ -507,9 +544,7 @@ class KeywordSearches:
                             continue
 
                         if (match_value is None
-                            or Searches.search_matches(
-                                PathSearchMethods.EQUALS, match_value,
-                                eval_val)
+                            or is_equal(eval_val)
                         ):
                             match_nodes.append(NodeCoords(
                                 val, data, key, next_path, next_ancestry,
@@ -547,11 +582,11 @@ class KeywordSearches:
                 if (ele is not None
                     and (
                         match_value is None or
-                        Searches.search_matches(
-                            PathSearchMethods.GREATER_THAN, match_value,
-                            ele)
+                        is_better(ele)
                 )):
                     match_value = ele
+                    is_better, is_equal = KeywordSearches._rank_predicates(
+                        PathSearchMethods.GREATER_THAN, match_value)
                     discard_nodes.extend(match_nodes)
                     match_nodes = [
                         NodeCoords(
@@ -561,9 +596,7 @@ class KeywordSearches:
                     continue
 
                 if (ele is not None
-                    and Searches.search_matches(
-                        PathSearchMethods.EQUALS, match_value,
-                        ele)
+                    and is_equal(ele)
                 ):
                     match_nodes.append(NodeCoords(
                         ele, data, idx, next_path, next_ancestry,
@@ -591,8 +624,8 @@ class KeywordSearches:
     @staticmethod
     # pylint: disable=locally-disabled,too-many-locals,too-many-branches,too-many-statements
     def min(
-        data: Any, invert: bool, parameters: List[str], yaml_path: YAMLPath,
-        **kwargs: Any
+        data: Any, invert: bool, parameters: List[str],
+        yaml_path: Union[CompiledYAMLPath, YAMLPath], **kwargs: Any
     ) -> Generator[NodeCoords, None, None]:
         """
         Find whichever nodes/elements have a minimum value.
@@ -609,9 +642,9 @@ class KeywordSearches:
         * parentref (Any) The Index or Key of data within parent
         * relay_segment (PathSegment) YAML Path segment presently under
           evaluation
-        * translated_path (YAMLPath) YAML Path indicating precisely which node
-          is being evaluated
-        * ancestry (List[AncestryEntry]) Stack of ancestors preceding the
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
           present node under evaluation
 
         Returns:  (Generator[NodeCoords, None, None]) each result as it is
@@ -619,8 +652,9 @@ class KeywordSearches:
         """
         parent: Any = kwargs.pop("parent", None)
         parentref: Any = kwargs.pop("parentref", None)
-        translated_path: YAMLPath = kwargs.pop("translated_path", YAMLPath(""))
-        ancestry: List[AncestryEntry] = kwargs.pop("ancestry", [])
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
         relay_segment: PathSegment = kwargs.pop("relay_segment", None)
 
         # There may be 0 or 1 parameters
@@ -634,6 +668,8 @@ class KeywordSearches:
 
         scan_node = parameters[0] if param_count > 0 else None
         match_value: Any = None
+        is_better, is_equal = KeywordSearches._rank_predicates(
+            PathSearchMethods.LESS_THAN, match_value)
         match_nodes: List[NodeCoords] = []
         discard_nodes: List[NodeCoords] = []
         unwrapped_data: Any = NodeCoords.unwrap_node_coords(data)
@@ -655,11 +691,11 @@ class KeywordSearches:
                 if ele is not None and scan_node in ele:
                     eval_val = ele[scan_node]
                     if (match_value is None
-                        or Searches.search_matches(
-                            PathSearchMethods.LESS_THAN, match_value,
-                            eval_val)
+                        or is_better(eval_val)
                     ):
                         match_value = eval_val
+                        is_better, is_equal = KeywordSearches._rank_predicates(
+                            PathSearchMethods.LESS_THAN, match_value)
                         discard_nodes.extend(match_nodes)
                         match_nodes = [
                             NodeCoords(
@@ -669,9 +705,7 @@ class KeywordSearches:
                         continue
 
                     if (match_value is None
-                        or Searches.search_matches(
-                            PathSearchMethods.EQUALS, match_value,
-                            eval_val)
+                        or is_equal(eval_val)
                     ):
                         match_nodes.append(NodeCoords(
                             ele, data, idx, next_path, next_ancestry,
@@ -700,11 +734,12 @@ class KeywordSearches:
                     if val is not None and scan_node in val:
                         eval_val = val[scan_node]
                         if (match_value is None
-                            or Searches.search_matches(
-                                PathSearchMethods.LESS_THAN, match_value,
-                                eval_val)
+                            or is_better(eval_val)
                         ):
                             match_value = eval_val
+                            is_better, is_equal = (
+                                KeywordSearches._rank_predicates(
+                                    PathSearchMethods.LESS_THAN, match_value))
                             discard_nodes.extend(match_nodes)
                             match_nodes = [
                                 NodeCoords(
@@ -714,9 +749,7 @@ class KeywordSearches:
                             continue
 
                         if (match_value is None
-                            or Searches.search_matches(
-                                PathSearchMethods.EQUALS, match_value,
-                                eval_val)
+                            or is_equal(eval_val)
                         ):
                             match_nodes.append(NodeCoords(
                                 val, data, key, next_path, next_ancestry,
@@ -754,11 +787,11 @@ class KeywordSearches:
                 if (ele is not None
                     and (
                         match_value is None or
-                        Searches.search_matches(
-                            PathSearchMethods.LESS_THAN, match_value,
-                            ele)
+                        is_better(ele)
                 )):
                     match_value = ele
+                    is_better, is_equal = KeywordSearches._rank_predicates(
+                        PathSearchMethods.LESS_THAN, match_value)
                     discard_nodes.extend(match_nodes)
                     match_nodes = [
                         NodeCoords(
@@ -768,9 +801,7 @@ class KeywordSearches:
                     continue
 
                 if (ele is not None
-                    and Searches.search_matches(
-                        PathSearchMethods.EQUALS, match_value,
-                        ele)
+                    and is_equal(ele)
                 ):
                     match_nodes.append(NodeCoords(
                         ele, data, idx, next_path, next_ancestry,
@@ -797,8 +828,8 @@ class KeywordSearches:
     @staticmethod
     # pylint: disable=locally-disabled,too-many-locals
     def parent(
-        data: Any, invert: bool, parameters: List[str], yaml_path: YAMLPath,
-        **kwargs: Any
+        data: Any, invert: bool, parameters: List[str],
+        yaml_path: Union[CompiledYAMLPath, YAMLPath], **kwargs: Any
     ) -> Generator[NodeCoords, None, None]:
         """
         Climb back up N parent levels in the data hierarchy.
@@ -815,9 +846,9 @@ class KeywordSearches:
         * parentref (Any) The Index or Key of data within parent
         * relay_segment (PathSegment) YAML Path segment presently under
           evaluation
-        * translated_path (YAMLPath) YAML Path indicating precisely which node
-          is being evaluated
-        * ancestry (List[AncestryEntry]) Stack of ancestors preceding the
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
           present node under evaluation
 
         Returns:  (Generator[NodeCoords, None, None]) each result as it is
@@ -825,8 +856,9 @@ class KeywordSearches:
         """
         parent: Any = kwargs.pop("parent", None)
         parentref: Any = kwargs.pop("parentref", None)
-        translated_path: YAMLPath = kwargs.pop("translated_path", YAMLPath(""))
-        ancestry: List[AncestryEntry] = kwargs.pop("ancestry", [])
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
         relay_segment: PathSegment = kwargs.pop("relay_segment", None)
 
         # There may be 0 or 1 parameters
@@ -871,9 +903,13 @@ class KeywordSearches:
                 data, parent, parentref, translated_path, ancestry,
                 relay_segment)
         else:
+            if not isinstance(translated_path, TranslatedPath):
+                translated_path = TranslatedPath(translated_path)
+            ancestry = Ancestry.from_entries(ancestry)
             for _ in range(parent_levels):
-                translated_path.pop()
-                (data, _) = ancestry.pop()
+                translated_path = translated_path.parent
+                (data, _) = ancestry.head
+                ancestry = ancestry.tail
                 ancestry_len -= 1
 
             parentref = ancestry[-1][1] if ancestry_len > 0 else None
@@ -886,8 +922,8 @@ class KeywordSearches:
     @staticmethod
     # pylint: disable=locally-disabled,too-many-locals,too-many-branches,too-many-statements
     def distinct(
-        data: Any, invert: bool, parameters: List[str], yaml_path: YAMLPath,
-        **kwargs: Any
+        data: Any, invert: bool, parameters: List[str],
+        yaml_path: Union[CompiledYAMLPath, YAMLPath], **kwargs: Any
     ) -> Generator[NodeCoords, None, None]:
         """
         Find distinct values.
@@ -904,9 +940,9 @@ class KeywordSearches:
         * parentref (Any) The Index or Key of data within parent
         * relay_segment (PathSegment) YAML Path segment presently under
           evaluation
-        * translated_path (YAMLPath) YAML Path indicating precisely which node
-          is being evaluated
-        * ancestry (List[AncestryEntry]) Stack of ancestors preceding the
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
           present node under evaluation
 
         Returns:  (Generator[NodeCoords, None, None]) each result as it is
@@ -914,8 +950,9 @@ class KeywordSearches:
         """
         parent: Any = kwargs.pop("parent", None)
         parentref: Any = kwargs.pop("parentref", None)
-        translated_path: YAMLPath = kwargs.pop("translated_path", YAMLPath(""))
-        ancestry: List[AncestryEntry] = kwargs.pop("ancestry", [])
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
         relay_segment: PathSegment = kwargs.pop("relay_segment", None)
 
         if invert:
@@ -1033,8 +1070,8 @@ class KeywordSearches:
     @staticmethod
     # pylint: disable=locally-disabled,too-many-locals,too-many-branches,too-many-statements
     def unique(
-        data: Any, invert: bool, parameters: List[str], yaml_path: YAMLPath,
-        **kwargs: Any
+        data: Any, invert: bool, parameters: List[str],
+        yaml_path: Union[CompiledYAMLPath, YAMLPath], **kwargs: Any
     ) -> Generator[NodeCoords, None, None]:
         """
         Find unique values.
@@ -1051,9 +1088,9 @@ class KeywordSearches:
         * parentref (Any) The Index or Key of data within parent
         * relay_segment (PathSegment) YAML Path segment presently under
           evaluation
-        * translated_path (YAMLPath) YAML Path indicating precisely which node
-          is being evaluated
-        * ancestry (List[AncestryEntry]) Stack of ancestors preceding the
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
           present node under evaluation
 
         Returns:  (Generator[NodeCoords, None, None]) each result as it is
@@ -1061,8 +1098,9 @@ class KeywordSearches:
         """
         parent: Any = kwargs.pop("parent", None)
         parentref: Any = kwargs.pop("parentref", None)
-        translated_path: YAMLPath = kwargs.pop("translated_path", YAMLPath(""))
-        ancestry: List[AncestryEntry] = kwargs.pop("ancestry", [])
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
         relay_segment: PathSegment = kwargs.pop("relay_segment", None)
 
         # There may be 0 or 1 parameters
@@ -4,9 +4,11 @@ Implement Nodes, a static library of generally-useful code for data nodes.
 Copyright 2020 William W. Kimball, Jr. MBA MSIS
 """
 import re
+import threading
+from collections import OrderedDict
 from datetime import datetime, date, timedelta, timezone
 from ast import literal_eval
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple, Union
 
 from dateutil import parser
 
@@ -31,12 +33,37 @@ from yamlpath.enums import (
     YAMLValueFormats,
 )
 from yamlpath.wrappers import NodeCoords
-from yamlpath import YAMLPath
+from yamlpath import CompiledYAMLPath, YAMLPath
 
 
 class Nodes:
     """Helper methods for common data node operations."""
 
+    # Upper bound on how many distinct strings typed_value remembers
+    TYPED_VALUE_CACHE_SIZE: int = 4096
+
+    _typed_values: "OrderedDict[str, Any]" = OrderedDict()
+    _typed_value_hits: int = 0
+    _typed_value_misses: int = 0
+
+    # Guards the typed value cache and its counters against concurrent callers
+    _typed_value_lock: threading.Lock = threading.Lock()
+
+    # Marks a cached string as not being a Python literal
+    _NOT_A_LITERAL: object = object()
+
+    # Marks a string as not being cached at all
+    _NOT_CACHED: object = object()
+
+    # Only these conversions are safe to share between callers
+    _IMMUTABLE_LITERALS: Tuple[type, ...] = (
+        bool, int, float, complex, str, bytes, type(None))
+
+    # Whether a string could possibly be a Python literal:  a number, a
+    # quoted string, a container, or one of the named constants
+    _MAYBE_LITERAL = re.compile(
+        r"[\s\d.+\-'\"\[({]|[bBrRuUfF]{1,2}['\"]|True|False|None")
+
     @staticmethod
     # pylint: disable=too-many-branches,too-many-statements,too-many-locals
     def make_new_node(
@@ -442,7 +469,8 @@ class Nodes:
 
     @staticmethod
     def build_next_node(
-        yaml_path: YAMLPath, depth: int, value: Any = None
+        yaml_path: Union[CompiledYAMLPath, YAMLPath], depth: int,
+        value: Any = None
     ) -> Any:
         """
         Get the best default value for the next entry in a YAML Path.
@@ -628,6 +656,10 @@ class Nodes:
         """
         Safely convert a String value to its intrinsic Python data type.
 
+        The same scalar strings tend to recur throughout a document, so the
+        conversions of the most recently converted strings are remembered in a
+        bounded, process-wide cache.
+
         Parameters:
         1. value (Any) the value to convert
         """
@@ -637,13 +669,58 @@ class Nodes:
         if isinstance(value, NodeCoords):
             return Nodes.typed_value(value.node)
 
+        if not isinstance(value, str):
+            return Nodes._convert_typed_value(value)
+
+        cache = Nodes._typed_values
+        with Nodes._typed_value_lock:
+            cached_value = cache.get(value, Nodes._NOT_CACHED)
+            if cached_value is not Nodes._NOT_CACHED:
+                Nodes._typed_value_hits += 1
+                cache.move_to_end(value)
+                return (value if cached_value is Nodes._NOT_A_LITERAL
+                        else cached_value)
+            Nodes._typed_value_misses += 1
+
+        # Convert without holding the lock
+        typed_value = Nodes._convert_typed_value(value)
+        if typed_value is value:
+            cached_value = Nodes._NOT_A_LITERAL
+        elif type(typed_value) in Nodes._IMMUTABLE_LITERALS:
+            cached_value = typed_value
+        if cached_value is not Nodes._NOT_CACHED:
+            with Nodes._typed_value_lock:
+                cache[str(value)] = cached_value
+                cache.move_to_end(str(value))
+                if len(cache) > Nodes.TYPED_VALUE_CACHE_SIZE:
+                    cache.popitem(last=False)
+        return typed_value
+
+    @staticmethod
+    def _convert_typed_value(value: Any) -> Any:
+        """
+        Convert a value to its intrinsic Python data type, without caching.
+
+        Parameters:
+        1. value (Any) the value to convert
+
+        Returns:  (Any) the converted value or, when it is not a Python
+            literal, `value` itself
+        """
         cased_value = value
         lower_value = str(value).lower()
 
+        # Booleans require special handling
+        if lower_value in ("true", "false"):
+            cased_value = str(value).title()
+        elif (isinstance(value, str)
+              and not Nodes._MAYBE_LITERAL.match(value)
+        ):
+            # Most YAML strings cannot possibly be literals, so don't bother
+            # parsing them to find that out.
+            return value
+
         try:
-            # Booleans require special handling
-            if lower_value in ("true", "false"):
-                cased_value = str(value).title()
             typed_value = literal_eval(cased_value)
         except ValueError:
             typed_value = value
@@ -651,6 +728,32 @@ class Nodes:
             typed_value = value
         return typed_value
 
+    @staticmethod
+    def clear_typed_value_cache() -> None:
+        """Discard every cached typed value and reset cache statistics."""
+        with Nodes._typed_value_lock:
+            Nodes._typed_values.clear()
+            Nodes._typed_value_hits = 0
+            Nodes._typed_value_misses = 0
+
+    @staticmethod
+    def typed_value_cache_info() -> Dict[str, Any]:
+        """
+        Report statistics about the process-wide typed value cache.
+
+        Parameters:  N/A
+
+        Returns:  (Dict[str, Any]) The hits, misses, present size, and maximum
+            size of the cache
+        """
+        with Nodes._typed_value_lock:
+            return {
+                "hits": Nodes._typed_value_hits,
+                "misses": Nodes._typed_value_misses,
+                "size": len(Nodes._typed_values),
+                "maxsize": Nodes.TYPED_VALUE_CACHE_SIZE,
+            }
+
     @staticmethod
     def get_timestamp_with_tzinfo(data: AnchoredTimeStamp) -> Any:
         """
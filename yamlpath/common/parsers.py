@@ -3,8 +3,9 @@ Implement Parsers, a static library of generally-useful code for data parsers.
 
 Copyright 2020, 2021 William W. Kimball, Jr. MBA MSIS
 """
+import sys
 import warnings
-from sys import maxsize, stdin
+from sys import maxsize
 from datetime import date, datetime
 from typing import Any, Dict, Generator, Tuple
 
@@ -26,11 +27,16 @@ from yamlpath.patches.timestamp import (
 
 from yamlpath.wrappers import ConsolePrinter
 from yamlpath.common import Nodes
+from .plainyamlreader import PlainYAMLReader
 
 
 class Parsers:
     """Helper methods for common YAML/JSON/Compatible parser operations."""
 
+    # Cache of parsed documents used whenever a load is given none, like the
+    # in-memory cache of a long-running process; None = parse every file
+    default_cache: Any = None
+
     @staticmethod
     def get_yaml_editor(**kwargs: Any) -> YAML:
         """
@@ -72,6 +78,32 @@ class Parsers:
 
         return yaml
 
+    @staticmethod
+    def get_yaml_reader(**kwargs: Any) -> YAML:
+        """
+        Build and return a YAML reader for documents which won't be written.
+
+        Parameters:  N/A
+
+        Keyword Arguments:
+        * fast (bool) True = load documents as plain dict, list, and scalar
+          data via the C-based loader of ruamel.yaml when it is available
+          (its pure-Python safe loader, otherwise), except documents with
+          Anchors, Aliases, merge keys, or tags, which are round-trip loaded;
+          False = round-trip load every document; default=False
+        * Any keyword argument of get_yaml_editor, which configures the
+          round-trip editor
+
+        Returns (Any) The ready-for-use YAML reader.
+
+        Raises:  N/A
+        """
+        fast = kwargs.pop("fast", False)
+        yaml = Parsers.get_yaml_editor(**kwargs)
+        if fast:
+            return PlainYAMLReader(yaml)
+        return yaml
+
     @staticmethod
     # pylint: disable=too-many-branches,too-many-statements,too-many-locals
     def get_yaml_data(
@@ -91,6 +123,8 @@ class Parsers:
         Keyword Arguments:
         * literal (bool) `source` is literal serialized YAML data rather than a
           file-spec, so load it directly
+        * cache (DocumentCache) Load files via this cache of parsed
+          documents; default=Parsers.default_cache
 
         Returns:  Tuple[Any, bool] A tuple containing the document and its
         success/fail state.  The first field is the parsed document; will be
@@ -99,6 +133,9 @@ class Parsers:
         and False, otherwise.
         """
         literal = kwargs.pop("literal", False)
+        cache = kwargs.pop("cache", None)
+        if cache is None:
+            cache = Parsers.default_cache
         yaml_data = None
         data_available = True
 
@@ -110,10 +147,12 @@ class Parsers:
             with warnings.catch_warnings():
                 warnings.filterwarnings("error")
                 if source == "-":
-                    yaml_data = parser.load(stdin.read())
+                    yaml_data = parser.load(sys.stdin.read())
                 else:
                     if literal:
                         yaml_data = parser.load(source)
+                    elif cache is not None:
+                        yaml_data = cache.load(parser, source)
                     else:
                         with open(source, 'r', encoding='utf-8') as fhnd:
                             yaml_data = parser.load(fhnd)
@@ -189,6 +228,8 @@ class Parsers:
         Keyword Arguments:
         * literal (bool) `source` is literal serialized YAML data rather than a
           file-spec, so load it directly
+        * cache (DocumentCache) Load files via this cache of parsed
+          documents; default=Parsers.default_cache
 
         Returns:  Generator[Tuple[Any, bool], None, None] A tuple for each
         document as it is parsed.  The first field is the parsed document; will
@@ -197,6 +238,9 @@ class Parsers:
         and False, otherwise.
         """
         literal = kwargs.pop("literal", False)
+        cache = kwargs.pop("cache", None)
+        if cache is None:
+            cache = Parsers.default_cache
 
         # This code traps errors and warnings from ruamel.yaml, substituting
         # lengthy stack-dumps with specific, meaningful feedback.  Further,
@@ -208,7 +252,7 @@ class Parsers:
                 warnings.filterwarnings("error")
                 if source == "-":
                     doc_yielded = False
-                    for document in parser.load_all(stdin.read()):
+                    for document in parser.load_all(sys.stdin.read()):
                         doc_yielded = True
                         logger.debug(
                             "Yielding document from {}:".format(source),
@@ -222,6 +266,14 @@ class Parsers:
                     if literal:
                         for document in parser.load_all(source):
                             yield (document, True)
+                    elif cache is not None:
+                        for document in cache.load_all(parser, source):
+                            logger.debug(
+                                "Yielding document from {}:"
+                                .format(source),
+                                prefix="get_yaml_multidoc_data: ",
+                                data=document)
+                            yield (document, True)
                     else:
                         with open(source, 'r', encoding='utf-8') as fhnd:
                             for document in parser.load_all(fhnd):
@@ -0,0 +1,142 @@
+"""
+Implement PlainYAMLReader, a loader of YAML documents as plain Python data.
+
+Copyright 2022 William W. Kimball, Jr. MBA MSIS
+"""
+import re
+from typing import Any, Generator, List, Optional
+
+from ruamel.yaml import YAML
+from ruamel.yaml.constructor import SafeConstructor
+
+from yamlpath.patches.timestamp import construct_anchored_timestamp
+
+
+# pylint: disable=too-many-ancestors
+class PlainConstructor(SafeConstructor):
+    """Construct plain Python data with the same timestamps as round-trips."""
+
+
+PlainConstructor.add_constructor(
+    "tag:yaml.org,2002:timestamp", construct_anchored_timestamp)
+
+
+class PlainYAMLReader(YAML):
+    """
+    Load YAML documents as plain dict, list, and scalar data.
+
+    Round-trip loading tracks the comments, formatting, quoting, and
+    references of every node so a document can be written back as it was
+    read.  Documents which will only be read need none of that, so this
+    reader loads them with the safe loader of ruamel.yaml -- which is
+    C-based whenever ruamel.yaml has its C extension -- instead.  Only
+    documents which can be read identically either way are loaded so:
+    documents which have any Anchors, Aliases, merge keys, or tags -- and
+    any which the safe loader cannot load -- are instead loaded by the
+    round-trip fallback editor, which also reports any errors.  Every
+    timestamp is loaded as an AnchoredTimeStamp or AnchoredDate just as the
+    round-trip editor would load it.
+    """
+
+    # Conservatively detects any Anchor, Alias, or tag indicator and any
+    # merge key; false positives merely cost a round-trip load
+    _REFERENCES = re.compile(r"(?:\A|[\s\[\{,:])[&*!]|<<")
+
+    def __init__(self, fallback: YAML, **kwargs: Any) -> None:
+        """
+        Instantiate a PlainYAMLReader.
+
+        Parameters:
+        1. fallback (ruamel.yaml.YAML) The round-trip editor which loads any
+           document this reader cannot load identically
+
+        Keyword Arguments:
+        * pure (bool) True = use the pure-Python loader even when the C-based
+          loader is available; default=False
+
+        Returns:  N/A
+        """
+        super().__init__(typ="safe", pure=kwargs.pop("pure", False))
+        # pylint: disable=invalid-name
+        self.Constructor = PlainConstructor
+        self.fallback: YAML = fallback
+
+    @staticmethod
+    def is_plain(text: str) -> bool:
+        """
+        Indicate whether YAML data can be loaded as plain data.
+
+        Parameters:
+        1. text (str) The serialized YAML data
+
+        Returns:  (bool) True when the data has no Anchors, Aliases, merge
+            keys, or tags; False, otherwise
+
+        Raises:  N/A
+        """
+        return PlainYAMLReader._REFERENCES.search(text) is None
+
+    def load(self, stream: Any) -> Any:
+        """
+        Load one YAML document.
+
+        Parameters:
+        1. stream (Any) The serialized YAML data or a file-like source of it
+
+        Returns:  (Any) The loaded document
+
+        Raises:
+            - Any error of the fallback editor
+        """
+        text = PlainYAMLReader._read(stream)
+        if PlainYAMLReader.is_plain(text):
+            try:
+                return super().load(text)
+            # Let the fallback editor report any problem
+            except Exception:  # pylint: disable=broad-except
+                pass
+        return self.fallback.load(PlainYAMLReader._rewind(stream, text))
+
+    def load_all(self, stream: Any) -> Generator[Any, None, None]:
+        """
+        Load every YAML document of a multi-document source.
+
+        Either every document is loaded as plain data or every document is
+        loaded by the fallback editor.
+
+        Parameters:
+        1. stream (Any) The serialized YAML data or a file-like source of it
+
+        Returns:  (Generator[Any, None, None]) Each loaded document
+
+        Raises:
+            - Any error of the fallback editor
+        """
+        text = PlainYAMLReader._read(stream)
+        documents: Optional[List[Any]] = None
+        if PlainYAMLReader.is_plain(text):
+            try:
+                documents = list(super().load_all(text))
+            # Let the fallback editor report any problem
+            except Exception:  # pylint: disable=broad-except
+                documents = None
+
+        if documents is None:
+            yield from self.fallback.load_all(
+                PlainYAMLReader._rewind(stream, text))
+        else:
+            yield from documents
+
+    @staticmethod
+    def _read(stream: Any) -> str:
+        """Read all of the serialized YAML data."""
+        return stream if isinstance(stream, str) else stream.read()
+
+    @staticmethod
+    def _rewind(stream: Any, text: str) -> Any:
+        """Get the source of YAML data which has already been read."""
+        # Files are reread so their name appears in any error message
+        if isinstance(stream, str) or not stream.seekable():
+            return text
+        stream.seek(0)
+        return stream
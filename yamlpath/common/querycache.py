@@ -0,0 +1,246 @@
+"""
+Implement QueryCache, a versioned cache of the nodes matched by queries.
+
+Copyright 2022 William W. Kimball, Jr. MBA MSIS
+"""
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from ruamel.yaml.comments import CommentedSet
+
+from yamlpath.enums import PathSegmentTypes
+from yamlpath.types import AncestryEntry
+from yamlpath.wrappers import NodeCoords
+from yamlpath import CompiledYAMLPath
+from .searchindex import SearchIndex
+
+# Identifies one query:  (YAML Path, segment separator)
+QueryKey = Tuple[str, Any]
+
+# The identities of every matched node and of each of their ancestors and of
+# those ancestors whose other children may also be matched
+QueryLineage = Tuple[FrozenSet[int], FrozenSet[int]]
+
+# One cached query:  (document version, matched nodes, lineage or None when
+# any change to the document may change the matches)
+QueryEntry = Tuple[int, List[NodeCoords], Optional[QueryLineage]]
+
+
+class QueryCache:
+    """
+    Remember the nodes which queries of one document have matched.
+
+    Every change to the document increments its version.  By default, every
+    cached query is stale once the version changes.  A selective cache
+    instead keeps each query whose matches cannot have been affected by the
+    change:  the query must select nodes purely by position (via keys,
+    indexes, and `*` wildcards), the change must neither replace nor remove
+    any matched node or any of their ancestors, it must not add to, remove
+    from, or replace the children of any Array, Set, or wildcard-matched Hash
+    among those ancestors, and it must not touch any Anchored or merged node
+    (which may be reachable from elsewhere).  Queries which matched nothing
+    are stale after any change.
+    Any code which changes the document other than through the Processor
+    which owns the cache must invalidate it.
+    """
+
+    # Maximum number of queries to retain by default
+    DEFAULT_SIZE: int = 256
+
+    # The segment types which select nodes purely by position
+    POSITIONAL_SEGMENTS: Tuple[PathSegmentTypes, ...] = (
+        PathSegmentTypes.KEY,
+        PathSegmentTypes.INDEX,
+        PathSegmentTypes.MATCH_ALL,
+    )
+
+    def __init__(
+        self, maxsize: int = DEFAULT_SIZE, selective: bool = False
+    ) -> None:
+        """
+        Instantiate an empty QueryCache.
+
+        Parameters:
+        1. maxsize (int) The most queries to retain; the least recently used
+           are discarded first
+        2. selective (bool) Keep the queries which a change cannot affect
+           rather than discarding every query upon any change
+
+        Returns:  N/A
+        """
+        self.maxsize: int = maxsize
+        self.selective: bool = selective
+        self._entries: "OrderedDict[QueryKey, QueryEntry]" = OrderedDict()
+        self._version: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def __len__(self) -> int:
+        """Indicate how many queries are cached, including stale ones."""
+        return len(self._entries)
+
+    @property
+    def version(self) -> int:
+        """Get the number of changes made to the document."""
+        return self._version
+
+    @property
+    def hits(self) -> int:
+        """Get the number of queries answered from this cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Get the number of queries which had to be evaluated."""
+        return self._misses
+
+    def cache_info(self) -> Dict[str, Any]:
+        """
+        Report statistics about this cache.
+
+        Parameters:  N/A
+
+        Returns:  (Dict[str, Any]) hits, misses, size, maxsize, and version of
+            the cache
+
+        Raises:  N/A
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "version": self._version,
+        }
+
+    def get(self, yaml_path: CompiledYAMLPath) -> Optional[List[NodeCoords]]:
+        """
+        Get the nodes matched by a query of the present document version.
+
+        Parameters:
+        1. yaml_path (CompiledYAMLPath) The query
+
+        Returns:  (Optional[List[NodeCoords]]) The matched nodes or None when
+            the query is not cached or its matches are stale
+
+        Raises:  N/A
+        """
+        key = QueryCache._key_of(yaml_path)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != self._version:
+            if entry is not None:
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(
+        self, yaml_path: CompiledYAMLPath, node_coords: List[NodeCoords]
+    ) -> None:
+        """
+        Remember every node matched by a query of the present document.
+
+        Parameters:
+        1. yaml_path (CompiledYAMLPath) The query
+        2. node_coords (List[NodeCoords]) Every node the query matched
+
+        Returns:  N/A
+
+        Raises:  N/A
+        """
+        if self.maxsize < 1:
+            return
+
+        lineage: Optional[QueryLineage] = None
+        if self.selective and node_coords and all(
+            step.segment_type in QueryCache.POSITIONAL_SEGMENTS
+            for step in yaml_path.steps
+        ):
+            lineage = QueryCache._lineage_of(yaml_path, node_coords)
+
+        key = QueryCache._key_of(yaml_path)
+        self._entries[key] = (self._version, node_coords, lineage)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def discard(self, ancestry: Iterable[AncestryEntry], *nodes: Any) -> None:
+        """
+        Record a change to the document, discarding the affected queries.
+
+        Parameters:
+        1. ancestry (Iterable[AncestryEntry]) The ancestors of the changed
+           node
+        2. *nodes (Any) The changed -- or added -- node followed by its
+           parent
+
+        Returns:  N/A
+
+        Raises:  N/A
+        """
+        prior_version = self._version
+        self._version += 1
+        if not (self.selective and self._entries):
+            return
+
+        ancestors = [parent for (parent, _) in ancestry]
+        if any(
+            SearchIndex.is_anchored(node)
+            or len(getattr(node, "merge", ())) > 0
+            for node in list(nodes) + ancestors
+        ):
+            return
+
+        # Changes beneath a matched node change only the content of the
+        # matched node, which its NodeCoords still reference
+        changed_id = id(nodes[0]) if nodes else None
+        parent_ids = {id(node) for node in nodes[1:]}
+        for key, (version, node_coords, lineage) in list(
+                self._entries.items()):
+            if (version == prior_version
+                    and lineage is not None
+                    and changed_id not in lineage[0]
+                    and lineage[1].isdisjoint(parent_ids)):
+                self._entries[key] = (self._version, node_coords, lineage)
+
+    def invalidate(self) -> None:
+        """
+        Discard every cached query.
+
+        Parameters:  N/A
+
+        Returns:  N/A
+
+        Raises:  N/A
+        """
+        self._entries.clear()
+        self._version += 1
+
+    @staticmethod
+    def _key_of(yaml_path: CompiledYAMLPath) -> QueryKey:
+        """Identify a query."""
+        return (yaml_path.original, yaml_path.separator)
+
+    @staticmethod
+    def _lineage_of(
+        yaml_path: CompiledYAMLPath, node_coords: List[NodeCoords]
+    ) -> QueryLineage:
+        """Identify the nodes on which the matches of a query depend."""
+        wildcard = any(
+            step.segment_type is PathSegmentTypes.MATCH_ALL
+            for step in yaml_path.steps)
+        line: Dict[int, None] = {}
+        branches: Dict[int, None] = {}
+        for node_coord in node_coords:
+            line[id(node_coord.node)] = None
+            ancestors = [node_coord.parent]
+            ancestors.extend(parent for (parent, _) in node_coord.ancestry)
+            for ancestor in ancestors:
+                line[id(ancestor)] = None
+                if wildcard or isinstance(
+                        ancestor, (list, set, CommentedSet)):
+                    branches[id(ancestor)] = None
+        return (frozenset(line), frozenset(branches))
@@ -0,0 +1,231 @@
+"""
+Implement QueryExplanation, a per-segment profile of one query.
+
+Copyright 2022 William W. Kimball, Jr. MBA MSIS
+"""
+from collections import deque
+from time import perf_counter
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple
+
+from yamlpath.enums import PathSegmentTypes, PathSeparators
+from yamlpath.wrappers import NodeCoords
+from yamlpath import CompiledYAMLPath, TranslatedPath, YAMLPath
+
+
+# pylint: disable=too-few-public-methods,too-many-instance-attributes
+class SegmentStatistics:
+    """
+    The work done while evaluating one segment of one YAML Path.
+
+    Time and allocations are exclusive:  work done while evaluating another
+    segment -- even one which this segment's handler evaluates on its own
+    behalf -- is attributed to that other segment.  The segments of each
+    YAML Path which a segment evaluates on its own behalf, like the
+    sub-paths of a Collector or the attribute of a descendant search, are
+    the children of that segment.
+    """
+
+    def __init__(
+        self, yaml_path: CompiledYAMLPath, segment_index: int
+    ) -> None:
+        """
+        Instantiate empty SegmentStatistics.
+
+        Parameters:
+        1. yaml_path (CompiledYAMLPath) The YAML Path being evaluated
+        2. segment_index (int) Index of the segment within yaml_path
+
+        Returns:  N/A
+        """
+        step = yaml_path.steps[segment_index]
+        self.yaml_path: CompiledYAMLPath = yaml_path
+        self.segment_index: int = segment_index
+        self.segment_type: PathSegmentTypes = step.segment_type
+        # pylint: disable=locally-disabled,protected-access
+        self.segment: str = YAMLPath._stringify_yamlpath_segments(
+            deque([step.unescaped]), PathSeparators.DOT)
+        self.evaluations: int = 0
+        self.visited: int = 0
+        self.yielded: int = 0
+        self.elapsed: float = 0.0
+        self.node_coords: int = 0
+        self.yaml_paths: int = 0
+        self.children: List[SegmentStatistics] = []
+
+    def __str__(self) -> str:
+        """Get a one-line summary of these statistics."""
+        return (
+            "[{}] {} {}:  evaluations={}, visited={}, yielded={},"
+            " time={:.6f}s, NodeCoords={}, YAMLPaths={}".format(
+                self.segment_index, self.segment_type.name, self.segment,
+                self.evaluations, self.visited, self.yielded, self.elapsed,
+                self.node_coords, self.yaml_paths))
+
+
+class QueryExplanation:
+    """
+    Explain how a Processor evaluated one YAML Path against its document.
+
+    Like the EXPLAIN ANALYZE of a database, this reports -- for each segment
+    of the YAML Path -- how often its handler was evaluated, how many nodes
+    it visited and yielded, how long it ran, and how many NodeCoords and YAML
+    Path objects it created.  The statistics form a tree which mirrors the
+    parsed segments:  the top level holds the segments of the explained YAML
+    Path and each segment holds the segments of the YAML Paths it evaluated
+    on its own behalf.  Created objects are counted only while a segment is
+    being explained, so no other query pays for the counting.
+    """
+
+    def __init__(self, yaml_path: CompiledYAMLPath) -> None:
+        """
+        Instantiate an empty QueryExplanation.
+
+        Parameters:
+        1. yaml_path (CompiledYAMLPath) The YAML Path being explained
+
+        Returns:  N/A
+        """
+        self.yaml_path: CompiledYAMLPath = yaml_path
+        self.matches: int = 0
+        self.elapsed: float = 0.0
+        self.segments: List[SegmentStatistics] = []
+
+        # Every profiled segment by (id(YAML Path), segment index); the YAML
+        # Paths are retained so their identities remain unique
+        self._statistics: Dict[Tuple[int, int], SegmentStatistics] = {}
+        self._yaml_paths: List[CompiledYAMLPath] = []
+
+        # The segments presently being evaluated, innermost last, as
+        # [statistics, start time, NodeCoords created at start, YAML Paths
+        # created at start, time of nested segments, NodeCoords of nested
+        # segments, YAML Paths of nested segments]
+        self._frames: List[List[Any]] = []
+
+        # Whether objects were being counted before any segment was entered
+        self._was_counting: bool = False
+
+        self._add_path(yaml_path, self.segments)
+
+    def __str__(self) -> str:
+        """Render these statistics as an indented tree."""
+        lines = [
+            "Query:  {}".format(self.yaml_path.original),
+            "Matches:  {} in {:.6f}s".format(self.matches, self.elapsed),
+        ]
+        lines.extend(QueryExplanation._render(self.segments, 1))
+        return "\n".join(lines)
+
+    def profile(
+        self, yaml_path: CompiledYAMLPath, segment_index: int,
+        node_coords: Iterable[Any]
+    ) -> Generator[Any, None, None]:
+        """
+        Relay the results of one segment handler while profiling it.
+
+        Parameters:
+        1. yaml_path (CompiledYAMLPath) The YAML Path being evaluated
+        2. segment_index (int) Index of the evaluated segment within yaml_path
+        3. node_coords (Iterable[Any]) The results of the segment handler
+
+        Returns:  (Generator[Any, None, None]) The results of the handler
+
+        Raises:  N/A
+        """
+        stats = self._statistics.get((id(yaml_path), segment_index))
+        if stats is None:
+            self._add_path(
+                yaml_path,
+                self._frames[-1][0].children if self._frames
+                else self.segments)
+            stats = self._statistics[(id(yaml_path), segment_index)]
+        stats.evaluations += 1
+        stats.visited += 1
+
+        results = iter(node_coords)
+        while True:
+            self._enter(stats)
+            try:
+                node_coord = next(results)
+            except StopIteration:
+                return
+            finally:
+                self._leave()
+            stats.yielded += 1
+            yield node_coord
+
+    def visit(self, nodes: int) -> None:
+        """
+        Count nodes visited by the segment presently being evaluated.
+
+        Parameters:
+        1. nodes (int) The number of nodes visited
+
+        Returns:  N/A
+
+        Raises:  N/A
+        """
+        if self._frames:
+            self._frames[-1][0].visited += nodes
+
+    def _add_path(
+        self, yaml_path: CompiledYAMLPath, parent: List[SegmentStatistics]
+    ) -> None:
+        """Add statistics for every segment of a newly seen YAML Path."""
+        self._yaml_paths.append(yaml_path)
+        for idx in range(len(yaml_path.steps)):
+            stats = SegmentStatistics(yaml_path, idx)
+            self._statistics[(id(yaml_path), idx)] = stats
+            parent.append(stats)
+
+    def _enter(self, stats: SegmentStatistics) -> None:
+        """Begin attributing work to a segment."""
+        if not self._frames:
+            self._was_counting = QueryExplanation._count_created(True)
+        self._frames.append([
+            stats, perf_counter(), NodeCoords.created,
+            YAMLPath.created + TranslatedPath.created, 0.0, 0, 0])
+
+    def _leave(self) -> None:
+        """Stop attributing work to the innermost segment."""
+        (stats, start, start_nc, start_paths, nested_time, nested_nc,
+         nested_paths) = self._frames.pop()
+        elapsed = perf_counter() - start
+        node_coords = NodeCoords.created - start_nc
+        yaml_paths = YAMLPath.created + TranslatedPath.created - start_paths
+        stats.elapsed += elapsed - nested_time
+        stats.node_coords += node_coords - nested_nc
+        stats.yaml_paths += yaml_paths - nested_paths
+        if self._frames:
+            outer = self._frames[-1]
+            outer[4] += elapsed
+            outer[5] += node_coords
+            outer[6] += yaml_paths
+        else:
+            QueryExplanation._count_created(self._was_counting)
+
+    @staticmethod
+    def _count_created(counting: bool) -> bool:
+        """Turn counting of created objects on or off; get the old state."""
+        was_counting = NodeCoords.counting
+        NodeCoords.counting = counting
+        YAMLPath.counting = counting
+        TranslatedPath.counting = counting
+        return was_counting
+
+    @staticmethod
+    def _render(
+        segments: List[SegmentStatistics], depth: int
+    ) -> List[str]:
+        """Render a tree of statistics as indented lines."""
+        lines: List[str] = []
+        for stats in segments:
+            lines.append("{}{}".format("  " * depth, stats))
+            yaml_path: Optional[CompiledYAMLPath] = None
+            for child in stats.children:
+                # Name each YAML Path this segment evaluated
+                if child.yaml_path is not yaml_path:
+                    yaml_path = child.yaml_path
+                    lines.append("{}Path:  {}".format(
+                        "  " * (depth + 1), yaml_path.original))
+                lines.extend(QueryExplanation._render([child], depth + 2))
+        return lines
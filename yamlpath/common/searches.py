@@ -3,8 +3,9 @@ Implement Searches, a static library of generally-useful code for searching.
 
 Copyright 2020 William W. Kimball, Jr. MBA MSIS
 """
+import operator
 import re
-from typing import Any, List
+from typing import Any, Callable, Dict, List
 
 from yamlpath.enums import (
     AnchorMatches,
@@ -18,8 +19,15 @@ from yamlpath.path import SearchTerms
 class Searches:
     """Helper methods for common data searching operations."""
 
+    # Comparison operators for the ordering search methods
+    _ORDERINGS: Dict[PathSearchMethods, Callable[[Any, Any], bool]] = {
+        PathSearchMethods.GREATER_THAN: operator.gt,
+        PathSearchMethods.LESS_THAN: operator.lt,
+        PathSearchMethods.GREATER_THAN_OR_EQUAL: operator.ge,
+        PathSearchMethods.LESS_THAN_OR_EQUAL: operator.le,
+    }
+
     @staticmethod
-    # pylint: disable=too-many-branches,too-many-statements
     def search_matches(
         method: PathSearchMethods, needle: str, haystack: Any
     ) -> bool:
@@ -29,6 +37,9 @@ class Searches:
         NOTE:  For less-than, greather-than and related operations, the test is
         whether `haystack` is less/greater-than `needle`.
 
+        When the same `needle` is to be compared against many haystacks, use
+        `search_predicate` (or `SearchTerms.predicate`), instead.
+
         Parameters:
         1. method (PathSearchMethods) The search method to employ
         2. needle (str) The value to look for.
@@ -36,85 +47,81 @@ class Searches:
 
         Returns:  (bool) True = comparision passes; False = comparison fails.
         """
-        typed_haystack = Nodes.typed_value(haystack)
-        typed_needle = Nodes.typed_value(needle)
-        needle_type = type(typed_needle)
-        matches: bool = False
+        return Searches.search_predicate(method, needle)(haystack)
+
+    @staticmethod
+    # pylint: disable=too-many-return-statements
+    def search_predicate(
+        method: PathSearchMethods, needle: str
+    ) -> Callable[[Any], bool]:
+        """
+        Compile a search comparison into a reusable predicate.
+
+        The needle is typed -- and, for regular expressions, compiled -- only
+        once and the returned predicate is specialized for the search method
+        and the type of the needle, so applying it to each haystack does only
+        the work which depends on that haystack.
+
+        Parameters:
+        1. method (PathSearchMethods) The search method to employ
+        2. needle (str) The value to look for.
+
+        Returns:  (Callable[[Any], bool]) A function which accepts a haystack
+            and performs the same comparison as `search_matches`
+
+        Raises:
+            - `NotImplementedError` when `method` is unknown
+        """
+        typed_value = Nodes.typed_value
+        typed_needle = typed_value(needle)
+        str_needle = str(needle)
 
         if method is PathSearchMethods.EQUALS:
-            if isinstance(typed_haystack, bool) and needle_type is bool:
-                matches = typed_haystack == typed_needle
-            elif isinstance(typed_haystack, int) and needle_type is int:
-                matches = typed_haystack == typed_needle
-            elif isinstance(typed_haystack, float) and needle_type is float:
-                matches = typed_haystack == typed_needle
-            else:
-                matches = str(typed_haystack) == str(needle)
-        elif method is PathSearchMethods.STARTS_WITH:
-            matches = str(typed_haystack).startswith(needle)
-        elif method is PathSearchMethods.ENDS_WITH:
-            matches = str(typed_haystack).endswith(needle)
-        elif method is PathSearchMethods.CONTAINS:
-            matches = needle in str(typed_haystack)
-        elif method is PathSearchMethods.GREATER_THAN:
-            if isinstance(typed_haystack, int):
-                if isinstance(typed_needle, (int, float)):
-                    matches = typed_haystack > typed_needle
-                else:
-                    matches = False
-            elif isinstance(typed_haystack, float):
-                if isinstance(typed_needle, (int, float)):
-                    matches = typed_haystack > typed_needle
-                else:
-                    matches = False
-            else:
-                matches = str(typed_haystack) > str(needle)
-        elif method is PathSearchMethods.LESS_THAN:
-            if isinstance(typed_haystack, int):
-                if isinstance(typed_needle, (int, float)):
-                    matches = typed_haystack < typed_needle
-                else:
-                    matches = False
-            elif isinstance(typed_haystack, float):
-                if isinstance(typed_needle, (int, float)):
-                    matches = typed_haystack < typed_needle
-                else:
-                    matches = False
-            else:
-                matches = str(typed_haystack) < str(needle)
-        elif method is PathSearchMethods.GREATER_THAN_OR_EQUAL:
-            if isinstance(typed_haystack, int):
-                if isinstance(typed_needle, (int, float)):
-                    matches = typed_haystack >= typed_needle
-                else:
-                    matches = False
-            elif isinstance(typed_haystack, float):
-                if isinstance(typed_needle, (int, float)):
-                    matches = typed_haystack >= typed_needle
-                else:
-                    matches = False
-            else:
-                matches = str(typed_haystack) >= str(needle)
-        elif method is PathSearchMethods.LESS_THAN_OR_EQUAL:
-            if isinstance(typed_haystack, int):
-                if isinstance(typed_needle, (int, float)):
-                    matches = typed_haystack <= typed_needle
-                else:
-                    matches = False
-            elif isinstance(typed_haystack, float):
-                if isinstance(typed_needle, (int, float)):
-                    matches = typed_haystack <= typed_needle
-                else:
-                    matches = False
-            else:
-                matches = str(typed_haystack) <= str(needle)
-        elif method == PathSearchMethods.REGEX:
+            # Booleans are also ints, so match on the needle's exact type
+            needle_type = type(typed_needle)
+            if needle_type in (bool, int, float):
+                haystack_type = needle_type
+
+                def equals_typed(haystack: Any) -> bool:
+                    typed_haystack = typed_value(haystack)
+                    if isinstance(typed_haystack, haystack_type):
+                        return bool(typed_haystack == typed_needle)
+                    return str(typed_haystack) == str_needle
+                return equals_typed
+
+            def equals(haystack: Any) -> bool:
+                return str(typed_value(haystack)) == str_needle
+            return equals
+
+        if method is PathSearchMethods.STARTS_WITH:
+            return lambda haystack: str(typed_value(haystack)).startswith(
+                needle)
+
+        if method is PathSearchMethods.ENDS_WITH:
+            return lambda haystack: str(typed_value(haystack)).endswith(
+                needle)
+
+        if method is PathSearchMethods.CONTAINS:
+            return lambda haystack: needle in str(typed_value(haystack))
+
+        if method in Searches._ORDERINGS:
+            compare = Searches._ORDERINGS[method]
+            needle_is_number = isinstance(typed_needle, (int, float))
+
+            def ordered(haystack: Any) -> bool:
+                typed_haystack = typed_value(haystack)
+                if isinstance(typed_haystack, (int, float)):
+                    return (needle_is_number
+                            and compare(typed_haystack, typed_needle))
+                return compare(str(typed_haystack), str_needle)
+            return ordered
+
+        if method is PathSearchMethods.REGEX:
             matcher = re.compile(needle)
-            matches = matcher.search(str(typed_haystack)) is not None
-        else:
-            raise NotImplementedError
+            return lambda haystack: matcher.search(
+                str(typed_value(haystack))) is not None
 
-        return matches
+        raise NotImplementedError
 
     @staticmethod
     def search_anchor(
@@ -158,8 +165,7 @@ class Searches:
             return AnchorMatches.ALIAS_EXCLUDED
 
         retval = AnchorMatches.NO_MATCH
-        matches = Searches.search_matches(
-            terms.method, terms.term, anchor_name)
+        matches = terms.predicate(anchor_name)
         if ((matches and not terms.inverted)
             or (terms.inverted and not matches)
         ):
@@ -0,0 +1,179 @@
+"""
+Implement SearchIndex, lazily-built indexes of Array-of-Hashes attributes.
+
+Copyright 2022 William W. Kimball, Jr. MBA MSIS
+"""
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from yamlpath.enums import PathSearchMethods
+from yamlpath.types import AncestryEntry
+from .nodes import Nodes
+
+
+class _AttributeIndex:
+    """Map each value of an Array-of-Hashes attribute to its elements."""
+
+    def __init__(self, data: List[Any], attribute: str) -> None:
+        """
+        Index every element of an Array by the value of one of its keys.
+
+        Each value is indexed by its string form and, when it is a number, by
+        its numeric value so every element which a search could match is
+        found by either.  Elements which lack the attribute are recorded
+        separately because searching them requires a descendant search.
+        """
+        self.data: List[Any] = data
+        self.values: Dict[Any, List[int]] = {}
+        self.unindexed: List[int] = []
+        self.shared: bool = False
+        self._texts: Optional[List[str]] = None
+
+        for idx, ele in enumerate(data):
+            if not (isinstance(ele, dict) and attribute in ele):
+                self.unindexed.append(idx)
+                continue
+
+            value = ele[attribute]
+            typed_value = Nodes.typed_value(value)
+            self.values.setdefault(str(typed_value), []).append(idx)
+            if isinstance(typed_value, (int, float)):
+                self.values.setdefault(typed_value, []).append(idx)
+
+            # Elements reachable from elsewhere in the document may change
+            # without a change to this Array
+            if (SearchIndex.is_anchored(ele)
+                or SearchIndex.is_anchored(value)
+                or len(getattr(ele, "merge", ())) > 0
+            ):
+                self.shared = True
+
+    def lookup(self, keys: Iterable[Any]) -> List[int]:
+        """Get the indexes of the elements with any of several values."""
+        found: Dict[int, None] = dict.fromkeys(self.unindexed)
+        for key in keys:
+            found.update(dict.fromkeys(self.values.get(key, ())))
+        return sorted(found)
+
+    def prefixed(self, prefix: str) -> List[int]:
+        """Get the indexes of the elements whose values begin with a prefix."""
+        if self._texts is None:
+            self._texts = sorted(
+                key for key in self.values if isinstance(key, str))
+
+        texts = self._texts
+        keys: List[str] = []
+        for idx in range(bisect_left(texts, prefix), len(texts)):
+            if not texts[idx].startswith(prefix):
+                break
+            keys.append(texts[idx])
+        return self.lookup(keys)
+
+
+class SearchIndex:
+    """
+    Index the attributes of the Arrays-of-Hashes searched within a document.
+
+    Without an index, every search of an Array-of-Hashes -- like
+    `/users[name=alice]` -- compares every element of the Array.  The first
+    equality (`=`) or prefix (`^`) search of an attribute within an Array
+    indexes every element of that Array by the value of that attribute so
+    that later such searches compare only the elements which can possibly
+    match.  Each index is kept until a change to its Array -- or to any node
+    within it -- discards it.  Any code which changes the document other than
+    through the Processor which owns the index must invalidate it.
+    """
+
+    # The search methods which may be answered via an index
+    METHODS: Tuple[PathSearchMethods, ...] = (
+        PathSearchMethods.EQUALS,
+        PathSearchMethods.STARTS_WITH,
+    )
+
+    def __init__(self) -> None:
+        """Instantiate an empty SearchIndex."""
+        self._indexes: Dict[Tuple[int, str], _AttributeIndex] = {}
+
+    def __len__(self) -> int:
+        """Indicate how many (Array, attribute) pairs are indexed."""
+        return len(self._indexes)
+
+    def candidates(
+        self, data: List[Any], attribute: str, method: PathSearchMethods,
+        term: str
+    ) -> Optional[List[int]]:
+        """
+        Get the indexes of the elements of an Array which a search may match.
+
+        The result may include elements which do not match, so each must still
+        be compared against the search, but it includes every element which
+        does match.  Elements are reported in the order of the Array.
+
+        Parameters:
+        1. data (List[Any]) The Array being searched
+        2. attribute (str) The name of the key being searched
+        3. method (PathSearchMethods) The search method
+        4. term (str) The search term
+
+        Returns:  (Optional[List[int]]) The indexes of the candidate elements
+            or None when the search cannot be answered via an index
+
+        Raises:  N/A
+        """
+        if method not in SearchIndex.METHODS:
+            return None
+
+        key = (id(data), attribute)
+        index = self._indexes.get(key)
+        if index is None or index.data is not data:
+            index = _AttributeIndex(data, attribute)
+            self._indexes[key] = index
+
+        if method is PathSearchMethods.STARTS_WITH:
+            return index.prefixed(term)
+
+        keys: List[Any] = [str(term)]
+        typed_term = Nodes.typed_value(term)
+        if isinstance(typed_term, (int, float)):
+            keys.append(typed_term)
+        return index.lookup(keys)
+
+    def discard(self, ancestry: Iterable[AncestryEntry], *nodes: Any) -> None:
+        """
+        Discard the indexes which a change to the document may affect.
+
+        Parameters:
+        1. ancestry (Iterable[AncestryEntry]) The ancestors of the changed
+           node
+        2. *nodes (Any) The changed node(s) and their parent(s)
+
+        Returns:  N/A
+
+        Raises:  N/A
+        """
+        if not self._indexes:
+            return
+
+        changed = {id(node) for node in nodes}
+        changed.update(id(parent) for (parent, _) in ancestry)
+        self._indexes = {
+            key: index for key, index in self._indexes.items()
+            if not (index.shared or key[0] in changed)}
+
+    def invalidate(self) -> None:
+        """
+        Discard every index so each will be rebuilt upon its next use.
+
+        Parameters:  N/A
+
+        Returns:  N/A
+
+        Raises:  N/A
+        """
+        self._indexes = {}
+
+    @staticmethod
+    def is_anchored(node: Any) -> bool:
+        """Indicate whether a node has a YAML Anchor."""
+        anchor = getattr(node, "anchor", None)
+        return anchor is not None and anchor.value is not None
@@ -0,0 +1,231 @@
+"""
+Implement CompiledYAMLPath, a pre-parsed and immutable YAML Path query plan.
+
+Copyright 2022 William W. Kimball, Jr. MBA MSIS
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Union
+
+from yamlpath.types import PathAttributes, PathSegment
+from yamlpath.enums import PathSegmentTypes, PathSeparators
+from yamlpath import YAMLPath
+
+
+class PathStep:
+    """
+    One executable step of a CompiledYAMLPath.
+
+    Each step pairs the escaped and unescaped renditions of one YAML Path
+    segment so that query processors need not re-read -- and re-copy -- the
+    parsed YAML Path for every node they visit.
+    """
+
+    def __init__(
+        self, escaped: PathSegment, unescaped: PathSegment
+    ) -> None:
+        """
+        Instantiate a PathStep.
+
+        Parameters:
+        1. escaped (PathSegment) The escaped form of the segment
+        2. unescaped (PathSegment) The unescaped form of the segment
+
+        Returns:  N/A
+        """
+        self._escaped: PathSegment = escaped
+        self._unescaped: PathSegment = unescaped
+
+    def __str__(self) -> str:
+        """Get a String representation of this step."""
+        return str(self._unescaped[1])
+
+    @property
+    def segment_type(self) -> PathSegmentTypes:
+        """Get the type of the segment this step processes."""
+        return self._escaped[0]
+
+    @property
+    def escaped(self) -> PathSegment:
+        """Get the escaped PathSegment of this step."""
+        return self._escaped
+
+    @property
+    def unescaped(self) -> PathSegment:
+        """Get the unescaped PathSegment of this step."""
+        return self._unescaped
+
+    @property
+    def stripped_attrs(self) -> PathAttributes:
+        """Get the escaped (stripped) attributes of this step."""
+        return self._escaped[1]
+
+    @property
+    def unstripped_attrs(self) -> PathAttributes:
+        """Get the unescaped (unstripped) attributes of this step."""
+        return self._unescaped[1]
+
+
+class CompiledYAMLPath:
+    """
+    An immutable, parsed-once query plan for a YAML Path.
+
+    Unlike YAMLPath, whose escaped and unescaped accessors return fresh copies
+    of its parsed segments, a CompiledYAMLPath resolves its segments exactly
+    once into a flat tuple of PathSteps.  Plans are shared through a bounded,
+    process-wide LRU cache which is keyed by the original YAML Path string and
+    its segment separator.  Use `CompiledYAMLPath.compile` to obtain plans.
+    """
+
+    # Maximum number of plans to retain in the process-wide LRU cache
+    CACHE_SIZE: int = 1024
+
+    _cache: "OrderedDict[Tuple[str, PathSeparators], CompiledYAMLPath]" = (
+        OrderedDict())
+    _cache_hits: int = 0
+    _cache_misses: int = 0
+
+    # Guards the LRU cache and its counters against concurrent callers
+    _cache_lock: threading.Lock = threading.Lock()
+
+    def __init__(self, yaml_path: YAMLPath) -> None:
+        """
+        Compile a YAML Path into a query plan.
+
+        Parameters:
+        1. yaml_path (YAMLPath) The YAML Path to compile; it is copied so
+           later changes to it do not affect this plan
+
+        Returns:  N/A
+
+        Raises:
+            - `YAMLPathException` when the YAML Path is invalid
+        """
+        self._separator: PathSeparators = yaml_path.separator
+        self._original: str = yaml_path.original
+        self._escaped: Tuple[PathSegment, ...] = tuple(yaml_path.escaped)
+        self._unescaped: Tuple[PathSegment, ...] = tuple(yaml_path.unescaped)
+        self._stringified: str = str(yaml_path)
+        self._steps: Tuple[PathStep, ...] = tuple(
+            PathStep(esc, unesc)
+            for esc, unesc in zip(self._escaped, self._unescaped))
+
+    def __str__(self) -> str:
+        """Get a stringified version of this plan's YAML Path."""
+        return self._stringified
+
+    def __repr__(self) -> str:
+        """Generate an eval()-safe representation of this object."""
+        return ("{}('{}', '{}')".format(self.__class__.__name__,
+                                        self._original, self._separator))
+
+    def __len__(self) -> int:
+        """Indicate how many steps comprise this plan."""
+        return len(self._steps)
+
+    @property
+    def original(self) -> str:
+        """Get the original, unparsed YAML Path of this plan."""
+        return self._original
+
+    @property
+    def separator(self) -> PathSeparators:
+        """Get the segment separator of this plan's YAML Path."""
+        return self._separator
+
+    @property
+    def escaped(self) -> Tuple[PathSegment, ...]:
+        """Get the (shared, immutable) escaped segments of this plan."""
+        return self._escaped
+
+    @property
+    def unescaped(self) -> Tuple[PathSegment, ...]:
+        """Get the (shared, immutable) unescaped segments of this plan."""
+        return self._unescaped
+
+    @property
+    def steps(self) -> Tuple[PathStep, ...]:
+        """Get the executable steps of this plan."""
+        return self._steps
+
+    @property
+    def is_root(self) -> bool:
+        """Indicate whether this plan points at the document root."""
+        return len(self._steps) == 0
+
+    @property
+    def yaml_path(self) -> YAMLPath:
+        """Get a new, mutable YAMLPath equivalent to this plan."""
+        yaml_path = YAMLPath(self._original)
+        yaml_path.separator = self._separator
+        return yaml_path
+
+    @staticmethod
+    def compile(
+        yaml_path: Union["CompiledYAMLPath", YAMLPath, str, None],
+        pathsep: PathSeparators = PathSeparators.AUTO
+    ) -> "CompiledYAMLPath":
+        """
+        Get the cached query plan for a YAML Path, compiling it when needed.
+
+        Parameters:
+        1. yaml_path (Union[CompiledYAMLPath, YAMLPath, str, None]) The YAML
+           Path to compile; pre-compiled plans are returned as-is
+        2. pathsep (PathSeparators) Forced YAML Path segment separator; set
+           only when automatic inference fails
+
+        Returns:  (CompiledYAMLPath) The query plan
+
+        Raises:
+            - `YAMLPathException` when the YAML Path is invalid
+        """
+        if isinstance(yaml_path, CompiledYAMLPath):
+            return yaml_path
+
+        if not isinstance(yaml_path, YAMLPath):
+            yaml_path = YAMLPath(yaml_path, pathsep)
+        elif pathsep is not PathSeparators.AUTO:
+            yaml_path.separator = pathsep
+
+        cache = CompiledYAMLPath._cache
+        cache_key = (yaml_path.original, yaml_path.separator)
+        with CompiledYAMLPath._cache_lock:
+            plan: Optional[CompiledYAMLPath] = cache.get(cache_key)
+            if plan is not None:
+                CompiledYAMLPath._cache_hits += 1
+                cache.move_to_end(cache_key)
+                return plan
+            CompiledYAMLPath._cache_misses += 1
+
+        # Compile without holding the lock; should another thread have cached
+        # the same plan meanwhile, share its plan instead
+        compiled = CompiledYAMLPath(yaml_path)
+        with CompiledYAMLPath._cache_lock:
+            plan = cache.setdefault(cache_key, compiled)
+            cache.move_to_end(cache_key)
+            if len(cache) > CompiledYAMLPath.CACHE_SIZE:
+                cache.popitem(last=False)
+        return plan
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Discard every cached query plan and reset cache statistics."""
+        with CompiledYAMLPath._cache_lock:
+            CompiledYAMLPath._cache.clear()
+            CompiledYAMLPath._cache_hits = 0
+            CompiledYAMLPath._cache_misses = 0
+
+    @staticmethod
+    def cache_info() -> Dict[str, Any]:
+        """
+        Report statistics about the process-wide query plan cache.
+
+        Returns:  (Dict[str, Any]) hits, misses, size, and maxsize of the cache
+        """
+        with CompiledYAMLPath._cache_lock:
+            return {
+                "hits": CompiledYAMLPath._cache_hits,
+                "misses": CompiledYAMLPath._cache_misses,
+                "size": len(CompiledYAMLPath._cache),
+                "maxsize": CompiledYAMLPath.CACHE_SIZE,
+            }
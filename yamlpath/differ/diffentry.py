@@ -17,6 +17,16 @@ from .enums.diffactions import DiffActions
 class DiffEntry:
     """One entry of a diff."""
 
+    __slots__ = (
+        "_action",
+        "_path",
+        "_lhs",
+        "_rhs",
+        "_key_tag",
+        "_index",
+        "_verbose",
+    )
+
     def __init__(
         self, action: DiffActions, path: YAMLPath, lhs: Any, rhs: Any,
         **kwargs
@@ -227,8 +227,8 @@ class Differ:
         rhs_tag = rhs.tag.value if hasattr(rhs, "tag") else None
         if lhs_tag != rhs_tag:
             self.logger.debug(
-                "Dictionaries have different YAML Tags; {} != {}:".format(
-                    lhs_tag, rhs_tag),
+                "Dictionaries have different YAML Tags; {} != {}:",
+                lhs_tag, rhs_tag,
                 prefix="Differ::_diff_dicts:  ")
             self._diffs.append(
                 DiffEntry(
@@ -305,23 +305,25 @@ class Differ:
         Returns:  N/A
         """
         self.logger.debug("Differ::_diff_synced_lists:  Starting...")
-        self.logger.debug(
-            "Synchronizing LHS Array elements at YAML Path, {}:"
-            .format(path if path else "/"),
-            prefix="Differ::_diff_syncd_lists:  ",
-            data=lhs)
-        self.logger.debug(
-            "Synchronizing RHS Array elements at YAML Path, {}:"
-            .format(path if path else "/"),
-            prefix="Differ::_diff_syncd_lists:  ",
-            data=rhs)
+        if self.logger.is_debug_enabled:
+            self.logger.debug(
+                "Synchronizing LHS Array elements at YAML Path, {}:"
+                .format(path if path else "/"),
+                prefix="Differ::_diff_syncd_lists:  ",
+                data=lhs)
+            self.logger.debug(
+                "Synchronizing RHS Array elements at YAML Path, {}:"
+                .format(path if path else "/"),
+                prefix="Differ::_diff_syncd_lists:  ",
+                data=rhs)
 
         syn_pairs = Differ.synchronize_lists_by_value(lhs, rhs)
-        self.logger.debug(
-            "Got synchronized pairs of Array elements at YAML Path, {}:"
-            .format(path if path else "/"),
-            prefix="Differ::_diff_syncd_lists:  ",
-            data=syn_pairs)
+        if self.logger.is_debug_enabled:
+            self.logger.debug(
+                "Got synchronized pairs of Array elements at YAML Path, {}:"
+                .format(path if path else "/"),
+                prefix="Differ::_diff_syncd_lists:  ",
+                data=syn_pairs)
 
         for (lidx, lele, ridx, rele) in syn_pairs:
             if lele is None:
@@ -462,25 +464,27 @@ class Differ:
             return
         deep_diff = diff_mode is AoHDiffOpts.DEEP
 
-        self.logger.debug(
-            "Synchronizing LHS Array elements at YAML Path, {}:"
-            .format(path if path else "/"),
-            prefix="Differ::_diff_arrays_of_hashes:  ",
-            data=lhs)
-        self.logger.debug(
-            "Synchronizing RHS Array elements at YAML Path, {}:"
-            .format(path if path else "/"),
-            prefix="Differ::_diff_arrays_of_hashes:  ",
-            data=rhs)
+        if self.logger.is_debug_enabled:
+            self.logger.debug(
+                "Synchronizing LHS Array elements at YAML Path, {}:"
+                .format(path if path else "/"),
+                prefix="Differ::_diff_arrays_of_hashes:  ",
+                data=lhs)
+            self.logger.debug(
+                "Synchronizing RHS Array elements at YAML Path, {}:"
+                .format(path if path else "/"),
+                prefix="Differ::_diff_arrays_of_hashes:  ",
+                data=rhs)
 
         # Perform either a KEY or DEEP comparison; either way, the elements
         # must first be synchronized based on their identity key values.
         syn_pairs = self.synchronize_lods_by_key(path, lhs, rhs)
-        self.logger.debug(
-            "Got synchronized pairs of Array elements at YAML Path, {}:"
-            .format(path if path else "/"),
-            prefix="Differ::_diff_arrays_of_hashes:  ",
-            data=syn_pairs)
+        if self.logger.is_debug_enabled:
+            self.logger.debug(
+                "Got synchronized pairs of Array elements at YAML Path, {}:"
+                .format(path if path else "/"),
+                prefix="Differ::_diff_arrays_of_hashes:  ",
+                data=syn_pairs)
 
         for (lidx, lele, ridx, rele) in syn_pairs:
             if lele is None:
@@ -782,7 +786,7 @@ class Differ:
                 NodeCoords(rhs[0], rhs, 0))
             self.logger.debug(
                 "Differ::synchronize_lods_by_key:  RHS AoH yielded key_attr:"
-                "  {}.".format(key_attr))
+                "  {}.", key_attr)
 
         rhs_reduced = []
         for original_idx, val in enumerate(rhs):
@@ -795,8 +799,8 @@ class Differ:
             if not key_attr in lhs_ele:
                 # Impossible to match this LHS record to any RHS record
                 self.logger.debug(
-                    "LHS record has no identity key, {}, for record at {}:"
-                    .format(key_attr, path),
+                    "LHS record has no identity key, {}, for record at {}:",
+                    key_attr, path,
                     data=lhs_ele,
                     prefix="Differ::synchronize_lods_by_key:  ")
                 syn_pairs.append((lhs_idx, lhs_ele, None, None))
@@ -814,14 +818,14 @@ class Differ:
                 if is_user_key and alt_key:
                     use_key = alt_key
                     self.logger.debug(
-                        "Using alternate key, {}, for record at {}[{}]."
-                        .format(use_key, path, rhs_idx),
+                        "Using alternate key, {}, for record at {}[{}].",
+                        use_key, path, rhs_idx,
                         data=rhs_ele,
                         prefix="Differ::synchronize_lods_by_key:  ")
                 else:
                     self.logger.debug(
-                        "Using inferred key, {}, for record at {}[{}]."
-                        .format(use_key, path, rhs_idx),
+                        "Using inferred key, {}, for record at {}[{}].",
+                        use_key, path, rhs_idx,
                         data=rhs_ele,
                         prefix="Differ::synchronize_lods_by_key:  ")
 
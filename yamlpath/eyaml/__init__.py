@@ -1,2 +1,3 @@
 """EYAML specializations of the core YAML Path processing classes."""
+from .eyamlbackend import EYAMLBackend, EYAMLCommandBackend
 from .eyamlprocessor import EYAMLProcessor
@@ -0,0 +1,114 @@
+"""
+Implement the means by which EYAML values are encrypted and decrypted.
+
+Copyright 2022 William W. Kimball, Jr. MBA MSIS
+"""
+from concurrent.futures import ThreadPoolExecutor
+from subprocess import run, PIPE
+from typing import List
+
+
+class EYAMLBackend:
+    """
+    Run eyaml commands on behalf of an EYAMLProcessor.
+
+    The EYAMLProcessor composes every eyaml command and interprets its output;
+    a backend decides only how those commands are run.  Subclasses must
+    implement `run`.  Those which can process many values more efficiently
+    than one at a time should also override `run_many`.
+    """
+
+    def run(self, cmd: List[str], value: bytes) -> str:
+        """
+        Run an eyaml command against one value.
+
+        Parameters:
+        1. cmd (List[str]) The eyaml command and its arguments
+        2. value (bytes) The value to feed to the command via STDIN
+
+        Returns:  (str) The STDOUT of the command, less trailing whitespace
+
+        Raises:
+        - `CalledProcessError` when the command fails
+        """
+        raise NotImplementedError
+
+    def run_many(self, cmd: List[str], values: List[bytes]) -> List[str]:
+        """
+        Run an eyaml command against each of many values.
+
+        Parameters:
+        1. cmd (List[str]) The eyaml command and its arguments
+        2. values (List[bytes]) The values to feed to the command
+
+        Returns:  (List[str]) The output for each value, in the same order
+
+        Raises:
+        - `CalledProcessError` when the command fails for any value
+        """
+        return [self.run(cmd, value) for value in values]
+
+
+class EYAMLCommandBackend(EYAMLBackend):
+    """
+    Run eyaml commands as child processes.
+
+    The eyaml command accepts only one value via STDIN per invocation, so
+    batches of values are spread across a small pool of concurrently running
+    eyaml processes.
+    """
+
+    DEFAULT_WORKERS: int = 4
+
+    def __init__(self, workers: int = DEFAULT_WORKERS) -> None:
+        """
+        Instantiate an EYAMLCommandBackend.
+
+        Parameters:
+        1. workers (int) The maximum number of eyaml processes to run at once
+
+        Returns:  N/A
+        """
+        self.workers: int = workers
+
+    def run(self, cmd: List[str], value: bytes) -> str:
+        """
+        Run an eyaml command against one value.
+
+        Parameters:
+        1. cmd (List[str]) The eyaml command and its arguments
+        2. value (bytes) The value to feed to the command via STDIN
+
+        Returns:  (str) The STDOUT of the command, less trailing whitespace
+
+        Raises:
+        - `CalledProcessError` when the command fails
+        """
+        # The eyaml binary is untrusted, so shell must always be False and
+        # all parameters must be supplied via a List.
+        return (
+            run(cmd, stdout=PIPE, input=value, check=True, shell=False)
+            .stdout
+            .decode("ascii")
+            .rstrip()
+        )
+
+    def run_many(self, cmd: List[str], values: List[bytes]) -> List[str]:
+        """
+        Run an eyaml command against each of many values.
+
+        Parameters:
+        1. cmd (List[str]) The eyaml command and its arguments
+        2. values (List[bytes]) The values to feed to the command
+
+        Returns:  (List[str]) The output for each value, in the same order
+
+        Raises:
+        - `CalledProcessError` when the command fails for any value
+        """
+        workers = min(self.workers, len(values))
+        if workers < 2:
+            return super().run_many(cmd, values)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda value: self.run(cmd, value), values))
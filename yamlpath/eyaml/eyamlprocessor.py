@@ -4,16 +4,17 @@ Implements an EYAML-capable version of YAML Path.
 Copyright 2018, 2019, 2020 William W. Kimball, Jr. MBA MSIS
 """
 import re
-from subprocess import run, PIPE, CalledProcessError
+from subprocess import CalledProcessError
 from os import access, sep, X_OK
 from shutil import which
-from typing import Any, Generator, List, Optional, Union
+from typing import Any, Dict, Generator, List, Optional, Union
 
-from ruamel.yaml.comments import CommentedSeq, CommentedMap
+from ruamel.yaml.comments import CommentedMap
 
 from yamlpath import YAMLPath
 from yamlpath.common import Anchors
 from yamlpath.eyaml.enums import EYAMLOutputFormats
+from yamlpath.eyaml.eyamlbackend import EYAMLBackend, EYAMLCommandBackend
 from yamlpath.enums import YAMLValueFormats, PathSeparators
 from yamlpath.eyaml.exceptions import EYAMLCommandException
 from yamlpath.wrappers import ConsolePrinter, NodeCoords
@@ -24,7 +25,7 @@ class EYAMLProcessor(Processor):
     """Extend Processor to understand EYAML content."""
 
     def __init__(
-        self, logger: ConsolePrinter, data: Any, **kwargs: Optional[str]
+        self, logger: ConsolePrinter, data: Any, **kwargs: Any
     ) -> None:
         """
         Instantiate an EYAMLProcessor.
@@ -41,6 +42,9 @@ class EYAMLProcessor(Processor):
             for use with data encryption
         * privatekey (Optional[str]) Fully-qualified path to the public key
             for use with data decryption
+        * backend (Optional[EYAMLBackend]) The means by which eyaml commands
+            are run; by default, each is run as a child process with up to
+            EYAMLCommandBackend.DEFAULT_WORKERS of them running at once
 
         Returns:  N/A
 
@@ -49,6 +53,9 @@ class EYAMLProcessor(Processor):
         self.eyaml: str = str(kwargs.pop("binary", "eyaml"))
         self.publickey: Optional[str] = kwargs.pop("publickey", None)
         self.privatekey: Optional[str] = kwargs.pop("privatekey", None)
+        backend: Optional[EYAMLBackend] = kwargs.pop("backend", None)
+        self.backend: EYAMLBackend = (
+            EYAMLCommandBackend() if backend is None else backend)
         super().__init__(logger, data)
 
     # pylint: disable=locally-disabled,too-many-branches
@@ -70,7 +77,7 @@ class EYAMLProcessor(Processor):
 
         Raises:  N/A
         """
-        if isinstance(data, CommentedSeq):
+        if isinstance(data, list):
             for idx, ele in enumerate(data):
                 node_anchor = Anchors.get_node_anchor(ele)
                 if node_anchor is not None:
@@ -87,8 +94,11 @@ class EYAMLProcessor(Processor):
                     for subpath in self._find_eyaml_paths(ele, tmp_path):
                         yield subpath
 
-        elif isinstance(data, CommentedMap):
-            for key, val in data.non_merged_items():
+        elif isinstance(data, dict):
+            items = (data.non_merged_items()
+                     if isinstance(data, CommentedMap)
+                     else data.items())
+            for key, val in items:
                 tmp_path = build_path + YAMLPath.escape_path_section(
                     key, PathSeparators.DOT)
                 if self.is_eyaml_value(val):
@@ -127,19 +137,53 @@ class EYAMLProcessor(Processor):
         Raises:
         - `EYAMLCommandException` when the eyaml binary cannot be utilized
         """
-        if isinstance(value, NodeCoords):
-            value = self.decrypt_eyaml(value.node)
+        return self.decrypt_eyaml_values([value])[0]
 
-        # Recursively decrypt lists
-        if isinstance(value, list):
-            decvals: list = []
-            for encval in value:
-                decvals.append(self.decrypt_eyaml(encval))
-            return decvals
+    def decrypt_eyaml_values(
+        self, values: List[Union[str, list, NodeCoords]]
+    ) -> List[Union[str, list]]:
+        """
+        Decrypt many EYAML values in one batch.
+
+        Every distinct encrypted value is decrypted only once and all of them
+        are handed to the backend together, which may decrypt them
+        concurrently.
+
+        Parameters:
+        1. values (List[Union[str, list, NodeCoords]]) The EYAML values to
+           decrypt; lists are decrypted recursively
+
+        Returns:  (List[Union[str, list]]) The decrypted values, in the same
+            order, or the original values which were not actually encrypted
 
-        if not self.is_eyaml_value(value):
+        Raises:
+        - `EYAMLCommandException` when the eyaml binary cannot be utilized
+        """
+        cleanvals: Dict[str, str] = {}
+
+        def gather(value: Any) -> None:
+            if isinstance(value, NodeCoords):
+                gather(value.node)
+            elif isinstance(value, list):
+                for ele in value:
+                    gather(ele)
+            elif self.is_eyaml_value(value):
+                cleanvals.setdefault(EYAMLProcessor._clean_eyaml(value), "")
+
+        def resolve(value: Any) -> Any:
+            if isinstance(value, NodeCoords):
+                return resolve(value.node)
+            if isinstance(value, list):
+                return [resolve(ele) for ele in value]
+            if self.is_eyaml_value(value):
+                return cleanvals[EYAMLProcessor._clean_eyaml(value)]
             return value
 
+        for value in values:
+            gather(value)
+        if not cleanvals:
+            return [resolve(value) for value in values]
+
         if not self._can_run_eyaml():
             raise EYAMLCommandException("No accessible eyaml command.")
 
@@ -149,46 +193,31 @@ class EYAMLProcessor(Processor):
             '--quiet',
             '--stdin'
         ]
-        if self.publickey:
-            cmd.append(f"--pkcs7-public-key={self.publickey}")
-        if self.privatekey:
-            cmd.append(f"--pkcs7-private-key={self.privatekey}")
+        cmd.extend(self._key_arguments())
 
-        cleanval: str = str(value).replace("\n", "").replace(" ", "").rstrip()
-        bval: bytes = cleanval.encode("ascii")
+        encvals: List[str] = list(cleanvals)
         self.logger.debug(
-            f"About to execute {' '.join(cmd)} against:\n{cleanval}",
-            prefix="EYAMLPath::decrypt_eyaml:  "
+            "About to execute {} against {} value(s):\n{}",
+            " ".join(cmd), len(encvals), "\n".join(encvals),
+            prefix="EYAMLPath::decrypt_eyaml_values:  "
         )
-
-        try:
-            # self.eyaml is untrusted, so shell must always be False and
-            # all parameters must be supplied via a List.
-            retval: str = run(
-                cmd,
-                stdout=PIPE,
-                input=bval,
-                check=True,
-                shell=False
-            ).stdout.decode('ascii').rstrip()
-        except CalledProcessError as ex:
-            raise EYAMLCommandException(
-                f"The {self.eyaml} command cannot be run due to exit code:"
-                f"  {ex.returncode}"
-            ) from ex
+        decvals = self._run_eyaml(cmd, encvals)
 
         # Check for bad decryptions
-        self.logger.debug(
-            f"EYAMLPath::decrypt_eyaml:  Decrypted result:  {retval}"
-        )
-        if not retval or retval == cleanval:
-            raise EYAMLCommandException(
-                "Unable to decrypt value!  Please verify you are using the"
-                " correct old EYAML keys and the value is not corrupt:"
-                "    {cleanval}"
+        for (cleanval, retval) in zip(encvals, decvals):
+            self.logger.debug(
+                "EYAMLPath::decrypt_eyaml_values:  Decrypted result:  {}",
+                retval
             )
+            if not retval or retval == cleanval:
+                raise EYAMLCommandException(
+                    "Unable to decrypt value!  Please verify you are using the"
+                    " correct old EYAML keys and the value is not corrupt:"
+                    f"    {cleanval}"
+                )
+            cleanvals[cleanval] = retval
 
-        return retval
+        return [resolve(value) for value in values]
 
     def encrypt_eyaml(
         self, value: str,
@@ -207,8 +236,34 @@ class EYAMLProcessor(Processor):
         Raises:
         - `EYAMLCommandException` when the eyaml binary cannot be utilized.
         """
-        if self.is_eyaml_value(value):
-            return value
+        return self.encrypt_eyaml_values([value], output)[0]
+
+    def encrypt_eyaml_values(
+        self, values: List[str],
+        output: EYAMLOutputFormats = EYAMLOutputFormats.STRING
+    ) -> List[str]:
+        """
+        Encrypt many values via EYAML in one batch.
+
+        All of the values are handed to the backend together, which may
+        encrypt them concurrently.
+
+        Parameters:
+        1. values (List[str]) the values to encrypt
+        2. output (EYAMLOutputFormats) the output format of the encryptions
+
+        Returns:  (List[str]) The encrypted results, in the same order, or
+            the original values which were already EYAML encryptions
+
+        Raises:
+        - `EYAMLCommandException` when the eyaml binary cannot be utilized.
+        """
+        retvals: List[str] = list(values)
+        indexes: List[int] = [
+            idx for (idx, value) in enumerate(values)
+            if not self.is_eyaml_value(value)]
+        if not indexes:
+            return retvals
 
         if not self._can_run_eyaml():
             raise EYAMLCommandException(
@@ -222,52 +277,78 @@ class EYAMLProcessor(Processor):
             '--stdin',
             f"--output={output}"
         ]
-        if self.publickey:
-            cmd.append(f"--pkcs7-public-key={self.publickey}")
-        if self.privatekey:
-            cmd.append(f"--pkcs7-private-key={self.privatekey}")
+        cmd.extend(self._key_arguments())
 
         self.logger.debug(
-            f"EYAMLPath::encrypt_eyaml:  About to execute:  {' '.join(cmd)}"
+            "EYAMLPath::encrypt_eyaml_values:  About to execute against {}"
+            " value(s):  {}", len(indexes), " ".join(cmd)
         )
-        bval: bytes = value.encode("ascii")
+        encvals = self._run_eyaml(cmd, [values[idx] for idx in indexes])
+
+        for (idx, retval) in zip(indexes, encvals):
+            # While exceedingly rare and difficult to test for, it is
+            # possible for custom eyaml commands to produce no output.  This
+            # is a critical error in every conceivable case but pycov will
+            # never get a test that works multi-platform.  So, ignore
+            # covering this case.
+            if not retval: # pragma: no cover
+                raise EYAMLCommandException(
+                    f"The {self.eyaml} command was unable to encrypt your"
+                    " value.  Please verify this process can run that"
+                    " command and read your EYAML keys."
+                )
+
+            if output is EYAMLOutputFormats.BLOCK:
+                fixval: str = re.sub(r" ", "", retval.strip())
+                retval = re.sub(r"\r\n", " ", fixval) + "\n"
+
+            self.logger.debug(
+                "Encrypted result:\n{}", retval,
+                prefix="EYAMLPath::encrypt_eyaml_values:  "
+            )
+            retvals[idx] = retval
 
+        return retvals
+
+    def _key_arguments(self) -> List[str]:
+        """
+        Get the eyaml command arguments which identify the present keys.
+
+        Parameters:  N/A
+
+        Returns:  (List[str]) The key arguments
+
+        Raises:  N/A
+        """
+        args: List[str] = []
+        if self.publickey:
+            args.append(f"--pkcs7-public-key={self.publickey}")
+        if self.privatekey:
+            args.append(f"--pkcs7-private-key={self.privatekey}")
+        return args
+
+    def _run_eyaml(self, cmd: List[str], values: List[str]) -> List[str]:
+        """
+        Run an eyaml command against each of many values via the backend.
+
+        Parameters:
+        1. cmd (List[str]) The eyaml command and its arguments
+        2. values (List[str]) The values to feed to the command
+
+        Returns:  (List[str]) The output for each value, in the same order
+
+        Raises:
+        - `EYAMLCommandException` when the eyaml command fails
+        """
         try:
-            # self.eyaml is untrusted, so shell must always be False and
-            # all parameters must be supplied via a List.
-            retval: str = (
-                run(cmd, stdout=PIPE, input=bval, check=True, shell=False)
-                .stdout
-                .decode("ascii")
-                .rstrip()
-            )
+            return self.backend.run_many(
+                cmd, [value.encode("ascii") for value in values])
         except CalledProcessError as ex:
             raise EYAMLCommandException(
                 f"The {self.eyaml} command cannot be run due to exit code:"
                 f"  {ex.returncode}"
             ) from ex
 
-        # While exceedingly rare and difficult to test for, it is possible
-        # for custom eyaml commands to produce no output.  This is a critical
-        # error in every conceivable case but pycov will never get a test
-        # that works multi-platform.  So, ignore covering this case.
-        if not retval: # pragma: no cover
-            raise EYAMLCommandException(
-                f"The {self.eyaml} command was unable to encrypt your value."
-                "  Please verify this process can run that command and read"
-                " your EYAML keys."
-            )
-
-        if output is EYAMLOutputFormats.BLOCK:
-            fixval: str = re.sub(r" ", "", retval.strip())
-            retval = re.sub(r"\r\n", " ", fixval) + "\n"
-
-        self.logger.debug(
-            f"Encrypted result:\n{retval}",
-            prefix="EYAMLPath::encrypt_eyaml:  "
-        )
-        return retval
-
     def set_eyaml_value(
         self, yaml_path: YAMLPath, value: str,
         output: EYAMLOutputFormats = EYAMLOutputFormats.STRING,
@@ -327,9 +408,9 @@ class EYAMLProcessor(Processor):
         - `YAMLPathException` when YAML Path is invalid
         """
         self.logger.verbose(f"Decrypting value(s) at {yaml_path}.")
-        for node in self.get_nodes(yaml_path, mustexist=mustexist,
-                                   default_value=default_value):
-            plain_text: Union[str, list] = self.decrypt_eyaml(node.node)
+        nodes: List[Union[str, list, NodeCoords]] = list(self.get_nodes(
+            yaml_path, mustexist=mustexist, default_value=default_value))
+        for plain_text in self.decrypt_eyaml_values(nodes):
             yield plain_text
 
     def _can_run_eyaml(self) -> bool:
@@ -378,6 +459,20 @@ class EYAMLProcessor(Processor):
             return binary
         return None
 
+    @staticmethod
+    def _clean_eyaml(value: str) -> str:
+        """
+        Strip the whitespace which formats an EYAML value.
+
+        Parameters:
+        1. value (str) The EYAML value to clean
+
+        Returns:  (str) The value as the eyaml command expects it
+
+        Raises:  N/A
+        """
+        return str(value).replace("\n", "").replace(" ", "").rstrip()
+
     @staticmethod
     def is_eyaml_value(value: str) -> bool:
         """
@@ -95,11 +95,12 @@ class Merger:
 
         reference_keys = set(data.keys()).difference(concrete_keys)
         for key in reference_keys:
-            self.logger.debug(
-                "Deleting key from LHS:",
-                data=key, prefix="Merger::_delete_mergeref_keys:  ",
-                header="!" * 50
-            )
+            if self.logger.is_debug_enabled:
+                self.logger.debug(
+                    "Deleting key from LHS:",
+                    data=key, prefix="Merger::_delete_mergeref_keys:  ",
+                    header="!" * 50
+                )
             del data[key]
 
     #pylint: disable=too-many-branches,too-many-statements
@@ -124,20 +125,21 @@ class Merger:
             raise MergeException(
                 "Impossible to add Hash data to non-Hash destination.", path)
 
-        self.logger.debug(
-            "Merging INTO dict with keys: {}:".format(", ".join([
-                    str(k.value) if isinstance(k, TaggedScalar)
-                    else str(k)
-                    for k in lhs.keys()])),
-            data=lhs, prefix="Merger::_merge_dicts:  ",
-            header="--------------------")
-        self.logger.debug(
-            "Merging FROM dict with keys: {}:".format(", ".join([
-                    str(k.value) if isinstance(k, TaggedScalar)
-                    else str(k)
-                    for k in rhs.keys()])),
-            data=rhs, prefix="Merger::_merge_dicts:  ",
-            footer="====================")
+        if self.logger.is_debug_enabled:
+            self.logger.debug(
+                "Merging INTO dict with keys: {}:".format(", ".join([
+                        str(k.value) if isinstance(k, TaggedScalar)
+                        else str(k)
+                        for k in lhs.keys()])),
+                data=lhs, prefix="Merger::_merge_dicts:  ",
+                header="--------------------")
+            self.logger.debug(
+                "Merging FROM dict with keys: {}:".format(", ".join([
+                        str(k.value) if isinstance(k, TaggedScalar)
+                        else str(k)
+                        for k in rhs.keys()])),
+                data=rhs, prefix="Merger::_merge_dicts:  ",
+                footer="====================")
 
         # Delete all internal YAML merge reference keys lest any later
         # .insert() operation on LHS inexplicably convert them from reference
@@ -153,11 +155,12 @@ class Merger:
             if key in lhs:
                 # Write the buffer if populated
                 for b_key, b_val in buffer:
-                    self.logger.debug(
-                        "Merger::_merge_dicts:  Inserting key, {}, from"
-                        " buffer to position, {}, at path, {}."
-                        .format(b_key, buffer_pos, path_next),
-                        header="INSERT " * 15)
+                    if self.logger.is_debug_enabled:
+                        self.logger.debug(
+                            "Merger::_merge_dicts:  Inserting key, {}, from"
+                            " buffer to position, {}, at path, {}.",
+                            b_key, buffer_pos, path_next,
+                            header="INSERT " * 15)
                     self.logger.debug(
                         "Before INSERT, the LHS document was:",
                         data=lhs, prefix="Merger::_merge_dicts:  ")
@@ -181,8 +184,8 @@ class Merger:
                     if isinstance(val, CommentedSet)
                     else self.config.aoh_merge_mode(node_coord)
                 )
-                self.logger.debug("Merger::_merge_dicts:  Got merge mode, {}."
-                                  .format(merge_mode))
+                self.logger.debug("Merger::_merge_dicts:  Got merge mode, {}.",
+                                  merge_mode)
                 if merge_mode in (
                     HashMergeOpts.LEFT, AoHMergeOpts.LEFT, SetMergeOpts.LEFT
                 ):
@@ -190,10 +193,11 @@ class Merger:
                 if merge_mode in (
                     HashMergeOpts.RIGHT, AoHMergeOpts.RIGHT, SetMergeOpts.RIGHT
                 ):
-                    self.logger.debug(
-                        "Merger::_merge_dicts:  Overwriting key, {}, at path,"
-                        " {}.".format(key, path_next),
-                        header="OVERWRITE " * 15)
+                    if self.logger.is_debug_enabled:
+                        self.logger.debug(
+                            "Merger::_merge_dicts:  Overwriting key, {}, at"
+                            " path, {}.", key, path_next,
+                            header="OVERWRITE " * 15)
                     lhs[key] = val
                     continue
 
@@ -201,9 +205,10 @@ class Merger:
                     lhs[key] = self._merge_dicts(lhs[key], val, path_next)
 
                     # Synchronize any YAML Tag
-                    self.logger.debug(
-                        "Merger::_merge_dicts:  Setting LHS tag from {} to {}."
-                        .format(lhs[key].tag.value, val.tag.value))
+                    if self.logger.is_debug_enabled:
+                        self.logger.debug(
+                            "Merger::_merge_dicts:  Setting LHS tag from {} to"
+                            " {}.", lhs[key].tag.value, val.tag.value)
                     lhs[key].yaml_set_tag(val.tag.value)
 
                     self.logger.debug(
@@ -220,23 +225,26 @@ class Merger:
                         lhs[key], val, path_next, parent=rhs, parentref=key)
 
                     # Synchronize any YAML Tag
-                    self.logger.debug(
-                        "Merger::_merge_dicts:  Setting LHS tag from {} to {}."
-                        .format(lhs[key].tag.value, val.tag.value))
+                    if self.logger.is_debug_enabled:
+                        self.logger.debug(
+                            "Merger::_merge_dicts:  Setting LHS tag from {} to"
+                            " {}.", lhs[key].tag.value, val.tag.value)
                     lhs[key].yaml_set_tag(val.tag.value)
                 elif isinstance(val, CommentedSet):
                     lhs[key] = self._merge_sets(
                         lhs[key], val, path_next, node_coord)
 
                     # Synchronize any YAML Tag
-                    self.logger.debug(
-                        "Merger::_merge_dicts:  Setting LHS tag from {} to {}."
-                        .format(lhs[key].tag.value, val.tag.value))
+                    if self.logger.is_debug_enabled:
+                        self.logger.debug(
+                            "Merger::_merge_dicts:  Setting LHS tag from {} to"
+                            " {}.", lhs[key].tag.value, val.tag.value)
                     lhs[key].yaml_set_tag(val.tag.value)
                 else:
-                    self.logger.debug(
-                        "Merger::_merge_dicts:  Updating key, {}, at path,"
-                        " {}.".format(key, path_next), header="UPDATE " * 15)
+                    if self.logger.is_debug_enabled:
+                        self.logger.debug(
+                            "Merger::_merge_dicts:  Updating key, {}, at path,"
+                            " {}.", key, path_next, header="UPDATE " * 15)
                     self.logger.debug(
                         "Before UPDATE, the LHS document was:",
                         data=lhs, prefix="Merger::_merge_dicts:  ")
@@ -257,13 +265,14 @@ class Merger:
 
         # Write any remaining buffered content to the end of LHS
         for b_key, b_val in buffer:
-            self.logger.debug(
-                "Merger::_merge_dicts:  Appending key, {}, from buffer at"
-                " path, {}.".format(b_key, path), header="APPEND " * 15)
+            if self.logger.is_debug_enabled:
+                self.logger.debug(
+                    "Merger::_merge_dicts:  Appending key, {}, from buffer at"
+                    " path, {}.", b_key, path, header="APPEND " * 15)
             lhs[b_key] = b_val
 
         self.logger.debug(
-            "Completed merge result for path, {}:".format(path),
+            "Completed merge result for path, {}:", path,
             data=lhs, prefix="Merger::_merge_dicts:  ")
 
         return lhs
@@ -302,7 +311,7 @@ class Merger:
         for idx, ele in enumerate(rhs):
             path_next = path + "[{}]".format(idx)
             self.logger.debug(
-                "Processing element {} at {}.".format(idx, path_next),
+                "Processing element {} at {}.", idx, path_next,
                 prefix="Merger::_merge_simple_lists:  ", data=ele)
 
             if merge_mode is ArrayMergeOpts.UNIQUE:
@@ -311,7 +320,7 @@ class Merger:
                     cmp_val = ele.value
 
                 self.logger.debug(
-                    "Looking for comparison value, {}, in:".format(cmp_val),
+                    "Looking for comparison value, {}, in:", cmp_val,
                     prefix="Merger::_merge_simple_lists:  ", data=tagless_lhs)
 
                 if cmp_val in tagless_lhs:
@@ -360,9 +369,10 @@ class Merger:
                 " destination."
                 , path)
 
-        self.logger.debug(
-            "Merging {} Hash(es) at {}.".format(len(rhs), path),
-            prefix="Merger::_merge_arrays_of_hashes:  ", data=rhs)
+        if self.logger.is_debug_enabled:
+            self.logger.debug(
+                "Merging {} Hash(es) at {}.".format(len(rhs), path),
+                prefix="Merger::_merge_arrays_of_hashes:  ", data=rhs)
 
         id_key: str = ""
         if len(rhs) > 0 and isinstance(rhs[0], CommentedMap):
@@ -370,13 +380,13 @@ class Merger:
                 NodeCoords(rhs[0], rhs, 0), rhs[0])
             self.logger.debug(
                 "Merger::_merge_arrays_of_hashes:  RHS AoH yielded id_key:"
-                "  {}.".format(id_key))
+                "  {}.", id_key)
 
         merge_mode = self.config.aoh_merge_mode(node_coord)
         for idx, ele in enumerate(rhs):
             path_next = path + "[{}]".format(idx)
             self.logger.debug(
-                "Processing element #{} at {}.".format(idx, path_next),
+                "Processing element #{} at {}.", idx, path_next,
                 prefix="Merger::_merge_arrays_of_hashes:  ", data=ele)
 
             if merge_mode is AoHMergeOpts.DEEP:
@@ -479,7 +489,7 @@ class Merger:
             path_next = (path +
                 YAMLPath.escape_path_section(ele, path.separator))
             self.logger.debug(
-                "Processing set element {} at {}.".format(ele, path_next),
+                "Processing set element {} at {}.", ele, path_next,
                 prefix="Merger::_merge_sets:  ", data=ele)
 
             cmp_val = ele
@@ -487,7 +497,7 @@ class Merger:
                 cmp_val = ele.value
 
             self.logger.debug(
-                "Looking for comparison value, {}, in:".format(cmp_val),
+                "Looking for comparison value, {}, in:", cmp_val,
                 prefix="Merger::_merge_sets:  ", data=tagless_lhs)
 
             if cmp_val in tagless_lhs:
@@ -573,8 +583,7 @@ class Merger:
             if not anchors_match:
                 if conflict_mode is AnchorConflictResolutions.RENAME:
                     self.logger.debug(
-                        "Anchor {} conflict; will RENAME anchors."
-                        .format(anchor),
+                        "Anchor {} conflict; will RENAME anchors.", anchor,
                         prefix="Merger::_resolve_anchor_conflicts:  ")
                     Anchors.rename_anchor(
                         rhs, anchor,
@@ -586,14 +595,12 @@ class Merger:
                     )
                 elif conflict_mode is AnchorConflictResolutions.LEFT:
                     self.logger.debug(
-                        "Anchor {} conflict; LEFT will override."
-                        .format(anchor),
+                        "Anchor {} conflict; LEFT will override.", anchor,
                         prefix="Merger::_resolve_anchor_conflicts:  ")
                     Anchors.replace_anchor(rhs, rhs_anchor, lhs_anchor)
                 elif conflict_mode is AnchorConflictResolutions.RIGHT:
                     self.logger.debug(
-                        "Anchor {} conflict; RIGHT will override."
-                        .format(anchor),
+                        "Anchor {} conflict; RIGHT will override.", anchor,
                         prefix="Merger::_resolve_anchor_conflicts:  ")
                     Anchors.replace_anchor(self.data, lhs_anchor, rhs_anchor)
                 else:
@@ -604,7 +611,7 @@ class Merger:
                 self.logger.debug(
                     "Merger::_resolve_anchor_conflicts:  Anchor {} is"
                     " symmetric; RIGHT will override to eliminate spurious"
-                    " anchor re-definition.".format(anchor))
+                    " anchor re-definition.", anchor)
                 # While the anchors are identical, the reference nodes are not.
                 # So, overwrite all matching LHS nodes with their RHS
                 # equivalents in order to stave off spurious anchor
@@ -661,8 +668,8 @@ class Merger:
 
         # Synchronize YAML Tags
         self.logger.debug(
-            "Merger::_insert_dict:  Setting LHS tag from {} to {}."
-            .format(lhs.tag.value, rhs.tag.value))
+            "Merger::_insert_dict:  Setting LHS tag from {} to {}.",
+            lhs.tag.value, rhs.tag.value)
         lhs.yaml_set_tag(rhs.tag.value)
 
         if insert_at.is_root:
@@ -702,8 +709,8 @@ class Merger:
 
         # Synchronize any YAML Tag
         self.logger.debug(
-            "Merger::_insert_list:  Setting LHS tag from {} to {}."
-            .format(lhs.tag.value, rhs.tag.value))
+            "Merger::_insert_list:  Setting LHS tag from {} to {}.",
+            lhs.tag.value, rhs.tag.value)
         lhs.yaml_set_tag(rhs.tag.value)
 
         if insert_at.is_root:
@@ -747,8 +754,8 @@ class Merger:
 
         # Synchronize any YAML Tag
         self.logger.debug(
-            "Merger::_insert_set:  Setting LHS tag from {} to {}."
-            .format(lhs.tag.value, rhs.tag.value))
+            "Merger::_insert_set:  Setting LHS tag from {} to {}.",
+            lhs.tag.value, rhs.tag.value)
         lhs.yaml_set_tag(rhs.tag.value)
 
         if insert_at.is_root:
@@ -880,6 +887,9 @@ class Merger:
                 merge_performed = self._insert_scalar(
                     insert_at, target_node, lhs_proc, rhs)
 
+            # The merge may have changed the YAML Anchors of the document
+            lhs_proc.document_index.invalidate()
+
         self.logger.debug(
             "Completed merge operation, resulting in document:",
             prefix="Merger::merge_with:  ", data=self.data)
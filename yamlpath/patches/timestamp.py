@@ -39,6 +39,14 @@ class AnchoredTimeStamp(TimeStamp):
         ts._yaml = copy.deepcopy(self._yaml)
         return ts
 
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        """Pickle the YAML details -- like the Anchor -- with the value."""
+        return (
+            self.__class__,
+            (self.year, self.month, self.day, self.hour, self.minute,
+             self.second, self.microsecond),
+            self.__dict__)
+
     @property
     def anchor(self) -> Any:
         """Access the YAML Anchor."""
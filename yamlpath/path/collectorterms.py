@@ -9,6 +9,8 @@ from yamlpath.enums import CollectorOperators
 class CollectorTerms:
     """YAML Path Collector segment terms."""
 
+    __slots__ = ("_expression", "_operation")
+
     def __init__(
         self, expression: str,
         operation: CollectorOperators = CollectorOperators.NONE
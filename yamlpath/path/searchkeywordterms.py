@@ -11,6 +11,14 @@ from yamlpath.enums import PathSearchKeywords
 class SearchKeywordTerms:
     """YAML path Search Keyword segment terms."""
 
+    __slots__ = (
+        "_inverted",
+        "_keyword",
+        "_parameters",
+        "_lparameters",
+        "_parameters_parsed",
+    )
+
     def __init__(
         self, inverted: bool, keyword: PathSearchKeywords, parameters: str
     ) -> None:
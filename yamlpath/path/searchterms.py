@@ -3,12 +3,16 @@ YAML path Search segment terms.
 
 Copyright 2019, 2020 William W. Kimball, Jr. MBA MSIS
 """
+from typing import Any, Callable, Optional
+
 from yamlpath.enums import PathSearchMethods
 
 
 class SearchTerms:
     """YAML path Search segment terms."""
 
+    __slots__ = ("_inverted", "_method", "_attribute", "_term", "_predicate")
+
     def __init__(
         self, inverted: bool, method: PathSearchMethods, attribute: str,
         term: str
@@ -26,6 +30,7 @@ class SearchTerms:
         self._method: PathSearchMethods = method
         self._attribute: str = attribute
         self._term: str = term
+        self._predicate: Optional[Callable[[Any], bool]] = None
 
     # While this works in Python 3.7.3, it does not work in Python 3.6.3.  In
     # the older Python, this code creates a cyclic ImportError.  Because this
@@ -106,3 +111,19 @@ class SearchTerms:
         This is the "needle" to search for within the attribute ("haystack").
         """
         return self._term
+
+    @property
+    def predicate(self) -> Callable[[Any], bool]:
+        """
+        Accessor for the compiled comparison of these terms.
+
+        This is a function which accepts a haystack and indicates whether the
+        term matches it per the search method, ignoring inversion.  It is
+        compiled only once, upon first use.
+        """
+        if self._predicate is None:
+            # pylint: disable=locally-disabled,import-outside-toplevel
+            from yamlpath.common import Searches
+            self._predicate = Searches.search_predicate(
+                self.method, self.term)
+        return self._predicate
@@ -0,0 +1,161 @@
+"""
+Implement PathTrie, a prefix tree of compiled YAML Paths.
+
+Copyright 2022 William W. Kimball, Jr. MBA MSIS
+"""
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from yamlpath.enums import (
+    CollectorOperators,
+    PathSegmentTypes,
+    PathSeparators,
+)
+from yamlpath.path import CollectorTerms
+from yamlpath import CompiledYAMLPath, YAMLPath
+
+# Identifies the PathSteps consumed by one edge of a PathTrie
+EdgeKey = Tuple[Tuple[PathSegmentTypes, str], ...]
+
+
+# pylint: disable=too-few-public-methods
+class PathTrieNode:
+    """
+    One node of a PathTrie.
+
+    A node is reached by evaluating every preceding edge.  It holds the
+    payloads of the YAML Paths which end at it and the edges to the nodes
+    reached by evaluating the next segment(s) of the YAML Paths which continue
+    past it.
+    """
+
+    def __init__(
+        self, yaml_path: Optional[CompiledYAMLPath] = None,
+        segment_index: int = 0
+    ) -> None:
+        """
+        Instantiate a PathTrieNode.
+
+        Parameters:
+        1. yaml_path (CompiledYAMLPath) A YAML Path which reaches this node
+        2. segment_index (int) Index of the next segment of `yaml_path` to
+           evaluate from this node
+
+        Returns:  N/A
+        """
+        self.yaml_path: Optional[CompiledYAMLPath] = yaml_path
+        self.segment_index: int = segment_index
+        self.payloads: List[Any] = []
+        self.children: Dict[EdgeKey, PathTrieNode] = {}
+
+    def __len__(self) -> int:
+        """Indicate how many YAML Paths end at or beneath this node."""
+        return (len(self.payloads)
+                + sum(len(child) for child in self.children.values()))
+
+
+class PathTrie:
+    """
+    A prefix tree which merges the segments of many compiled YAML Paths.
+
+    YAML Paths which share leading segments share the nodes of the tree which
+    represent those segments, so a processor which walks the tree evaluates
+    every shared prefix only once for all of the YAML Paths beginning with it.
+    Each edge of the tree represents the segment(s) of a YAML Path which must
+    be evaluated together:  traversals and wildcards also consider the segment
+    which follows them and Collectors also consume the arithmetic Collectors
+    which follow them.  Every inserted YAML Path carries an arbitrary payload
+    which is reported with its matches.
+    """
+
+    def __init__(self) -> None:
+        """Instantiate an empty PathTrie."""
+        self._root: PathTrieNode = PathTrieNode()
+
+    def __len__(self) -> int:
+        """Indicate how many YAML Paths have been inserted."""
+        return len(self._root)
+
+    @property
+    def root(self) -> PathTrieNode:
+        """Get the root node of this tree."""
+        return self._root
+
+    def insert(
+        self, yaml_path: Union[CompiledYAMLPath, YAMLPath, str, None],
+        payload: Any, pathsep: PathSeparators = PathSeparators.AUTO
+    ) -> CompiledYAMLPath:
+        """
+        Add a YAML Path to this tree.
+
+        Parameters:
+        1. yaml_path (Union[CompiledYAMLPath, YAMLPath, str, None]) The YAML
+           Path to add
+        2. payload (Any) The value to report with the matches of `yaml_path`
+        3. pathsep (PathSeparators) Forced YAML Path segment separator; set
+           only when automatic inference fails
+
+        Returns:  (CompiledYAMLPath) The compiled `yaml_path`
+
+        Raises:
+            - `YAMLPathException` when the YAML Path is invalid
+        """
+        plan = CompiledYAMLPath.compile(yaml_path, pathsep)
+        node = self._root
+        if node.yaml_path is None:
+            node.yaml_path = plan
+
+        index = 0
+        while index < len(plan):
+            (edge_key, next_index) = PathTrie._edge_of(plan, index)
+            child = node.children.get(edge_key)
+            if child is None:
+                child = PathTrieNode(plan, next_index)
+                node.children[edge_key] = child
+            node = child
+            index = next_index
+
+        node.payloads.append(payload)
+        return plan
+
+    @staticmethod
+    def _edge_of(
+        plan: CompiledYAMLPath, index: int
+    ) -> Tuple[EdgeKey, int]:
+        """
+        Identify the edge which begins at a segment of a compiled YAML Path.
+
+        Parameters:
+        1. plan (CompiledYAMLPath) The compiled YAML Path
+        2. index (int) Index of the first segment of the edge
+
+        Returns:  (Tuple[EdgeKey, int]) The key of the edge and the index of
+            the first segment after it
+        """
+        steps = plan.steps
+        step_count = len(steps)
+        (unesc_type, unesc_attrs) = steps[index].unescaped
+        next_index = index + 1
+        last_index = next_index
+
+        if (isinstance(unesc_attrs, CollectorTerms)
+                and unesc_attrs.operation is CollectorOperators.NONE):
+            # Collectors combine the arithmetic Collectors which follow them
+            while last_index < step_count:
+                (peek_type, peek_attrs) = steps[last_index].unescaped
+                if not (peek_type is PathSegmentTypes.COLLECTOR
+                        and isinstance(peek_attrs, CollectorTerms)
+                        and peek_attrs.operation
+                        is not CollectorOperators.NONE):
+                    break
+                last_index += 1
+            next_index = last_index
+        elif unesc_type in (
+            PathSegmentTypes.TRAVERSE, PathSegmentTypes.MATCH_ALL
+        ) and next_index < step_count:
+            # These filter their results by the segment which follows them
+            last_index = next_index + 1
+
+        edge_key: EdgeKey = tuple(
+            (seg_type, str(seg_attrs)) for (seg_type, seg_attrs)
+            in plan.unescaped[index:last_index])
+        return (edge_key, next_index)
@@ -5,7 +5,9 @@ YAML Path processor based on ruamel.yaml.
 Copyright 2018, 2019, 2020, 2021, 2022 William W. Kimball, Jr. MBA MSIS
 """
 from collections import OrderedDict
-from typing import Any, Dict, Generator, List, Union
+from time import perf_counter
+from typing import (
+    Any, Dict, FrozenSet, Generator, Iterable, List, Optional, Tuple, Union)
 
 from ruamel.yaml.compat import ordereddict as ryod
 from ruamel.yaml.comments import (
@@ -15,9 +17,22 @@ from ruamel.yaml.comments import (
     TaggedScalar,
 )
 
-from yamlpath.types import AncestryEntry, PathAttributes, PathSegment
-from yamlpath.common import Anchors, KeywordSearches, Nodes, Searches
-from yamlpath import YAMLPath
+from yamlpath.types import (
+    Ancestry, AncestryEntry, PathAttributes, PathSegment)
+from yamlpath.common import (
+    Anchors,
+    DocumentIndex,
+    FingerprintSet,
+    KeyIndex,
+    KeywordSearches,
+    Nodes,
+    QueryCache,
+    QueryExplanation,
+    SearchIndex,
+)
+from yamlpath.common.documentindex import ReferenceSite
+from yamlpath import CompiledYAMLPath, PathTrie, TranslatedPath, YAMLPath
+from yamlpath.pathtrie import PathTrieNode
 from yamlpath.path import SearchKeywordTerms, SearchTerms, CollectorTerms
 from yamlpath.wrappers import ConsolePrinter, NodeCoords
 from yamlpath.exceptions import (
@@ -37,7 +52,12 @@ from yamlpath.enums import (
     PathSeparators,
 )
 
+# A pending change to the document:
+# (parent, parentref, reference_node, replacement_node)
+NodeReplacement = Tuple[Any, Any, Any, Any]
+
 
+# pylint: disable=too-many-public-methods,too-many-instance-attributes
 class Processor:
     """Query and update YAML data via robust YAML Paths."""
 
@@ -54,14 +74,190 @@ class Processor:
         Raises:  N/A
         """
         self.logger: ConsolePrinter = logger
-        self.data: Any = data
+        self._data: Any = data
+        self._document_index: DocumentIndex = DocumentIndex(data)
+        self._index_references: bool = False
+        self._search_index: SearchIndex = SearchIndex()
+        self._index_searches: bool = False
+        self._key_index: KeyIndex = KeyIndex(data)
+        self._index_keys: bool = False
+        self._iterative_engine: bool = False
+        self._query_cache: QueryCache = QueryCache()
+        self._cache_queries: bool = False
+        self._explanation: Optional[QueryExplanation] = None
+
+    @property
+    def data(self) -> Any:
+        """Get the document this Processor queries and changes."""
+        return self._data
+
+    @data.setter
+    def data(self, value: Any) -> None:
+        """Replace the document this Processor queries and changes."""
+        self._data = value
+        self._document_index = DocumentIndex(value)
+        self._search_index = SearchIndex()
+        self._key_index = KeyIndex(value)
+        self._query_cache.invalidate()
+
+    @property
+    def document_index(self) -> DocumentIndex:
+        """
+        Get the index of the YAML Anchors in this Processor's document.
+
+        The index is kept current by every change made through this Processor.
+        Code which otherwise changes the Anchors or Aliases of the document
+        must call its `invalidate` method.
+        """
+        return self._document_index
+
+    @property
+    def index_references(self) -> bool:
+        """
+        Indicate whether changes find the references to nodes via an index.
+
+        When enabled, the first change to a Scalar node indexes every
+        reference to every node in the document so that it and all later
+        changes touch only the references to the changed node rather than
+        searching the entire document for them.  This trades memory for speed
+        when many changes are made to a large document.  Disabled by default.
+        """
+        return self._index_references
+
+    @index_references.setter
+    def index_references(self, value: bool) -> None:
+        """Enable or disable the reference index."""
+        self._index_references = value
+
+    @property
+    def search_index(self) -> SearchIndex:
+        """
+        Get the index of the Array-of-Hashes attributes searched by queries.
+
+        The index is kept current by every change made through this Processor.
+        Code which otherwise changes the document must call its `invalidate`
+        method.
+        """
+        return self._search_index
+
+    @property
+    def index_searches(self) -> bool:
+        """
+        Indicate whether Array-of-Hashes searches are answered via indexes.
+
+        When enabled, the first equality (`=`) or prefix (`^`) search of an
+        attribute within an Array-of-Hashes -- like `/users[name=alice]` --
+        indexes every element of that Array by the value of that attribute so
+        that later searches of it compare only the elements which can
+        possibly match.  This trades memory for speed when the same large
+        Arrays are searched repeatedly.  Disabled by default.
+        """
+        return self._index_searches
+
+    @index_searches.setter
+    def index_searches(self, value: bool) -> None:
+        """Enable or disable the search index."""
+        self._index_searches = value
+        if not value:
+            self._search_index.invalidate()
+
+    @property
+    def key_index(self) -> KeyIndex:
+        """
+        Get the index of the key names in this Processor's document.
+
+        The index is discarded by every change made through this Processor.
+        Code which otherwise changes the document must call its `invalidate`
+        method.
+        """
+        return self._key_index
+
+    @property
+    def index_keys(self) -> bool:
+        """
+        Indicate whether traversals seek key names via an index.
+
+        When enabled, the first traversal (`**`) followed by a key name --
+        like `/**/image` -- indexes every key name in the document in a
+        single pass so that it and all later such traversals descend only
+        into the subtrees which hold the sought key rather than visiting every
+        node.  Any change to the document discards the index, so this trades
+        memory for speed when a large document is queried far more often
+        than it is changed.  Disabled by default.
+        """
+        return self._index_keys
+
+    @index_keys.setter
+    def index_keys(self, value: bool) -> None:
+        """Enable or disable the key name index."""
+        self._index_keys = value
+        if not value:
+            self._key_index.invalidate()
+
+    @property
+    def iterative_engine(self) -> bool:
+        """
+        Indicate whether queries run on an explicit work stack.
+
+        When enabled, the segments of every query and every traversal (`**`)
+        are evaluated on an explicit stack rather than by a chain of nested,
+        recursive generators.  Each match is then yielded directly rather than
+        through one generator per segment and per level of depth, and very
+        deep documents can be traversed without reaching Python's recursion
+        limit.  Both engines yield identical results in identical order.
+        Disabled by default.
+        """
+        return self._iterative_engine
+
+    @iterative_engine.setter
+    def iterative_engine(self, value: bool) -> None:
+        """Select the iterative or the recursive query engine."""
+        self._iterative_engine = value
+
+    @property
+    def query_cache(self) -> QueryCache:
+        """
+        Get the cache of the nodes matched by queries of this document.
 
-    def exists(self, yaml_path: Union[YAMLPath, str], **kwargs: Any) -> bool:
+        The cache reports its hit and miss statistics and may be made to
+        discard only the queries which each change can affect via its
+        `selective` attribute.  It is kept current by every change made
+        through this Processor.  Code which otherwise changes the document
+        must call its `invalidate` method.
+        """
+        return self._query_cache
+
+    @property
+    def cache_queries(self) -> bool:
+        """
+        Indicate whether the nodes matched by queries are cached.
+
+        When enabled, every node matched by a query which must exist -- via
+        `exists`, `first`, `count`, and `get_nodes` with `mustexist` -- is
+        remembered so that repeating the query before the document changes
+        generates the very same NodeCoords without evaluating the document
+        again.  Only queries which are evaluated to completion are cached.
+        This trades memory for speed when the same queries are repeated
+        against a long-lived document.  Disabled by default.
+        """
+        return self._cache_queries
+
+    @cache_queries.setter
+    def cache_queries(self, value: bool) -> None:
+        """Enable or disable the query cache."""
+        self._cache_queries = value
+        if not value:
+            self._query_cache.invalidate()
+
+    def exists(
+        self, yaml_path: Union[CompiledYAMLPath, YAMLPath, str], **kwargs: Any
+    ) -> bool:
         """
         Indicate whether a given YAMLPath resolves to at least one node.
 
         Parameters:
-        1. yaml_path (Union[YAMLPath, str]) The YAML Path to evaluate
+        1. yaml_path (Union[CompiledYAMLPath, YAMLPath, str]) The YAML Path to
+           evaluate
 
         Keyword Arguments:
         * pathsep (PathSeparators) Forced YAML Path segment separator; set
@@ -78,32 +274,138 @@ class Processor:
         if self.data is None:
             return False
 
-        if isinstance(yaml_path, str):
-            yaml_path = YAMLPath(yaml_path, pathsep)
-        elif pathsep is not PathSeparators.AUTO:
-            yaml_path.separator = pathsep
+        yaml_path = CompiledYAMLPath.compile(yaml_path, pathsep)
 
-        self.logger.debug(
-            "Processing YAML Path:",
-            prefix="Processor::exists:  ", data={
-                'path': yaml_path,
-                'segments': yaml_path.escaped
-            })
+        if self.logger.is_debug_enabled:
+            self.logger.debug(
+                "Processing YAML Path:",
+                prefix="Processor::exists:  ", data={
+                    'path': yaml_path,
+                    'segments': yaml_path.escaped
+                })
+
+        # Stop at the first match; the remaining nodes are never evaluated
+        for _ in self._get_matched_nodes(yaml_path):
+            return True
+        return False
+
+    def first(
+        self, yaml_path: Union[CompiledYAMLPath, YAMLPath, str], **kwargs: Any
+    ) -> Optional[NodeCoords]:
+        """
+        Get the first node at YAML Path in data.
+
+        The document is evaluated only until the first match is found.
+
+        Parameters:
+        1. yaml_path (Union[CompiledYAMLPath, YAMLPath, str]) The YAML Path to
+           evaluate
+
+        Keyword Arguments:
+        * pathsep (PathSeparators) Forced YAML Path segment separator; set
+          only when automatic inference fails;
+          default = PathSeparators.AUTO
+
+        Returns:  (Optional[NodeCoords]) The first matching node or None when
+            the YAML Path matches no nodes
+
+        Raises:
+            - `YAMLPathException` when YAML Path is invalid
+        """
+        pathsep: PathSeparators = kwargs.pop("pathsep", PathSeparators.AUTO)
+
+        if self.data is None:
+            return None
+
+        yaml_path = CompiledYAMLPath.compile(yaml_path, pathsep)
+        for node_coords in self._get_matched_nodes(yaml_path):
+            return node_coords
+        return None
+
+    def count(
+        self, yaml_path: Union[CompiledYAMLPath, YAMLPath, str], **kwargs: Any
+    ) -> int:
+        """
+        Count the nodes at YAML Path in data.
+
+        The nodes are counted as they are matched rather than gathered.  Like
+        `get_nodes`, the results of a Collector are counted as one node.
+
+        Parameters:
+        1. yaml_path (Union[CompiledYAMLPath, YAMLPath, str]) The YAML Path to
+           evaluate
+
+        Keyword Arguments:
+        * pathsep (PathSeparators) Forced YAML Path segment separator; set
+          only when automatic inference fails;
+          default = PathSeparators.AUTO
+
+        Returns:  (int) The number of matching nodes
+
+        Raises:
+            - `YAMLPathException` when YAML Path is invalid
+        """
+        pathsep: PathSeparators = kwargs.pop("pathsep", PathSeparators.AUTO)
 
+        if self.data is None:
+            return 0
+
+        yaml_path = CompiledYAMLPath.compile(yaml_path, pathsep)
         matched_nodes: int = 0
-        for _ in self._get_required_nodes(self.data, yaml_path):
+        for _ in self._get_matched_nodes(yaml_path):
             matched_nodes += 1
+        return matched_nodes
+
+    def explain(
+        self, yaml_path: Union[CompiledYAMLPath, YAMLPath, str], **kwargs: Any
+    ) -> QueryExplanation:
+        """
+        Explain how a YAML Path is evaluated against data.
+
+        Every pre-existing node matching the YAML Path is sought -- without
+        consulting any cached query and without changing the document -- while
+        the work done for each of its segments is measured.
+
+        Parameters:
+        1. yaml_path (Union[CompiledYAMLPath, YAMLPath, str]) The YAML Path to
+           explain
+
+        Keyword Arguments:
+        * pathsep (PathSeparators) Forced YAML Path segment separator; set
+          only when automatic inference fails;
+          default = PathSeparators.AUTO
+
+        Returns:  (QueryExplanation) The statistics of each segment
+
+        Raises:
+            - `YAMLPathException` when YAML Path is invalid
+        """
+        pathsep: PathSeparators = kwargs.pop("pathsep", PathSeparators.AUTO)
+
+        yaml_path = CompiledYAMLPath.compile(yaml_path, pathsep)
+        explanation = QueryExplanation(yaml_path)
+        if self.data is None:
+            return explanation
 
-        return 0 < matched_nodes
+        start = perf_counter()
+        self._explanation = explanation
+        try:
+            for _ in self._get_required_nodes(self.data, yaml_path):
+                explanation.matches += 1
+        finally:
+            self._explanation = None
+            explanation.elapsed = perf_counter() - start
+        return explanation
 
     def get_nodes(
-        self, yaml_path: Union[YAMLPath, str], **kwargs: Any
+        self, yaml_path: Union[CompiledYAMLPath, YAMLPath, str], **kwargs: Any
     ) -> Generator[Any, None, None]:
         """
         Get nodes at YAML Path in data.
 
         Parameters:
-        1. yaml_path (Union[YAMLPath, str]) The YAML Path to evaluate
+        1. yaml_path (Union[CompiledYAMLPath, YAMLPath, str]) The YAML Path to
+           evaluate
 
         Keyword Arguments:
         * mustexist (bool) Indicate whether yaml_path must exist
@@ -115,6 +417,12 @@ class Processor:
         * pathsep (PathSeparators) Forced YAML Path segment separator; set
           only when automatic inference fails;
           default = PathSeparators.AUTO
+        * limit (Optional[int]) The most nodes to generate; the document is
+          evaluated -- and, when mustexist is False, missing nodes are
+          created -- only until this many have been generated; default=None
+          for no limit
+        * offset (int) How many of the matching nodes to skip before
+          generating any; default=0
 
         Returns:  (Generator) The requested YAML nodes as they are matched
 
@@ -124,6 +432,8 @@ class Processor:
         mustexist: bool = kwargs.pop("mustexist", False)
         default_value: Any = kwargs.pop("default_value", None)
         pathsep: PathSeparators = kwargs.pop("pathsep", PathSeparators.AUTO)
+        limit: Optional[int] = kwargs.pop("limit", None)
+        offset: int = kwargs.pop("offset", 0)
 
         if self.data is None:
             self.logger.debug(
@@ -131,26 +441,34 @@ class Processor:
                 prefix="Processor::get_nodes:  ", data=self.data)
             return
 
-        if isinstance(yaml_path, str):
-            yaml_path = YAMLPath(yaml_path, pathsep)
-        elif pathsep is not PathSeparators.AUTO:
-            yaml_path.separator = pathsep
+        yaml_path = CompiledYAMLPath.compile(yaml_path, pathsep)
 
-        self.logger.debug(
-            "Processing YAML Path:",
-            prefix="Processor::get_nodes:  ", data={
-                'path': yaml_path,
-                'segments': yaml_path.escaped
-            })
+        if self.logger.is_debug_enabled:
+            self.logger.debug(
+                "Processing YAML Path:",
+                prefix="Processor::get_nodes:  ", data={
+                    'path': yaml_path,
+                    'segments': yaml_path.escaped
+                })
+
+        # Matches beyond the limit are never evaluated
+        stop_after: Optional[int] = None if limit is None else offset + limit
+        if stop_after is not None and stop_after <= offset:
+            return
 
+        matched_nodes: int = 0
         if mustexist:
-            matched_nodes: int = 0
-            for node_coords in self._get_required_nodes(self.data, yaml_path):
+            for node_coords in self._get_matched_nodes(yaml_path):
                 matched_nodes += 1
+                if matched_nodes <= offset:
+                    continue
+
                 self.logger.debug(
                     "Relaying required node:",
                     prefix="Processor::get_nodes:  ", data=node_coords)
                 yield node_coords
+                if matched_nodes == stop_after:
+                    break
 
             if matched_nodes < 1:
                 raise UnmatchedYAMLPathException(
@@ -161,13 +479,113 @@ class Processor:
             for opt_node in self._get_optional_nodes(
                 self.data, yaml_path, default_value
             ):
+                matched_nodes += 1
+                if matched_nodes <= offset:
+                    continue
+
                 self.logger.debug(
                     "Relaying optional node:",
                     prefix="Processor::get_nodes:  ", data=opt_node)
                 yield opt_node
+                if matched_nodes == stop_after:
+                    break
+
+    def get_nodes_many(
+        self, yaml_paths: List[Union[CompiledYAMLPath, YAMLPath, str]],
+        **kwargs: Any
+    ) -> Generator[Tuple[Any, Any], None, None]:
+        """
+        Get the nodes at many YAML Paths in data.
+
+        Unlike a series of `get_nodes` calls, the YAML Paths are merged into a
+        prefix tree and resolved in a single traversal of the document which
+        evaluates the segments they share -- like a common
+        `/spec/template/spec/containers[*]` prefix -- only once.  Matches are
+        therefore generated in the order they are found rather than grouped
+        by YAML Path.
+
+        Parameters:
+        1. yaml_paths (List[Union[CompiledYAMLPath, YAMLPath, str]]) The YAML
+           Paths to evaluate
+
+        Keyword Arguments:
+        * mustexist (bool) Indicate whether every YAML Path must exist
+          in data prior to this query (lest an Exception be raised after all
+          matches have been generated); default=False
+        * default_value (Any) The value to set at each YAML Path which does
+          not already exist in data when mustexist is False;
+          default=None
+        * pathsep (PathSeparators) Forced YAML Path segment separator; set
+          only when automatic inference fails;
+          default = PathSeparators.AUTO
+        * limit (Optional[int]) The most nodes to generate for each YAML Path;
+          the document is evaluated only until every YAML Path has reached
+          this many; default=None for no limit
+
+        Returns:  (Generator[Tuple[Any, Any], None, None]) Each YAML Path,
+            exactly as given, with each of the nodes it matches
+
+        Raises:
+            - `YAMLPathException` when any YAML Path is invalid
+        """
+        mustexist: bool = kwargs.pop("mustexist", False)
+        default_value: Any = kwargs.pop("default_value", None)
+        pathsep: PathSeparators = kwargs.pop("pathsep", PathSeparators.AUTO)
+        limit: Optional[int] = kwargs.pop("limit", None)
+
+        if self.data is None:
+            self.logger.debug(
+                "Refusing to get nodes from a null document!",
+                prefix="Processor::get_nodes_many:  ", data=self.data)
+            return
+        if limit is not None and limit < 1:
+            return
+
+        trie = PathTrie()
+        paths: List[CompiledYAMLPath] = [
+            trie.insert(yaml_path, path_idx, pathsep)
+            for path_idx, yaml_path in enumerate(yaml_paths)]
+        matched: List[int] = [0] * len(paths)
+        unfilled: int = len(paths)
+
+        for (path_idx, node_coords) in self._get_nodes_by_trie(
+            self.data, trie.root
+        ):
+            if matched[path_idx] == limit:
+                continue
+
+            matched[path_idx] += 1
+            self.logger.debug(
+                "Relaying node for {}:", paths[path_idx],
+                prefix="Processor::get_nodes_many:  ", data=node_coords)
+            yield (yaml_paths[path_idx], node_coords)
+
+            # Stop evaluating the document once every YAML Path is satisfied
+            if matched[path_idx] == limit:
+                unfilled -= 1
+                if unfilled < 1:
+                    break
+
+        for path_idx, yaml_path in enumerate(paths):
+            if matched[path_idx]:
+                continue
+            if mustexist:
+                raise UnmatchedYAMLPathException(
+                    "Required YAML Path does not match any nodes",
+                    str(yaml_path)
+                )
+
+            for opt_node in self._get_optional_nodes(
+                self.data, yaml_path, default_value
+            ):
+                self.logger.debug(
+                    "Relaying optional node for {}:", yaml_path,
+                    prefix="Processor::get_nodes_many:  ", data=opt_node)
+                yield (yaml_paths[path_idx], opt_node)
 
     def set_value(
-        self, yaml_path: Union[YAMLPath, str], value: Any, **kwargs
+        self, yaml_path: Union[CompiledYAMLPath, YAMLPath, str], value: Any,
+        **kwargs: Any
     ) -> None:
         """
         Set the value of zero or more nodes at YAML Path in YAML data.
@@ -205,15 +623,13 @@ class Processor:
         pathsep: PathSeparators = kwargs.pop("pathsep", PathSeparators.AUTO)
         tag: str = kwargs.pop("tag", None)
 
-        if isinstance(yaml_path, str):
-            yaml_path = YAMLPath(yaml_path, pathsep)
-        elif pathsep is not PathSeparators.AUTO:
-            yaml_path.separator = pathsep
+        yaml_path = CompiledYAMLPath.compile(yaml_path, pathsep)
 
         if mustexist:
-            self.logger.debug(
-                f"Processor::set_value:  Seeking required node at {yaml_path}."
-            )
+            if self.logger.is_debug_enabled:
+                self.logger.debug(
+                    "Processor::set_value:  Seeking required node at"
+                    f" {yaml_path}.")
             found_nodes: int = 0
             for req_node in self._get_required_nodes(self.data, yaml_path):
                 found_nodes += 1
@@ -227,8 +643,8 @@ class Processor:
                 )
         else:
             self.logger.debug(
-                "Processor::set_value:  Seeking optional node at {}."
-                .format(yaml_path)
+                "Processor::set_value:  Seeking optional node at {}.",
+                yaml_path
             )
             for node_coord in self._get_optional_nodes(
                 self.data, yaml_path, value
@@ -236,9 +652,94 @@ class Processor:
                 self._apply_change(yaml_path, node_coord, value,
                     value_format=value_format, tag=tag)
 
+    # pylint: disable=locally-disabled,too-many-locals
+    def apply_changes(
+        self, changes: List[Tuple[Any, ...]], **kwargs: Any
+    ) -> List[List[NodeCoords]]:
+        """
+        Set the values of the nodes at many YAML Paths at once.
+
+        Each change is a tuple of (yaml_path, value[, value_format[, tag]]).
+        Unlike a series of `set_value` calls, the YAML Paths of every change
+        are resolved in a single traversal of the document which evaluates
+        the segments they share -- like a common `/spec/containers` prefix --
+        only once.  Every YAML Path is resolved before any value is changed,
+        so no change can affect which nodes another matches.  The changes are
+        then applied in the order given, after which every reference to the
+        changed nodes is updated in one pass over the document rather than
+        one pass per change.
+
+        Parameters:
+        1. changes (List[Tuple[Any, ...]]) The changes to make; each is a
+           (yaml_path, value) tuple optionally followed by the
+           YAMLValueFormats and the custom data-type tag of the value
+
+        Keyword Arguments:
+        * mustexist (bool) Indicate whether every YAML Path must exist in data
+          prior to this change (lest an Exception be raised before any change
+          is made); default=False
+        * pathsep (PathSeparators) Forced YAML Path segment separator; set
+          only when automatic inference fails;
+          default = PathSeparators.AUTO
+
+        Returns:  (List[List[NodeCoords]]) For each change, in order, the
+            nodes it changed as they were before the change
+
+        Raises:
+            - `YAMLPathException` when any YAML Path is invalid
+        """
+        mustexist: bool = kwargs.pop("mustexist", False)
+        pathsep: PathSeparators = kwargs.pop("pathsep", PathSeparators.AUTO)
+        results: List[List[NodeCoords]] = [[] for _ in changes]
+
+        if self.data is None:
+            self.logger.debug(
+                "Refusing to set nodes of a null document!",
+                prefix="Processor::apply_changes:  ", data=self.data)
+            return results
+
+        trie = PathTrie()
+        paths: List[CompiledYAMLPath] = [
+            trie.insert(change[0], change_idx, pathsep)
+            for change_idx, change in enumerate(changes)]
+
+        for (change_idx, node_coords) in self._get_nodes_by_trie(
+            self.data, trie.root
+        ):
+            results[change_idx].append(node_coords)
+
+        for change_idx, yaml_path in enumerate(paths):
+            if results[change_idx]:
+                continue
+            if mustexist:
+                raise UnmatchedYAMLPathException(
+                    "No nodes matched required YAML Path",
+                    str(yaml_path)
+                )
+
+            self.logger.debug(
+                "Processor::apply_changes:  Creating missing node at {}.",
+                yaml_path)
+            results[change_idx] = list(self._get_optional_nodes(
+                self.data, yaml_path, changes[change_idx][1]))
+
+        deferred: List[NodeReplacement] = []
+        for change_idx, yaml_path in enumerate(paths):
+            change = tuple(changes[change_idx]) + (None,) * 2
+            value = change[1]
+            value_format = (YAMLValueFormats.DEFAULT
+                            if change[2] is None else change[2])
+            for node_coord in results[change_idx]:
+                self._apply_change(yaml_path, node_coord, value,
+                    value_format=value_format, tag=change[3],
+                    deferred=deferred)
+
+        self._replace_nodes(deferred)
+        return results
+
     # pylint: disable=locally-disabled,too-many-locals,too-many-branches
     def _apply_change(
-        self, yaml_path: YAMLPath, node_coord: NodeCoords, value: Any,
+        self, yaml_path: CompiledYAMLPath, node_coord: NodeCoords, value: Any,
         **kwargs: Any
     ) -> None:
         """
@@ -254,6 +755,8 @@ class Processor:
           representation to use when writing the data;
           default=YAMLValueFormats.DEFAULT
         * tag (str) Custom data-type tag to assign
+        * deferred (List[NodeReplacement]) Gather replacements of nodes into
+          this list rather than applying them to the document
 
         Returns: N/A
 
@@ -263,21 +766,26 @@ class Processor:
         value_format: YAMLValueFormats = kwargs.pop("value_format",
                                                     YAMLValueFormats.DEFAULT)
         tag: str = kwargs.pop("tag", None)
+        deferred: Optional[List[NodeReplacement]] = kwargs.pop(
+            "deferred", None)
+        self._discard_indexes(node_coord)
 
-        self.logger.debug(
-            "Attempting to change a node coordinate of type"
-            f" {type(node_coord)} to value with format <{value_format}>:",
-            data={
-                "value": value,
-                "node_coord": node_coord
-            }, prefix="Processor::_apply_change:  ")
+        if self.logger.is_debug_enabled:
+            self.logger.debug(
+                "Attempting to change a node coordinate of type"
+                f" {type(node_coord)} to value with format <{value_format}>:",
+                data={
+                    "value": value,
+                    "node_coord": node_coord
+                }, prefix="Processor::_apply_change:  ")
 
         if isinstance(node_coord.node, NodeCoords):
             self.logger.debug(
                 "Unpacked Collector results to apply change:"
                 , data=node_coord.node
                 , prefix="Processor::_apply_change:  ")
-            self._apply_change(yaml_path, node_coord.node, value, **kwargs)
+            self._apply_change(yaml_path, node_coord.node, value,
+                deferred=deferred, **kwargs)
 
         if (isinstance(node_coord.node, list)
             and len(node_coord.node) > 0
@@ -288,7 +796,8 @@ class Processor:
                     "Expanded collected Collector results to apply change:"
                     , data=collector_node
                     , prefix="Processor::_apply_change:  ")
-                self._apply_change(yaml_path, collector_node, value, **kwargs)
+                self._apply_change(yaml_path, collector_node, value,
+                    deferred=deferred, **kwargs)
             return
 
         last_segment = node_coord.path_segment
@@ -300,6 +809,7 @@ class Processor:
             ):
                 # Rename a key; the new name must not already exist in its
                 # parent.
+                self._document_index.invalidate()
                 parent = node_coord.parent
                 parentref = node_coord.parentref
                 if isinstance(parent, CommentedMap):
@@ -335,7 +845,7 @@ class Processor:
         try:
             self._update_node(
                 node_coord.parent, node_coord.parentref, value,
-                value_format, tag)
+                value_format, tag, deferred)
         except ValueError as vex:
             raise TypeMismatchYAMLPathException(
                 "Impossible to write '{}' as {}.  The error was:  {}"
@@ -343,16 +853,17 @@ class Processor:
                 , str(yaml_path)) from vex
 
     def _get_anchor_node(
-        self, anchor_path: Union[YAMLPath, str], **kwargs: Any
+        self, anchor_path: Union[CompiledYAMLPath, YAMLPath, str],
+        **kwargs: Any
     ) -> Any:
         """
         Gather the source YAML Anchor node for an Aliasing operation.
 
         Parameters:
-        1. anchor_path (Union[YAMLPath, str]) The YAML Path to a single source
-           anchor node; specifying any path which points to more than one node
-           will result in a YAMLPathException because YAML does not define
-           Aliases for more than one Anchor.
+        1. anchor_path (Union[CompiledYAMLPath, YAMLPath, str]) The YAML Path
+           to a single source anchor node; specifying any path which points to
+           more than one node will result in a YAMLPathException because YAML
+           does not define Aliases for more than one Anchor.
 
         Keyword Arguments:
         * anchor_name (str) Alternate name to use for the YAML Anchor and its
@@ -367,10 +878,7 @@ class Processor:
         pathsep: PathSeparators = kwargs.pop("pathsep", PathSeparators.AUTO)
         anchor_name: str = kwargs.pop("anchor_name", "")
 
-        if isinstance(anchor_path, str):
-            anchor_path = YAMLPath(anchor_path, pathsep)
-        elif pathsep is not PathSeparators.AUTO:
-            anchor_path.separator = pathsep
+        anchor_path = CompiledYAMLPath.compile(anchor_path, pathsep)
 
         anchor_node_coordinates: List[NodeCoords] = []
         for node_coords in self._get_required_nodes(self.data, anchor_path):
@@ -386,12 +894,13 @@ class Processor:
         anchor_coord = anchor_node_coordinates[0]
         anchor_node = anchor_coord.node
         if not hasattr(anchor_node, "anchor"):
+            self._discard_indexes(anchor_coord)
             anchor_coord.parent[anchor_coord.parentref] = Nodes.wrap_type(
                 anchor_node)
             anchor_node = anchor_coord.parent[anchor_coord.parentref]
+            self._document_index.invalidate()
 
-        known_anchors: Dict[str, Any] = {}
-        Anchors.scan_for_anchors(self.data, known_anchors)
+        known_anchors: Dict[str, Any] = self._document_index.anchors
 
         if anchor_name:
             # Rename any pre-existing anchor or set an original anchor name;
@@ -411,10 +920,11 @@ class Processor:
                 self.data, anchor_coord, known_anchors)
             anchor_node.yaml_set_anchor(new_anchor, always_dump=True)
 
+        self._document_index.invalidate()
         return anchor_node
 
     def ymk_nodes(
-        self, yaml_path: Union[YAMLPath, str],
+        self, yaml_path: Union[CompiledYAMLPath, YAMLPath, str],
         anchor_path: Union[YAMLPath, str], **kwargs: Any
     ) -> None:
         """Add a YAML Merge Key to YAML Path specified nodes."""
@@ -428,10 +938,7 @@ class Processor:
                 prefix="Processor::ymk_nodes:  ", data=self.data)
             return
 
-        if isinstance(yaml_path, str):
-            yaml_path = YAMLPath(yaml_path, pathsep)
-        elif pathsep is not PathSeparators.AUTO:
-            yaml_path.separator = pathsep
+        yaml_path = CompiledYAMLPath.compile(yaml_path, pathsep)
 
         anchor_node = self._get_anchor_node(
             anchor_path, pathsep=pathsep, anchor_name=anchor_name)
@@ -470,16 +977,18 @@ class Processor:
 
     def _ymk_nodes(
         self, gathered_nodes: List[NodeCoords], anchor_node: Any,
-        target_path: Union[YAMLPath, str]
+        target_path: Union[CompiledYAMLPath, YAMLPath, str]
     ) -> None:
         """Add a YAML Merge Key to nodes."""
+        self._document_index.invalidate()
         anchor_name = anchor_node.anchor.value
         for node_coord in gathered_nodes:
             self.logger.debug(
-                "Attempting to add YAML Merge Key for node to {}:"
-                .format(anchor_name),
+                "Attempting to add YAML Merge Key for node to {}:",
+                anchor_name,
                 data=node_coord,
                 prefix="yaml_set::_ymk_nodes:  ")
+            self._discard_indexes(node_coord)
             node = node_coord.node
             if not isinstance(node, CommentedMap):
                 raise BadAliasYAMLPathException(
@@ -499,16 +1008,16 @@ class Processor:
             node_coord.node.add_yaml_merge([(len(refs), anchor_node)])
 
     def alias_nodes(
-        self, yaml_path: Union[YAMLPath, str],
+        self, yaml_path: Union[CompiledYAMLPath, YAMLPath, str],
         anchor_path: Union[YAMLPath, str], **kwargs: Any
     ) -> None:
         """
         Gather and assign YAML Aliases to nodes at YAML Path in data.
 
         Parameters:
-        1. yaml_path (Union[YAMLPath, str]) The YAML Path to all target nodes
-           which will become Aliases to the Anchor node specified via
-           `anchor_path`.
+        1. yaml_path (Union[CompiledYAMLPath, YAMLPath, str]) The YAML Path to
+           all target nodes which will become Aliases to the Anchor node
+           specified via `anchor_path`.
         2. anchor_path (Union[YAMLPath, str]) The YAML Path to a single source
            anchor node; specifying any path which points to more than one node
            will result in a YAMLPathException because YAML does not define
@@ -536,10 +1045,7 @@ class Processor:
                 prefix="Processor::alias_nodes:  ", data=self.data)
             return
 
-        if isinstance(yaml_path, str):
-            yaml_path = YAMLPath(yaml_path, pathsep)
-        elif pathsep is not PathSeparators.AUTO:
-            yaml_path.separator = pathsep
+        yaml_path = CompiledYAMLPath.compile(yaml_path, pathsep)
 
         anchor_node = self._get_anchor_node(
             anchor_path, pathsep=pathsep, anchor_name=anchor_name)
@@ -602,23 +1108,27 @@ class Processor:
 
         Returns:  N/A
         """
+        self._document_index.invalidate()
         anchor_name = anchor_node.anchor.value
         for node_coord in gathered_nodes:
             self.logger.debug(
-                "Attempting to set the anchor name for node to {}:"
-                .format(anchor_name),
+                "Attempting to set the anchor name for node to {}:",
+                anchor_name,
                 data=node_coord,
                 prefix="yaml_set::_alias_nodes:  ")
+            self._discard_indexes(node_coord)
             node_coord.parent[node_coord.parentref] = anchor_node
 
     def tag_nodes(
-        self, yaml_path: Union[YAMLPath, str], tag: str, **kwargs: Any
+        self, yaml_path: Union[CompiledYAMLPath, YAMLPath, str], tag: str,
+        **kwargs: Any
     ) -> None:
         """
         Gather and assign a data-type tag to nodes at YAML Path in data.
 
         Parameters:
-        1. yaml_path (Union[YAMLPath, str]) The YAML Path to evaluate
+        1. yaml_path (Union[CompiledYAMLPath, YAMLPath, str]) The YAML Path to
+           evaluate
         2. tag (str) The tag to assign
 
         Keyword Arguments:
@@ -639,10 +1149,7 @@ class Processor:
                 prefix="Processor::tag_nodes:  ", data=self.data)
             return
 
-        if isinstance(yaml_path, str):
-            yaml_path = YAMLPath(yaml_path, pathsep)
-        elif pathsep is not PathSeparators.AUTO:
-            yaml_path.separator = pathsep
+        yaml_path = CompiledYAMLPath.compile(yaml_path, pathsep)
 
         gathered_nodes: List[NodeCoords] = []
         for node_coords in self._get_required_nodes(self.data, yaml_path):
@@ -670,7 +1177,9 @@ class Processor:
         if tag and not tag[0] == "!":
             tag = "!{}".format(tag)
 
+        self._document_index.invalidate()
         for node_coord in gathered_nodes:
+            self._discard_indexes(node_coord)
             old_node = node_coord.node
             if node_coord.parent is None:
                 node_coord.node.yaml_set_tag(tag)
@@ -683,13 +1192,14 @@ class Processor:
                         node_coord.parent[node_coord.parentref])
 
     def delete_nodes(
-        self, yaml_path: Union[YAMLPath, str], **kwargs: Any
+        self, yaml_path: Union[CompiledYAMLPath, YAMLPath, str], **kwargs: Any
     ) -> Generator[NodeCoords, None, None]:
         """
         Gather and delete nodes at YAML Path in data.
 
         Parameters:
-        1. yaml_path (Union[YAMLPath, str]) The YAML Path to evaluate
+        1. yaml_path (Union[CompiledYAMLPath, YAMLPath, str]) The YAML Path to
+           evaluate
 
         Keyword Arguments:
         * pathsep (PathSeparators) Forced YAML Path segment separator; set
@@ -709,10 +1219,7 @@ class Processor:
                 prefix="Processor::delete_nodes:  ", data=self.data)
             return
 
-        if isinstance(yaml_path, str):
-            yaml_path = YAMLPath(yaml_path, pathsep)
-        elif pathsep is not PathSeparators.AUTO:
-            yaml_path.separator = pathsep
+        yaml_path = CompiledYAMLPath.compile(yaml_path, pathsep)
 
         # Nodes must be processed in reverse order while deleting them to avoid
         # corrupting list element indecies, thereby deleting the wrong nodes.
@@ -754,12 +1261,14 @@ class Processor:
             parent = delete_nc.parent
             parentref = delete_nc.parentref
             ancestry = delete_nc.ancestry
-            self.logger.debug(
-                "Deleting node:",
-                prefix="yaml_set::delete_nodes:  ",
-                data_header="!" * 80,
-                footer="!" * 80,
-                data=delete_nc)
+            self._discard_indexes(delete_nc)
+            if self.logger.is_debug_enabled:
+                self.logger.debug(
+                    "Deleting node:",
+                    prefix="yaml_set::delete_nodes:  ",
+                    data_header="!" * 80,
+                    footer="!" * 80,
+                    data=delete_nc)
 
             # Ensure the reference exists before attempting to delete it
             if isinstance(node, list) and isinstance(node[0], NodeCoords):
@@ -768,8 +1277,7 @@ class Processor:
                 self._delete_nodes([node])
             elif isinstance(parent, (CommentedMap, dict)):
                 all_data = ancestry[0][0] if len(ancestry) > 0 else parent
-                all_anchors: Dict[str, Any] = {}
-                Anchors.scan_for_anchors(all_data, all_anchors)
+                all_anchors: Dict[str, Any] = self._anchors_of(all_data)
                 compare_node = (all_anchors[parentref]
                                 if parentref in all_anchors
                                 else None)
@@ -791,10 +1299,18 @@ class Processor:
                             break
                 elif parentref in parent:
                     del parent[parentref]
+
+                # Removing an unanchored scalar changes no YAML Anchors
+                if (isinstance(node, (dict, list, set))
+                    or Anchors.get_node_anchor(node) is not None
+                ):
+                    self._document_index.invalidate()
             elif isinstance(parent, (CommentedSeq, list)):
+                self._document_index.invalidate()
                 if len(parent) > parentref:
                     del parent[parentref]
             elif isinstance(parent, (CommentedSet, set)):
+                self._document_index.invalidate()
                 parent.discard(parentref)
             else:
                 # Edge-case:  Attempt to delete from a document which is
@@ -809,7 +1325,8 @@ class Processor:
 
     # pylint: disable=locally-disabled,too-many-branches,too-many-locals
     def _get_nodes_by_path_segment(
-        self, data: Any, yaml_path: YAMLPath, segment_index: int, **kwargs: Any
+        self, data: Any, yaml_path: CompiledYAMLPath, segment_index: int,
+        **kwargs: Any
     ) -> Generator[Any, None, None]:
         """
         Get nodes identified by their YAML Path segment.
@@ -828,9 +1345,9 @@ class Processor:
         * parentref (Any) The Index or Key of data within parent
         * traverse_lists (Boolean) Indicate whether KEY searches against lists
           are permitted to automatically traverse into the list; Default=True
-        * translated_path (YAMLPath) YAML Path indicating precisely which node
-          is being evaluated
-        * ancestry (List[AncestryEntry]) Stack of ancestors preceding the
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
           present node under evaluation
 
         Returns:  (Generator[Any, None, None]) Each node coordinate or list of
@@ -845,24 +1362,28 @@ class Processor:
         parent: Any = kwargs.pop("parent", None)
         parentref: Any = kwargs.pop("parentref", None)
         traverse_lists: bool = kwargs.pop("traverse_lists", True)
-        translated_path: YAMLPath = kwargs.pop("translated_path", YAMLPath(""))
-        ancestry: List[AncestryEntry] = kwargs.pop("ancestry", [])
-        segments = yaml_path.escaped
-        if not (segments and len(segments) > segment_index):
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
+        if not isinstance(yaml_path, CompiledYAMLPath):
+            yaml_path = CompiledYAMLPath(yaml_path)
+        steps = yaml_path.steps
+        if not (steps and len(steps) > segment_index):
             self.logger.debug(
-                "Bailing out because there are not {} segments in:"
-                .format(segment_index),
+                "Bailing out because there are not {} segments in:",
+                segment_index,
                 prefix="Processor::_get_nodes_by_path_segment:  ",
-                data=segments)
+                data=yaml_path.escaped)
             return
 
-        pathseg: PathSegment = yaml_path.unescaped[segment_index]
+        step = steps[segment_index]
+        pathseg: PathSegment = step.unescaped
         (unesc_type, unesc_attrs) = pathseg
-        (segment_type, stripped_attrs) = segments[segment_index]
+        (segment_type, stripped_attrs) = step.escaped
 
         # Disallow traversal recursion (because it creates a denial-of-service)
         if segment_index > 0 and segment_type == PathSegmentTypes.TRAVERSE:
-            (prior_segment_type, _) = segments[segment_index - 1]
+            prior_segment_type = steps[segment_index - 1].segment_type
             if prior_segment_type == PathSegmentTypes.TRAVERSE:
                 raise RecursionYAMLPathException(
                     "Repeating traversals are not allowed because they cause"
@@ -873,8 +1394,11 @@ class Processor:
         # NodeCoords cannot be directly evaluated as data, so pull out their
         # wrapped data for evaluation.
         if isinstance(data, NodeCoords):
-            ancestry = data.ancestry
-            translated_path = YAMLPath(data.path)
+            ancestry = Ancestry.from_entries(data.ancestry)
+            translated_path = (
+                data.translated_path
+                if isinstance(data.translated_path, TranslatedPath)
+                else TranslatedPath(data.translated_path))
             parent = data.parent
             parentref = data.parentref
             data = data.node
@@ -905,7 +1429,7 @@ class Processor:
                 data, yaml_path, stripped_attrs, parent=parent,
                 parentref=parentref, traverse_lists=traverse_lists,
                 translated_path=translated_path, ancestry=ancestry,
-                relay_segment=pathseg)
+                relay_segment=pathseg, document_index=self._document_index)
         elif (
                 segment_type == PathSegmentTypes.SEARCH
                 and isinstance(stripped_attrs, SearchTerms)
@@ -922,6 +1446,14 @@ class Processor:
                 data, yaml_path, segment_index, unesc_attrs, parent=parent,
                 parentref=parentref, translated_path=translated_path,
                 ancestry=ancestry)
+        elif (
+                segment_type == PathSegmentTypes.TRAVERSE
+                and self._iterative_engine
+        ):
+            node_coords = self._get_nodes_by_traversal_iterative(
+                data, yaml_path, segment_index, parent=parent,
+                parentref=parentref, translated_path=translated_path,
+                ancestry=ancestry)
         elif segment_type == PathSegmentTypes.TRAVERSE:
             node_coords = self._get_nodes_by_traversal(
                 data, yaml_path, segment_index, parent=parent,
@@ -930,11 +1462,16 @@ class Processor:
         else:
             raise NotImplementedError
 
+        if self._explanation is not None:
+            node_coords = self._explanation.profile(
+                yaml_path, segment_index, node_coords)
+
         for node_coord in node_coords:
             yield node_coord
 
     def _get_nodes_by_key(
-        self, data: Any, yaml_path: YAMLPath, segment_index: int, **kwargs: Any
+        self, data: Any, yaml_path: CompiledYAMLPath, segment_index: int,
+        **kwargs: Any
     ) -> Generator[NodeCoords, None, None]:
         """
         Get nodes from a Hash by their unique key name.
@@ -950,9 +1487,9 @@ class Processor:
         Keyword Arguments:
         * traverse_lists (Boolean) Indicate whether KEY searches against lists
           are permitted to automatically traverse into the list; Default=True
-        * translated_path (YAMLPath) YAML Path indicating precisely which node
-          is being evaluated
-        * ancestry (List[AncestryEntry]) Stack of ancestors preceding the
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
           present node under evaluation
 
         Returns:  (Generator[NodeCoords, None, None]) Each NodeCoords as they
@@ -961,20 +1498,21 @@ class Processor:
         Raises:  N/A
         """
         traverse_lists: bool = kwargs.pop("traverse_lists", True)
-        translated_path: YAMLPath = kwargs.pop("translated_path", YAMLPath(""))
-        ancestry: List[AncestryEntry] = kwargs.pop("ancestry", [])
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
 
         pathseg: PathSegment = yaml_path.escaped[segment_index]
         (_, stripped_attrs) = pathseg
         str_stripped = str(stripped_attrs)
-        next_ancestry: List[AncestryEntry] = []
+        next_ancestry: Ancestry = Ancestry()
 
-        self.logger.debug((
-            "Seeking KEY node, {}, in data:"
-            ).format(str_stripped),
-            prefix="Processor::_get_nodes_by_key:  ",
-            data={"KEY": stripped_attrs,
-                  "DATA": data})
+        if self.logger.is_debug_enabled:
+            self.logger.debug(
+                "Seeking KEY node, {}, in data:", str_stripped,
+                prefix="Processor::_get_nodes_by_key:  ",
+                data={"KEY": stripped_attrs,
+                      "DATA": data})
 
         if isinstance(data, dict):
             next_translated_path = (translated_path +
@@ -984,8 +1522,7 @@ class Processor:
             if stripped_attrs in data:
                 self.logger.debug(
                     "Processor::_get_nodes_by_key:  FOUND key node by name at"
-                    " {}."
-                    .format(str_stripped))
+                    " {}.", str_stripped)
                 yield NodeCoords(
                     data[stripped_attrs], data, stripped_attrs,
                     next_translated_path, next_ancestry, pathseg)
@@ -1007,8 +1544,7 @@ class Processor:
                 if len(data) > idx:
                     self.logger.debug(
                         "Processor::_get_nodes_by_key:  FOUND key node as a"
-                        " bare Array index at [{}]."
-                        .format(str_stripped))
+                        " bare Array index at [{}].", str_stripped)
                     next_translated_path = translated_path + "[{}]".format(idx)
                     next_ancestry = ancestry + [(data, idx)]
                     yield NodeCoords(
@@ -1034,18 +1570,17 @@ class Processor:
                             ancestry=next_ancestry):
                         self.logger.debug(
                             "Processor::_get_nodes_by_key:  FOUND key node "
-                            " via pass-through Array-of-Hashes search at {}."
-                            .format(next_translated_path))
+                            " via pass-through Array-of-Hashes search at {}.",
+                            next_translated_path)
                         yield node_coord
 
         elif isinstance(data, (set, CommentedSet)):
             for ele in data:
                 ele_val = ele.value if isinstance(ele, TaggedScalar) else ele
                 if ele_val == stripped_attrs:
-                    self.logger.debug((
+                    self.logger.debug(
                         "Processor::_get_nodes_by_key:  FOUND set node by"
-                        " name at {}."
-                        ).format(str_stripped))
+                        " name at {}.", str_stripped)
                     next_translated_path = (translated_path +
                         YAMLPath.escape_path_section(
                             ele_val, translated_path.separator))
@@ -1057,7 +1592,8 @@ class Processor:
 
     # pylint: disable=locally-disabled,too-many-locals
     def _get_nodes_by_index(
-        self, data: Any, yaml_path: YAMLPath, segment_index: int, **kwargs
+        self, data: Any, yaml_path: CompiledYAMLPath, segment_index: int,
+        **kwargs: Any
     ) -> Generator[NodeCoords, None, None]:
         """
         Get nodes from a List by their index.
@@ -1072,9 +1608,9 @@ class Processor:
         3. segment_index (int) Segment index of the YAML Path to process
 
         Keyword Arguments:
-        * translated_path (YAMLPath) YAML Path indicating precisely which node
-          is being evaluated
-        * ancestry (List[AncestryEntry]) Stack of ancestors preceding the
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
           present node under evaluation
 
         Returns:  (Generator[NodeCoords, None, None]) Each NodeCoords as they
@@ -1082,8 +1618,9 @@ class Processor:
 
         Raises:  N/A
         """
-        translated_path: YAMLPath = kwargs.pop("translated_path", YAMLPath(""))
-        ancestry: List[AncestryEntry] = kwargs.pop("ancestry", [])
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
 
         pathseg: PathSegment = yaml_path.escaped[segment_index]
         (_, stripped_attrs) = pathseg
@@ -1091,8 +1628,8 @@ class Processor:
         str_stripped = str(stripped_attrs)
 
         self.logger.debug(
-            "Processor::_get_nodes_by_index:  Seeking INDEX node at {}."
-            .format(str_stripped))
+            "Processor::_get_nodes_by_index:  Seeking INDEX node at {}.",
+            str_stripped)
 
         if ':' in str_stripped:
             # Array index or Hash key slice
@@ -1172,7 +1709,8 @@ class Processor:
                 )
 
     def _get_nodes_by_anchor(
-        self, data: Any, yaml_path: YAMLPath, segment_index: int, **kwargs
+        self, data: Any, yaml_path: CompiledYAMLPath, segment_index: int,
+        **kwargs: Any
     ) -> Generator[NodeCoords, None, None]:
         """
         Get nodes matching an Anchor name.
@@ -1186,9 +1724,9 @@ class Processor:
         3. segment_index (int) Segment index of the YAML Path to process
 
         Keyword Arguments:
-        * translated_path (YAMLPath) YAML Path indicating precisely which node
-          is being evaluated
-        * ancestry (List[AncestryEntry]) Stack of ancestors preceding the
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
           present node under evaluation
 
         Returns:  (Generator[NodeCoords, None, None]) Each NodeCoords as they
@@ -1196,8 +1734,9 @@ class Processor:
 
         Raises:  N/A
         """
-        translated_path: YAMLPath = kwargs.pop("translated_path", YAMLPath(""))
-        ancestry: List[AncestryEntry] = kwargs.pop("ancestry", [])
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
 
         pathseg: PathSegment = yaml_path.escaped[segment_index]
         (_, stripped_attrs) = pathseg
@@ -1206,8 +1745,8 @@ class Processor:
                 str(stripped_attrs), translated_path.separator))
 
         self.logger.debug(
-            "Processor::_get_nodes_by_anchor:  Seeking ANCHOR node at {}."
-            .format(stripped_attrs))
+            "Processor::_get_nodes_by_anchor:  Seeking ANCHOR node at {}.",
+            stripped_attrs)
 
         if isinstance(data, list):
             for lstidx, ele in enumerate(data):
@@ -1220,22 +1759,22 @@ class Processor:
                 and hasattr(data, "merge")
                 and len(data.merge) > 0
             ):
-                all_anchors: Dict[str, Any] = {}
-                Anchors.scan_for_anchors(self.data, all_anchors)
+                all_anchors: Dict[str, Any] = self._document_index.anchors
                 compare_node = (all_anchors[str(stripped_attrs)]
                                 if stripped_attrs in all_anchors
                                 else None)
                 if compare_node:
                     for merge_tuple in data.merge:
                         merge_node = merge_tuple[1]
-                        self.logger.debug((
-                            "Comparing YAML Merge Key against ANCHOR node {}:"
-                            ).format(stripped_attrs),
-                            prefix="Processor::_get_nodes_by_anchor:  ",
-                            data={
-                                "merge_node": merge_node,
-                                "anchor_node": compare_node
-                            })
+                        if self.logger.is_debug_enabled:
+                            self.logger.debug(
+                                "Comparing YAML Merge Key against ANCHOR node"
+                                " {}:", stripped_attrs,
+                                prefix="Processor::_get_nodes_by_anchor:  ",
+                                data={
+                                    "merge_node": merge_node,
+                                    "anchor_node": compare_node
+                                })
                         if merge_node == compare_node:
                             next_ancestry = ancestry + [(data, merge_node)]
                             yield NodeCoords(
@@ -1264,7 +1803,8 @@ class Processor:
                         ancestry + [(data, ele)], pathseg)
 
     def _get_nodes_by_keyword_search(
-        self, data: Any, yaml_path: YAMLPath, terms: SearchKeywordTerms,
+        self, data: Any, yaml_path: CompiledYAMLPath,
+        terms: SearchKeywordTerms,
         **kwargs: Any
     ) -> Generator[NodeCoords, None, None]:
         """
@@ -1281,9 +1821,9 @@ class Processor:
         * parentref (Any) The Index or Key of data within parent
         * traverse_lists (Boolean) Indicate whether searches against lists are
           permitted to automatically traverse into the list; Default=True
-        * translated_path (YAMLPath) YAML Path indicating precisely which node
-          is being evaluated
-        * ancestry (List[AncestryEntry]) Stack of ancestors preceding the
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
           present node under evaluation
 
         Returns:  (Generator[NodeCoords, None, None]) Each NodeCoords as they
@@ -1292,7 +1832,7 @@ class Processor:
         Raises:  N/A
         """
         self.logger.debug(
-            "Seeking KEYWORD_SEARCH nodes matching {} in data:".format(terms),
+            "Seeking KEYWORD_SEARCH nodes matching {} in data:", terms,
             data=data,
             prefix="Processor::_get_nodes_by_keyword_search:  ")
 
@@ -1325,9 +1865,9 @@ class Processor:
         * parentref (Any) The Index or Key of data within parent
         * traverse_lists (Boolean) Indicate whether searches against lists are
           permitted to automatically traverse into the list; Default=True
-        * translated_path (YAMLPath) YAML Path indicating precisely which node
-          is being evaluated
-        * ancestry (List[AncestryEntry]) Stack of ancestors preceding the
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
           present node under evaluation
 
         Returns:  (Generator[NodeCoords, None, None]) Each NodeCoords as they
@@ -1336,23 +1876,24 @@ class Processor:
         Raises:  N/A
         """
         self.logger.debug(
-            "Seeking SEARCH nodes matching {} in data:".format(terms),
+            "Seeking SEARCH nodes matching {} in data:", terms,
             data=data,
             prefix="Processor::_get_nodes_by_search:  ")
 
         parent: Any = kwargs.pop("parent", None)
         parentref: Any = kwargs.pop("parentref", None)
         traverse_lists: bool = kwargs.pop("traverse_lists", True)
-        translated_path: YAMLPath = kwargs.pop("translated_path", YAMLPath(""))
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
         pathseg: PathSegment = (PathSegmentTypes.SEARCH, terms)
-        ancestry: List[AncestryEntry] = kwargs.pop("ancestry", [])
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
 
         invert = terms.inverted
-        method = terms.method
+        is_match = terms.predicate
         attr = terms.attribute
         term = terms.term
         matches = False
-        desc_path = YAMLPath(attr)
+        desc_path = CompiledYAMLPath.compile(attr)
         debug_matched = "NO MATCHES YIELDED"
         if isinstance(data, list):
             if not traverse_lists:
@@ -1363,15 +1904,25 @@ class Processor:
 
             is_aoh = Nodes.node_is_aoh(data, accept_nulls=True)
             search_keys = attr == '.'
-            for lstidx, ele in enumerate(data):
+            candidates: Optional[List[int]] = None
+            if self._index_searches and not (search_keys or invert):
+                candidates = self._search_index.candidates(
+                    data, attr, terms.method, term)
+            if self._explanation is not None:
+                self._explanation.visit(
+                    len(data) if candidates is None else len(candidates))
+            for lstidx in (range(len(data)) if candidates is None
+                           else candidates):
+                ele = data[lstidx]
                 if search_keys:
                     # pylint: disable=locally-disabled,consider-using-ternary
                     matches = ((is_aoh and term in ele)
-                        or Searches.search_matches(method, term, ele))
+                        or is_match(ele))
                 elif isinstance(ele, dict) and attr in ele:
-                    matches = Searches.search_matches(method, term, ele[attr])
+                    matches = is_match(ele[attr])
                 else:
                     # Attempt a descendant search
+                    matches = False
                     next_translated_path = translated_path + "[{}]".format(
                         lstidx)
                     next_ancestry = ancestry + [(data, lstidx)]
@@ -1380,14 +1931,13 @@ class Processor:
                         translated_path=next_translated_path,
                         ancestry=next_ancestry, relay_segment=pathseg
                     ):
-                        matches = Searches.search_matches(
-                            method, term, desc_node.node)
+                        matches = is_match(desc_node.node)
                         break
 
                 if (matches and not invert) or (invert and not matches):
                     debug_matched = "one list match yielded"
                     self.logger.debug(
-                        "Yielding list match at index {}:".format(lstidx),
+                        "Yielding list match at index {}:", lstidx,
                         data=ele,
                         prefix="Processor::_get_nodes_by_search:  ")
                     yield NodeCoords(
@@ -1401,13 +1951,15 @@ class Processor:
                 self.logger.debug(
                     "Scanning every key's name...",
                     prefix="Processor::_get_nodes_by_search:  ")
+                if self._explanation is not None:
+                    self._explanation.visit(len(data))
                 for key, val in data.items():
-                    matches = Searches.search_matches(method, term, key)
+                    matches = is_match(key)
                     if (matches and not invert) or (invert and not matches):
                         debug_matched = "one dictionary key name match yielded"
                         self.logger.debug(
-                            "Yielding dictionary key name match against '{}':"
-                            .format(key),
+                            "Yielding dictionary key name match against '{}':",
+                            key,
                             data=val,
                             prefix="Processor::_get_nodes_by_search:  ")
                         yield NodeCoords(
@@ -1418,16 +1970,18 @@ class Processor:
 
             elif attr in data:
                 value = data[attr]
-                matches = Searches.search_matches(method, term, value)
-                self.logger.debug(
-                    "Scanning for an attribute match against {}, which {}."
-                    .format(attr, "matches" if matches else "does not match"),
-                    prefix="Processor::_get_nodes_by_search:  ")
+                matches = is_match(value)
+                if self.logger.is_debug_enabled:
+                    self.logger.debug(
+                        "Scanning for an attribute match against {}, which"
+                        " {}.", attr,
+                        "matches" if matches else "does not match",
+                        prefix="Processor::_get_nodes_by_search:  ")
                 if (matches and not invert) or (invert and not matches):
                     debug_matched = "one dictionary attribute match yielded"
                     self.logger.debug(
-                        "Yielding dictionary attribute match against '{}':"
-                        .format(attr),
+                        "Yielding dictionary attribute match against '{}':",
+                        attr,
                         data=value,
                         prefix="Processor::_get_nodes_by_search:  ")
                     yield NodeCoords(
@@ -1439,10 +1993,10 @@ class Processor:
             else:
                 # Attempt a descendant search; return every node which has ANY
                 # descendent matching the search expression.
-                self.logger.debug((
+                self.logger.debug(
                     "Attempting a descendant search against data at"
-                    " desc_path={}, translated_path={}:"
-                    ).format(desc_path, translated_path),
+                    " desc_path={}, translated_path={}:",
+                    desc_path, translated_path,
                     prefix="Processor::_get_nodes_by_search:  ",
                     data=data)
                 for desc_node in self._get_required_nodes(
@@ -1450,25 +2004,24 @@ class Processor:
                     translated_path=translated_path, ancestry=ancestry,
                     relay_segment=pathseg
                 ):
-                    matches = Searches.search_matches(
-                        method, term, desc_node.node)
+                    matches = is_match(desc_node.node)
 
                     if (matches and not invert) or (invert and not matches):
                         # Search no further because the parent node of this
                         # search has at least one matching descendent.
-                        self.logger.debug((
-                            "BREAKING OUT of descendent search with matches={}"
-                            " and invert={}").format(
+                        if self.logger.is_debug_enabled:
+                            self.logger.debug(
+                                "BREAKING OUT of descendent search with"
+                                " matches={} and invert={}",
                                 "matching" if matches else "NOT matching",
-                                "yes" if invert else "no"),
-                            prefix="Processor::_get_nodes_by_search:  ")
+                                "yes" if invert else "no",
+                                prefix="Processor::_get_nodes_by_search:  ")
                         break
 
                 if (matches and not invert) or (invert and not matches):
                     debug_matched = "one descendant search match yielded"
                     self.logger.debug(
-                        "Yielding descendant match against '{}':"
-                        .format(attr),
+                        "Yielding descendant match against '{}':", attr,
                         data=data,
                         prefix="Processor::_get_nodes_by_search:  ")
                     yield NodeCoords(
@@ -1476,13 +2029,15 @@ class Processor:
                         pathseg)
 
         elif isinstance(data, (CommentedSet, set)):
+            if self._explanation is not None:
+                self._explanation.visit(len(data))
             for ele in data:
-                matches = Searches.search_matches(method, term, ele)
+                matches = is_match(ele)
 
                 if (matches and not invert) or (invert and not matches):
                     debug_matched = "one set match yielded"
                     self.logger.debug(
-                        "Yielding set match at value {}:".format(ele),
+                        "Yielding set match at value {}:", ele,
                         prefix="Processor::_get_nodes_by_search:  ")
                     yield NodeCoords(
                         ele, data, ele,
@@ -1492,7 +2047,7 @@ class Processor:
 
         else:
             # Check the passed data itself for a match
-            matches = Searches.search_matches(method, term, data)
+            matches = is_match(data)
             if (matches and not invert) or (invert and not matches):
                 debug_matched = "query source data itself yielded"
                 self.logger.debug(
@@ -1503,13 +2058,14 @@ class Processor:
                     pathseg)
 
         self.logger.debug(
-            "Finished seeking SEARCH nodes matching {} in data with {}:"
-            .format(terms, debug_matched),
+            "Finished seeking SEARCH nodes matching {} in data with {}:",
+            terms, debug_matched,
             data=data,
             prefix="Processor::_get_nodes_by_search:  ")
 
     def _collector_addition(
-        self, data: Any, peek_path: YAMLPath, node_coords: List[NodeCoords],
+        self, data: Any, peek_path: CompiledYAMLPath,
+        node_coords: List[NodeCoords],
         **kwargs
     ) -> List[NodeCoords]:
         """List nodes matching the given path of an Addition Collector.
@@ -1519,8 +2075,9 @@ class Processor:
         updated_coords = node_coords
         parent: Any = kwargs.pop("parent", None)
         parentref: Any = kwargs.pop("parentref", None)
-        translated_path: YAMLPath = kwargs.pop("translated_path", YAMLPath(""))
-        ancestry: List[AncestryEntry] = kwargs.pop("ancestry", [])
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
         relay_segment: PathSegment = kwargs.pop("relay_segment")
 
         for node_coord in self._get_required_nodes(
@@ -1532,7 +2089,7 @@ class Processor:
                     and isinstance(node_coord.node, list)):
                 for coord_idx, coord in enumerate(node_coord.node):
                     if not isinstance(coord, NodeCoords):
-                        next_translated_path = node_coord.path
+                        next_translated_path = node_coord.translated_path
                         if next_translated_path is not None:
                             next_translated_path = (
                                 next_translated_path +
@@ -1550,7 +2107,8 @@ class Processor:
         return updated_coords
 
     def _collector_subtraction(
-        self, data: Any, peek_path: YAMLPath, lhs_ncs: List[NodeCoords],
+        self, data: Any, peek_path: CompiledYAMLPath,
+        lhs_ncs: List[NodeCoords],
         **kwargs
     ) -> List[NodeCoords]:
         """List nodes matching the given path of a Subtraction Collector.
@@ -1573,19 +2131,21 @@ class Processor:
 
         parent: Any = kwargs.pop("parent", None)
         parentref: Any = kwargs.pop("parentref", None)
-        translated_path: YAMLPath = kwargs.pop("translated_path", YAMLPath(""))
-        ancestry: List[AncestryEntry] = kwargs.pop("ancestry", [])
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
         relay_segment: PathSegment = kwargs.pop("relay_segment")
 
-        expression_path = YAMLPath(peek_path)
+        expression_path = peek_path
 
-        self.logger.debug((
-            "Getting required nodes matching collector sub-path, {}, from:"
-            ).format(peek_path),
-            prefix="Processor::_collector_subtraction:  ",
-            data={
-                "segments": expression_path.unescaped,
-                "data": data})
+        if self.logger.is_debug_enabled:
+            self.logger.debug(
+                "Getting required nodes matching collector sub-path, {},"
+                " from:", peek_path,
+                prefix="Processor::_collector_subtraction:  ",
+                data={
+                    "segments": expression_path.unescaped,
+                    "data": data})
 
         rem_data: List[Any] = []
         for node_coord in self._get_required_nodes(
@@ -1600,13 +2160,34 @@ class Processor:
                 data=node_coord)
             get_del_nodes(rem_data, node_coord)
 
-        self.logger.debug((
-            "Removing the following nodes from pre-gathered data:"),
-            prefix="Processor::_collector_subtraction:  REMOVAL NODES->",
-            data={
-                "REMOVING": rem_data,
-                "FROM": lhs_ncs,
-            })
+        if self.logger.is_debug_enabled:
+            self.logger.debug((
+                "Removing the following nodes from pre-gathered data:"),
+                prefix="Processor::_collector_subtraction:  REMOVAL NODES->",
+                data={
+                    "REMOVING": rem_data,
+                    "FROM": lhs_ncs,
+                })
+
+        # Index the RHS so each LHS node is compared only against the RHS
+        # nodes which may equal it.  Single-entry Hashes identify key-value
+        # pairs to delete from LHS Hashes; group their values by key.
+        rem_nodes = FingerprintSet(rem_data)
+        rem_keys: Dict[Any, None] = {}
+        rem_pairs: Dict[Any, FingerprintSet] = {}
+        rem_others: List[Any] = []
+        for rhs in rem_data:
+            if not isinstance(rhs, dict):
+                rem_others.append(rhs)
+                continue
+            rem_keys.update(dict.fromkeys(rhs))
+            if isinstance(rhs, OrderedDict):
+                # Do not drill into OrderedDict results because such
+                # wrapping means the user intends for the ENTIRE dict to be
+                # matched, not its individual key-value pairs.
+                continue
+            for key, val in rhs.items():
+                rem_pairs.setdefault(key, FingerprintSet()).add(val)
 
         # If LHS in RHS, delete it
         rem_dels = []
@@ -1618,30 +2199,31 @@ class Processor:
             append_node = True
 
             if lhs.wraps_a(dict):
-                if unwrapped_lhs in rem_data:
+                if unwrapped_lhs in rem_nodes:
                     continue
-                for rhs in rem_data:
+                if lhs.parentref in rem_keys:
+                    append_node = False
+                for rhs in rem_others:
                     if lhs.parentref in rhs:
                         append_node = False
-                    if isinstance(rhs, OrderedDict):
-                        # Do not drill into OrderedDict results because such
-                        # wrapping means the user intends for the ENTIRE dict
-                        # to be matched, not its individual key-value pairs.
-                        continue
                     for key, val in rhs.items():
                         if key in unwrapped_lhs and unwrapped_lhs[key] == val:
                             rem_dels.append((rem_idx, key))
+                for key, vals in rem_pairs.items():
+                    if key in unwrapped_lhs and unwrapped_lhs[key] in vals:
+                        rem_dels.append((rem_idx, key))
             elif lhs.wraps_a(list):
-                if unwrapped_lhs in rem_data or rem_data == unwrapped_lhs:
+                if unwrapped_lhs in rem_nodes or rem_data == unwrapped_lhs:
                     continue
             else:
-                if unwrapped_lhs in rem_data:
+                if unwrapped_lhs in rem_nodes:
                     continue
 
             if append_node:
                 updated_coords.append(deepest_lhs)
                 rem_idx += 1
         for idx, key in rem_dels:
+            self._discard_indexes(updated_coords[idx].deepest_node_coord)
             del updated_coords[idx].deepest_node_coord.node[key]
 
         self.logger.debug((
@@ -1652,7 +2234,8 @@ class Processor:
         return updated_coords
 
     def _collector_intersection(
-        self, data: Any, peek_path: YAMLPath, lhs_ncs: List[NodeCoords],
+        self, data: Any, peek_path: CompiledYAMLPath,
+        lhs_ncs: List[NodeCoords],
         **kwargs
     ) -> List[NodeCoords]:
         """
@@ -1673,8 +2256,9 @@ class Processor:
 
         parent: Any = kwargs.pop("parent", None)
         parentref: Any = kwargs.pop("parentref", None)
-        translated_path: YAMLPath = kwargs.pop("translated_path", YAMLPath(""))
-        ancestry: List[AncestryEntry] = kwargs.pop("ancestry", [])
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
         relay_segment: PathSegment = kwargs.pop("relay_segment")
         rhs_unwrapped_data: List[Any] = []
         for node_coord in self._get_required_nodes(
@@ -1688,14 +2272,15 @@ class Processor:
                 , data=node_coord)
             deeply_unwrap_nodes(rhs_unwrapped_data, node_coord)
 
+        rhs_nodes = FingerprintSet(rhs_unwrapped_data)
         updated_coords = [
             nc for nc in lhs_ncs
-            if NodeCoords.unwrap_node_coords(nc) in rhs_unwrapped_data]
+            if NodeCoords.unwrap_node_coords(nc) in rhs_nodes]
 
         return updated_coords
 
     def _get_nodes_by_collector(
-        self, data: Any, yaml_path: YAMLPath, segment_index: int,
+        self, data: Any, yaml_path: CompiledYAMLPath, segment_index: int,
         terms: CollectorTerms, **kwargs: Any
     ) -> Generator[List[NodeCoords], None, None]:
         """
@@ -1715,9 +2300,9 @@ class Processor:
         * parent (ruamel.yaml node) The parent node from which this query
           originates
         * parentref (Any) The Index or Key of data within parent
-        * translated_path (YAMLPath) YAML Path indicating precisely which node
-          is being evaluated
-        * ancestry (List[AncestryEntry]) Stack of ancestors preceding the
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
           present node under evaluation
 
         Returns:  (Generator[List[NodeCoords], None, None]) Each list of
@@ -1726,31 +2311,33 @@ class Processor:
         Raises:  N/A
         """
         if terms.operation is not CollectorOperators.NONE:
-            self.logger.debug((
+            self.logger.debug(
                 "Processor::_get_nodes_by_collector:  Bailing out -- yielding"
-                " the input data -- because the operation is {}"
-                ).format(terms.operation))
+                " the input data -- because the operation is {}",
+                terms.operation)
             yield data
             return
 
         parent: Any = kwargs.pop("parent", None)
         parentref: Any = kwargs.pop("parentref", None)
-        translated_path: YAMLPath = kwargs.pop("translated_path", YAMLPath(""))
-        ancestry: List[AncestryEntry] = kwargs.pop("ancestry", [])
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
 
         node_coords: List[NodeCoords] = []
         segments = yaml_path.escaped
         next_segment_idx = segment_index + 1
         pathseg: PathSegment = segments[segment_index]
-        expression_path = YAMLPath(terms.expression)
+        expression_path = CompiledYAMLPath.compile(terms.expression)
 
-        self.logger.debug((
-            "Getting required nodes matching collector sub-path, {}, from:"
-            ).format(terms.expression),
-            prefix="Processor::_get_nodes_by_collector:  ",
-            data={
-                "segments": expression_path.unescaped,
-                "data": data})
+        if self.logger.is_debug_enabled:
+            self.logger.debug(
+                "Getting required nodes matching collector sub-path, {},"
+                " from:", terms.expression,
+                prefix="Processor::_get_nodes_by_collector:  ",
+                data={
+                    "segments": expression_path.unescaped,
+                    "data": data})
         for node_coord in self._get_required_nodes(
             data, expression_path, 0, parent=parent,
             parentref=parentref, translated_path=translated_path,
@@ -1777,7 +2364,8 @@ class Processor:
                 flat_nodes.append(
                     NodeCoords(
                         flatten_node, node_coord.parent, flatten_idx,
-                        node_coord.path, node_coord.ancestry, pathseg))
+                        node_coord.translated_path, node_coord.ancestry,
+                        pathseg))
             node_coords = flat_nodes
 
         # As long as each next segment is an ADDITION, SUBTRACTION, or
@@ -1789,7 +2377,7 @@ class Processor:
                 peek_type is PathSegmentTypes.COLLECTOR
                 and isinstance(peek_attrs, CollectorTerms)
             ):
-                peek_path: YAMLPath = YAMLPath(peek_attrs.expression)
+                peek_path = CompiledYAMLPath.compile(peek_attrs.expression)
                 if peek_attrs.operation == CollectorOperators.ADDITION:
                     node_coords = self._collector_addition(
                         data, peek_path, node_coords,
@@ -1831,7 +2419,8 @@ class Processor:
 
     # pylint: disable=locally-disabled,too-many-branches
     def _get_nodes_by_traversal(
-        self, data: Any, yaml_path: YAMLPath, segment_index: int, **kwargs: Any
+        self, data: Any, yaml_path: CompiledYAMLPath, segment_index: int,
+        **kwargs: Any
     ) -> Generator[Any, None, None]:
         """
         Deeply traverse the document tree, returning all or filtered nodes.
@@ -1845,9 +2434,9 @@ class Processor:
         * parent (ruamel.yaml node) The parent node from which this query
           originates
         * parentref (Any) The Index or Key of data within parent
-        * translated_path (YAMLPath) YAML Path indicating precisely which node
-          is being evaluated
-        * ancestry (List[AncestryEntry]) Stack of ancestors preceding the
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
           present node under evaluation
 
         Returns:  (Generator[Any, None, None]) Each node coordinate as they are
@@ -1855,8 +2444,9 @@ class Processor:
         """
         parent: Any = kwargs.pop("parent", None)
         parentref: Any = kwargs.pop("parentref", None)
-        translated_path: YAMLPath = kwargs.pop("translated_path", YAMLPath(""))
-        ancestry: List[AncestryEntry] = kwargs.pop("ancestry", [])
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
 
         segments = yaml_path.escaped
         pathseg: PathSegment = segments[segment_index]
@@ -1877,6 +2467,10 @@ class Processor:
                     ancestry, pathseg)
                 return
 
+            if (self._explanation is not None
+                    and isinstance(data, (dict, list, CommentedSet, set))):
+                self._explanation.visit(len(data))
+
             if isinstance(data, (CommentedMap, dict)):
                 for key, val in data.items():
                     next_translated_path = (
@@ -1934,13 +2528,19 @@ class Processor:
             # matching node(s).
             peekseg: PathSegment = segments[next_segment_idx]
 
+            # Skip every subtree which cannot hold a sought key
+            key_holders = self._get_key_holders(peekseg)
+            if (key_holders is not None
+                    and self._lacks_key(data, key_holders)):
+                return
+
             # Because the calling code will continue to process the remainder
             # of the YAML Path, only the parent of the matched node(s) can be
             # yielded.
-            self.logger.debug((
+            self.logger.debug(
                 "Checking the DIRECT node for a next-segment match at"
-                " parentref {} with next segment {} in data..."
-                ).format(parentref, peekseg),
+                " parentref {} with next segment {} in data...",
+                parentref, peekseg,
                 prefix="Processor::_get_nodes_by_traversal:  ",
                 data=data)
 
@@ -1950,8 +2550,8 @@ class Processor:
                 translated_path=translated_path, ancestry=ancestry
             ):
                 self.logger.debug(
-                    "Yielding filtered DIRECT node at parentref {} of coord:"
-                    .format(parentref),
+                    "Yielding filtered DIRECT node at parentref {} of coord:",
+                    parentref,
                     prefix="Processor::_get_nodes_by_traversal:  ",
                     data=node_coord)
                 yield NodeCoords(
@@ -1959,12 +2559,15 @@ class Processor:
                     peekseg)
 
             # Then, recurse into each child to perform the same test.
+            if (self._explanation is not None
+                    and isinstance(data, (dict, list))):
+                self._explanation.visit(len(data))
             if isinstance(data, dict):
                 for key, val in data.items():
                     self.logger.debug(
                         "Processor::_get_nodes_by_traversal:  Recursing into"
-                        " KEY '{}' at ref '{}' for next-segment matches..."
-                        .format(key, parentref))
+                        " KEY '{}' at ref '{}' for next-segment matches...",
+                        key, parentref)
                     next_translated_path = (
                         translated_path + YAMLPath.escape_path_section(
                             key, translated_path.separator))
@@ -1977,7 +2580,7 @@ class Processor:
                     ):
                         self.logger.debug(
                             "Yielding filtered indirect Hash value from KEY"
-                            " '{}' at ref '{}':".format(key, parentref),
+                            " '{}' at ref '{}':", key, parentref,
                             prefix="Processor::_get_nodes_by_traversal:  ",
                             data=node_coord.node)
                         yield node_coord
@@ -1985,8 +2588,8 @@ class Processor:
                 for idx, ele in enumerate(data):
                     self.logger.debug(
                         "Processor::_get_nodes_by_traversal:  Recursing into"
-                        " INDEX '{}' at ref '{}' for next-segment matches..."
-                        .format(idx, parentref))
+                        " INDEX '{}' at ref '{}' for next-segment matches...",
+                        idx, parentref)
                     next_translated_path = translated_path + "[{}]".format(idx)
                     next_ancestry = ancestry + [(data, idx)]
                     for node_coord in self._get_nodes_by_traversal(
@@ -1997,16 +2600,20 @@ class Processor:
                     ):
                         self.logger.debug(
                             "Yielding filtered indirect Array value from INDEX"
-                            " {} at {}:".format(idx, parentref),
+                            " {} at {}:", idx, parentref,
                             prefix="Processor::_get_nodes_by_traversal:  ",
                             data=node_coord)
                         yield node_coord
 
-    def _get_nodes_by_match_all_unfiltered(
-        self, data: Any, yaml_path: YAMLPath, segment_index: int, **kwargs: Any
+    def _get_nodes_by_traversal_iterative(
+        self, data: Any, yaml_path: CompiledYAMLPath, segment_index: int,
+        **kwargs: Any
     ) -> Generator[Any, None, None]:
         """
-        Yield every immediate, non-leaf child node.
+        Deeply traverse the document tree on an explicit stack.
+
+        This yields exactly what `_get_nodes_by_traversal` yields, in the same
+        order, without recursing once per level of depth in the document.
 
         Parameters:
         1. data (ruamel.yaml data) The parsed YAML data to process
@@ -2017,39 +2624,198 @@ class Processor:
         * parent (ruamel.yaml node) The parent node from which this query
           originates
         * parentref (Any) The Index or Key of data within parent
-        * translated_path (YAMLPath) YAML Path indicating precisely which node
-          is being evaluated
-        * ancestry (List[AncestryEntry]) Stack of ancestors preceding the
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
           present node under evaluation
 
         Returns:  (Generator[Any, None, None]) Each node coordinate as they are
         matched.
         """
-        dbg_prefix="Processor::_get_nodes_by_match_all_unfiltered:  "
         parent: Any = kwargs.pop("parent", None)
         parentref: Any = kwargs.pop("parentref", None)
-        translated_path: YAMLPath = kwargs.pop("translated_path", YAMLPath(""))
-        ancestry: List[AncestryEntry] = kwargs.pop("ancestry", [])
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
+
         segments = yaml_path.escaped
         pathseg: PathSegment = segments[segment_index]
-
-        self.logger.debug(
-            "Gathering ALL immediate children in the tree at parentref,"
-            f" {parentref}, in data:",
-            prefix=dbg_prefix, data=data)
-
-        if isinstance(data, (CommentedMap, dict)):
-            self.logger.debug(
-                "Iterating over all keys to find ANY matches in data:",
-                prefix=dbg_prefix, data=data)
-            for key, val in data.items():
-                next_translated_path = (
-                    translated_path + YAMLPath.escape_path_section(
-                        key, translated_path.separator))
-                next_ancestry = ancestry + [(data, key)]
-                self.logger.debug(
-                    f"Yielding dict value at key, {key} from data:",
-                    prefix=dbg_prefix, data={'VAL': val, 'OF_DATA': data})
+        next_segment_idx: int = segment_index + 1
+        gather_leaves: bool = next_segment_idx == len(segments)
+        peekseg: Optional[PathSegment] = (
+            None if gather_leaves else segments[next_segment_idx])
+        key_holders: Optional[FrozenSet[int]] = (
+            None if peekseg is None else self._get_key_holders(peekseg))
+
+        # Nodes awaiting evaluation as (data, parent, parentref,
+        # translated_path, ancestry).  Children are pushed in reverse so they
+        # are popped -- and so yielded -- in document order.
+        stack: List[Tuple[Any, Any, Any, TranslatedPath, Ancestry]] = [
+            (data, parent, parentref, translated_path, ancestry)]
+        while stack:
+            (data, parent, parentref, translated_path, ancestry) = stack.pop()
+            children: List[Tuple[Any, Any, Any, TranslatedPath, Ancestry]] = []
+
+            if gather_leaves:
+                # This traversal is gathering every leaf node
+                if data is None:
+                    yield NodeCoords(None, parent, parentref, translated_path,
+                        ancestry, pathseg)
+                elif isinstance(data, (CommentedMap, dict)):
+                    children = [
+                        (val, data, key,
+                         translated_path + YAMLPath.escape_path_section(
+                             key, translated_path.separator),
+                         ancestry + [(data, key)])
+                        for key, val in data.items()]
+                elif isinstance(data, (CommentedSeq, list)):
+                    # As with the recursive traversal, leaf Array elements
+                    # are reported without their ancestry
+                    children = [
+                        (ele, data, idx, translated_path + "[{}]".format(idx),
+                         Ancestry())
+                        for idx, ele in enumerate(data)]
+                elif isinstance(data, (CommentedSet, set)):
+                    # Sets cannot be traversed; they cannot have complex
+                    # children
+                    if self._explanation is not None:
+                        self._explanation.visit(len(data))
+                    for ele in data:
+                        yield NodeCoords(
+                            ele, parent, ele,
+                            translated_path + YAMLPath.escape_path_section(
+                                ele, translated_path.separator),
+                            ancestry, pathseg)
+                else:
+                    yield NodeCoords(
+                        data, parent, parentref, translated_path, ancestry,
+                        pathseg)
+            elif (key_holders is not None
+                    and self._lacks_key(data, key_holders)):
+                # Skip every subtree which cannot hold a sought key
+                continue
+            else:
+                # Only the parent of each node matching the next segment can
+                # be yielded because the calling code will continue to
+                # process the remainder of the YAML Path.
+                for _ in self._get_nodes_by_path_segment(
+                    data, yaml_path, next_segment_idx, parent=parent,
+                    parentref=parentref, traverse_lists=False,
+                    translated_path=translated_path, ancestry=ancestry
+                ):
+                    self.logger.debug(
+                        "Yielding filtered node at parentref {}:",
+                        parentref,
+                        prefix="Processor::_get_nodes_by_traversal_iterative:"
+                               "  ",
+                        data=data)
+                    yield NodeCoords(
+                        data, parent, parentref, translated_path, ancestry,
+                        peekseg)
+
+                if isinstance(data, dict):
+                    children = [
+                        (val, data, key,
+                         translated_path + YAMLPath.escape_path_section(
+                             key, translated_path.separator),
+                         ancestry + [(data, key)])
+                        for key, val in data.items()]
+                elif isinstance(data, list):
+                    children = [
+                        (ele, data, idx, translated_path + "[{}]".format(idx),
+                         ancestry + [(data, idx)])
+                        for idx, ele in enumerate(data)]
+
+            if self._explanation is not None:
+                self._explanation.visit(len(children))
+            stack.extend(reversed(children))
+
+    def _get_key_holders(
+        self, pathseg: PathSegment
+    ) -> Optional[FrozenSet[int]]:
+        """
+        Identify the nodes whose subtrees hold the key a segment seeks.
+
+        Parameters:
+        1. pathseg (PathSegment) The segment which follows a traversal
+
+        Returns:  (Optional[FrozenSet[int]]) The identities of every indexed
+            node whose subtree holds the sought key or None when the segment
+            cannot be answered via the key name index
+
+        Raises:  N/A
+        """
+        (segment_type, key) = pathseg
+        if not (self._index_keys and segment_type is PathSegmentTypes.KEY):
+            return None
+
+        # Numeric keys may also match Array indexes and integer keys
+        try:
+            int(str(key))
+            return None
+        except ValueError:
+            pass
+        return self._key_index.holders_of(key)
+
+    def _lacks_key(self, data: Any, key_holders: FrozenSet[int]) -> bool:
+        """Indicate whether a node's subtree cannot hold a sought key."""
+        if not isinstance(data, (dict, list, CommentedSet, set)):
+            return True
+        return (id(data) not in key_holders
+                and self._key_index.is_indexed(data))
+
+    def _get_nodes_by_match_all_unfiltered(
+        self, data: Any, yaml_path: CompiledYAMLPath, segment_index: int,
+        **kwargs: Any
+    ) -> Generator[Any, None, None]:
+        """
+        Yield every immediate, non-leaf child node.
+
+        Parameters:
+        1. data (ruamel.yaml data) The parsed YAML data to process
+        2. yaml_path (yamlpath.Path) The YAML Path being processed
+        3. segment_index (int) Segment index of the YAML Path to process
+
+        Keyword Arguments:
+        * parent (ruamel.yaml node) The parent node from which this query
+          originates
+        * parentref (Any) The Index or Key of data within parent
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
+          present node under evaluation
+
+        Returns:  (Generator[Any, None, None]) Each node coordinate as they are
+        matched.
+        """
+        dbg_prefix="Processor::_get_nodes_by_match_all_unfiltered:  "
+        parent: Any = kwargs.pop("parent", None)
+        parentref: Any = kwargs.pop("parentref", None)
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
+        segments = yaml_path.escaped
+        pathseg: PathSegment = segments[segment_index]
+
+        if self.logger.is_debug_enabled:
+            self.logger.debug(
+                "Gathering ALL immediate children in the tree at parentref,"
+                f" {parentref}, in data:",
+                prefix=dbg_prefix, data=data)
+
+        if isinstance(data, (CommentedMap, dict)):
+            self.logger.debug(
+                "Iterating over all keys to find ANY matches in data:",
+                prefix=dbg_prefix, data=data)
+            for key, val in data.items():
+                next_translated_path = (
+                    translated_path + YAMLPath.escape_path_section(
+                        key, translated_path.separator))
+                next_ancestry = ancestry + [(data, key)]
+                if self.logger.is_debug_enabled:
+                    self.logger.debug(
+                        f"Yielding dict value at key, {key} from data:",
+                        prefix=dbg_prefix, data={'VAL': val, 'OF_DATA': data})
                 yield NodeCoords(val, data, key, next_translated_path,
                     next_ancestry, pathseg)
             return
@@ -2058,9 +2824,10 @@ class Processor:
             for idx, ele in enumerate(data):
                 next_translated_path = translated_path + f"[{idx}]"
                 next_ancestry = ancestry + [(data, idx)]
-                self.logger.debug(
-                    f"Yielding list element at index, {idx}:",
-                    prefix=dbg_prefix, data=ele)
+                if self.logger.is_debug_enabled:
+                    self.logger.debug(
+                        f"Yielding list element at index, {idx}:",
+                        prefix=dbg_prefix, data=ele)
                 yield NodeCoords(ele, data, idx, next_translated_path,
                     next_ancestry, pathseg)
             return
@@ -2083,7 +2850,8 @@ class Processor:
         return
 
     def _get_nodes_by_match_all_filtered(
-        self, data: Any, yaml_path: YAMLPath, segment_index: int, **kwargs: Any
+        self, data: Any, yaml_path: CompiledYAMLPath, segment_index: int,
+        **kwargs: Any
     ) -> Generator[Any, None, None]:
         """
         Yield immediate child nodes whose children match additional filters.
@@ -2097,9 +2865,9 @@ class Processor:
         * parent (ruamel.yaml node) The parent node from which this query
           originates
         * parentref (Any) The Index or Key of data within parent
-        * translated_path (YAMLPath) YAML Path indicating precisely which node
-          is being evaluated
-        * ancestry (List[AncestryEntry]) Stack of ancestors preceding the
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
           present node under evaluation
 
         Returns:  (Generator[Any, None, None]) Each node coordinate as they are
@@ -2107,16 +2875,18 @@ class Processor:
         """
         dbg_prefix="Processor::_get_nodes_by_match_all_filtered:  "
         parentref: Any = kwargs.pop("parentref", None)
-        translated_path: YAMLPath = kwargs.pop("translated_path", YAMLPath(""))
-        ancestry: List[AncestryEntry] = kwargs.pop("ancestry", [])
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
         segments = yaml_path.escaped
         pathseg: PathSegment = segments[segment_index]
         next_segment_idx: int = segment_index + 1
 
-        self.logger.debug(
-            "FILTERING children in the tree at parentref,"
-            f" {parentref}, of data:",
-            prefix=dbg_prefix, data=data)
+        if self.logger.is_debug_enabled:
+            self.logger.debug(
+                "FILTERING children in the tree at parentref,"
+                f" {parentref}, of data:",
+                prefix=dbg_prefix, data=data)
 
         # There is a filter on this segment.  Return nodes from the present
         # data if-and-only-if any of their immediate children will match the
@@ -2136,16 +2906,17 @@ class Processor:
                     parentref=key, translated_path=next_translated_path,
                     ancestry=next_ancestry
                 ):
-                    self.logger.debug(
-                        "Ignoring yielded child node coordinate to yield its"
-                        " successfully matched, filtered dict val parent for"
-                        f" key, {key}:"
-                        , prefix=dbg_prefix
-                        , data={
-                            'VAL': val
-                            , 'OF_DATA': data
-                            , 'IGNORING': filtered_nc
-                        })
+                    if self.logger.is_debug_enabled:
+                        self.logger.debug(
+                            "Ignoring yielded child node coordinate to yield"
+                            " its successfully matched, filtered dict val"
+                            f" parent for key, {key}:"
+                            , prefix=dbg_prefix
+                            , data={
+                                'VAL': val
+                                , 'OF_DATA': data
+                                , 'IGNORING': filtered_nc
+                            })
                     yield NodeCoords(
                         val, data, key, next_translated_path, next_ancestry,
                         pathseg
@@ -2155,9 +2926,10 @@ class Processor:
 
         if isinstance(data, list):
             for idx, ele in enumerate(data):
-                self.logger.debug(
-                    f"Recursing into INDEX '{idx}' at ref '{parentref}' for"
-                    " next-segment matches...", prefix=dbg_prefix)
+                if self.logger.is_debug_enabled:
+                    self.logger.debug(
+                        f"Recursing into INDEX '{idx}' at ref '{parentref}'"
+                        " for next-segment matches...", prefix=dbg_prefix)
                 next_translated_path = translated_path + f"[{idx}]"
                 next_ancestry = ancestry + [(data, idx)]
                 for filtered_nc in self._get_nodes_by_path_segment(
@@ -2165,16 +2937,17 @@ class Processor:
                     parentref=idx, translated_path=next_translated_path,
                     ancestry=next_ancestry
                 ):
-                    self.logger.debug(
-                        "Ignoring yielded child node coordinate to yield its"
-                        " successfully matched, filtered list ele parent for"
-                        f" idx, {idx}:"
-                        , prefix=dbg_prefix
-                        , data={
-                            'ELE': ele
-                            , 'OF_DATA': data
-                            , 'IGNORING': filtered_nc
-                        })
+                    if self.logger.is_debug_enabled:
+                        self.logger.debug(
+                            "Ignoring yielded child node coordinate to yield"
+                            " its successfully matched, filtered list ele"
+                            f" parent for idx, {idx}:"
+                            , prefix=dbg_prefix
+                            , data={
+                                'ELE': ele
+                                , 'OF_DATA': data
+                                , 'IGNORING': filtered_nc
+                            })
                     yield NodeCoords(
                         ele, data, idx, next_translated_path, next_ancestry,
                         pathseg
@@ -2183,7 +2956,8 @@ class Processor:
             return
 
     def _get_nodes_by_match_all(
-        self, data: Any, yaml_path: YAMLPath, segment_index: int, **kwargs: Any
+        self, data: Any, yaml_path: CompiledYAMLPath, segment_index: int,
+        **kwargs: Any
     ) -> Generator[Any, None, None]:
         """
         Yield every immediate child node.
@@ -2197,9 +2971,9 @@ class Processor:
         * parent (ruamel.yaml node) The parent node from which this query
           originates
         * parentref (Any) The Index or Key of data within parent
-        * translated_path (YAMLPath) YAML Path indicating precisely which node
-          is being evaluated
-        * ancestry (List[AncestryEntry]) Stack of ancestors preceding the
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
           present node under evaluation
 
         Returns:  (Generator[Any, None, None]) Each node coordinate as they are
@@ -2208,8 +2982,9 @@ class Processor:
         dbg_prefix="Processor::_get_nodes_by_match_all:  "
         parent: Any = kwargs.pop("parent", None)
         parentref: Any = kwargs.pop("parentref", None)
-        translated_path: YAMLPath = kwargs.pop("translated_path", YAMLPath(""))
-        ancestry: List[AncestryEntry] = kwargs.pop("ancestry", [])
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
 
         segments = yaml_path.escaped
         next_segment_idx: int = segment_index + 1
@@ -2235,13 +3010,55 @@ class Processor:
             )
 
         for all_coord in all_coords:
-            self.logger.debug(
-                "Yielding matched child node of source data:"
-                , prefix=dbg_prefix, data={'NODE': all_coord, 'DATA': data})
+            if self.logger.is_debug_enabled:
+                self.logger.debug(
+                    "Yielding matched child node of source data:"
+                    , prefix=dbg_prefix
+                    , data={'NODE': all_coord, 'DATA': data})
             yield all_coord
 
+    def _get_matched_nodes(
+        self, yaml_path: CompiledYAMLPath
+    ) -> Generator[NodeCoords, None, None]:
+        """
+        Generate the pre-existing NodeCoords matching a YAML Path in data.
+
+        When queries are cached, the NodeCoords of a cached query are
+        generated without evaluating the document and those of an uncached
+        query are cached once every one of them has been generated.
+
+        Parameters:
+        1. yaml_path (CompiledYAMLPath) The YAML Path to evaluate
+
+        Returns:  (Generator[NodeCoords, None, None]) The requested NodeCoords
+            as they are matched
+
+        Raises:  N/A
+        """
+        if not self._cache_queries:
+            for node_coords in self._get_required_nodes(self.data, yaml_path):
+                yield node_coords
+            return
+
+        cached_coords = self._query_cache.get(yaml_path)
+        if cached_coords is not None:
+            for node_coords in cached_coords:
+                yield node_coords
+            return
+
+        # Only complete results are cached; a query abandoned by its caller
+        # never reaches the end of this loop
+        version = self._query_cache.version
+        matched_coords: List[NodeCoords] = []
+        for node_coords in self._get_required_nodes(self.data, yaml_path):
+            matched_coords.append(node_coords)
+            yield node_coords
+        if version == self._query_cache.version:
+            self._query_cache.put(yaml_path, matched_coords)
+
     def _get_required_nodes(
-        self, data: Any, yaml_path: YAMLPath, depth: int = 0, **kwargs: Any
+        self, data: Any, yaml_path: CompiledYAMLPath, depth: int = 0,
+        **kwargs: Any
     ) -> Generator[NodeCoords, None, None]:
         """
         Generate pre-existing NodeCoords from YAML data matching a YAML Path.
@@ -2260,9 +3077,9 @@ class Processor:
         * parentref (Any) The Index or Key of data within parent
         * relay_segment (PathSegment) YAML Path segment presently under
           evaluation
-        * translated_path (YAMLPath) YAML Path indicating precisely which node
-          is being evaluated
-        * ancestry (List[AncestryEntry]) Stack of ancestors preceding the
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
           present node under evaluation
 
         Returns:  (Generator[NodeCoords, None, None]) The requested NodeCoords
@@ -2273,34 +3090,48 @@ class Processor:
         parent: Any = kwargs.pop("parent", None)
         parentref: Any = kwargs.pop("parentref", None)
         relay_segment: PathSegment = kwargs.pop("relay_segment", None)
-        translated_path: YAMLPath = kwargs.pop("translated_path", YAMLPath(""))
-        ancestry: List[AncestryEntry] = kwargs.pop("ancestry", [])
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
+
+        if self._iterative_engine:
+            for node_coord in self._get_required_nodes_iterative(
+                data, yaml_path, depth, parent=parent, parentref=parentref,
+                relay_segment=relay_segment, translated_path=translated_path,
+                ancestry=ancestry
+            ):
+                yield node_coord
+            return
 
+        if not isinstance(yaml_path, CompiledYAMLPath):
+            yaml_path = CompiledYAMLPath(yaml_path)
         segments = yaml_path.escaped
         if segments and len(segments) > depth:
             pathseg: PathSegment = yaml_path.unescaped[depth]
             (segment_type, unstripped_attrs) = pathseg
             except_segment = str(unstripped_attrs)
-            self.logger.debug(
-                "Seeking segment <{}>{} in data of type {}:"
-                .format(segment_type, except_segment, type(data)),
-                prefix="Processor::_get_required_nodes:  ",
-                data=data, footer=" ")
+            if self.logger.is_debug_enabled:
+                self.logger.debug(
+                    "Seeking segment <{}>{} in data of type {}:"
+                    .format(segment_type, except_segment, type(data)),
+                    prefix="Processor::_get_required_nodes:  ",
+                    data=data, footer=" ")
 
             for segment_node_coords in self._get_nodes_by_path_segment(
                 data, yaml_path, depth, parent=parent, parentref=parentref,
                 translated_path=translated_path, ancestry=ancestry
             ):
-                self.logger.debug(
-                    "Got data of type {} at <{}>{} in the data."
-                    .format(
-                        type(segment_node_coords.node
-                             if hasattr(segment_node_coords, "node")
-                             else segment_node_coords),
-                        segment_type,
-                        except_segment),
-                    prefix="Processor::_get_required_nodes:  ",
-                    data=segment_node_coords)
+                if self.logger.is_debug_enabled:
+                    self.logger.debug(
+                        "Got data of type {} at <{}>{} in the data."
+                        .format(
+                            type(segment_node_coords.node
+                                 if hasattr(segment_node_coords, "node")
+                                 else segment_node_coords),
+                            segment_type,
+                            except_segment),
+                        prefix="Processor::_get_required_nodes:  ",
+                        data=segment_node_coords)
 
                 if isinstance(segment_node_coords, list):
                     # Most likely the output of a Collector, this list will be
@@ -2326,30 +3157,210 @@ class Processor:
                             segment_node_coords.node, yaml_path, depth + 1,
                             parent=segment_node_coords.parent,
                             parentref=segment_node_coords.parentref,
-                            translated_path=segment_node_coords.path,
+                            translated_path=(
+                                segment_node_coords.translated_path),
                             ancestry=segment_node_coords.ancestry,
                             relay_segment=pathseg):
-                        self.logger.debug(
-                            "Finally returning segment data of type {} at"
-                            " parentref {}:"
-                            .format(type(subnode_coord.node),
-                                    subnode_coord.parentref),
-                            prefix="Processor::_get_required_nodes:  ",
-                            data=subnode_coord, footer=" ")
+                        if self.logger.is_debug_enabled:
+                            self.logger.debug(
+                                "Finally returning segment data of type {} at"
+                                " parentref {}:"
+                                .format(type(subnode_coord.node),
+                                        subnode_coord.parentref),
+                                prefix="Processor::_get_required_nodes:  ",
+                                data=subnode_coord, footer=" ")
                         yield subnode_coord
         else:
-            self.logger.debug(
-                "Finally returning data of type {} at parentref {}:"
-                .format(type(data), parentref),
-                prefix="Processor::_get_required_nodes:  ",
-                data=data, footer=" ")
+            if self.logger.is_debug_enabled:
+                self.logger.debug(
+                    "Finally returning data of type {} at parentref {}:"
+                    .format(type(data), parentref),
+                    prefix="Processor::_get_required_nodes:  ",
+                    data=data, footer=" ")
             yield NodeCoords(
                 data, parent, parentref, translated_path, ancestry,
                 relay_segment)
 
+    def _get_required_nodes_iterative(
+        self, data: Any, yaml_path: CompiledYAMLPath, depth: int = 0,
+        **kwargs: Any
+    ) -> Generator[NodeCoords, None, None]:
+        """
+        Generate pre-existing NodeCoords on an explicit stack.
+
+        This yields exactly what `_get_required_nodes` yields, in the same
+        order, but evaluates the segments of the YAML Path on an explicit
+        stack of pending segment results.  Each match is yielded directly
+        rather than through one nested generator per segment.
+
+        Parameters:
+        1. data (Any) The parsed YAML data to process
+        2. yaml_path (YAMLPath) The pre-parsed YAML Path to follow
+        3. depth (int) Index within yaml_path to process; default=0
+
+        Keyword Arguments:
+        * parent (ruamel.yaml node) The parent node from which this query
+          originates
+        * parentref (Any) The Index or Key of data within parent
+        * relay_segment (PathSegment) YAML Path segment presently under
+          evaluation
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
+          present node under evaluation
+
+        Returns:  (Generator[NodeCoords, None, None]) The requested NodeCoords
+            as they are matched
+
+        Raises:  N/A
+        """
+        parent: Any = kwargs.pop("parent", None)
+        parentref: Any = kwargs.pop("parentref", None)
+        relay_segment: PathSegment = kwargs.pop("relay_segment", None)
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
+
+        if not isinstance(yaml_path, CompiledYAMLPath):
+            yaml_path = CompiledYAMLPath(yaml_path)
+        segment_count = len(yaml_path.escaped)
+        if depth >= segment_count:
+            yield NodeCoords(
+                data, parent, parentref, translated_path, ancestry,
+                relay_segment)
+            return
+
+        # Each entry holds the index of a segment, the pending results of
+        # evaluating it, and the coordinates of the data it is evaluated
+        # against -- which Collector results, being virtual, inherit.
+        stack: List[Tuple[
+            int, Generator[Any, None, None], Any, Any, TranslatedPath,
+            Ancestry
+        ]] = [(
+            depth,
+            self._get_nodes_by_path_segment(
+                data, yaml_path, depth, parent=parent, parentref=parentref,
+                translated_path=translated_path, ancestry=ancestry),
+            parent, parentref, translated_path, ancestry)]
+        while stack:
+            (depth, results, parent, parentref, translated_path,
+             ancestry) = stack[-1]
+            try:
+                segment_node_coords = next(results)
+            except StopIteration:
+                stack.pop()
+                continue
+
+            if isinstance(segment_node_coords, list):
+                # Most likely the output of a Collector, this list of
+                # NodeCoords is a virtual DOM element which cannot itself be
+                # parented to the real DOM.
+                (node, node_parent, node_parentref, node_path,
+                 node_ancestry) = (
+                    segment_node_coords, parent, parentref, translated_path,
+                    ancestry)
+            else:
+                (node, node_parent, node_parentref, node_path,
+                 node_ancestry) = (
+                    segment_node_coords.node, segment_node_coords.parent,
+                    segment_node_coords.parentref,
+                    segment_node_coords.translated_path,
+                    segment_node_coords.ancestry)
+
+            next_depth = depth + 1
+            if next_depth < segment_count:
+                stack.append((
+                    next_depth,
+                    self._get_nodes_by_path_segment(
+                        node, yaml_path, next_depth, parent=node_parent,
+                        parentref=node_parentref, translated_path=node_path,
+                        ancestry=node_ancestry),
+                    node_parent, node_parentref, node_path, node_ancestry))
+                continue
+
+            if self.logger.is_debug_enabled:
+                self.logger.debug(
+                    "Finally returning data of type {} at parentref {}:"
+                    .format(type(node), node_parentref),
+                    prefix="Processor::_get_required_nodes_iterative:  ",
+                    data=node, footer=" ")
+            yield NodeCoords(
+                node, node_parent, node_parentref, node_path, node_ancestry,
+                yaml_path.unescaped[depth])
+
+    def _get_nodes_by_trie(
+        self, data: Any, trie_node: PathTrieNode, **kwargs: Any
+    ) -> Generator[Tuple[Any, NodeCoords], None, None]:
+        """
+        Generate pre-existing NodeCoords matching the YAML Paths of a PathTrie.
+
+        Every edge of the tree is evaluated once for each node matched by its
+        predecessors, so YAML Paths which share segments share their
+        evaluation.
+
+        Parameters:
+        1. data (Any) The parsed YAML data to process
+        2. trie_node (PathTrieNode) The node of the PathTrie reached by data
+
+        Keyword Arguments:
+        * parent (ruamel.yaml node) The parent node from which this query
+          originates
+        * parentref (Any) The Index or Key of data within parent
+        * relay_segment (PathSegment) YAML Path segment presently under
+          evaluation
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
+          present node under evaluation
+
+        Returns:  (Generator[Tuple[Any, NodeCoords], None, None]) The payload
+            of each matching YAML Path with each NodeCoords it matches
+
+        Raises:  N/A
+        """
+        parent: Any = kwargs.pop("parent", None)
+        parentref: Any = kwargs.pop("parentref", None)
+        relay_segment: PathSegment = kwargs.pop("relay_segment", None)
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
+
+        for payload in trie_node.payloads:
+            yield (payload, NodeCoords(
+                data, parent, parentref, translated_path, ancestry,
+                relay_segment))
+
+        depth = trie_node.segment_index
+        for child in trie_node.children.values():
+            yaml_path = child.yaml_path
+            if yaml_path is None:
+                continue  # pragma: no cover
+            pathseg: PathSegment = yaml_path.unescaped[
+                child.segment_index - 1]
+            for segment_node_coords in self._get_nodes_by_path_segment(
+                data, yaml_path, depth, parent=parent, parentref=parentref,
+                translated_path=translated_path, ancestry=ancestry
+            ):
+                if isinstance(segment_node_coords, list):
+                    # Collector results are virtual DOM elements
+                    child_matches = self._get_nodes_by_trie(
+                        segment_node_coords, child, parent=parent,
+                        parentref=parentref, translated_path=translated_path,
+                        ancestry=ancestry, relay_segment=pathseg)
+                else:
+                    child_matches = self._get_nodes_by_trie(
+                        segment_node_coords.node, child,
+                        parent=segment_node_coords.parent,
+                        parentref=segment_node_coords.parentref,
+                        translated_path=segment_node_coords.translated_path,
+                        ancestry=segment_node_coords.ancestry,
+                        relay_segment=pathseg)
+                for child_match in child_matches:
+                    yield child_match
+
     # pylint: disable=locally-disabled,too-many-statements
     def _get_optional_nodes(
-        self, data: Any, yaml_path: YAMLPath, value: Any = None,
+        self, data: Any, yaml_path: CompiledYAMLPath, value: Any = None,
         depth: int = 0, **kwargs: Any
     ) -> Generator[NodeCoords, None, None]:
         """
@@ -2371,9 +3382,9 @@ class Processor:
         * parentref (Any) The Index or Key of data within parent
         * relay_segment (PathSegment) YAML Path segment presently under
           evaluation
-        * translated_path (YAMLPath) YAML Path indicating precisely which node
-          is being evaluated
-        * ancestry (List[AncestryEntry]) Stack of ancestors preceding the
+        * translated_path (TranslatedPath) YAML Path indicating precisely which
+          node is being evaluated
+        * ancestry (Ancestry) Stack of ancestors preceding the
           present node under evaluation
 
         Returns:  (Generator[NodeCoords, None, None]) The requested NodeCoords
@@ -2388,8 +3399,11 @@ class Processor:
         parent: Any = kwargs.pop("parent", None)
         parentref: Any = kwargs.pop("parentref", None)
         relay_segment: PathSegment = kwargs.pop("relay_segment", None)
-        translated_path: YAMLPath = kwargs.pop("translated_path", YAMLPath(""))
-        ancestry: List[AncestryEntry] = kwargs.pop("ancestry", [])
+        translated_path: TranslatedPath = kwargs.pop(
+            "translated_path", TranslatedPath())
+        ancestry: Ancestry = kwargs.pop("ancestry", Ancestry())
+        if not isinstance(yaml_path, CompiledYAMLPath):
+            yaml_path = CompiledYAMLPath(yaml_path)
         segments = yaml_path.escaped
 
         # pylint: disable=locally-disabled,too-many-nested-blocks
@@ -2399,11 +3413,12 @@ class Processor:
             stripped_attrs: PathAttributes = segments[depth][1]
             except_segment = str(unstripped_attrs)
 
-            self.logger.debug(
-                "Seeking element <{}>{} in data of type {}:"
-                .format(segment_type, except_segment, type(data)),
-                prefix="Processor::_get_optional_nodes:  ",
-                data=data, footer=" ")
+            if self.logger.is_debug_enabled:
+                self.logger.debug(
+                    "Seeking element <{}>{} in data of type {}:"
+                    .format(segment_type, except_segment, type(data)),
+                    prefix="Processor::_get_optional_nodes:  ",
+                    data=data, footer=" ")
 
             # The next element may not exist; this method ensures that it does
             matched_nodes = 0
@@ -2421,31 +3436,32 @@ class Processor:
                             ancestry=ancestry,
                             relay_segment=pathseg
                     ):
-                        self.logger.debug((
-                            "Relaying a drilled-into Collector node:"),
-                            prefix="Processor::_get_optional_nodes:  ",
-                            data={
-                                "node": node_coord,
-                                "parent": parent,
-                                "parentref": parentref
-                            }
-                        )
+                        if self.logger.is_debug_enabled:
+                            self.logger.debug((
+                                "Relaying a drilled-into Collector node:"),
+                                prefix="Processor::_get_optional_nodes:  ",
+                                data={
+                                    "node": node_coord,
+                                    "parent": parent,
+                                    "parentref": parentref
+                                }
+                            )
                         yield node_coord
                     continue
 
                 if next_coord.node is None:
-                    self.logger.debug((
-                        "Relaying a None element <{}>{} from the data."
-                        ).format(segment_type, except_segment),
+                    self.logger.debug(
+                        "Relaying a None element <{}>{} from the data.",
+                        segment_type, except_segment,
                         prefix="Processor::_get_optional_nodes:  ",
                         data=next_coord
                     )
                     yield next_coord
                     continue
 
-                self.logger.debug((
-                    "Found element <{}>{} in the data; recursing into it..."
-                    ).format(segment_type, except_segment),
+                self.logger.debug(
+                    "Found element <{}>{} in the data; recursing into it...",
+                    segment_type, except_segment,
                     prefix="Processor::_get_optional_nodes:  ",
                     data=next_coord
                 )
@@ -2454,7 +3470,7 @@ class Processor:
                         next_coord.node, yaml_path, value, depth + 1,
                         parent=next_coord.parent,
                         parentref=next_coord.parentref,
-                        translated_path=next_coord.path,
+                        translated_path=next_coord.translated_path,
                         ancestry=next_coord.ancestry,
                         relay_segment=pathseg
                 ):
@@ -2470,13 +3486,14 @@ class Processor:
                     and segment_type is not PathSegmentTypes.TRAVERSE
             ):
                 # Add the missing element
-                self.logger.debug(
-                    ("Processor::_get_optional_nodes:  Element <{}>{} is"
-                     " unknown in the data!  Applying default, <{}>{} to"
-                     " data:"
-                    ).format(segment_type, except_segment, type(value), value),
-                    data=data
-                )
+                if self.logger.is_debug_enabled:
+                    self.logger.debug(
+                        "Processor::_get_optional_nodes:  Element <{}>{} is"
+                        " unknown in the data!  Applying default, <{}>{} to"
+                        " data:", segment_type, except_segment, type(value),
+                        value,
+                        data=data
+                    )
                 if isinstance(data, list):
                     self.logger.debug(
                         "Processor::_get_optional_nodes:  Dealing with a list"
@@ -2492,6 +3509,8 @@ class Processor:
                             data, next_node, stripped_attrs
                         )
                         new_idx = len(data) - 1
+                        self._document_index.add_node(new_ele, data, new_idx)
+                        self._record_change(ancestry, new_ele, data)
                         next_translated_path = translated_path + "[{}]".format(
                             new_idx)
                         next_ancestry = ancestry + [(data, new_idx)]
@@ -2525,7 +3544,11 @@ class Processor:
                             next_node = Nodes.build_next_node(
                                 yaml_path, depth + 1, value
                             )
-                            Nodes.append_list_element(data, next_node)
+                            new_ele = Nodes.append_list_element(
+                                data, next_node)
+                            self._document_index.add_node(
+                                new_ele, data, len(data) - 1)
+                            self._record_change(ancestry, new_ele, data)
                         next_translated_path = translated_path + "[{}]".format(
                             newidx)
                         next_ancestry = ancestry + [(data, newidx)]
@@ -2546,10 +3569,11 @@ class Processor:
                         )
 
                 elif isinstance(data, dict):
-                    self.logger.debug(
-                        "Processor::_get_optional_nodes:  Dealing with a"
-                        + " dictionary"
-                    )
+                    if self.logger.is_debug_enabled:
+                        self.logger.debug(
+                            "Processor::_get_optional_nodes:  Dealing with a"
+                            + " dictionary"
+                        )
                     if segment_type is PathSegmentTypes.ANCHOR:
                         raise BadAliasYAMLPathException(
                             "Cannot add ANCHOR keys",
@@ -2560,6 +3584,10 @@ class Processor:
                         data[stripped_attrs] = Nodes.build_next_node(
                             yaml_path, depth + 1, value
                         )
+                        self._document_index.add_node(
+                            data[stripped_attrs], data, stripped_attrs)
+                        self._record_change(
+                            ancestry, data[stripped_attrs], data)
                         next_translated_path = (
                             translated_path + YAMLPath.escape_path_section(
                                 str(stripped_attrs),
@@ -2595,20 +3623,25 @@ class Processor:
                         )
 
                     data.add(stripped_attrs)
+                    self._document_index.add_node(
+                        stripped_attrs, data, stripped_attrs)
+                    self._record_change(ancestry, stripped_attrs, data)
                     yield NodeCoords(
                         data, parent, parentref,
                         translated_path, ancestry,
                         relay_segment)
 
                 else:
-                    self.logger.debug(
-                        "Assuming data is scalar and cannot receive a {}"
-                        " subreference at {} ({}/{}):".format(
+                    if self.logger.is_debug_enabled:
+                        self.logger.debug(
+                            "Assuming data is scalar and cannot receive a {}"
+                            " subreference at {} ({}/{}):",
                             str(segment_type), str(yaml_path), str(depth + 1),
-                            str(len(yaml_path))),
-                        prefix="Processor::_get_optional_nodes:  ",
-                        data={"data": data, "parent": parent,
-                            "parentref": parentref, "(default_)value": value})
+                            str(len(yaml_path)),
+                            prefix="Processor::_get_optional_nodes:  ",
+                            data={"data": data, "parent": parent,
+                                  "parentref": parentref,
+                                  "(default_)value": value})
                     raise YAMLPathException(
                         "Cannot add {} subreference to scalars".format(
                             str(segment_type)
@@ -2618,18 +3651,37 @@ class Processor:
                     )
 
         else:
-            self.logger.debug(
-                "Finally returning data of type {}:"
-                .format(type(data)),
-                prefix="Processor::_get_optional_nodes:  ", data=data)
+            if self.logger.is_debug_enabled:
+                self.logger.debug(
+                    "Finally returning data of type {}:"
+                    .format(type(data)),
+                    prefix="Processor::_get_optional_nodes:  ", data=data)
             yield NodeCoords(
                 data, parent, parentref, translated_path, ancestry,
                 relay_segment)
 
     # pylint: disable=too-many-arguments
+    def _anchors_of(self, data: Any) -> Dict[str, Any]:
+        """
+        Get every YAML Anchor in a document, by name.
+
+        Parameters:
+        1. data (Any) The document to scan
+
+        Returns:  (Dict[str, Any]) The anchored nodes, by Anchor name; when
+            `data` is this Processor's document, these come from its index
+        """
+        if data is self.data:
+            return self._document_index.anchors
+
+        all_anchors: Dict[str, Any] = {}
+        Anchors.scan_for_anchors(data, all_anchors)
+        return all_anchors
+
     def _update_node(
         self, parent: Any, parentref: Any, value: Any,
-        value_format: YAMLValueFormats, value_tag: Union[str, None] = None
+        value_format: YAMLValueFormats, value_tag: Union[str, None] = None,
+        deferred: Optional[List[NodeReplacement]] = None
     ) -> None:
         """
         Set the value of a data node.
@@ -2646,6 +3698,9 @@ class Processor:
         4. value_format (YAMLValueFormats) the YAML representation of the
            value
         5. value_tag (str) the custom YAML data-type tag of the value
+        6. deferred (List[NodeReplacement]) When set, the replacement is
+           added to this list rather than applied to the document; pass the
+           list to `_replace_nodes` to apply all such replacements at once
 
         Returns: N/A
 
@@ -2657,75 +3712,6 @@ class Processor:
                 "Processor::_update_node:  Ignoring node with no parent!")
             return
 
-        # This recurse function was contributed by Anthon van der Neut, the
-        # author of ruamel.yaml, to resolve how to update all references to an
-        # Anchor throughout the parsed data structure.
-        def recurse(data, parent, parentref, reference_node, replacement_node):
-            if isinstance(data, (CommentedMap, ryod)):
-                for i, k in [
-                        (idx, key) for idx, key in enumerate(data.keys())
-                        if key is reference_node
-                ]:
-                    data.insert(i, replacement_node, data.pop(k))
-                for k, val in data.non_merged_items():
-                    if val is reference_node:
-                        if (hasattr(val, "anchor") or
-                                (data is parent and k == parentref)):
-                            data[k] = replacement_node
-                    else:
-                        recurse(val, parent, parentref, reference_node,
-                                replacement_node)
-            elif isinstance(data, (CommentedSeq, list)):
-                for idx, item in enumerate(data):
-                    if data is parent and item is reference_node:
-                        data[idx] = replacement_node
-                    else:
-                        recurse(item, parent, parentref, reference_node,
-                                replacement_node)
-            elif isinstance(data, (CommentedSet, set)):
-                data.discard(reference_node)
-                data.add(replacement_node)
-            elif isinstance(data, OrderedDict):
-                # Manual key (re)ordering is necessary and YMKs are not
-                # supported.
-                push_to_end = False
-                found_key = None
-                push_keys = []
-                for k, val in data.items():
-                    if push_to_end:
-                        push_keys.append(k)
-                    elif k is reference_node:
-                        found_key = k
-                        push_to_end = True
-                if push_to_end:
-                    data[replacement_node] = data.pop(found_key)
-                    for key in push_keys:
-                        data.move_to_end(key)
-
-                for k, val in data.items():
-                    if val is reference_node:
-                        if (hasattr(val, "anchor") or
-                                (data is parent and k == parentref)):
-                            data[k] = replacement_node
-                    else:
-                        recurse(val, parent, parentref, reference_node,
-                                replacement_node)
-            elif isinstance(data, dict):
-                # Key ordering is irrelevant and YMKs are not supported
-                for i, k in [
-                        (idx, key) for idx, key in enumerate(data.keys())
-                        if key is reference_node
-                ]:
-                    data[replacement_node] = data.pop(k)
-                for k, val in data.items():
-                    if val is reference_node:
-                        if (hasattr(val, "anchor") or
-                                (data is parent and k == parentref)):
-                            data[k] = replacement_node
-                    else:
-                        recurse(val, parent, parentref, reference_node,
-                                replacement_node)
-
         change_node = None
         if isinstance(parent, (set, CommentedSet)):
             for ele in parent:
@@ -2737,13 +3723,207 @@ class Processor:
         new_node = Nodes.make_new_node(
             change_node, value, value_format, tag=value_tag)
 
-        self.logger.debug(
-            f"Changing the following <{value_format}> formatted node:",
-            prefix="Processor::_update_node:  ",
-            data={ "__FROM__": change_node, "___TO___": new_node })
+        if self.logger.is_debug_enabled:
+            self.logger.debug(
+                f"Changing the following <{value_format}> formatted node:",
+                prefix="Processor::_update_node:  ",
+                data={ "__FROM__": change_node, "___TO___": new_node })
 
-        recurse(self.data, parent, parentref, change_node, new_node)
+        if (self._index_references
+            and not isinstance(change_node, (dict, list, set, CommentedSet))
+        ):
+            self._update_references(parent, parentref, change_node, new_node)
+        elif deferred is not None:
+            deferred.append((parent, parentref, change_node, new_node))
+        else:
+            self._replace_nodes([(parent, parentref, change_node, new_node)])
 
         self.logger.debug(
             "Parent after change:", prefix="Processor::_update_node:  ",
             data=parent)
+
+    def _discard_indexes(self, node_coord: NodeCoords) -> None:
+        """Discard the indexes and queries which a change to a node affects."""
+        self._record_change(
+            node_coord.ancestry, node_coord.node, node_coord.parent)
+
+    def _record_change(
+        self, ancestry: Iterable[AncestryEntry], *nodes: Any
+    ) -> None:
+        """
+        Discard the indexes and cached queries which a change may affect.
+
+        Parameters:
+        1. ancestry (Iterable[AncestryEntry]) The ancestors of the changed
+           node
+        2. *nodes (Any) The changed -- or added -- node followed by its
+           parent
+
+        Returns:  N/A
+        """
+        self._search_index.discard(ancestry, *nodes)
+        self._query_cache.discard(ancestry, *nodes)
+        if self._key_index.is_built:
+            self._key_index.invalidate()
+
+    def _replace_nodes(self, replacements: List[NodeReplacement]) -> None:
+        """
+        Replace nodes and their references throughout the document.
+
+        Every replacement is applied during a single walk of the entire
+        document, so many changes cost no more than one.  When more than one
+        replacement affects the same place, the last of them prevails.
+
+        Parameters:
+        1. replacements (List[NodeReplacement]) The (parent, parentref,
+           reference_node, replacement_node) of each node to replace
+
+        Returns:  N/A
+        """
+        by_id: Dict[int, List[NodeReplacement]] = {}
+        for replacement in replacements:
+            by_id.setdefault(id(replacement[2]), []).append(replacement)
+
+        def rename_keys(data):
+            for key in [k for k in data.keys() if id(k) in by_id]:
+                Processor._rename_key(data, key, by_id[id(key)][-1][3])
+
+        def replace_value(data, key, val):
+            # Anchored values are replaced everywhere; others only at the
+            # place the change names.
+            entries = by_id[id(val)]
+            if hasattr(val, "anchor"):
+                data[key] = entries[-1][3]
+                return True
+            for (parent, parentref, _, replacement_node) in reversed(entries):
+                if data is parent and key == parentref:
+                    data[key] = replacement_node
+                    return True
+            return False
+
+        # This recurse function was contributed by Anthon van der Neut, the
+        # author of ruamel.yaml, to resolve how to update all references to an
+        # Anchor throughout the parsed data structure.
+        def recurse(data):
+            if isinstance(data, (CommentedMap, ryod)):
+                rename_keys(data)
+                for k, val in data.non_merged_items():
+                    if not (id(val) in by_id and replace_value(data, k, val)):
+                        recurse(val)
+            elif isinstance(data, (CommentedSeq, list)):
+                for idx, item in enumerate(data):
+                    entries = [entry for entry in by_id.get(id(item), [])
+                               if data is entry[0]]
+                    if entries:
+                        data[idx] = entries[-1][3]
+                    else:
+                        recurse(item)
+            elif isinstance(data, (CommentedSet, set)):
+                for ele in [ele for ele in data if id(ele) in by_id]:
+                    data.discard(ele)
+                    data.add(by_id[id(ele)][-1][3])
+            elif isinstance(data, dict):
+                # YMKs are not supported by OrderedDict or dict
+                rename_keys(data)
+                for k, val in data.items():
+                    if not (id(val) in by_id and replace_value(data, k, val)):
+                        recurse(val)
+
+        if by_id:
+            recurse(self.data)
+            self._document_index.invalidate()
+
+    def _update_references(
+        self, parent: Any, parentref: Any, reference_node: Any,
+        replacement_node: Any
+    ) -> None:
+        """
+        Replace a Scalar node and its references via the reference index.
+
+        This has the same effect as searching the entire document for every
+        reference to the node but touches only the places which hold it.
+
+        Parameters:
+        1. parent (ruamel.yaml data) The parent of the node to change
+        2. parentref (Any) Index or Key of the node within parent
+        3. reference_node (Any) The node to replace
+        4. replacement_node (Any) The node to put in its place
+
+        Returns:  N/A
+        """
+        index = self._document_index
+        replaced: List[ReferenceSite] = []
+        keys_renamed = False
+
+        # Keys are renamed first, so later sites must follow the new name
+        sites = sorted(index.references(reference_node),
+                       key=lambda site: not site[2])
+        for site in sites:
+            (container, ref, is_key) = site
+            if is_key:
+                Processor._rename_key(
+                    container, reference_node, replacement_node)
+                keys_renamed = True
+                continue
+
+            if keys_renamed and ref is reference_node:
+                ref = replacement_node
+            if isinstance(container, (CommentedSet, set)):
+                container.discard(reference_node)
+                container.add(replacement_node)
+            elif isinstance(container, list):
+                if container is not parent:
+                    continue
+                container[ref] = replacement_node
+            elif (hasattr(reference_node, "anchor")
+                  or (container is parent and ref == parentref)):
+                container[ref] = replacement_node
+            else:
+                continue
+            replaced.append(site)
+
+        if keys_renamed:
+            # Renaming a key relocates everything held beneath it
+            index.invalidate()
+        else:
+            index.replace_node(reference_node, replacement_node, replaced)
+
+    @staticmethod
+    def _rename_key(
+        data: Any, reference_node: Any, replacement_node: Any
+    ) -> None:
+        """
+        Rename the key of a Hash which is a particular node, in place.
+
+        Parameters:
+        1. data (Any) The Hash to affect
+        2. reference_node (Any) The key to rename, by identity
+        3. replacement_node (Any) The new key
+
+        Returns:  N/A
+        """
+        if isinstance(data, (CommentedMap, ryod)):
+            for i, k in [
+                    (idx, key) for idx, key in enumerate(data.keys())
+                    if key is reference_node
+            ]:
+                data.insert(i, replacement_node, data.pop(k))
+        elif isinstance(data, OrderedDict):
+            # Manual key (re)ordering is necessary
+            push_to_end = False
+            found_key = None
+            push_keys = []
+            for k in data.keys():
+                if push_to_end:
+                    push_keys.append(k)
+                elif k is reference_node:
+                    found_key = k
+                    push_to_end = True
+            if push_to_end:
+                data[replacement_node] = data.pop(found_key)
+                for key in push_keys:
+                    data.move_to_end(key)
+        elif isinstance(data, dict):
+            # Key ordering is irrelevant
+            for k in [key for key in data.keys() if key is reference_node]:
+                data[replacement_node] = data.pop(k)
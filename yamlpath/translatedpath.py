@@ -0,0 +1,158 @@
+"""
+Implement TranslatedPath, a lazy, structurally-shared YAML Path.
+
+Copyright 2022 William W. Kimball, Jr. MBA MSIS
+"""
+from typing import List, Optional, Union
+
+from yamlpath.enums import PathSeparators
+from yamlpath import YAMLPath
+
+
+class TranslatedPath:
+    """
+    An immutable YAML Path which is built one segment at a time.
+
+    Query processors report the precise YAML Path of every node they visit.
+    Building those paths with `YAMLPath.__add__` copies the entire YAML Path,
+    grows its original string, and discards its parsing caches at every step,
+    so each node costs time in proportion to its depth.  A TranslatedPath is
+    instead a link to its parent path plus the one -- pre-escaped -- segment
+    it adds, so extending it is a constant-time operation and every child of a
+    node shares that node's path.  The string and YAMLPath renditions are
+    produced only when they are requested and are then retained.
+    """
+
+    __slots__ = (
+        "_parent",
+        "_segment",
+        "_original",
+        "_yaml_path",
+        "_separator",
+    )
+
+    # The number of TranslatedPaths created while counting, as reported by
+    # query profiles; only a QueryExplanation turns counting on
+    created: int = 0
+    counting: bool = False
+
+    def __init__(
+        self, yaml_path: Union[YAMLPath, str, None] = "",
+        parent: Optional["TranslatedPath"] = None
+    ) -> None:
+        """
+        Instantiate a TranslatedPath.
+
+        Parameters:
+        1. yaml_path (Union[YAMLPath, str, None]) The YAML Path to start from
+           or, when `parent` is set, the next -- pre-escaped -- segment to add
+           to `parent`
+        2. parent (TranslatedPath) The path to which `yaml_path` is appended
+
+        Returns:  N/A
+
+        Raises:  N/A
+        """
+        self._parent: Optional[TranslatedPath] = parent
+        self._segment: str = ""
+        self._original: Optional[str] = None
+        self._yaml_path: Optional[YAMLPath] = None
+        if TranslatedPath.counting:
+            TranslatedPath.created += 1
+
+        if parent is None:
+            self._yaml_path = YAMLPath(yaml_path)
+            self._original = self._yaml_path.original
+            self._separator: PathSeparators = (
+                PathSeparators.infer_separator(self._original))
+        else:
+            self._segment = str(yaml_path)
+            self._separator = parent.separator
+            if self._separator is PathSeparators.AUTO:
+                # Appending to an empty YAML Path simply replaces it
+                self._separator = PathSeparators.infer_separator(
+                    self._segment if self._segment.strip() else "")
+
+    def __str__(self) -> str:
+        """Get a stringified version of this object."""
+        return str(self.yaml_path)
+
+    def __repr__(self) -> str:
+        """Generate an eval()-safe representation of this object."""
+        return "{}('{}')".format(self.__class__.__name__, self.original)
+
+    def __add__(self, other: object) -> "TranslatedPath":
+        """Add a nonmutating -- pre-escaped -- path segment."""
+        next_segment = str(other) if not isinstance(other, str) else other
+        return TranslatedPath(next_segment, self)
+
+    @property
+    def separator(self) -> PathSeparators:
+        """Get the separator which demarcates this path's segments."""
+        return self._separator
+
+    @property
+    def parent(self) -> "TranslatedPath":
+        """
+        Get the path with the last segment of this path removed.
+
+        Parameters:  N/A
+
+        Returns:  (TranslatedPath) The parent path
+
+        Raises:
+            - `YAMLPathException` when this path has no segments to remove
+        """
+        if self._parent is not None:
+            return self._parent
+
+        parent_path = YAMLPath(self.yaml_path)
+        parent_path.pop()
+        return TranslatedPath(parent_path)
+
+    @property
+    # pylint: disable=locally-disabled,protected-access
+    def original(self) -> str:
+        """
+        Get the unparsed YAML Path this path represents.
+
+        The value is identical to that which repeatedly adding each segment to
+        a YAMLPath would produce.
+
+        Parameters:  N/A
+
+        Returns:  (str) The unparsed YAML Path
+
+        Raises:  N/A
+        """
+        if self._original is not None:
+            return self._original
+
+        # Gather every link back to the nearest one which already knows its
+        # original YAML Path.
+        links: List[TranslatedPath] = []
+        link: TranslatedPath = self
+        while link._original is None and link._parent is not None:
+            links.append(link)
+            link = link._parent
+
+        original: str = link._original if link._original is not None else ""
+        for link in reversed(links):
+            if len(original) < 1:
+                original = link._segment
+            else:
+                original += "{}{}".format(
+                    PathSeparators.infer_separator(original), link._segment)
+
+            if not original.strip():
+                original = ""
+
+        self._original = original
+        return original
+
+    @property
+    def yaml_path(self) -> YAMLPath:
+        """Get the YAMLPath this path represents."""
+        if self._yaml_path is None:
+            self._yaml_path = YAMLPath(self.original)
+        return self._yaml_path
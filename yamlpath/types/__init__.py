@@ -1,4 +1,5 @@
 """Make all custom types available."""
 from .ancestryentry import AncestryEntry
+from .ancestry import Ancestry
 from .pathattributes import PathAttributes
 from .pathsegment import PathSegment
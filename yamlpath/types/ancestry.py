@@ -0,0 +1,178 @@
+"""
+Defines a persistent, structurally-shared stack of AncestryEntry.
+
+Copyright 2022 William W. Kimball, Jr. MBA MSIS
+"""
+from typing import Any, Iterable, Iterator, List, Optional, Union
+
+from yamlpath.types.ancestryentry import AncestryEntry
+
+
+class Ancestry:
+    """
+    An immutable stack of AncestryEntry (parent, parentref).
+
+    Each Ancestry links its nearest AncestryEntry to the Ancestry of its
+    parent (a "cons-list"), so siblings share the whole of their ancestry and
+    descending one level into a document costs a single link rather than a
+    copy of every preceding entry.  It otherwise reads like the list it
+    replaces; index 0 is the document root and -1 is the nearest ancestor.  A
+    list is built only when one is requested.
+    """
+
+    __slots__ = ("_entry", "_tail", "_depth", "_root")
+
+    def __init__(
+        self, entry: Optional[AncestryEntry] = None,
+        tail: Optional["Ancestry"] = None
+    ) -> None:
+        """
+        Instantiate an Ancestry.
+
+        Parameters:
+        1. entry (AncestryEntry) The nearest ancestor; leave unset to create an
+           empty Ancestry
+        2. tail (Ancestry) The ancestry of `entry`
+
+        Returns:  N/A
+
+        Raises:  N/A
+        """
+        self._entry: Optional[AncestryEntry] = entry
+        self._tail: Optional[Ancestry] = None
+        self._depth: int = 0
+        self._root: Optional[AncestryEntry] = entry
+
+        if entry is not None:
+            self._tail = Ancestry() if tail is None else tail
+            self._depth = len(self._tail) + 1
+            if self._depth > 1:
+                self._root = self._tail[0]
+
+    def __len__(self) -> int:
+        """Indicate how many ancestors are in this stack."""
+        return self._depth
+
+    def __iter__(self) -> Iterator[AncestryEntry]:
+        """Iterate over the ancestors, from the document root onward."""
+        return iter(self.to_list())
+
+    def __getitem__(self, index: Any) -> Any:
+        """
+        Get an ancestor by its list index.
+
+        Parameters:
+        1. index (Any) The `list` index or slice of the ancestor(s) to get
+
+        Returns:  (Any) The AncestryEntry or, for slices, list of them
+
+        Raises:
+            - `IndexError` when there is no ancestor at the index
+        """
+        if not isinstance(index, int):
+            return self.to_list()[index]
+
+        if index < 0:
+            index += self._depth
+        if index < 0 or index >= self._depth:
+            raise IndexError("Ancestry index out of range")
+
+        if index == 0:
+            return self._root
+
+        link: Ancestry = self
+        for _ in range(self._depth - 1 - index):
+            link = link.tail
+        return link.head
+
+    def __add__(self, other: Iterable[AncestryEntry]) -> "Ancestry":
+        """Add -- without mutating this stack -- more ancestors."""
+        link: Ancestry = self
+        for entry in other:
+            link = Ancestry(entry, link)
+        return link
+
+    def __eq__(self, other: object) -> bool:
+        """Indicate whether two ancestries list the same ancestors."""
+        if isinstance(other, Ancestry):
+            return self.to_list() == other.to_list()
+        if isinstance(other, list):
+            return self.to_list() == other
+        return False
+
+    def __ne__(self, other: object) -> bool:
+        """Indicate whether two ancestries list different ancestors."""
+        return not self == other
+
+    def __repr__(self) -> str:
+        """Generate an eval()-safe representation of this object."""
+        return "{}() + {}".format(
+            self.__class__.__name__, repr(self.to_list()))
+
+    @property
+    def head(self) -> AncestryEntry:
+        """
+        Get the nearest ancestor.
+
+        Parameters:  N/A
+
+        Returns:  (AncestryEntry) The nearest ancestor
+
+        Raises:
+            - `IndexError` when this Ancestry is empty
+        """
+        if self._entry is None:
+            raise IndexError("An empty Ancestry has no head")
+        return self._entry
+
+    @property
+    def tail(self) -> "Ancestry":
+        """
+        Get the ancestry of the nearest ancestor.
+
+        Parameters:  N/A
+
+        Returns:  (Ancestry) This stack without its nearest ancestor
+
+        Raises:
+            - `IndexError` when this Ancestry is empty
+        """
+        if self._tail is None:
+            raise IndexError("An empty Ancestry has no tail")
+        return self._tail
+
+    def to_list(self) -> List[AncestryEntry]:
+        """
+        Get the ancestors as a new list, from the document root onward.
+
+        Parameters:  N/A
+
+        Returns:  (List[AncestryEntry]) The ancestors
+
+        Raises:  N/A
+        """
+        entries: List[AncestryEntry] = []
+        link: Ancestry = self
+        while len(link) > 0:
+            entries.append(link.head)
+            link = link.tail
+        entries.reverse()
+        return entries
+
+    @staticmethod
+    def from_entries(
+        entries: Union["Ancestry", Iterable[AncestryEntry], None]
+    ) -> "Ancestry":
+        """
+        Get an Ancestry for any stack of AncestryEntry.
+
+        Parameters:
+        1. entries (Union[Ancestry, Iterable[AncestryEntry], None]) The
+           ancestors, from the document root onward
+
+        Returns:  (Ancestry) `entries` itself when it is already an Ancestry;
+            otherwise, a new Ancestry of the same ancestors
+        """
+        if isinstance(entries, Ancestry):
+            return entries
+        return Ancestry() + ([] if entries is None else entries)
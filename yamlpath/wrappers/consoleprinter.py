@@ -152,15 +152,29 @@ class ConsolePrinter:
         self.debug("Terminating with exit code, {}.".format(exit_code))
         sys.exit(exit_code)
 
-    def debug(self, message, **kwargs):
+    @property
+    def is_debug_enabled(self) -> bool:
+        """
+        Indicate whether debug messages will be written.
+
+        Callers should check this before doing any work -- like formatting
+        messages or gathering data -- which only serves a debug message.
+        """
+        return bool(self.args.debug and not self.args.quiet)
+
+    def debug(self, message, *args, **kwargs):
         """
         Write a debug message to STDOUT unless quiet mode is active.
 
         Dumps all key-value pairs of a dictionary or all elements of a list,
-        when the message is either.
+        when the message is either.  Rendering the message is deferred until
+        it is known that the message will be written.
 
         Positional Parameters:
-        1. message (str) The message to print
+        1. message (Any) The message to print or a callable, taking no
+           arguments, which returns the message to print
+        2. *args (Any) When present, `message` is a format string and these
+           are its format arguments
 
         Keyword Arguments:
         * data (Any) Data to recursively add to the DEBUG message
@@ -175,11 +189,16 @@ class ConsolePrinter:
 
         Raises:  N/A
         """
-        if self.args.debug and not self.args.quiet:
+        if self.is_debug_enabled:
             header = kwargs.pop("header", "")
             footer = kwargs.pop("footer", "")
             prefix = kwargs.pop("prefix", "")
 
+            if callable(message):
+                message = message()
+            if args:
+                message = str(message).format(*args)
+
             if header:
                 print(ConsolePrinter._debug_prefix_lines(
                     "{}{}".format(prefix, header)))
@@ -335,7 +354,7 @@ class ConsolePrinter:
             yield line
 
         for line in ConsolePrinter._debug_dump(
-            data.ancestry, prefix=ancestry_prefix
+            list(data.ancestry), prefix=ancestry_prefix
         ):
             yield line
 
@@ -3,10 +3,10 @@ Implement NodeCoords.
 
 Copyright 2020, 2021 William W. Kimball, Jr. MBA MSIS
 """
-from typing import Any, List, Optional, Type
+from typing import Any, List, Optional, Type, Union
 
-from yamlpath.types import AncestryEntry, PathSegment
-from yamlpath import YAMLPath
+from yamlpath.types import Ancestry, AncestryEntry, PathSegment
+from yamlpath import TranslatedPath, YAMLPath
 
 class NodeCoords:
     """
@@ -22,11 +22,25 @@ class NodeCoords:
     `__init__` method for details.
     """
 
+    __slots__ = (
+        "node",
+        "parent",
+        "parentref",
+        "_path",
+        "ancestry",
+        "path_segment",
+    )
+
+    # The number of NodeCoords created while counting, as reported by query
+    # profiles; only a QueryExplanation turns counting on
+    created: int = 0
+    counting: bool = False
+
     # pylint: disable=locally-disabled,too-many-arguments
     def __init__(
         self, node: Any, parent: Any, parentref: Any,
-        path: Optional[YAMLPath] = None,
-        ancestry: Optional[List[AncestryEntry]] = None,
+        path: Union[YAMLPath, TranslatedPath, None] = None,
+        ancestry: Union[Ancestry, List[AncestryEntry], None] = None,
         path_segment: Optional[PathSegment] = None
     ) -> None:
         """
@@ -37,11 +51,12 @@ class NodeCoords:
         2. parent (Any) Reference to `node`'s immediate DOM parent
         3. parentref (Any) The `list` index or `dict` key which indicates where
            within `parent` the `node` is located
-        4. path (YAMLPath) The YAML Path for this node, as reported by its
-           creator process
-        5. ancestry (List[AncestryEntry]) Stack of AncestryEntry (parent,
-           parentref) tracking the hierarchical ancestry of this node through
-           its parent document
+        4. path (Union[YAMLPath, TranslatedPath]) The YAML Path for this
+           node, as reported by its creator process; a TranslatedPath is
+           rendered as a YAMLPath only when the `path` property is read
+        5. ancestry (Union[Ancestry, List[AncestryEntry]]) Stack of
+           AncestryEntry (parent, parentref) tracking the hierarchical ancestry
+           of this node through its parent document
         6. path_segment (PathSegment) The YAML Path segment which most directly
            caused the generation of this NodeCoords
 
@@ -52,11 +67,12 @@ class NodeCoords:
         self.node: Any = node
         self.parent: Any = parent
         self.parentref: Any = parentref
-        self.path: Optional[YAMLPath] = path
-        self.ancestry: List[AncestryEntry] = ([]
-                                              if ancestry is None
-                                              else ancestry)
+        self._path: Union[YAMLPath, TranslatedPath, None] = path
+        self.ancestry: Union[Ancestry, List[AncestryEntry]] = (
+            [] if ancestry is None else ancestry)
         self.path_segment: Optional[PathSegment] = path_segment
+        if NodeCoords.counting:
+            NodeCoords.created += 1
 
     def __str__(self) -> str:
         """Get a String representation of this object."""
@@ -84,6 +100,28 @@ class NodeCoords:
             return False
         return self.node < rhs.node
 
+    @property
+    def path(self) -> Optional[YAMLPath]:
+        """Get the YAML Path of this node, as reported by its creator."""
+        if isinstance(self._path, TranslatedPath):
+            return self._path.yaml_path
+        return self._path
+
+    @path.setter
+    def path(self, value: Union[YAMLPath, TranslatedPath, None]) -> None:
+        """Set the YAML Path of this node."""
+        self._path = value
+
+    @property
+    def translated_path(self) -> Union[YAMLPath, TranslatedPath, None]:
+        """
+        Get the YAML Path of this node without rendering it.
+
+        Query processors use this to extend the YAML Path of a node without
+        paying to render it as a YAMLPath.
+        """
+        return self._path
+
     @property
     def unwrapped_node(self) -> Any:
         """Unwrap the data, no matter how deeply nested it may be."""
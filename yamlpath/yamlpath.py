@@ -4,8 +4,9 @@ Implement YAML Path.
 
 Copyright 2019, 2020, 2021 William W. Kimball, Jr. MBA MSIS
 """
+import re
 from collections import deque
-from typing import Deque, List, Optional, Union
+from typing import Deque, Dict, List, Optional, Pattern, Tuple, Union
 
 from yamlpath.types import PathAttributes, PathSegment
 from yamlpath.exceptions import (
@@ -22,6 +23,57 @@ from yamlpath.enums import (
 from yamlpath.path import SearchKeywordTerms, SearchTerms, CollectorTerms
 
 
+def _compile_simple_scanner(pathsep: str) -> Pattern[str]:
+    """
+    Compile a scanner for the tokens of simple YAML Paths.
+
+    Simple YAML Paths have no escapes, whitespace, demarcation marks, Anchor
+    marks, Collectors, Keyword Searches, Regular Expressions, or nested
+    brackets; every other YAML Path must be parsed one character at a time.
+
+    Parameters:
+    1. pathsep (str) The segment separator of the YAML Paths to scan
+
+    Returns:  (Pattern[str]) A pattern matching any one token
+    """
+    sep = re.escape(pathsep)
+    return re.compile(
+        r"(?P<sep>{sep})"
+        r"|(?P<key>[^\\ '\"()\[\]&{sep}]+)"
+        r"|\[(?:"
+        r"(?P<index>-?[0-9]+)"
+        r"|(?P<slice>[-0-9]*:[-0-9:]*)"
+        r"|(?P<attr>[^\\ '\"()\[\]&=^$%!<>~]+)(?P<inverted>!?)"
+        r"(?P<method>==?|[<>]=?|[\^$%])"
+        r"(?P<term>[^\\ '\"()\[\]=^$%!<>~]*)"
+        r")\]".format(sep=sep))
+
+
+# Scanners for the tokens of simple YAML Paths, by segment separator
+_SIMPLE_SCANNERS: Dict[str, Pattern[str]] = {
+    str(PathSeparators.DOT): _compile_simple_scanner(str(PathSeparators.DOT)),
+    str(PathSeparators.FSLASH): _compile_simple_scanner(
+        str(PathSeparators.FSLASH)),
+}
+
+# Matches YAML Paths -- or sections of them -- having only KEY segments
+_PLAIN_PATH: Pattern[str] = re.compile(r"[^\\ '\"()\[\]&]*")
+
+# The search methods of simple YAML Paths, by operator
+_SIMPLE_SEARCH_METHODS: Dict[str, PathSearchMethods] = {
+    "=": PathSearchMethods.EQUALS,
+    "==": PathSearchMethods.EQUALS,
+    "^": PathSearchMethods.STARTS_WITH,
+    "$": PathSearchMethods.ENDS_WITH,
+    "%": PathSearchMethods.CONTAINS,
+    ">": PathSearchMethods.GREATER_THAN,
+    "<": PathSearchMethods.LESS_THAN,
+    ">=": PathSearchMethods.GREATER_THAN_OR_EQUAL,
+    "<=": PathSearchMethods.LESS_THAN_OR_EQUAL,
+}
+
+
+# pylint: disable=too-many-instance-attributes
 class YAMLPath:
     """
     Encapsulate a YAML Path and its parsing logic.
@@ -34,8 +86,25 @@ class YAMLPath:
 
     Parsing operations are lazy and property setting smartly tiggers re-parsing
     only when necessary.
+
+    YAMLPaths are hashable so they may serve as dict keys and set members.
+    Like any such key, a YAMLPath must not be changed while it is one.
     """
 
+    __slots__ = (
+        "_separator",
+        "_original",
+        "_unescaped",
+        "_escaped",
+        "_stringified",
+        "_canonical",
+    )
+
+    # The number of YAMLPaths created while counting, as reported by query
+    # profiles; only a QueryExplanation turns counting on
+    created: int = 0
+    counting: bool = False
+
     def __init__(self, yaml_path: Union["YAMLPath", str, None] = "",
                  pathsep: PathSeparators = PathSeparators.AUTO) -> None:
         """
@@ -53,9 +122,12 @@ class YAMLPath:
         """
         self._separator: PathSeparators = pathsep
         self._original: str = ""
-        self._unescaped: deque = deque()
-        self._escaped: deque = deque()
+        self._unescaped: Tuple[PathSegment, ...] = ()
+        self._escaped: Tuple[PathSegment, ...] = ()
         self._stringified: str = ""
+        self._canonical: str = ""
+        if YAMLPath.counting:
+            YAMLPath.created += 1
 
         if isinstance(yaml_path, YAMLPath):
             self.original = yaml_path.original
@@ -93,23 +165,28 @@ class YAMLPath:
 
         Returns:  (bool) true = Both are identical; false, otherwise
         """
-        if not isinstance(other, (YAMLPath, str)):
+        if isinstance(other, YAMLPath):
+            that = other
+        elif isinstance(other, str):
+            that = YAMLPath(other)
+        else:
             return False
 
-        equiv_this = YAMLPath(self)
-        equiv_this.separator = PathSeparators.FSLASH
-        cmp_this = str(equiv_this)
-
-        equiv_that = YAMLPath(other)
-        equiv_that.separator = PathSeparators.FSLASH
-        cmp_that = str(equiv_that)
-
-        return cmp_this == cmp_that
+        return self._get_canonical() == that._get_canonical()
 
     def __ne__(self, other: object) -> bool:
         """Indicate non-equivalence of two YAMLPaths."""
         return not self == other
 
+    def __hash__(self) -> int:
+        """
+        Hash this YAML Path consistently with its equivalence.
+
+        As with equivalence, the path separator is ignored.  Note that a
+        string equivalent to a YAMLPath does not share its hash.
+        """
+        return hash(self._get_canonical())
+
     def __add__(self, other: object) -> "YAMLPath":
         """Add a nonmutating -- pre-escaped -- path segment."""
         next_segment = str(other) if not isinstance(other, str) else other
@@ -132,8 +209,28 @@ class YAMLPath:
             else self.separator)
         if len(self._original) < 1:
             self.original = segment
-        else:
-            self.original += "{}{}".format(separator, segment)
+            return self
+
+        escaped = self._escaped
+        unescaped = self._unescaped
+        self.original += "{}{}".format(separator, segment)
+
+        # Extend the already parsed segments rather than parse the entire
+        # YAML Path again when the new segment cannot be affected by those
+        # which precede it
+        if (escaped and unescaped
+                and separator is self.separator
+                and escaped[-1][0] is not PathSegmentTypes.COLLECTOR
+                and "\\" not in self._original):
+            try:
+                appended = YAMLPath._scan_simple_path(
+                    self._original, segment, str(separator))
+            except YAMLPathException:
+                # Report invalid segments only once the path is parsed
+                appended = None
+            if appended is not None:
+                self._escaped = escaped + tuple(appended)
+                self._unescaped = unescaped + tuple(appended)
         return self
 
     def pop(self) -> PathSegment:
@@ -209,9 +306,10 @@ class YAMLPath:
 
         self._original = str_val
         self._separator = PathSeparators.AUTO
-        self._unescaped = deque()
-        self._escaped = deque()
+        self._unescaped = ()
+        self._escaped = ()
         self._stringified = ""
+        self._canonical = ""
 
     @property
     def separator(self) -> PathSeparators:
@@ -303,9 +401,9 @@ class YAMLPath:
         Raises:  N/A
         """
         if not self._escaped:
-            self._escaped = self._parse_path(True)
+            self._parse_both()
 
-        return self._escaped.copy()
+        return deque(self._escaped)
 
     @property
     def unescaped(self) -> Deque[PathSegment]:
@@ -322,11 +420,58 @@ class YAMLPath:
         Raises:  N/A
         """
         if not self._unescaped:
-            self._unescaped = self._parse_path(False)
+            if "\\" in self._original:
+                self._unescaped = tuple(self._parse_path(False))
+            else:
+                self._parse_both()
 
-        return self._unescaped.copy()
+        return deque(self._unescaped)
+
+    def _get_canonical(self) -> str:
+        """
+        Get the separator-independent form of this YAML Path.
+
+        This is the forward-slash rendering of the segments parsed via the
+        separator inferred from the original YAML Path.  It is computed once
+        and then retained until the original YAML Path changes.
+
+        Parameters:  N/A
+
+        Returns:  (str) The form by which YAMLPaths are compared and hashed
+
+        Raises:
+            - `YAMLPathException` when the YAML Path is invalid
+        """
+        if not self._canonical:
+            # A YAML Path parsed via any other separator must be re-parsed
+            parsed = self
+            if self._separator not in (
+                PathSeparators.AUTO,
+                PathSeparators.infer_separator(self._original)
+            ):
+                parsed = YAMLPath(self._original)
+            self._canonical = YAMLPath._stringify_yamlpath_segments(
+                parsed.unescaped, PathSeparators.FSLASH)
+        return self._canonical
+
+    def _parse_both(self) -> None:
+        """
+        Parse the escaped and, when possible, unescaped forms of this path.
+
+        The two forms differ only in their escape symbols, so both forms of a
+        YAML Path without any are produced by a single parse.
+
+        Parameters:  N/A
+
+        Returns:  N/A
+
+        Raises:
+            - `YAMLPathException` when the YAML Path is invalid
+        """
+        self._escaped = tuple(self._parse_path(True))
+        if "\\" not in self._original:
+            self._unescaped = self._escaped
 
-    # pylint: disable=locally-disabled,too-many-locals,too-many-branches,too-many-statements
     def _parse_path(self,
                     strip_escapes: bool = True
                    ) -> Deque[PathSegment]:
@@ -336,6 +481,131 @@ class YAMLPath:
         Breaks apart a stringified YAML Path into component segments, each
         identified by its type.  See README.md for sample YAML Paths.
 
+        Simple YAML Paths are tokenized by a precompiled scanner; all others
+        are parsed one character at a time.
+
+        Parameters:
+        1. strip_escapes (bool) True = Remove leading \ symbols, leaving
+           only the "escaped" symbol.  False = Leave all leading \ symbols
+           intact.
+
+        Returns:  (Deque[PathSegment]) an empty queue or a queue of
+            PathSegments.
+
+        Raises:
+            - `YAMLPathException` when the YAML Path is invalid
+        """
+        yaml_path: str = self.original
+        path_segments = YAMLPath._scan_simple_path(
+            yaml_path, yaml_path, str(self.separator))
+        if path_segments is None:
+            path_segments = self._parse_path_by_char(strip_escapes)
+        return path_segments
+
+    @staticmethod
+    def _scan_simple_path(
+        yaml_path: str, section: str, pathsep: str
+    ) -> Optional[Deque[PathSegment]]:
+        """
+        Tokenize a simple YAML Path -- or section of one -- all at once.
+
+        Parameters:
+        1. yaml_path (str) The full YAML Path being processed
+        2. section (str) The whole YAML Path or any of its trailing segments,
+           beginning at a segment separator or segment
+        3. pathsep (str) The segment separator
+
+        Returns:  (Optional[Deque[PathSegment]]) the PathSegments of the
+            section or None when it is not simple enough to tokenize; the
+            character parser must then be used
+
+        Raises:
+            - `YAMLPathException` when a KEY combines ** with other
+              characters
+        """
+        scanner = _SIMPLE_SCANNERS.get(pathsep)
+        if scanner is None:
+            return None
+
+        key_type = PathSegmentTypes.KEY
+        tokens: Optional[List[PathSegment]]
+        if _PLAIN_PATH.fullmatch(section):
+            # Only KEYs, so each segment lies between separators
+            tokens = [
+                (key_type, key) for key in section.split(pathsep) if key]
+            if "*" not in section:
+                return deque(tokens)
+        else:
+            tokens = YAMLPath._scan_simple_tokens(section, scanner)
+            if tokens is None:
+                return None
+
+        # Wildcards are expanded only once the entire section is known to be
+        # simple so the character parser alone reports the first error of
+        # every other YAML Path
+        path_segments: deque = deque()
+        for token in tokens:
+            (segment_type, segment_id) = token
+            if segment_type is key_type and "*" in segment_id:  # type: ignore
+                token = YAMLPath._expand_splats(
+                    yaml_path, segment_id, segment_type)
+            path_segments.append(token)
+        return path_segments
+
+    @staticmethod
+    def _scan_simple_tokens(
+        section: str, scanner: Pattern[str]
+    ) -> Optional[List[PathSegment]]:
+        """
+        Tokenize a simple YAML Path -- or section of one -- with brackets.
+
+        Parameters:
+        1. section (str) The YAML Path or section of one to tokenize
+        2. scanner (Pattern[str]) The scanner for the segment separator
+
+        Returns:  (Optional[List[PathSegment]]) the unexpanded segments of
+            the section or None when it is not simple enough to tokenize
+
+        Raises:  N/A
+        """
+        tokens: List[PathSegment] = []
+        pos = 0
+        for token in scanner.finditer(section):
+            if token.start() != pos:
+                return None
+            pos = token.end()
+
+            kind = token.lastgroup
+            if kind == "key":
+                tokens.append((PathSegmentTypes.KEY, token.group(kind)))
+            elif kind == "index":
+                tokens.append(
+                    (PathSegmentTypes.INDEX, int(token.group(kind))))
+            elif kind == "slice":
+                tokens.append((PathSegmentTypes.INDEX, token.group(kind)))
+            elif kind == "term":
+                (attr, inverted, method, term) = token.group(
+                    "attr", "inverted", "method", "term")
+                tokens.append((
+                    PathSegmentTypes.SEARCH,
+                    SearchTerms(
+                        inverted == "!", _SIMPLE_SEARCH_METHODS[method],
+                        attr, term)
+                ))
+
+        if pos != len(section):
+            return None
+        return tokens
+
+    # pylint: disable=locally-disabled,too-many-locals,too-many-branches,too-many-statements
+    def _parse_path_by_char(self,
+                            strip_escapes: bool = True
+                           ) -> Deque[PathSegment]:
+        r"""
+        Parse the YAML Path one character at a time.
+
+        This parses every YAML Path, no matter how complex.
+
         Parameters:
         1. strip_escapes (bool) True = Remove leading \ symbols, leaving
            only the "escaped" symbol.  False = Leave all leading \ symbols